@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Archive Hour-File Sidecar Index
+
+Archive hour files ({YYYYMMDD}/{HH}.jsonl.gz) are append-only while their
+hour is open and never change afterwards. Once a file is closed, one pass
+over it writes a small JSON sidecar next to it ({HH}.jsonl.gz.idx.json):
+
+    {
+      "index_version": 1,
+      "source": {"name": "05.jsonl.gz", "size": 1234567, "mtime_ns": ...},
+      "line_count": 2310,          # all lines (what a line count returns)
+      "row_count": 2309,           # parsed entries
+      "bad_lines": 0,
+      "uncompressed_bytes": 98765432,
+      "min_added_ts": "...", "max_added_ts": "...",
+      "last_entry_ts": "...",      # timestamp of the last entry in the file
+      "symbols": {"BTC": 12, ...}, # rows per symbol
+      "line_offsets": [0, 41234, ...]  # uncompressed byte offset of each line
+    }
+
+Readers call ensure_index() and answer row counts, time ranges, last entry
+timestamps and "does this hour contain symbol X" without decompressing
+anything. A sidecar is trusted only while the source size and mtime match;
+missing or stale sidecars are rebuilt (and written if the file is closed).
+build_tier3_daily.py writes sidecars as a by-product of reading a day.
+
+Sidecars go next to the hour files; set ARCHIVE_INDEX_DIR to keep them in a
+mirror tree instead (e.g. when the archive is read-only).
+
+Usage:
+    from archive_index import ensure_index
+
+    index = ensure_index(Path(".../20260118/05.jsonl.gz"))
+    if "BTC" in index["symbols"]: ...
+
+    # Index every closed hour file that lacks a fresh sidecar
+    python3 scripts/archive_index.py --archive-path /srv/cryptobot/data/archive
+    python3 scripts/archive_index.py --archive-path ... --date 20260118 --force
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import tempfile
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx.json"
+
+# An hour file untouched for this long is treated as closed (writers append
+# every few minutes while the hour is open)
+CLOSED_AFTER_SECONDS = 15 * 60
+
+# Fields tried, in order, for an entry's timestamp
+TIMESTAMP_FIELDS = ["meta.added_ts", "added_ts", "timestamp", "ts"]
+
+DEFAULT_ARCHIVE_PATH = Path("/srv/cryptobot/data/archive")
+
+# Errors that end the read of an hour file (truncated or corrupt gzip, I/O);
+# what was read before them is kept
+READ_ERRORS = (OSError, EOFError, zlib.error)
+
+
+def entry_timestamp(entry: dict) -> Optional[str]:
+    """First non-empty timestamp field of an entry (see TIMESTAMP_FIELDS)."""
+    for field in TIMESTAMP_FIELDS:
+        value = entry
+        for part in field.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+            if value is None:
+                break
+        if value:
+            return value
+    return None
+
+
+def index_path(hour_file: Path) -> Path:
+    """Sidecar path for an hour file (next to it, or under ARCHIVE_INDEX_DIR)."""
+    index_dir = os.environ.get("ARCHIVE_INDEX_DIR")
+    if index_dir:
+        return Path(index_dir) / hour_file.parent.name / (hour_file.name + INDEX_SUFFIX)
+    return hour_file.with_name(hour_file.name + INDEX_SUFFIX)
+
+
+def _source_info(hour_file: Path) -> dict:
+    st = hour_file.stat()
+    return {"name": hour_file.name, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def is_closed(hour_file: Path, now: Optional[float] = None) -> bool:
+    """
+    True once an hour file can no longer be appended to: its hour has ended
+    and it has not been modified for CLOSED_AFTER_SECONDS.
+    """
+    now = time.time() if now is None else now
+    if now - hour_file.stat().st_mtime < CLOSED_AFTER_SECONDS:
+        return False
+    hour = hour_file.name.split(".")[0]
+    day = hour_file.parent.name
+    if len(day) == 8 and day.isdigit() and len(hour) == 2 and hour.isdigit():
+        hour_end = datetime.strptime(day + hour, "%Y%m%d%H").replace(tzinfo=timezone.utc).timestamp() + 3600
+        return now >= hour_end
+    return True
+
+
+def _open_lines(hour_file: Path):
+    if hour_file.suffix == ".gz":
+        return gzip.open(hour_file, "rb")
+    return open(hour_file, "rb")
+
+
+class IndexBuilder:
+    """Accumulates sidecar fields while a file's lines are read in order."""
+
+    def __init__(self, hour_file: Path):
+        self.source = _source_info(hour_file)
+        self.offset = 0
+        self.line_offsets = []
+        self.row_count = 0
+        self.bad_lines = 0
+        self.symbols = {}
+        self.min_ts = None
+        self.max_ts = None
+        self.last_ts = None
+
+    def add_line(self, raw: bytes, entry: Optional[dict]):
+        self.line_offsets.append(self.offset)
+        self.offset += len(raw)
+        if entry is None:
+            return
+        self.row_count += 1
+        symbol = entry.get("symbol")
+        if symbol is not None:
+            self.symbols[symbol] = self.symbols.get(symbol, 0) + 1
+        ts = entry_timestamp(entry)
+        if ts is not None:
+            ts = str(ts)
+            self.min_ts = ts if self.min_ts is None else min(self.min_ts, ts)
+            self.max_ts = ts if self.max_ts is None else max(self.max_ts, ts)
+        self.last_ts = ts
+
+    def result(self) -> dict:
+        return {
+            "index_version": INDEX_VERSION,
+            "source": self.source,
+            "line_count": len(self.line_offsets),
+            "row_count": self.row_count,
+            "bad_lines": self.bad_lines,
+            "uncompressed_bytes": self.offset,
+            "min_added_ts": self.min_ts,
+            "max_added_ts": self.max_ts,
+            "last_entry_ts": self.last_ts,
+            "symbols": dict(sorted(self.symbols.items())),
+            "line_offsets": self.line_offsets,
+        }
+
+
+def decode_lines(hour_file: Path, builder: Optional[IndexBuilder] = None,
+                 accept_raw: Optional[Callable[[bytes], bool]] = None,
+                 counts: Optional[dict] = None, warn: bool = False) -> Iterator[dict]:
+    """
+    Yield the entries of an hour file: the one place that decides whether a
+    line is blank, bad (invalid JSON, non-UTF-8 bytes, not an object) or an
+    entry. Read errors propagate to the caller.
+
+    Args:
+        hour_file: Hour file (gzip or plain JSONL)
+        builder: Sidecar accumulator fed every line; it needs every line
+            decoded, so accept_raw is ignored when a builder is given
+        accept_raw: Pre-filter on the raw line; rejected lines are not decoded
+        counts: Dict whose "lines" and "bad_lines" are incremented
+        warn: Warn about each bad line
+    """
+    if builder is not None:
+        accept_raw = None
+    with _open_lines(hour_file) as f:
+        for line_num, raw in enumerate(f, 1):
+            if counts is not None:
+                counts["lines"] += 1
+            entry = None
+            if raw.strip() and (accept_raw is None or accept_raw(raw)):
+                try:
+                    entry = json.loads(raw)
+                    if not isinstance(entry, dict):
+                        raise ValueError(f"expected an object, got {type(entry).__name__}")
+                except ValueError as e:
+                    # JSONDecodeError, UnicodeDecodeError (non-UTF-8 bytes) or a non-object line
+                    entry = None
+                    if counts is not None:
+                        counts["bad_lines"] += 1
+                    if builder is not None:
+                        builder.bad_lines += 1
+                    if warn:
+                        print(f"[WARN] JSON decode error in {hour_file.name}:{line_num}: {e}", file=sys.stderr)
+            if builder is not None:
+                builder.add_line(raw, entry)
+            if entry is not None:
+                yield entry
+
+
+def iter_entries(hour_file: Path, write_index: bool = True, warn: bool = True) -> Iterator[dict]:
+    """
+    Yield parsed entries of an hour file (blank and undecodable lines
+    skipped, the latter warned about if warn), building its sidecar on the way.
+
+    A read error (truncated or corrupt gzip) is warned about and ends the
+    file; the entries before it have been yielded and no sidecar is written.
+    When the generator is exhausted and the file is closed, the sidecar is
+    written unless a fresh one already exists.
+    """
+    builder = IndexBuilder(hour_file)
+    try:
+        yield from decode_lines(hour_file, builder, warn=warn)
+    except READ_ERRORS as e:
+        print(f"[WARN] Error reading {hour_file}: {e}", file=sys.stderr)
+        return
+
+    if write_index and load_index(hour_file) is None and is_closed(hour_file):
+        write_sidecar(hour_file, builder.result())
+
+
+def build_index(hour_file: Path) -> dict:
+    """
+    Read an hour file once and return its sidecar dict (not written).
+
+    A read error is warned about; the dict then covers the lines read before
+    it and carries "read_error", and must not be written as a sidecar.
+    """
+    builder = IndexBuilder(hour_file)
+    try:
+        for _ in decode_lines(hour_file, builder):
+            pass
+    except READ_ERRORS as e:
+        print(f"[WARN] Error reading {hour_file}: {e}", file=sys.stderr)
+        return {**builder.result(), "read_error": str(e)}
+    return builder.result()
+
+
+def write_sidecar(hour_file: Path, index: dict) -> bool:
+    """Atomically write a sidecar; returns False (with a warning) if not writable."""
+    path = index_path(hour_file)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp_")
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(tmp, path)
+        return True
+    except OSError as e:
+        print(f"[WARN] Could not write sidecar {path}: {e}", file=sys.stderr)
+        return False
+
+
+def load_index(hour_file: Path) -> Optional[dict]:
+    """The hour file's sidecar, or None if missing, unreadable or stale."""
+    try:
+        with open(index_path(hour_file)) as f:
+            index = json.load(f)
+        source = _source_info(hour_file)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if index.get("index_version") != INDEX_VERSION or index.get("source") != source:
+        return None
+    return index
+
+
+def ensure_index(hour_file: Path, write: bool = True) -> dict:
+    """
+    The hour file's sidecar; built with one pass over the file if missing or
+    stale, and written when the file is closed and was read without error.
+    """
+    index = load_index(hour_file)
+    if index is None:
+        index = build_index(hour_file)
+        if write and "read_error" not in index and is_closed(hour_file):
+            write_sidecar(hour_file, index)
+    return index
+
+
+def read_line(hour_file: Path, index: dict, line_number: int) -> Optional[dict]:
+    """
+    Parse one line (0-based) using the sidecar's offsets. Plain files seek
+    directly; gzip streams still decompress up to the offset but nothing
+    before it is split into lines or parsed.
+    """
+    offsets = index["line_offsets"]
+    if not 0 <= line_number < len(offsets):
+        return None
+    with _open_lines(hour_file) as f:
+        f.seek(offsets[line_number])
+        raw = f.readline()
+    return json.loads(raw) if raw.strip() else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write sidecar indexes for closed archive hour files")
+    parser.add_argument("--archive-path", type=Path, default=DEFAULT_ARCHIVE_PATH,
+                        help=f"Path to archive root (default: {DEFAULT_ARCHIVE_PATH})")
+    parser.add_argument("--date", action="append", dest="dates", help="YYYYMMDD folder (repeatable; default: all)")
+    parser.add_argument("--force", action="store_true", help="Rebuild sidecars that are still fresh")
+    args = parser.parse_args()
+
+    if not args.archive_path.exists():
+        print(f"[ERROR] Archive path not found: {args.archive_path}", file=sys.stderr)
+        return 1
+
+    folders = sorted(
+        d for d in args.archive_path.iterdir()
+        if d.is_dir() and d.name.isdigit() and len(d.name) == 8 and (not args.dates or d.name in args.dates)
+    )
+
+    print("=" * 60)
+    print("Archive Sidecar Indexer")
+    print("=" * 60)
+
+    written = fresh = open_files = 0
+    t0 = time.time()
+    for folder in folders:
+        for hour_file in sorted(list(folder.glob("*.jsonl.gz")) + list(folder.glob("*.jsonl"))):
+            if not is_closed(hour_file):
+                open_files += 1
+                continue
+            if not args.force and load_index(hour_file) is not None:
+                fresh += 1
+                continue
+            index = build_index(hour_file)
+            if "read_error" in index:
+                continue
+            if write_sidecar(hour_file, index):
+                written += 1
+                print(f"  [OK] {folder.name}/{hour_file.name}: {index['row_count']} rows, "
+                      f"{len(index['symbols'])} symbols")
+
+    print(f"\n[OK] {written} written, {fresh} already fresh, {open_files} still open "
+          f"({time.time() - t0:.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Parallel Map-Reduce Archive Scanner
+
+Scripts that need a pass over archive entries each used to carry their own
+serial loop over {YYYYMMDD}/{HH}.jsonl.gz with its own error handling. Here
+the loop is written once and parallelised one task per hour file:
+
+    - Aggregator plugins: create() an empty partial (start_file() sees the
+      hour file it is for), map() one entry into it, combine() two
+      partials, finalize() the merged partial into a result
+    - Early filtering: EntryFilter rejects lines on raw bytes (required
+      top-level keys, symbols) before json.loads, and skips whole hour files
+      whose sidecar index (archive_index.py) lists none of the symbols
+    - Deterministic results: partials are combined in file order whatever
+      order the workers finish in (via parallel_verify.run_partitions)
+    - Throughput: lines, decoded entries and entries/sec are reported
+    - Sidecars: with indexes={} the scan also builds each file's sidecar
+      index (archive_index.py), so counting needs no second pass
+
+Aggregators (and filters) are pickled to the workers, so they must be
+module-level classes holding plain configuration. An aggregator whose
+partials are as large as the data (CollectEntries) sets parallel = False;
+a scan using it runs in-process rather than pickling every entry back
+from the pool.
+
+Per-file error handling does not depend on --jobs: undecodable lines are
+counted as bad_lines, a truncated or corrupt file keeps the partials of the
+lines read before the error, and anything else fails only that file.
+
+Usage:
+    from archive_scan import Aggregator, EntryCount, scan_archive
+
+    class PostsBySymbol(Aggregator):
+        name = "posts_by_symbol"
+        def create(self):
+            return {}
+        def map(self, partial, entry):
+            partial[entry["symbol"]] = partial.get(entry["symbol"], 0) + 1
+            return partial
+        def combine(self, a, b):
+            for k, v in b.items():
+                a[k] = a.get(k, 0) + v
+            return a
+
+    results, stats = scan_archive(archive_path, [EntryCount(), PostsBySymbol()],
+                                  from_date="20260101", jobs=8)
+
+    # Built-in summary (counts, per-symbol rows, timestamp range)
+    python3 scripts/archive_scan.py --archive-path /srv/cryptobot/data/archive --from-date 20260101 --jobs 8
+    python3 scripts/archive_scan.py --archive-path ... --symbol BTC --symbol ETH --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+sys.path.insert(0, str(Path(__file__).parent))
+from archive_index import (
+    READ_ERRORS, IndexBuilder, decode_lines, entry_timestamp, is_closed, load_index, write_sidecar,
+)
+from parallel_verify import run_partitions
+
+DEFAULT_ARCHIVE_PATH = Path("/srv/cryptobot/data/archive")
+
+
+class Aggregator:
+    """
+    Base aggregator plugin. Subclasses override create/map/combine and
+    optionally finalize; partials must be picklable.
+    """
+
+    name = "aggregator"
+
+    # False keeps scans using this aggregator in-process (partials that
+    # would cost more to pickle back from a worker than to compute)
+    parallel = True
+
+    def create(self):
+        """Empty partial for one hour file."""
+        return None
+
+    def start_file(self, partial, hour_file: Path):
+        """Called with the fresh partial before a file's entries are mapped."""
+        return partial
+
+    def map(self, partial, entry: dict):
+        """Fold one entry into a partial; returns the updated partial."""
+        return partial
+
+    def combine(self, a, b):
+        """Merge partial b (a later file) into a; returns the merged partial."""
+        return a
+
+    def finalize(self, partial):
+        """Result from the fully combined partial."""
+        return partial
+
+
+class EntryCount(Aggregator):
+    """Number of decoded entries."""
+
+    name = "entries"
+
+    def create(self):
+        return 0
+
+    def map(self, partial, entry):
+        return partial + 1
+
+    def combine(self, a, b):
+        return a + b
+
+
+class SymbolCounts(Aggregator):
+    """Entries per symbol (sorted by symbol)."""
+
+    name = "symbols"
+
+    def create(self):
+        return {}
+
+    def map(self, partial, entry):
+        symbol = entry.get("symbol")
+        if symbol is not None:
+            partial[symbol] = partial.get(symbol, 0) + 1
+        return partial
+
+    def combine(self, a, b):
+        for symbol, count in b.items():
+            a[symbol] = a.get(symbol, 0) + count
+        return a
+
+    def finalize(self, partial):
+        return dict(sorted(partial.items()))
+
+
+class TimestampRange(Aggregator):
+    """Min / max entry timestamp (archive_index.TIMESTAMP_FIELDS)."""
+
+    name = "timestamp_range"
+
+    def create(self):
+        return [None, None]
+
+    def map(self, partial, entry):
+        ts = entry_timestamp(entry)
+        if ts is not None:
+            ts = str(ts)
+            partial[0] = ts if partial[0] is None else min(partial[0], ts)
+            partial[1] = ts if partial[1] is None else max(partial[1], ts)
+        return partial
+
+    def combine(self, a, b):
+        lows = [t for t in (a[0], b[0]) if t is not None]
+        highs = [t for t in (a[1], b[1]) if t is not None]
+        return [min(lows) if lows else None, max(highs) if highs else None]
+
+    def finalize(self, partial):
+        return {"min": partial[0], "max": partial[1]}
+
+
+class CollectEntries(Aggregator):
+    """
+    All entries, in file order (for consumers that need the full list).
+
+    Collected in-process: the partial is every decoded entry, which would
+    otherwise be pickled back through the pool.
+    """
+
+    name = "entries_list"
+    parallel = False
+
+    def create(self):
+        return []
+
+    def map(self, partial, entry):
+        partial.append(entry)
+        return partial
+
+    def combine(self, a, b):
+        a.extend(b)
+        return a
+
+
+class EntryFilter:
+    """
+    Early entry filter applied before (raw bytes) and after (parsed) decode.
+
+    The raw checks are necessary conditions only (a key or symbol name
+    appearing as a JSON string somewhere in the line); the parsed checks are
+    exact, so filtering never changes results, only the work done.
+
+    Args:
+        require_keys: Top-level keys an entry must have
+        symbols: Keep only entries whose "symbol" is one of these
+    """
+
+    def __init__(self, require_keys: Iterable[str] = (), symbols: Optional[Iterable[str]] = None):
+        self.require_keys = tuple(require_keys)
+        self.symbols = set(symbols) if symbols is not None else None
+        self._raw_keys = tuple(json.dumps(k).encode() for k in self.require_keys)
+        self._raw_symbols = (
+            tuple(json.dumps(s).encode() for s in sorted(self.symbols)) if self.symbols is not None else None
+        )
+
+    def skip_file(self, hour_file: Path) -> bool:
+        """True if the file's fresh sidecar lists none of the symbols."""
+        if self.symbols is None:
+            return False
+        index = load_index(hour_file)
+        return index is not None and self.symbols.isdisjoint(index["symbols"])
+
+    def accept_raw(self, raw: bytes) -> bool:
+        if not all(k in raw for k in self._raw_keys):
+            return False
+        if self._raw_symbols is not None and not any(s in raw for s in self._raw_symbols):
+            return False
+        return True
+
+    def accept(self, entry: dict) -> bool:
+        if not all(k in entry for k in self.require_keys):
+            return False
+        if self.symbols is not None and entry.get("symbol") not in self.symbols:
+            return False
+        return True
+
+
+def find_hour_files(
+    archive_path: Path,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+) -> list:
+    """
+    Hour files of the YYYYMMDD folders in [from_date, to_date], in
+    (date, name) order.
+    """
+    files = []
+    if not archive_path.exists():
+        print(f"[ERROR] Archive path not found: {archive_path}", file=sys.stderr)
+        return files
+    for folder in sorted(archive_path.iterdir()):
+        if not (folder.is_dir() and folder.name.isdigit() and len(folder.name) == 8):
+            continue
+        if (from_date and folder.name < from_date) or (to_date and folder.name > to_date):
+            continue
+        files.extend(sorted(list(folder.glob("*.jsonl.gz")) + list(folder.glob("*.jsonl"))))
+    return files
+
+
+def scan_hour_file(hour_file: Path, aggregators: Sequence[Aggregator],
+                   entry_filter: Optional[EntryFilter] = None, with_index: bool = False) -> dict:
+    """
+    Map every (filtered) entry of one hour file into fresh partials.
+
+    With with_index, every line is decoded (raw filtering is skipped) and
+    the file's sidecar index is built on the way, returned and, once the
+    file is closed, written unless a fresh one exists.
+
+    Returns:
+        {"partials": [...], "lines", "entries", "bad_lines", "skipped_file",
+         "error", "index"}
+    """
+    partials = [agg.start_file(agg.create(), hour_file) for agg in aggregators]
+    counts = {"lines": 0, "entries": 0, "bad_lines": 0, "skipped_file": False, "error": None, "index": None}
+
+    if not with_index and entry_filter is not None and entry_filter.skip_file(hour_file):
+        counts["skipped_file"] = True
+        return {"partials": partials, **counts}
+
+    builder = IndexBuilder(hour_file) if with_index else None
+    accept_raw = entry_filter.accept_raw if entry_filter is not None else None
+    try:
+        for entry in decode_lines(hour_file, builder, accept_raw, counts):
+            if entry_filter is not None and not entry_filter.accept(entry):
+                continue
+            counts["entries"] += 1
+            for i, agg in enumerate(aggregators):
+                partials[i] = agg.map(partials[i], entry)
+    except READ_ERRORS as e:
+        # Truncated / in-progress / corrupt gzip: keep what was read (no index)
+        counts["error"] = f"{type(e).__name__}: {e}"
+        builder = None
+
+    if builder is not None:
+        counts["index"] = builder.result()
+        if load_index(hour_file) is None and is_closed(hour_file):
+            write_sidecar(hour_file, counts["index"])
+
+    return {"partials": partials, **counts}
+
+
+def _failed_file(args: tuple, error: str) -> dict:
+    hour_file, aggregators = args[0], args[1]
+    return {
+        "partials": [agg.start_file(agg.create(), hour_file) for agg in aggregators],
+        "lines": 0, "entries": 0, "bad_lines": 0, "skipped_file": False, "error": error, "index": None,
+    }
+
+
+def _scan_in_process(args: tuple) -> dict:
+    # Same outcome as a pool worker that raised: only this file fails
+    try:
+        return scan_hour_file(*args)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        print(f"[ERROR] Archive scan worker failed: {error}", file=sys.stderr)
+        return _failed_file(args, error)
+
+
+def scan_files(
+    hour_files: Sequence[Path],
+    aggregators: Sequence[Aggregator],
+    entry_filter: Optional[EntryFilter] = None,
+    jobs: int = 1,
+    verbose: bool = True,
+    indexes: Optional[dict] = None,
+) -> tuple:
+    """
+    Run aggregators over the given hour files, one task per file.
+
+    Args:
+        hour_files: Files to scan; partials are combined in this order
+        aggregators: Aggregator plugins
+        entry_filter: Optional early filter
+        jobs: Worker processes (1 = scan in this process; forced for
+            aggregators with parallel = False)
+        verbose: Print per-file warnings and the throughput line
+        indexes: If given, sidecar indexes are built during the scan and
+            stored here as {hour_file: index} (see scan_hour_file)
+
+    Returns:
+        Tuple of ({aggregator name: result}, stats dict)
+    """
+    t0 = time.time()
+    with_index = indexes is not None
+    task_args = [(Path(f), list(aggregators), entry_filter, with_index) for f in hour_files]
+    if not all(agg.parallel for agg in aggregators):
+        jobs = 1
+    if jobs > 1 and len(task_args) > 1:
+        file_results = run_partitions(
+            scan_hour_file, task_args, jobs=min(jobs, len(task_args)),
+            on_error=_failed_file, label="Archive scan worker",
+        )
+    else:
+        file_results = [_scan_in_process(args) for args in task_args]
+
+    merged = [agg.create() for agg in aggregators]
+    stats = {"files": len(task_args), "files_skipped": 0, "files_with_errors": 0,
+             "lines": 0, "entries": 0, "bad_lines": 0}
+    for hour_file, result in zip(hour_files, file_results):
+        for i, agg in enumerate(aggregators):
+            merged[i] = agg.combine(merged[i], result["partials"][i])
+        stats["lines"] += result["lines"]
+        stats["entries"] += result["entries"]
+        stats["bad_lines"] += result["bad_lines"]
+        stats["files_skipped"] += result["skipped_file"]
+        if with_index and result["index"] is not None:
+            indexes[Path(hour_file)] = result["index"]
+        if result["error"]:
+            stats["files_with_errors"] += 1
+            if verbose:
+                print(f"[WARN] Error reading {hour_file}: {result['error']}", file=sys.stderr)
+
+    elapsed = time.time() - t0
+    stats["elapsed_sec"] = round(elapsed, 3)
+    stats["entries_per_sec"] = round(stats["entries"] / elapsed, 1) if elapsed > 0 else None
+    if verbose:
+        print(f"[INFO] Scanned {stats['files']} files ({stats['files_skipped']} skipped via sidecar), "
+              f"{stats['lines']:,} lines, {stats['entries']:,} entries in {elapsed:.1f}s "
+              f"({stats['entries_per_sec'] or 0:,.0f} entries/sec, jobs={jobs})")
+
+    results = {agg.name: agg.finalize(partial) for agg, partial in zip(aggregators, merged)}
+    return results, stats
+
+
+def scan_archive(
+    archive_path: Path,
+    aggregators: Sequence[Aggregator],
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    entry_filter: Optional[EntryFilter] = None,
+    jobs: int = 1,
+    verbose: bool = True,
+    indexes: Optional[dict] = None,
+) -> tuple:
+    """
+    Run aggregators over every hour file of a date range (YYYYMMDD, inclusive).
+
+    Returns:
+        Tuple of ({aggregator name: result}, stats dict)
+    """
+    hour_files = find_hour_files(archive_path, from_date, to_date)
+    return scan_files(hour_files, aggregators, entry_filter, jobs, verbose, indexes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scan archive hour files in parallel")
+    parser.add_argument("--archive-path", type=Path, default=DEFAULT_ARCHIVE_PATH,
+                        help=f"Path to archive root (default: {DEFAULT_ARCHIVE_PATH})")
+    parser.add_argument("--from-date", help="First YYYYMMDD folder (inclusive)")
+    parser.add_argument("--to-date", help="Last YYYYMMDD folder (inclusive)")
+    parser.add_argument("--symbol", action="append", dest="symbols", help="Only these symbols (repeatable)")
+    parser.add_argument("--require-key", action="append", dest="require_keys", default=[],
+                        help="Only entries with this top-level key (repeatable)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    entry_filter = None
+    if args.symbols or args.require_keys:
+        entry_filter = EntryFilter(args.require_keys, args.symbols)
+
+    if not args.json:
+        print("=" * 60)
+        print("Archive Scan")
+        print("=" * 60)
+
+    results, stats = scan_archive(
+        args.archive_path,
+        [EntryCount(), SymbolCounts(), TimestampRange()],
+        args.from_date, args.to_date, entry_filter, args.jobs, verbose=not args.json,
+    )
+
+    if args.json:
+        print(json.dumps({"results": results, "stats": stats}, indent=2))
+        return 0
+
+    print(f"\nEntries: {results['entries']:,}")
+    print(f"Symbols: {len(results['symbols'])}")
+    print(f"Range:   {results['timestamp_range']['min']} .. {results['timestamp_range']['max']}")
+    top = sorted(results["symbols"].items(), key=lambda kv: -kv[1])[:10]
+    for symbol, count in top:
+        print(f"  {symbol}: {count:,}")
+    return 0 if stats["files_with_errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
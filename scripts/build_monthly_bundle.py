@@ -27,7 +27,6 @@ import shutil
 import tempfile
 import calendar
 import json
-import hashlib
 from pathlib import Path
 from datetime import datetime, date, timedelta, timezone
 
@@ -35,15 +34,32 @@ from datetime import datetime, date, timedelta, timezone
 sys.path.insert(0, str(Path(__file__).parent))
 
 from r2_config import get_r2_config
+from r2_metrics import get_metrics, instrument_client, stage
+from manifest_catalog import catalog_entry_from_manifest, fetch_catalog_entries, upsert_catalog_entry
+from tier_cache import get_cache
+from hashing_io import write_table_hashed
+from local_parquet import open_local_parquet, read_columns
+from schema_registry import concat_by_fingerprint, record_partition_schema
+from verify_engine import upload_allowed, verification_block
+import verify_tier1_daily
+import verify_tier2_daily
+import verify_tier3_daily
 
 try:
     import pyarrow as pa
-    import pyarrow.parquet as pq
 except ImportError:
     print("[ERROR] pyarrow is required. Install with: pip install pyarrow", file=sys.stderr)
     sys.exit(1)
 
 
+# Daily rule set each bundle is verified against before upload
+DAILY_SPECS = {
+    "tier1": verify_tier1_daily.SPEC,
+    "tier2": verify_tier2_daily.SPEC,
+    "tier3": verify_tier3_daily.SPEC,
+}
+
+
 def get_days_in_month(year, month):
     """Return a list of date objects for every day in the month."""
     num_days = calendar.monthrange(year, month)[1]
@@ -104,13 +120,13 @@ def main():
         print(f"[ERROR] Loading R2 config: {e}", file=sys.stderr)
         sys.exit(1)
 
-    s3 = boto3.client(
+    s3 = instrument_client(boto3.client(
         's3',
         endpoint_url=cfg.endpoint,
         aws_access_key_id=cfg.access_key_id,
         aws_secret_access_key=cfg.secret_access_key,
         region_name='auto'
-    )
+    ))
 
     # 1. Prepare Workspace
     if args.mtd:
@@ -146,6 +162,10 @@ def main():
         # 2. Download Daily Files
         print(">>> Checking/Downloading daily files from R2...")
         
+        # Days in the daily catalog are known to exist (skips one head_object per day)
+        with stage("check_inputs"):
+            daily_catalog = fetch_catalog_entries(s3, cfg.bucket, f"{args.tier}/daily")
+        
         for day in days:
             day_str = day.strftime("%Y-%m-%d")
             # New structure: tierX/daily/YYYY-MM/YYYY-MM-DD/instrumetriq_tierX_daily_YYYY-MM-DD.parquet
@@ -156,11 +176,17 @@ def main():
             try:
                 # Check existance first (saves bandwidth on 404s, though head_object is an API call)
                 # Just get_object is cleaner? No, head first avoids reading body errors.
-                s3.head_object(Bucket=cfg.bucket, Key=daily_key)
+                if day_str not in daily_catalog:
+                    with stage("check_inputs"):
+                        s3.head_object(Bucket=cfg.bucket, Key=daily_key)
                 
                 # Download
                 print(f"    Downloading {day_str}...", end="", flush=True)
-                s3.download_file(cfg.bucket, daily_key, str(local_name))
+                with stage("download"):
+                    get_cache().materialize(
+                        s3, cfg.bucket, daily_key, local_name,
+                        expected_sha256=daily_catalog.get(day_str, {}).get("sha256"),
+                    )
                 downloaded_files.append(local_name)
                 print(" OK")
             except Exception as e:
@@ -178,7 +204,7 @@ def main():
         tables = []
         for f in downloaded_files:
             try:
-                t = pq.read_table(f)
+                t = read_columns(open_local_parquet(f), None)
                 
                 # Remove internal fields that shouldn't be exposed externally
                 # backfill_normalized: internal memo from Jan 15th futures backfill
@@ -217,24 +243,27 @@ def main():
              print("[ERROR] No valid parquet tables loaded.")
              sys.exit(1)
 
-        combined_table = pa.concat_tables(tables)
+        # Zero-copy concat when every day shares one schema fingerprint;
+        # otherwise drifted days are cast to the unified schema first
+        combined_table, concat_plan = concat_by_fingerprint(tables)
+        if concat_plan["path"] == "cast":
+            print(f"[WARN] {concat_plan['fingerprints']} daily schemas; "
+                  f"cast {concat_plan['cast_tables']} tables to the unified schema")
+        catalog_prefix = '/'.join(target_key.split('/')[:2])
+        schema_fp = record_partition_schema(catalog_prefix, target_month, combined_table.schema)
+        
+        # In-build verification: the bundle must pass the tier's daily rule set
+        verification = verification_block(DAILY_SPECS[args.tier], combined_table)
         
         # Write output locally
         output_file = temp_path / "monthly_bundle.parquet"
-        pq.write_table(combined_table, output_file, compression='snappy')
+        # SHA256 is computed as the bytes are written
+        parquet_sha256, final_size_bytes = write_table_hashed(combined_table, output_file, compression='snappy')
         
-        final_size_mb = output_file.stat().st_size / (1024 * 1024)
-        final_size_bytes = output_file.stat().st_size
+        final_size_mb = final_size_bytes / (1024 * 1024)
         print(f">>> Bundle Created: {final_size_mb:.2f} MB")
         print(f"    Rows: {combined_table.num_rows}")
         
-        # Generate SHA256 hash
-        sha256_hash = hashlib.sha256()
-        with open(output_file, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                sha256_hash.update(chunk)
-        parquet_sha256 = sha256_hash.hexdigest()
-        
         # Create manifest.json
         manifest = {
             "schema_version": "v7",
@@ -249,7 +278,11 @@ def main():
             "parquet_sha256": parquet_sha256,
             "parquet_size_bytes": final_size_bytes,
             "parquet_filename": target_key.split('/')[-1],
-            "source_daily_files": [f.name for f in downloaded_files]
+            "schema_fingerprint": schema_fp,
+            "source_daily_files": [f.name for f in downloaded_files],
+            "verification": verification,
+            # R2 calls made by this process up to manifest creation (excludes the upload itself)
+            "r2_operations": get_metrics().snapshot(),
         }
         
         manifest_file = temp_path / "manifest.json"
@@ -258,38 +291,51 @@ def main():
         
         print(f">>> Manifest created: {len(downloaded_files)} days merged")
 
+        if not upload_allowed(verification):
+            sys.exit(1)
+
         # 4. Upload
         if args.upload:
-            print(f"\n>>> Uploading parquet to {target_key}...")
-            try:
-                s3.upload_file(
-                    str(output_file),
-                    cfg.bucket,
-                    target_key,
-                    ExtraArgs={'StorageClass': 'STANDARD'}
-                )
-                print("SUCCESS: Parquet uploaded.")
-            except Exception as e:
-                print(f"[ERROR] Parquet upload failed: {e}")
-                sys.exit(1)
+            with stage("upload"):
+                print(f"\n>>> Uploading parquet to {target_key}...")
+                try:
+                    s3.upload_file(
+                        str(output_file),
+                        cfg.bucket,
+                        target_key,
+                        ExtraArgs={'StorageClass': 'STANDARD'}
+                    )
+                    print("SUCCESS: Parquet uploaded.")
+                except Exception as e:
+                    print(f"[ERROR] Parquet upload failed: {e}")
+                    sys.exit(1)
             
-            # Upload manifest.json
-            manifest_key = target_key.replace('.parquet', '_manifest.json') if not target_key.endswith('/') else target_key.rstrip('/') + '/manifest.json'
-            # Better: put it in same directory
-            manifest_key = '/'.join(target_key.split('/')[:-1]) + '/manifest.json'
+                # Upload manifest.json
+                manifest_key = target_key.replace('.parquet', '_manifest.json') if not target_key.endswith('/') else target_key.rstrip('/') + '/manifest.json'
+                # Better: put it in same directory
+                manifest_key = '/'.join(target_key.split('/')[:-1]) + '/manifest.json'
             
-            print(f">>> Uploading manifest to {manifest_key}...")
-            try:
-                s3.upload_file(
-                    str(manifest_file),
-                    cfg.bucket,
-                    manifest_key,
-                    ExtraArgs={'ContentType': 'application/json'}
-                )
-                print("SUCCESS: Manifest uploaded.")
-            except Exception as e:
-                print(f"[ERROR] Manifest upload failed: {e}")
-                sys.exit(1)
+                print(f">>> Uploading manifest to {manifest_key}...")
+                try:
+                    s3.upload_file(
+                        str(manifest_file),
+                        cfg.bucket,
+                        manifest_key,
+                        ExtraArgs={'ContentType': 'application/json'}
+                    )
+                    print("SUCCESS: Manifest uploaded.")
+                except Exception as e:
+                    print(f"[ERROR] Manifest upload failed: {e}")
+                    sys.exit(1)
+            
+                # Record the bundle in the monthly/mtd catalog
+                try:
+                    upsert_catalog_entry(
+                        s3, cfg.bucket, catalog_prefix, target_month,
+                        catalog_entry_from_manifest(manifest, target_key, manifest_key),
+                    )
+                except Exception as e:
+                    print(f"[WARN] Catalog update failed: {e}")
         else:
             print(f"\n[DRY RUN] Would upload to: {target_key}")
             print(f"          Local file available at: {output_file} (until script exits)")
@@ -38,7 +38,6 @@ Output:
 """
 
 import argparse
-import hashlib
 import json
 import os
 import sys
@@ -51,10 +50,17 @@ from typing import Any, Dict, List, Optional, Tuple
 sys.path.insert(0, str(Path(__file__).parent))
 
 from r2_config import get_r2_config, R2Config
+from r2_metrics import get_metrics, instrument_client, stage
+from manifest_catalog import catalog_entry_from_manifest, fetch_catalog_entries, upsert_catalog_entry
+from tier_cache import get_cache
+from hashing_io import sha256_file, write_table_hashed
+from local_parquet import open_local_parquet, read_columns
+from schema_registry import concat_by_fingerprint, record_partition_schema
+from verify_engine import upload_allowed, verification_block
+from verify_tier1_weekly import SPEC as TIER1_WEEKLY_SPEC
 
 try:
     import pyarrow as pa
-    import pyarrow.parquet as pq
     import pyarrow.compute as pc
 except ImportError:
     print("[ERROR] pyarrow is required. Install with: pip install pyarrow", file=sys.stderr)
@@ -163,6 +169,14 @@ REQUIRED_SOURCE_COLUMNS = [
     "twitter_sentiment_windows",  # For sentiment extraction
 ]
 
+# Top-level Tier 3 columns read per day (everything else is never decoded)
+TIER3_SOURCE_COLUMNS = list(dict.fromkeys(
+    REQUIRED_SOURCE_COLUMNS + [
+        name if spec["source"] == "top_level" else spec["source"].split(".")[0]
+        for name, spec in TIER1_FIELD_SPEC.items()
+    ]
+))
+
 # R2 path patterns
 TIER3_DAILY_PREFIX = "tier3/daily"
 TIER1_WEEKLY_PREFIX = "tier1/weekly"
@@ -174,12 +188,12 @@ TIER1_WEEKLY_PREFIX = "tier1/weekly"
 
 def get_s3_client(config: R2Config):
     """Create boto3 S3 client configured for R2."""
-    return boto3.client(
+    return instrument_client(boto3.client(
         "s3",
         endpoint_url=config.endpoint,
         aws_access_key_id=config.access_key_id,
         aws_secret_access_key=config.secret_access_key,
-    )
+    ))
 
 
 # ==============================================================================
@@ -315,23 +329,33 @@ def calculate_week_range(end_day: str, days: int = 7) -> Tuple[str, str, List[st
 def verify_tier3_inputs_exist(
     s3_client,
     bucket: str,
-    days: List[str]
+    days: List[str],
+    catalog: Optional[Dict[str, dict]] = None,
 ) -> Tuple[List[str], List[str], List[str]]:
     """
     Verify which Tier 3 daily parquets and manifests exist in R2.
     
+    Days listed in the Tier 3 catalog are taken as present without any
+    head_object calls; other days fall back to checking both objects.
+    
     Returns:
         Tuple of (present_days, missing_days, found_parquet_keys)
     """
     present_days = []
     missing_days = []
     found_keys = []
+    catalog = catalog or {}
     
     for day in days:
         month_str = day[:7]
         parquet_key = f"{TIER3_DAILY_PREFIX}/{month_str}/{day}/instrumetriq_tier3_daily_{day}.parquet"
         manifest_key = f"{TIER3_DAILY_PREFIX}/{month_str}/{day}/manifest.json"
         
+        if day in catalog:
+            present_days.append(day)
+            found_keys.append(catalog[day].get("r2_key") or parquet_key)
+            continue
+        
         try:
             # Both parquet and manifest must exist
             s3_client.head_object(Bucket=bucket, Key=parquet_key)
@@ -350,15 +374,29 @@ def verify_tier3_inputs_exist(
 def fetch_tier3_coverage(
     s3_client,
     bucket: str,
-    day: str
+    day: str,
+    catalog_entry: Optional[dict] = None,
 ) -> dict:
     """
     Fetch Tier 3 manifest and extract coverage metadata.
     
+    Uses the Tier 3 catalog entry when available (no R2 call).
+    
     Returns:
         Dict with coverage fields from Tier 3 manifest.
     """
-    manifest_key = f"{TIER3_DAILY_PREFIX}/{day}/manifest.json"
+    if catalog_entry is not None:
+        return {
+            # Missing fields default as for the manifest path; a recorded 0 is kept
+            "hours_found": 24 if catalog_entry.get("hours_found") is None else catalog_entry["hours_found"],
+            "hours_expected": 24 if catalog_entry.get("hours_expected") is None else catalog_entry["hours_expected"],
+            "is_partial": catalog_entry.get("is_partial", False),
+            "missing_hours": catalog_entry.get("missing_hours") or [],
+            "rows_by_hour": catalog_entry.get("rows_by_hour"),
+            "row_count": catalog_entry.get("row_count") or 0,
+        }
+    
+    manifest_key = f"{TIER3_DAILY_PREFIX}/{day[:7]}/{day}/manifest.json"
     
     try:
         response = s3_client.get_object(Bucket=bucket, Key=manifest_key)
@@ -514,22 +552,28 @@ def download_parquet_to_table(
     s3_client,
     bucket: str,
     key: str,
+    expected_sha256: Optional[str] = None,
 ) -> pa.Table:
     """
     Download a parquet from R2 to a PyArrow table.
     
-    Uses a temp file to avoid loading entire file into memory twice.
+    Goes through the shared tier cache, so a parquet already fetched by
+    another builder in this cycle is not downloaded again.
     """
-    with tempfile.NamedTemporaryFile(suffix=".parquet", delete=True) as tmp:
-        s3_client.download_file(bucket, key, tmp.name)
-        table = pq.read_table(tmp.name)
-        return table
+    with tempfile.TemporaryDirectory() as temp_dir:
+        local_path = get_cache().materialize(
+            s3_client, bucket, key, Path(temp_dir) / "tier3.parquet",
+            expected_sha256=expected_sha256,
+        )
+        # Memory-mapped, decoding only the columns Tier 1 is derived from
+        return read_columns(open_local_parquet(local_path), TIER3_SOURCE_COLUMNS)
 
 
 def build_tier1_from_tier3(
     s3_client,
     bucket: str,
     input_keys: List[str],
+    expected_sha256: Optional[Dict[str, str]] = None,
 ) -> Tuple[pa.Table, int, List[str]]:
     """
     Build Tier 1 parquet from multiple Tier 3 daily parquets.
@@ -537,6 +581,9 @@ def build_tier1_from_tier3(
     Processes day-by-day to manage memory.
     Extracts and flattens fields per TIER1_FIELD_SPEC.
     
+    Args:
+        expected_sha256: Optional {input key: sha256} used to verify downloads
+    
     Returns:
         Tuple of (combined table, total rows, list of present fields)
     """
@@ -548,7 +595,9 @@ def build_tier1_from_tier3(
         print(f"  [{i+1}/{len(input_keys)}] Processing {day}...")
         
         # Download and read Tier 3 parquet
-        tier3_table = download_parquet_to_table(s3_client, bucket, key)
+        tier3_table = download_parquet_to_table(
+            s3_client, bucket, key, (expected_sha256 or {}).get(key)
+        )
         
         # Verify required source columns exist
         missing_source = set(REQUIRED_SOURCE_COLUMNS) - set(tier3_table.schema.names)
@@ -573,7 +622,10 @@ def build_tier1_from_tier3(
     
     # Concatenate all tables
     print("  Concatenating tables...")
-    combined = pa.concat_tables(tables)
+    combined, concat_plan = concat_by_fingerprint(tables)
+    if concat_plan["path"] == "cast":
+        print(f"  [WARN] {concat_plan['fingerprints']} schemas across days; "
+              f"cast {concat_plan['cast_tables']} tables to the unified schema")
     
     # Free intermediate tables
     del tables
@@ -585,15 +637,6 @@ def build_tier1_from_tier3(
 # Output Writing
 # ==============================================================================
 
-def compute_sha256(filepath: Path) -> str:
-    """Compute SHA256 hash of a file."""
-    sha256 = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
-
-
 def create_manifest(
     end_day: str,
     start_day: str,
@@ -606,14 +649,19 @@ def create_manifest(
     row_count: int,
     parquet_path: Path,
     present_fields: List[str],
-    window_basis: str = "end_day"
+    window_basis: str = "end_day",
+    verification: Optional[dict] = None,
+    schema_fingerprint: Optional[str] = None,
 ) -> dict:
     """Create manifest for Tier 1 weekly output with source_coverage.
     
     Args:
         window_basis: "previous_week_utc" if built with --previous-week, else "end_day"
+        verification: In-build verification block (verify_engine.verification_block)
+        schema_fingerprint: Output schema fingerprint (schema_registry)
     """
-    parquet_sha256 = compute_sha256(parquet_path)
+    # Recorded by write_outputs while writing; no second pass over the file
+    parquet_sha256 = sha256_file(parquet_path)
     parquet_size = parquet_path.stat().st_size
     
     # Calculate coverage stats
@@ -685,6 +733,10 @@ def create_manifest(
         },
         "parquet_sha256": parquet_sha256,
         "parquet_size_bytes": parquet_size,
+        "schema_fingerprint": schema_fingerprint,
+        "verification": verification,
+        # R2 calls made by this process up to manifest creation (excludes the upload itself)
+        "r2_operations": get_metrics().snapshot(),
     }
 
 
@@ -699,8 +751,8 @@ def write_outputs(
     parquet_path = output_dir / "dataset_entries_7d.parquet"
     manifest_path = output_dir / "manifest.json"
     
-    # Write parquet with zstd compression
-    pq.write_table(
+    # Write parquet with zstd compression (hashed as it is written)
+    write_table_hashed(
         table,
         parquet_path,
         compression=PARQUET_COMPRESSION,
@@ -802,9 +854,11 @@ def build_tier1_weekly(
     
     # Verify Tier 3 inputs and get coverage
     print("\n[STEP 2] Checking Tier 3 inputs...")
-    present_days, missing_days, found_keys = verify_tier3_inputs_exist(
-        s3_client, config.bucket, all_days
-    )
+    with stage("check_inputs"):
+        tier3_catalog = fetch_catalog_entries(s3_client, config.bucket, TIER3_DAILY_PREFIX)
+        present_days, missing_days, found_keys = verify_tier3_inputs_exist(
+            s3_client, config.bucket, all_days, tier3_catalog
+        )
     
     print(f"    Present: {len(present_days)}/{len(all_days)} days")
     if present_days:
@@ -824,7 +878,8 @@ def build_tier1_weekly(
     per_day_coverage = {}
     partial_count = 0
     for day in present_days:
-        coverage = fetch_tier3_coverage(s3_client, config.bucket, day)
+        with stage("coverage"):
+            coverage = fetch_tier3_coverage(s3_client, config.bucket, day, tier3_catalog.get(day))
         per_day_coverage[day] = coverage
         if coverage.get("is_partial"):
             partial_count += 1
@@ -842,9 +897,14 @@ def build_tier1_weekly(
     # Build Tier 1 from Tier 3
     print("\n[STEP 4] Building Tier 1 parquet (extracting flattened fields)...")
     print(f"    Extracting {len(TIER1_FIELD_SPEC)} fields per Tier 1 spec")
-    combined_table, row_count, present_fields = build_tier1_from_tier3(
-        s3_client, config.bucket, found_keys
-    )
+    with stage("download"):
+        tier3_sha256 = {
+            entry["r2_key"]: entry.get("sha256")
+            for entry in tier3_catalog.values() if entry.get("r2_key")
+        }
+        combined_table, row_count, present_fields = build_tier1_from_tier3(
+            s3_client, config.bucket, found_keys, tier3_sha256
+        )
     
     # Verify output fields
     print("\n[STEP 5] Verifying output fields...")
@@ -857,6 +917,11 @@ def build_tier1_weekly(
     print("[OK] Output fields verified")
     print(f"    Fields ({len(present_fields)}): {present_fields}")
     
+    # In-build verification (verify_tier1_weekly rule set) on the table being written
+    verification = verification_block(TIER1_WEEKLY_SPEC, combined_table)
+    if not upload_allowed(verification):
+        return False
+    
     # Write local outputs (always, even for dry-run)
     print("\n[STEP 6] Writing local outputs...")
     parquet_path, manifest_path = write_outputs(
@@ -879,6 +944,8 @@ def build_tier1_weekly(
         parquet_path=parquet_path,
         present_fields=present_fields,
         window_basis=window_basis,
+        verification=verification,
+        schema_fingerprint=record_partition_schema(TIER1_WEEKLY_PREFIX, end_day, combined_table.schema),
     )
     
     # Rewrite manifest with correct data
@@ -897,13 +964,23 @@ def build_tier1_weekly(
         parquet_key = f"{r2_prefix}/dataset_entries_7d.parquet"
         manifest_key = f"{r2_prefix}/manifest.json"
         
-        print(f"  Uploading {parquet_key}...")
-        uploaded_parquet = upload_to_r2(s3_client, config.bucket, parquet_path, parquet_key, force)
-        if not uploaded_parquet and not force:
-            print(f"  [SKIP] Already exists (use --force to overwrite)")
-        
-        print(f"  Uploading {manifest_key}...")
-        uploaded_manifest = upload_to_r2(s3_client, config.bucket, manifest_path, manifest_key, force)
+        with stage("upload"):
+            print(f"  Uploading {parquet_key}...")
+            uploaded_parquet = upload_to_r2(s3_client, config.bucket, parquet_path, parquet_key, force)
+            if not uploaded_parquet and not force:
+                print(f"  [SKIP] Already exists (use --force to overwrite)")
+            
+            print(f"  Uploading {manifest_key}...")
+            uploaded_manifest = upload_to_r2(s3_client, config.bucket, manifest_path, manifest_key, force)
+            
+            if uploaded_parquet:
+                try:
+                    upsert_catalog_entry(
+                        s3_client, config.bucket, TIER1_WEEKLY_PREFIX, end_day,
+                        catalog_entry_from_manifest(manifest, parquet_key, manifest_key),
+                    )
+                except Exception as e:
+                    print(f"  [WARN] Catalog update failed: {e}")
         
         print(f"[OK] Upload complete to {config.bucket}")
     elif dry_run:
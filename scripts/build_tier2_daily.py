@@ -31,7 +31,6 @@ Cron (daily at 00:20 UTC):
 """
 
 import argparse
-import hashlib
 import json
 import sys
 import tempfile
@@ -41,6 +40,13 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 from r2_config import get_r2_config
+from r2_metrics import instrument_client, stage
+from manifest_catalog import catalog_entry_from_manifest, fetch_catalog_entries, upsert_catalog_entry
+from tier_cache import get_cache
+from hashing_io import sha256_file
+from schema_registry import record_partition_schema
+from verify_engine import upload_allowed, verification_block
+from verify_tier2_daily import SPEC as TIER2_SPEC
 
 import boto3
 import duckdb
@@ -88,12 +94,12 @@ TIER2_COL_SELECT = """
 
 def get_s3():
     cfg = get_r2_config()
-    return boto3.client(
+    return instrument_client(boto3.client(
         "s3",
         endpoint_url=cfg.endpoint,
         aws_access_key_id=cfg.access_key_id,
         aws_secret_access_key=cfg.secret_access_key
-    ), cfg.bucket
+    )), cfg.bucket
 
 
 def yesterday_utc():
@@ -101,15 +107,6 @@ def yesterday_utc():
     return (datetime.now(timezone.utc).date() - timedelta(days=1)).strftime("%Y-%m-%d")
 
 
-def sha256_file(path: Path) -> str:
-    """Compute SHA256 hash of a file."""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-
 def date_range(from_date: str, to_date: str) -> list[str]:
     """Generate list of dates from from_date to to_date (inclusive)."""
     start = datetime.strptime(from_date, "%Y-%m-%d").date()
@@ -180,9 +177,14 @@ def build_day(s3, bucket: str, date: str, upload: bool = False, force: bool = Fa
         temp_path = Path(temp_dir)
         src_path = temp_path / "tier3.parquet"
         
-        # Download Tier 3 source
+        # Fetch Tier 3 source through the shared cache (sha256 checked against the catalog)
         print(f"Downloading Tier 3 source...", end=" ", flush=True)
-        s3.download_file(bucket, tier3_key, str(src_path))
+        with stage("download"):
+            tier3_sha256 = fetch_catalog_entries(s3, bucket, TIER3_PREFIX).get(date, {}).get("sha256")
+            get_cache().materialize(
+                s3, bucket, tier3_key, src_path,
+                etag=tier3_head.get("ETag"), expected_sha256=tier3_sha256,
+            )
         print(f"done ({time.time()-t0:.1f}s)")
         
         # Transform with DuckDB
@@ -209,6 +211,10 @@ def build_day(s3, bucket: str, date: str, upload: bool = False, force: bool = Fa
     file_size = parquet_path.stat().st_size
     file_hash = sha256_file(parquet_path)
     
+    # In-build verification (verify_tier2_daily rules, streamed from the local file)
+    verification = verification_block(TIER2_SPEC, parquet_path)
+    schema_fp = record_partition_schema(TIER2_PREFIX, date, parquet_path)
+    
     print(f"\nOutput: {parquet_path}")
     print(f"  Rows: {row_count:,}")
     print(f"  Size: {file_size/1024/1024:.2f} MB (was {tier3_size/1024/1024:.2f} MB, {100*file_size/tier3_size:.0f}%)")
@@ -225,6 +231,8 @@ def build_day(s3, bucket: str, date: str, upload: bool = False, force: bool = Fa
         "build_ts_utc": datetime.now(timezone.utc).isoformat(),
         "parquet_sha256": file_hash,
         "parquet_size_bytes": file_size,
+        "schema_fingerprint": schema_fp,
+        "verification": verification,
         "column_policy": {
             "columns": [
                 "symbol", "snapshot_ts", "meta", "spot_raw", "derived",
@@ -245,20 +253,36 @@ def build_day(s3, bucket: str, date: str, upload: bool = False, force: bool = Fa
         json.dump(manifest, f, indent=2)
     print(f"  Manifest: {manifest_path}")
     
+    if not upload_allowed(verification):
+        return False
+    
     # Upload to R2
     if upload and not dry_run:
         print(f"\nUploading to R2...")
         
-        for local, key in [(parquet_path, tier2_key), (manifest_path, manifest_key)]:
-            if not force:
+        uploaded = []
+        with stage("upload"):
+            for local, key in [(parquet_path, tier2_key), (manifest_path, manifest_key)]:
+                if not force:
+                    try:
+                        s3.head_object(Bucket=bucket, Key=key)
+                        print(f"  [SKIP] {key} exists (use --force)")
+                        continue
+                    except:
+                        pass
+                s3.upload_file(str(local), bucket, key)
+                uploaded.append(key)
+                print(f"  [OK] {key}")
+            
+            # Record the partition in the tier catalog only if R2 now holds this build
+            if tier2_key in uploaded:
                 try:
-                    s3.head_object(Bucket=bucket, Key=key)
-                    print(f"  [SKIP] {key} exists (use --force)")
-                    continue
-                except:
-                    pass
-            s3.upload_file(str(local), bucket, key)
-            print(f"  [OK] {key}")
+                    upsert_catalog_entry(
+                        s3, bucket, TIER2_PREFIX, date,
+                        catalog_entry_from_manifest(manifest, tier2_key, manifest_key),
+                    )
+                except Exception as e:
+                    print(f"  [WARN] Catalog update failed: {e}")
     elif dry_run:
         print(f"\n[DRY-RUN] Would upload to:")
         print(f"  {tier2_key}")
@@ -15,7 +15,6 @@ EXCLUDES: futures_raw, spot_prices, flags, diag, last_2_cycles
 
 import argparse
 import gc
-import hashlib
 import json
 import sys
 import tempfile
@@ -25,6 +24,18 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 from r2_config import get_r2_config
+from r2_metrics import get_metrics, instrument_client, stage
+from manifest_catalog import (
+    catalog_entry_from_manifest,
+    fetch_catalog_entries,
+    upsert_catalog_entry,
+)
+from tier_cache import get_cache
+from hashing_io import write_table_hashed
+from local_parquet import open_local_parquet, read_columns
+from schema_registry import concat_by_fingerprint, record_partition_schema
+from verify_engine import upload_allowed, verification_block
+from verify_tier2_weekly import SPEC as TIER2_WEEKLY_SPEC
 
 import boto3
 import duckdb
@@ -56,9 +67,9 @@ TIER2_COLUMNS = [
 
 def get_s3():
     cfg = get_r2_config()
-    return boto3.client("s3", endpoint_url=cfg.endpoint,
-                        aws_access_key_id=cfg.access_key_id,
-                        aws_secret_access_key=cfg.secret_access_key), cfg.bucket
+    return instrument_client(boto3.client("s3", endpoint_url=cfg.endpoint,
+                                          aws_access_key_id=cfg.access_key_id,
+                                          aws_secret_access_key=cfg.secret_access_key)), cfg.bucket
 
 def previous_sunday():
     today = datetime.now(timezone.utc).date()
@@ -101,24 +112,16 @@ def discover_weeks(s3, bucket, min_days=5):
     
     return weeks
 
-def sha256(path):
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
 # ==============================================================================
 # Core Processing with DuckDB
 # ==============================================================================
 
-def download_day(s3, bucket, day, temp_dir):
-    """Download one day's parquet."""
+def download_day(s3, bucket, day, temp_dir, expected_sha256=None):
+    """Download one day's parquet (via the shared tier cache)."""
     month_str = day[:7]
     key = f"{TIER3_PREFIX}/{month_str}/{day}/instrumetriq_tier3_daily_{day}.parquet"
     local_path = Path(temp_dir) / f"{day}.parquet"
-    s3.download_file(bucket, key, str(local_path))
-    return local_path
+    return get_cache().materialize(s3, bucket, key, local_path, expected_sha256=expected_sha256)
 
 
 def build_week(s3, bucket, end_day, upload=False, force=False):
@@ -132,13 +135,18 @@ def build_week(s3, bucket, end_day, upload=False, force=False):
     
     # Check which days exist
     present = []
-    for d in days:
-        try:
-            m = d[:7]
-            s3.head_object(Bucket=bucket, Key=f"{TIER3_PREFIX}/{m}/{d}/instrumetriq_tier3_daily_{d}.parquet")
-            present.append(d)
-        except:
-            pass
+    with stage("check_inputs"):
+        tier3_catalog = fetch_catalog_entries(s3, bucket, TIER3_PREFIX)
+        for d in days:
+            if d in tier3_catalog:
+                present.append(d)
+                continue
+            try:
+                m = d[:7]
+                s3.head_object(Bucket=bucket, Key=f"{TIER3_PREFIX}/{m}/{d}/instrumetriq_tier3_daily_{d}.parquet")
+                present.append(d)
+            except:
+                pass
     
     print(f"Window: {start_day} to {end_day}")
     print(f"Days present: {len(present)}/7 - {present}")
@@ -194,7 +202,10 @@ def build_week(s3, bucket, end_day, upload=False, force=False):
             print(f"  [{i+1}/{len(present)}] {day}...", end=" ", flush=True)
             
             # Download
-            src_path = download_day(s3, bucket, day, temp_dir)
+            with stage("download"):
+                src_path = download_day(
+                    s3, bucket, day, temp_dir, tier3_catalog.get(day, {}).get("sha256")
+                )
             out_path = temp_dir_path / f"tier2_{day}.parquet"
             
             # Process with DuckDB - one file only
@@ -227,19 +238,25 @@ def build_week(s3, bucket, end_day, upload=False, force=False):
         
         tier2_files = sorted(temp_dir_path.glob("tier2_*.parquet"))
         
-        # Read and concat with PyArrow - schemas should match now
-        import pyarrow.parquet as pq
-        import pyarrow as pa
-        
+        # Read (memory-mapped) and concat with PyArrow - schemas should match now
         tables = []
         for f in tier2_files:
-            t = pq.read_table(f)
+            t = read_columns(open_local_parquet(f), None)
             tables.append(t)
             print(f"    Read {f.name}: {t.num_rows} rows")
         
-        # Concat - this should work since schemas match after DuckDB processing
-        merged = pa.concat_tables(tables, promote_options="permissive")
-        pq.write_table(merged, parquet_path, compression="zstd")
+        # Concat - zero-copy when every day has the same schema fingerprint,
+        # otherwise one planned cast per drifted day to the unified schema
+        merged, concat_plan = concat_by_fingerprint(tables)
+        if concat_plan["path"] == "cast":
+            print(f"    [WARN] {concat_plan['fingerprints']} schemas across days; "
+                  f"cast {concat_plan['cast_tables']} tables to the unified schema")
+        schema_fp = record_partition_schema(TIER2_PREFIX, end_day, merged.schema)
+        
+        # In-build verification of the merged table (verify_tier2_weekly rule set)
+        verification = verification_block(TIER2_WEEKLY_SPEC, merged)
+        # sha256 is computed as the bytes are written
+        parquet_sha256, parquet_size = write_table_hashed(merged, parquet_path, compression="zstd")
         
         del tables
         del merged
@@ -261,30 +278,50 @@ def build_week(s3, bucket, end_day, upload=False, force=False):
         "days_missing": [d for d in days if d not in present],
         "row_count": total_rows,
         "build_ts": datetime.now(timezone.utc).isoformat(),
-        "parquet_sha256": sha256(parquet_path),
-        "parquet_size_bytes": parquet_path.stat().st_size,
+        "parquet_sha256": parquet_sha256,
+        "parquet_size_bytes": parquet_size,
+        "schema_fingerprint": schema_fp,
+        "verification": verification,
+        # R2 calls made by this process up to manifest creation (excludes the upload itself)
+        "r2_operations": get_metrics().snapshot(),
     }
     
     with open(manifest_path, "w") as f:
         json.dump(manifest, f, indent=2)
     print(f"  Manifest: {manifest_path}")
     
+    if not upload_allowed(verification):
+        return False
+    
     # Upload
     if upload:
         print(f"\nUploading to R2...")
         r2_prefix = f"{TIER2_PREFIX}/{end_day}"
         
-        for local, key in [(parquet_path, f"{r2_prefix}/dataset_entries_7d.parquet"),
-                           (manifest_path, f"{r2_prefix}/manifest.json")]:
-            if not force:
+        parquet_key = f"{r2_prefix}/dataset_entries_7d.parquet"
+        manifest_key = f"{r2_prefix}/manifest.json"
+        uploaded = []
+        with stage("upload"):
+            for local, key in [(parquet_path, parquet_key), (manifest_path, manifest_key)]:
+                if not force:
+                    try:
+                        s3.head_object(Bucket=bucket, Key=key)
+                        print(f"  [SKIP] {key} exists (use --force)")
+                        continue
+                    except:
+                        pass
+                s3.upload_file(str(local), bucket, key)
+                uploaded.append(key)
+                print(f"  [OK] {key}")
+            
+            if parquet_key in uploaded:
                 try:
-                    s3.head_object(Bucket=bucket, Key=key)
-                    print(f"  [SKIP] {key} exists (use --force)")
-                    continue
-                except:
-                    pass
-            s3.upload_file(str(local), bucket, key)
-            print(f"  [OK] {key}")
+                    upsert_catalog_entry(
+                        s3, bucket, TIER2_PREFIX, end_day,
+                        catalog_entry_from_manifest(manifest, parquet_key, manifest_key),
+                    )
+                except Exception as e:
+                    print(f"  [WARN] Catalog update failed: {e}")
     
     return True
 
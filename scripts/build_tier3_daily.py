@@ -29,8 +29,6 @@ Output:
 """
 
 import argparse
-import gzip
-import hashlib
 import json
 import os
 import sys
@@ -42,10 +40,16 @@ from typing import Iterator, Optional
 sys.path.insert(0, str(Path(__file__).parent))
 
 from r2_config import get_r2_config, R2Config
+from r2_metrics import instrument_client, stage
+from manifest_catalog import catalog_entry_from_manifest, upsert_catalog_entry
+from archive_index import iter_entries as iter_archive_entries
+from hashing_io import sha256_file, write_table_hashed
+from schema_registry import record_partition_schema
+from verify_engine import upload_allowed, verification_block
+from verify_tier3_daily import SPEC as TIER3_SPEC
 
 try:
     import pyarrow as pa
-    import pyarrow.parquet as pq
 except ImportError:
     print("[ERROR] pyarrow is required. Install with: pip install pyarrow", file=sys.stderr)
     sys.exit(1)
@@ -172,6 +176,10 @@ def iter_entries_from_file(filepath: Path) -> Iterator[dict]:
     """
     Iterate over entries in a gzipped JSONL file.
     
+    Closed hour files get their archive_index sidecar written as a by-product.
+    Undecodable lines are skipped and a file that fails to read is warned
+    about, keeping the entries read before the error.
+    
     Args:
         filepath: Path to .jsonl.gz file
         
@@ -179,15 +187,7 @@ def iter_entries_from_file(filepath: Path) -> Iterator[dict]:
         Parsed JSON entry dicts
     """
     try:
-        with gzip.open(filepath, "rt", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                if not line.strip():
-                    continue
-                try:
-                    yield json.loads(line)
-                except json.JSONDecodeError as e:
-                    print(f"[WARN] JSON decode error in {filepath.name}:{line_num}: {e}", file=sys.stderr)
-                    continue
+        yield from iter_archive_entries(filepath)
     except Exception as e:
         print(f"[WARN] Error reading {filepath}: {e}", file=sys.stderr)
 
@@ -507,7 +507,8 @@ def entries_to_parquet(entries: list[dict], output_path: Path) -> dict:
         output_path: Path to write .parquet file
         
     Returns:
-        Dict with metadata (row_count, schema_versions, min/max added_ts, dropped_columns)
+        Dict with metadata (row_count, schema_versions, min/max added_ts,
+        dropped_columns, verification, parquet_sha256)
     """
     if not entries:
         raise ValueError("No entries to export")
@@ -540,11 +541,14 @@ def entries_to_parquet(entries: list[dict], output_path: Path) -> dict:
             table = table.drop(col_name)
             dropped_columns.append(col_name)
     
+    # In-build verification of the exact table being written (verify_tier3_daily rules)
+    verification = verification_block(TIER3_SPEC, table)
+    
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Write with zstd compression
-    pq.write_table(
+    # Write with zstd compression; sha256 is computed as the bytes are written
+    parquet_sha256, _ = write_table_hashed(
         table,
         output_path,
         compression=PARQUET_COMPRESSION,
@@ -560,18 +564,11 @@ def entries_to_parquet(entries: list[dict], output_path: Path) -> dict:
         "min_added_ts": min_added_ts,
         "max_added_ts": max_added_ts,
         "dropped_columns": dropped_columns,
+        "verification": verification,
+        "parquet_sha256": parquet_sha256,
     }
 
 
-def compute_file_sha256(filepath: Path) -> str:
-    """Compute SHA256 hash of a file."""
-    sha256 = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
-
-
 def create_manifest(
     date_str: str,
     parquet_path: Path,
@@ -600,7 +597,8 @@ def create_manifest(
         "schema_versions": metadata["schema_versions"],
         "min_added_ts": metadata["min_added_ts"],
         "max_added_ts": metadata["max_added_ts"],
-        "parquet_sha256": compute_file_sha256(parquet_path),
+        "parquet_sha256": metadata.get("parquet_sha256") or sha256_file(parquet_path),
+        "parquet_size_bytes": parquet_path.stat().st_size,
         "compression": PARQUET_COMPRESSION,
         "tier": "tier3",
         "export_version": "1.3",
@@ -617,6 +615,8 @@ def create_manifest(
         "min_hours_threshold": min_hours,
         # Schema notes
         "dropped_columns": metadata.get("dropped_columns", []),
+        "schema_fingerprint": metadata.get("schema_fingerprint"),
+        "verification": metadata.get("verification"),
         "null_semantics": {
             "futures_raw": "NULL means no futures contract available or data unavailable for this symbol",
             "optional_structs": "NULL in struct columns indicates empty/unavailable data block",
@@ -631,12 +631,12 @@ def create_manifest(
 
 def create_s3_client(config: R2Config):
     """Create boto3 S3 client for R2."""
-    return boto3.client(
+    return instrument_client(boto3.client(
         "s3",
         endpoint_url=config.endpoint,
         aws_access_key_id=config.access_key_id,
         aws_secret_access_key=config.secret_access_key,
-    )
+    ))
 
 
 def check_r2_objects_exist(client, bucket: str, date_str: str) -> list[str]:
@@ -782,6 +782,9 @@ def export_tier3_daily(
     # Merge hour info into metadata for manifest
     metadata.update(hour_info)
     
+    # Schema fingerprint (manifest + local registry, for drift detection across days)
+    metadata["schema_fingerprint"] = record_partition_schema("tier3/daily", date_str, parquet_path)
+    
     # Create manifest
     print(f"\n[STEP 4] Creating manifest...")
     manifest = create_manifest(date_str, parquet_path, metadata, min_hours)
@@ -791,6 +794,9 @@ def export_tier3_daily(
     
     print(f"[OK] Wrote {manifest_path}")
     
+    if not upload_allowed(manifest["verification"]):
+        return 1
+    
     # Upload to R2 if requested
     if upload:
         print(f"\n[STEP 5] Uploading to R2...")
@@ -821,15 +827,25 @@ def export_tier3_daily(
         if existing and force:
             print(f"[WARN] Overwriting {len(existing)} existing objects (--force)")
         
-        # Upload parquet
-        print(f"  Uploading {r2_parquet_key}...")
-        if not upload_to_r2(client, config.bucket, parquet_path, r2_parquet_key, "application/octet-stream"):
-            return 1
-        
-        # Upload manifest
-        print(f"  Uploading {r2_manifest_key}...")
-        if not upload_to_r2(client, config.bucket, manifest_path, r2_manifest_key, "application/json"):
-            return 1
+        with stage("upload"):
+            # Upload parquet
+            print(f"  Uploading {r2_parquet_key}...")
+            if not upload_to_r2(client, config.bucket, parquet_path, r2_parquet_key, "application/octet-stream"):
+                return 1
+            
+            # Upload manifest
+            print(f"  Uploading {r2_manifest_key}...")
+            if not upload_to_r2(client, config.bucket, manifest_path, r2_manifest_key, "application/json"):
+                return 1
+            
+            # Record the partition in the tier catalog (readers fetch one object instead of N manifests)
+            try:
+                upsert_catalog_entry(
+                    client, config.bucket, "tier3/daily", date_str,
+                    catalog_entry_from_manifest(manifest, r2_parquet_key, r2_manifest_key),
+                )
+            except Exception as e:
+                print(f"[WARN] Catalog update failed for {date_str}: {e}", file=sys.stderr)
         
         print(f"[OK] Upload complete to {config.bucket}")
     else:
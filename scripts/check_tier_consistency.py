@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+Cross-Tier Consistency Check
+
+Verifies that a Tier 1 or Tier 2 export matches its Tier 3 source row for
+row. Every row of both sides is reduced to a fingerprint - a DuckDB hash()
+of the shared projected columns, each cast to the derived tier's type and
+rendered as text - keyed by (symbol, snapshot_ts). The two keyed
+fingerprint tables are then compared with one hash join:
+
+    missing_in_derived   key in Tier 3 only
+    extra_in_derived     key in the derived tier only
+    count_mismatch       key present in both with a different row count
+    value_mismatch       same rows count, different fingerprint
+    matched              identical
+
+For a sample of mismatched keys the per-column values are fetched from both
+sides and the differing columns are reported.
+
+Projection (derived column -> Tier 3 source):
+    Tier 1: TIER1_FIELD_SPEC in build_tier1_weekly.py (the daily DuckDB
+            TIER1_COL_SELECT path must produce the same values)
+    Tier 2: same-named columns; twitter_sentiment_last_cycle.* compares to
+            twitter_sentiment_windows.last_cycle.*
+Struct columns are compared leaf by leaf, so fields added by schema
+promotion (null in the derived tier, absent in a Tier 3 day) still match.
+
+Scans stream through DuckDB under a fixed memory limit (--memory-limit),
+with the aggregation spilling to a temp directory, and Tier 3 days are
+fingerprinted one file at a time, so a full month or week fits the budget.
+
+Usage:
+    # Tier 1 daily vs Tier 3 daily for one date / a date range
+    python3 scripts/check_tier_consistency.py --tier tier1 --date 2026-01-18
+    python3 scripts/check_tier_consistency.py --tier tier2 --from-date 2026-01-01 --to-date 2026-01-31
+
+    # Weekly export vs the Tier 3 days of its window
+    python3 scripts/check_tier_consistency.py --tier tier1 --week 2026-01-18
+
+    # Local files
+    python3 scripts/check_tier_consistency.py --tier tier1 \\
+        --derived-file output/tier1_daily/2026-01-18/data.parquet \\
+        --tier3-file /tmp/tier3_2026-01-18.parquet
+
+Output:
+    ./output/consistency/{tier}_{date}.json (weekly: {tier}_week_{end_day}.json)
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from r2_config import get_r2_config
+from r2_metrics import instrument_client, stage
+from tier_cache import get_cache
+from build_tier1_weekly import TIER1_FIELD_SPEC
+
+import boto3
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# ==============================================================================
+# Config
+# ==============================================================================
+
+OUTPUT_DIR = Path("./output/consistency")
+DEFAULT_MEMORY_LIMIT = "2GB"
+DEFAULT_THREADS = 2
+DEFAULT_MAX_SAMPLES = 20
+
+KEY_COLUMNS = ["symbol", "snapshot_ts"]
+
+# Derived column -> dotted Tier 3 source path
+TIER1_SOURCES = {
+    name: name if spec["source"] == "top_level" else spec["source"]
+    for name, spec in TIER1_FIELD_SPEC.items()
+}
+
+# Derived column prefixes that come from a different Tier 3 path (others map by name)
+TIER2_RENAMED = {
+    "twitter_sentiment_last_cycle": "twitter_sentiment_windows.last_cycle",
+}
+
+# Key placeholder for NULL symbol / snapshot_ts (keeps the join a plain equi-join)
+NULL_KEY = "<null>"
+
+
+# ==============================================================================
+# Helpers
+# ==============================================================================
+
+def get_s3():
+    cfg = get_r2_config()
+    return instrument_client(boto3.client(
+        "s3",
+        endpoint_url=cfg.endpoint,
+        aws_access_key_id=cfg.access_key_id,
+        aws_secret_access_key=cfg.secret_access_key,
+        region_name="auto",
+    )), cfg.bucket
+
+
+def date_range(from_date: str, to_date: str) -> list[str]:
+    start = datetime.strptime(from_date, "%Y-%m-%d").date()
+    end = datetime.strptime(to_date, "%Y-%m-%d").date()
+    return [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range((end - start).days + 1)]
+
+
+def week_days(end_day: str) -> list[str]:
+    end = datetime.strptime(end_day, "%Y-%m-%d").date()
+    return [(end - timedelta(days=6 - i)).strftime("%Y-%m-%d") for i in range(7)]
+
+
+def daily_key(tier: str, date: str) -> str:
+    return f"{tier}/daily/{date[:7]}/{date}/instrumetriq_{tier}_daily_{date}.parquet"
+
+
+def weekly_key(tier: str, end_day: str) -> str:
+    return f"{tier}/weekly/{end_day}/dataset_entries_7d.parquet"
+
+
+def quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def sql_path(parts: list[str]) -> str:
+    """DuckDB expression for a (possibly nested) column path."""
+    expr = quote_ident(parts[0])
+    for part in parts[1:]:
+        expr = f"struct_extract({expr}, '{part}')"
+    return expr
+
+
+def leaf_paths(schema: pa.Schema) -> list[list[str]]:
+    """Column paths with structs expanded down to their non-struct fields."""
+    paths = []
+
+    def walk(prefix, dtype):
+        if pa.types.is_struct(dtype):
+            for child in dtype:
+                walk(prefix + [child.name], child.type)
+        else:
+            paths.append(prefix)
+
+    for field in schema:
+        walk([field.name], field.type)
+    return paths
+
+
+def has_path(schema: pa.Schema, parts: list[str]) -> bool:
+    if parts[0] not in schema.names:
+        return False
+    dtype = schema.field(parts[0]).type
+    for part in parts[1:]:
+        if not pa.types.is_struct(dtype) or dtype.get_field_index(part) < 0:
+            return False
+        dtype = dtype.field(part).type
+    return True
+
+
+def source_path(tier: str, derived: list[str]) -> Optional[list[str]]:
+    """Tier 3 path a derived column path is projected from, or None if unmapped."""
+    if tier == "tier1":
+        source = TIER1_SOURCES.get(derived[0])
+        return source.split(".") + derived[1:] if source else None
+    renamed = TIER2_RENAMED.get(derived[0])
+    if renamed:
+        return renamed.split(".") + derived[1:]
+    return derived
+
+
+# ==============================================================================
+# Projection
+# ==============================================================================
+
+def build_projection(con, tier: str, derived_path: Path) -> tuple[list[dict], list[str]]:
+    """
+    Shared columns of a derived parquet and their Tier 3 sources.
+
+    Returns:
+        Tuple of ([{"name", "derived", "source", "type"}], unmapped column names).
+        Keys come first; "type" is the DuckDB type of the derived column.
+    """
+    schema = pq.read_schema(derived_path)
+    projection = []
+    unmapped = []
+    for parts in leaf_paths(schema):
+        source = source_path(tier, parts)
+        if source is None:
+            unmapped.append(".".join(parts))
+            continue
+        projection.append({"name": ".".join(parts), "derived": parts, "source": source})
+
+    missing_keys = [k for k in KEY_COLUMNS if k not in [p["name"] for p in projection]]
+    if missing_keys:
+        raise ValueError(f"Derived parquet has no key columns {missing_keys}")
+    projection.sort(key=lambda p: KEY_COLUMNS.index(p["name"]) if p["name"] in KEY_COLUMNS else len(KEY_COLUMNS))
+
+    # Derived types, used to cast the Tier 3 side before rendering
+    exprs = ", ".join(f"{sql_path(p['derived'])} AS c{i}" for i, p in enumerate(projection))
+    described = con.execute(f"DESCRIBE SELECT {exprs} FROM read_parquet('{derived_path}')").fetchall()
+    for p, row in zip(projection, described):
+        p["type"] = row[1]
+    return projection, unmapped
+
+
+def side_exprs(projection: list[dict], side: str, tier3_schema: Optional[pa.Schema] = None) -> list[str]:
+    """Text rendering of every projected column for one side."""
+    exprs = []
+    for p in projection:
+        if side == "derived":
+            expr = f"CAST({sql_path(p['derived'])} AS VARCHAR)"
+        elif has_path(tier3_schema, p["source"]):
+            expr = f"CAST(TRY_CAST({sql_path(p['source'])} AS {p['type']}) AS VARCHAR)"
+        else:
+            # Absent in this Tier 3 file: the derived tier can only hold NULL
+            expr = "CAST(NULL AS VARCHAR)"
+        exprs.append(expr)
+    return exprs
+
+
+def fingerprint_select(path: Path, exprs: list[str]) -> str:
+    """SELECT producing (k0, k1, h) for every row of a parquet."""
+    keys = ", ".join(f"coalesce({e}, '{NULL_KEY}') AS k{i}" for i, e in enumerate(exprs[:len(KEY_COLUMNS)]))
+    return f"SELECT {keys}, hash({', '.join(exprs)}) AS h FROM read_parquet('{path}')"
+
+
+def values_select(path: Path, exprs: list[str]) -> str:
+    """SELECT producing (k0, k1, v0..vN) for every row of a parquet."""
+    keys = ", ".join(f"coalesce({e}, '{NULL_KEY}') AS k{i}" for i, e in enumerate(exprs[:len(KEY_COLUMNS)]))
+    values = ", ".join(f"{e} AS v{i}" for i, e in enumerate(exprs))
+    return f"SELECT {keys}, {values} FROM read_parquet('{path}')"
+
+
+# ==============================================================================
+# Comparison
+# ==============================================================================
+
+def compare_files(
+    tier: str,
+    derived_path: Path,
+    tier3_paths: list[Path],
+    memory_limit: str = DEFAULT_MEMORY_LIMIT,
+    threads: int = DEFAULT_THREADS,
+    max_samples: int = DEFAULT_MAX_SAMPLES,
+) -> dict:
+    """
+    Compare a derived-tier parquet with its Tier 3 source file(s).
+
+    Returns:
+        Result dict with counts, mismatch samples and "consistent"
+    """
+    t0 = time.time()
+    with tempfile.TemporaryDirectory() as spill_dir:
+        con = duckdb.connect(":memory:")
+        con.execute(f"SET memory_limit='{memory_limit}'")
+        con.execute(f"SET threads={threads}")
+        con.execute(f"SET temp_directory='{spill_dir}'")
+        con.execute("SET preserve_insertion_order=false")
+
+        projection, unmapped = build_projection(con, tier, derived_path)
+        derived_exprs = side_exprs(projection, "derived")
+        tier3_schemas = [pq.read_schema(p) for p in tier3_paths]
+
+        # Keyed fingerprints: (k0, k1) -> row count, sum of row hashes
+        con.execute(f"""
+            CREATE TABLE derived_fp AS
+            SELECT k0, k1, count(*) AS n, sum(h) AS h
+            FROM ({fingerprint_select(derived_path, derived_exprs)})
+            GROUP BY k0, k1
+        """)
+        con.execute("CREATE TABLE tier3_parts (k0 VARCHAR, k1 VARCHAR, n BIGINT, h HUGEINT)")
+        for path, schema in zip(tier3_paths, tier3_schemas):
+            con.execute(f"""
+                INSERT INTO tier3_parts
+                SELECT k0, k1, count(*), sum(h)
+                FROM ({fingerprint_select(path, side_exprs(projection, 'tier3', schema))})
+                GROUP BY k0, k1
+            """)
+        con.execute("""
+            CREATE TABLE tier3_fp AS
+            SELECT k0, k1, sum(n) AS n, sum(h) AS h FROM tier3_parts GROUP BY k0, k1
+        """)
+        con.execute("DROP TABLE tier3_parts")
+
+        con.execute("""
+            CREATE TABLE joined AS
+            SELECT
+                coalesce(t.k0, d.k0) AS k0,
+                coalesce(t.k1, d.k1) AS k1,
+                CASE
+                    WHEN d.k0 IS NULL THEN 'missing_in_derived'
+                    WHEN t.k0 IS NULL THEN 'extra_in_derived'
+                    WHEN t.n <> d.n THEN 'count_mismatch'
+                    WHEN t.h <> d.h THEN 'value_mismatch'
+                    ELSE 'matched'
+                END AS status,
+                coalesce(t.n, 0) AS tier3_rows,
+                coalesce(d.n, 0) AS derived_rows
+            FROM tier3_fp t FULL OUTER JOIN derived_fp d ON t.k0 = d.k0 AND t.k1 = d.k1
+        """)
+        counts = dict(con.execute("SELECT status, count(*) FROM joined GROUP BY status").fetchall())
+        tier3_rows, derived_rows = con.execute(
+            "SELECT sum(tier3_rows), sum(derived_rows) FROM joined"
+        ).fetchone()
+        samples = con.execute(f"""
+            SELECT k0, k1, status, tier3_rows, derived_rows FROM joined
+            WHERE status <> 'matched' ORDER BY status, k0, k1 LIMIT {int(max_samples)}
+        """).fetchall()
+
+        # Per-column diff for sampled value mismatches
+        value_keys = [(s[0], s[1]) for s in samples if s[2] == "value_mismatch"]
+        column_diffs = {}
+        if value_keys:
+            con.execute("CREATE TABLE sample_keys (k0 VARCHAR, k1 VARCHAR)")
+            con.executemany("INSERT INTO sample_keys VALUES (?, ?)", value_keys)
+            derived_values = {
+                (row[0], row[1]): row[2:] for row in con.execute(
+                    f"SELECT v.* FROM ({values_select(derived_path, derived_exprs)}) v "
+                    "JOIN sample_keys USING (k0, k1)"
+                ).fetchall()
+            }
+            tier3_values = {}
+            for path, schema in zip(tier3_paths, tier3_schemas):
+                for row in con.execute(
+                    f"SELECT v.* FROM ({values_select(path, side_exprs(projection, 'tier3', schema))}) v "
+                    "JOIN sample_keys USING (k0, k1)"
+                ).fetchall():
+                    tier3_values.setdefault((row[0], row[1]), row[2:])
+            for key in value_keys:
+                left, right = tier3_values.get(key), derived_values.get(key)
+                if left is None or right is None:
+                    continue
+                column_diffs[f"{key[0]}|{key[1]}"] = {
+                    p["name"]: {"tier3": _clip(a), "derived": _clip(b)}
+                    for p, a, b in zip(projection, left, right) if a != b
+                }
+        con.close()
+
+    mismatched = sum(n for status, n in counts.items() if status != "matched")
+    return {
+        "tier": tier,
+        "derived_file": str(derived_path),
+        "tier3_files": [str(p) for p in tier3_paths],
+        "columns_compared": [p["name"] for p in projection],
+        "columns_unmapped": unmapped,
+        "tier3_rows": int(tier3_rows or 0),
+        "derived_rows": int(derived_rows or 0),
+        "keys": {status: counts.get(status, 0) for status in (
+            "matched", "missing_in_derived", "extra_in_derived", "count_mismatch", "value_mismatch",
+        )},
+        "samples": [
+            {"symbol": s[0], "snapshot_ts": s[1], "status": s[2], "tier3_rows": s[3], "derived_rows": s[4]}
+            for s in samples
+        ],
+        "column_diffs": column_diffs,
+        "consistent": mismatched == 0,
+        "elapsed_sec": round(time.time() - t0, 1),
+    }
+
+
+def _clip(value, limit: int = 120):
+    if isinstance(value, str) and len(value) > limit:
+        return value[:limit] + "..."
+    return value
+
+
+# ==============================================================================
+# Reporting
+# ==============================================================================
+
+def print_result(label: str, result: dict):
+    keys = result["keys"]
+    status = "[OK]" if result["consistent"] else "[FAIL]"
+    print(f"\n{status} {result['tier']} {label}: "
+          f"{result['derived_rows']:,} derived rows vs {result['tier3_rows']:,} Tier 3 rows "
+          f"({len(result['columns_compared'])} columns, {result['elapsed_sec']}s)")
+    for status_name in ("missing_in_derived", "extra_in_derived", "count_mismatch", "value_mismatch"):
+        if keys[status_name]:
+            print(f"  {status_name}: {keys[status_name]:,} keys")
+    if result["columns_unmapped"]:
+        print(f"  [WARN] Not compared (no Tier 3 source): {result['columns_unmapped']}")
+    for key, diffs in list(result["column_diffs"].items())[:5]:
+        print(f"  {key}: {sorted(diffs)}")
+
+
+def write_result(label: str, result: dict) -> Path:
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    path = OUTPUT_DIR / f"{result['tier']}_{label}.json"
+    with open(path, "w") as f:
+        json.dump(result, f, indent=2, default=str)
+    return path
+
+
+# ==============================================================================
+# R2 Inputs
+# ==============================================================================
+
+def fetch(s3, bucket: str, key: str, dest: Path) -> Optional[Path]:
+    """Materialize an R2 object through the tier cache, or None if it doesn't exist."""
+    try:
+        etag = s3.head_object(Bucket=bucket, Key=key)["ETag"]
+    except Exception:
+        return None
+    with stage("download"):
+        return get_cache().materialize(s3, bucket, key, dest, etag=etag)
+
+
+def check_partition(s3, bucket: str, tier: str, label: str, derived_key: str, tier3_days: list[str], args) -> Optional[dict]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        derived_path = fetch(s3, bucket, derived_key, temp_path / "derived.parquet")
+        if derived_path is None:
+            print(f"[WARN] {label}: {derived_key} not found; skipping")
+            return None
+        tier3_paths = []
+        for day in tier3_days:
+            path = fetch(s3, bucket, daily_key("tier3", day), temp_path / f"tier3_{day}.parquet")
+            if path is not None:
+                tier3_paths.append(path)
+        if not tier3_paths:
+            print(f"[WARN] {label}: no Tier 3 source found; skipping")
+            return None
+        return compare_files(tier, derived_path, tier3_paths, args.memory_limit, args.threads, args.max_samples)
+
+
+# ==============================================================================
+# CLI
+# ==============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Check Tier 1/2 exports against their Tier 3 source row for row")
+    parser.add_argument("--tier", required=True, choices=["tier1", "tier2"], help="Derived tier to check")
+    parser.add_argument("--date", help="Daily partition (YYYY-MM-DD)")
+    parser.add_argument("--from-date", help="Start date for a daily range")
+    parser.add_argument("--to-date", help="End date for a daily range")
+    parser.add_argument("--week", help="Weekly partition end day (YYYY-MM-DD)")
+    parser.add_argument("--derived-file", type=Path, help="Local derived-tier parquet")
+    parser.add_argument("--tier3-file", type=Path, nargs="+", help="Local Tier 3 parquet(s) it was built from")
+    parser.add_argument("--memory-limit", default=DEFAULT_MEMORY_LIMIT,
+                        help=f"DuckDB memory limit; larger scans spill to disk (default: {DEFAULT_MEMORY_LIMIT})")
+    parser.add_argument("--threads", type=int, default=DEFAULT_THREADS,
+                        help=f"DuckDB threads (default: {DEFAULT_THREADS})")
+    parser.add_argument("--max-samples", type=int, default=DEFAULT_MAX_SAMPLES,
+                        help=f"Mismatched keys to sample (default: {DEFAULT_MAX_SAMPLES})")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"CROSS-TIER CONSISTENCY: {args.tier} vs tier3")
+    print("=" * 60)
+
+    results = {}
+    if args.derived_file or args.tier3_file:
+        if not (args.derived_file and args.tier3_file):
+            parser.error("--derived-file and --tier3-file go together")
+        label = args.derived_file.stem
+        results[label] = compare_files(
+            args.tier, args.derived_file, args.tier3_file,
+            args.memory_limit, args.threads, args.max_samples,
+        )
+    else:
+        s3, bucket = get_s3()
+        if args.week:
+            partitions = [(f"week_{args.week}", weekly_key(args.tier, args.week), week_days(args.week))]
+        elif args.from_date and args.to_date:
+            partitions = [(d, daily_key(args.tier, d), [d]) for d in date_range(args.from_date, args.to_date)]
+        elif args.date:
+            partitions = [(args.date, daily_key(args.tier, args.date), [args.date])]
+        else:
+            parser.error("Specify --date, --from-date/--to-date, --week or --derived-file/--tier3-file")
+        for label, derived_key, tier3_days in partitions:
+            result = check_partition(s3, bucket, args.tier, label, derived_key, tier3_days, args)
+            if result is not None:
+                results[label] = result
+
+    for label, result in results.items():
+        print_result(label, result)
+        write_result(label, result)
+
+    inconsistent = [label for label, r in results.items() if not r["consistent"]]
+    print()
+    print("=" * 60)
+    print(f"Checked: {len(results)}  Inconsistent: {len(inconsistent)}")
+    print(f"Reports: {OUTPUT_DIR}/")
+    print("=" * 60)
+    return 1 if inconsistent else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
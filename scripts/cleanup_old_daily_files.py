@@ -31,6 +31,8 @@ from datetime import datetime, timedelta, timezone
 sys.path.insert(0, str(Path(__file__).parent))
 
 from r2_config import get_r2_config
+from r2_metrics import instrument_client
+from manifest_catalog import remove_catalog_entries
 
 
 def get_cutoff_date(retention_days=7):
@@ -122,6 +124,7 @@ def delete_old_files(s3, bucket, tier, cutoff_date, dry_run=False):
     print(f"[{tier.upper()}] Found {len(old_files)} files older than {cutoff_date}:")
     
     deleted_count = 0
+    deleted_dates = []
     for key, file_date in sorted(old_files, key=lambda x: x[1]):
         age_days = (datetime.now(timezone.utc).date() - file_date).days
         
@@ -146,6 +149,16 @@ def delete_old_files(s3, bucket, tier, cutoff_date, dry_run=False):
                 deleted_count += 1
             except Exception as e:
                 print(f"  ✗ Failed to delete {key}: {e}")
+                continue
+            deleted_dates.append(file_date.strftime("%Y-%m-%d"))
+    
+    # Keep the tier catalog in sync so readers don't see deleted days
+    if deleted_dates:
+        try:
+            remove_catalog_entries(s3, bucket, f"{tier}/daily", deleted_dates)
+            print(f"  ✓ Removed {len(deleted_dates)} entries from {tier}/daily/catalog.json")
+        except Exception as e:
+            print(f"  ✗ Failed to update catalog: {e}")
     
     return deleted_count
 
@@ -175,13 +188,13 @@ def main():
         print(f"[ERROR] Loading R2 config: {e}", file=sys.stderr)
         sys.exit(1)
     
-    s3 = boto3.client(
+    s3 = instrument_client(boto3.client(
         's3',
         endpoint_url=cfg.endpoint,
         aws_access_key_id=cfg.access_key_id,
         aws_secret_access_key=cfg.secret_access_key,
         region_name='auto'
-    )
+    ))
     
     cutoff_date = get_cutoff_date(args.retention_days)
     
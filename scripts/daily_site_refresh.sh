@@ -76,58 +76,25 @@ log "Site root: $SITE_ROOT"
 cd "$SITE_ROOT"
 
 # ============================================================
-# Step 1: Sync latest sample data from archive
+# Steps 1-4: Run the refresh task graph (scripts/task_graph.py)
+#   1. sync_sample        - sync latest sample data from archive
+#   2. public_samples     - public samples (Dataset page preview)
+#   3. site_artifacts     - archive stats (Status page), coverage table +
+#                           dataset overview (Dataset page), research
+#                           artifacts (Research page), sentiment time series
+#   4. daily_update_post  - daily update post (Updates page)
+#   Independent steps run concurrently; steps whose inputs are unchanged
+#   since their last successful run are skipped. Per-step wall time and
+#   peak RSS are appended to output/task_metrics.jsonl.
 # ============================================================
-log_section "Step 1: Sync sample data from archive"
+log_section "Steps 1-4: Generate site data"
 
-run_cmd "python3 scripts/sync_from_archive.py --n 200 --archive-path $ARCHIVE_PATH"
+run_cmd "python3 scripts/task_graph.py daily_refresh --archive-path $ARCHIVE_PATH"
 
 # ============================================================
-# Step 2: Generate archive statistics (Status page)
+# Step 5: Commit changes to git (if any)
 # ============================================================
-log_section "Step 2: Generate archive stats"
-
-run_cmd "python3 scripts/generate_archive_stats.py --archive-path $ARCHIVE_PATH"
-
-# ============================================================
-# Step 3: Generate public samples (Dataset page preview)
-# ============================================================
-log_section "Step 3: Generate public samples"
-
-run_cmd "python3 scripts/generate_public_samples.py"
-
-# ============================================================
-# Step 4: Generate coverage table (Dataset page)
-# ============================================================
-log_section "Step 4: Generate coverage table"
-
-run_cmd "python3 scripts/generate_coverage_table.py"
-
-# ============================================================
-# Step 5: Generate dataset overview (Dataset page)
-# ============================================================
-log_section "Step 5: Generate dataset overview"
-
-run_cmd "python3 scripts/generate_dataset_overview.py"
-
-# ============================================================
-# Step 6: Generate research artifacts (Research page)
-# ============================================================
-log_section "Step 6: Generate research artifacts"
-
-run_cmd "python3 scripts/generate_research_artifacts.py --archive-path $ARCHIVE_PATH"
-
-# ============================================================
-# Step 6b: Generate daily update post (Updates page)
-# ============================================================
-log_section "Step 6b: Generate daily update post"
-
-run_cmd "python3 scripts/generate_daily_update_post.py"
-
-# ============================================================
-# Step 7: Commit changes to git (if any)
-# ============================================================
-log_section "Step 7: Check for changes"
+log_section "Step 5: Check for changes"
 
 # Check if there are changes in public/data/ or src/content/updates/
 if git diff --quiet public/data/ src/content/updates/; then
@@ -141,9 +108,9 @@ else
 fi
 
 # ============================================================
-# Step 8: Trigger Cloudflare Pages rebuild (via webhook or wrangler)
+# Step 6: Trigger Cloudflare Pages rebuild (via webhook or wrangler)
 # ============================================================
-log_section "Step 8: Trigger Cloudflare rebuild"
+log_section "Step 6: Trigger Cloudflare rebuild"
 
 # Option A: Use Cloudflare deploy hook (if configured)
 if [[ -n "$CLOUDFLARE_DEPLOY_HOOK" ]]; then
@@ -1,17 +1,19 @@
 #!/usr/bin/env python3
 """
 Publisher script for instrumetriq-site
-Runs CryptoBot exporter and generates daily update posts
+Runs CryptoBot exporter and artifact builders (via task_graph.py) and
+generates daily update posts
 """
 
 import argparse
 import json
-import os
-import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from task_graph import Task, run_graph
+
 # ASCII-only mode for OS-agnostic operation (Windows + Linux safe)
 ASCII_MODE = True
 
@@ -24,6 +26,9 @@ SUMMARY_MARK = "[SUMMARY]" if ASCII_MODE else "📊"
 SUCCESS_MARK = "[SUCCESS]" if ASCII_MODE else "✅"
 START_MARK = "[START]" if ASCII_MODE else "🚀"
 
+# Python executable for the generator subprocesses
+PYTHON_CMD = sys.executable if sys.executable else "python"
+
 
 def get_repo_paths():
     """Determine repository paths relative to instrumetriq-site root."""
@@ -51,8 +56,8 @@ def ensure_directories(paths):
     print(f"  - {paths['updates_dir']}")
 
 
-def run_exporter(paths, scan_limit=None):
-    """Run CryptoBot exporter as subprocess."""
+def exporter_task(paths, scan_limit=None):
+    """Task running the CryptoBot exporter (status.json, status_history.jsonl)."""
     if not paths["cryptobot_exporter"].exists():
         print(f"{ERROR_MARK} CryptoBot exporter not found at {paths['cryptobot_exporter']}")
         sys.exit(1)
@@ -61,131 +66,88 @@ def run_exporter(paths, scan_limit=None):
         print(f"{ERROR_MARK} CryptoBot archive not found at {paths['cryptobot_archive']}")
         sys.exit(1)
     
-    # Build environment variables
-    env = os.environ.copy()
-    env["ARCHIVE_BASE_PATH"] = str(paths["cryptobot_archive"])
-    env["OUTPUT_DIR"] = str(paths["output_dir"])
-    env["PYTHONIOENCODING"] = "utf-8"  # Fix Unicode output issues
-    
+    env = {
+        "ARCHIVE_BASE_PATH": str(paths["cryptobot_archive"]),
+        "OUTPUT_DIR": str(paths["output_dir"]),
+        "PYTHONIOENCODING": "utf-8",  # Fix Unicode output issues
+    }
     if scan_limit:
         env["DATASET_SCAN_LIMIT"] = str(scan_limit)
         print(f"  Using scan limit: {scan_limit}")
     
-    print(f"\n{RUNNING_MARK} Running CryptoBot exporter...")
-    print(f"  Archive: {paths['cryptobot_archive']}")
-    print(f"  Output: {paths['output_dir']}")
-    
-    # Determine python executable
-    python_cmd = sys.executable if sys.executable else "python"
-    
-    try:
-        result = subprocess.run(
-            [python_cmd, str(paths["cryptobot_exporter"])],
-            env=env,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            check=True
-        )
-        print(result.stdout)
-        if result.stderr:
-            print("Warnings:", result.stderr, file=sys.stderr)
-        print(f"{OK_MARK} Exporter completed successfully")
-    except subprocess.CalledProcessError as e:
-        print(f"{ERROR_MARK} Exporter failed with code {e.returncode}")
-        print("STDOUT:", e.stdout)
-        print("STDERR:", e.stderr)
-        sys.exit(1)
+    # No outputs declared, so it always runs: every publish appends a
+    # status_history.jsonl row, and the update post's delta compares the
+    # last two rows against status.json
+    return Task("exporter", (PYTHON_CMD, str(paths["cryptobot_exporter"])), env=env)
 
 
-def run_semantic_artifacts(paths, scan_limit=None):
-    """Run semantic artifacts builder as subprocess."""
+def semantic_task(paths, scan_limit=None):
+    """Task running the semantic artifacts builder (None if the script is missing)."""
     semantic_script = paths["site_root"] / "scripts" / "build_semantic_artifacts.py"
     
     if not semantic_script.exists():
         print(f"{WARN_MARK} Semantic artifacts builder not found at {semantic_script}")
         print(f"  Skipping semantic artifacts generation")
-        return
-    
-    # Build environment variables
-    env = os.environ.copy()
-    env["ARCHIVE_BASE_PATH"] = str(paths["cryptobot_archive"])
-    env["OUTPUT_DIR"] = str(paths["output_dir"])
-    env["PYTHONIOENCODING"] = "utf-8"
+        return None
     
+    env = {
+        "ARCHIVE_BASE_PATH": str(paths["cryptobot_archive"]),
+        "OUTPUT_DIR": str(paths["output_dir"]),
+        "PYTHONIOENCODING": "utf-8",
+    }
     if scan_limit:
         env["SEMANTIC_SCAN_LIMIT"] = str(scan_limit)
     
-    print(f"\n{RUNNING_MARK} Running semantic artifacts builder...")
-    print(f"  Archive: {paths['cryptobot_archive']}")
-    print(f"  Output: {paths['output_dir']}")
-    
-    # Determine python executable
-    python_cmd = sys.executable if sys.executable else "python"
-    
-    try:
-        result = subprocess.run(
-            [python_cmd, str(semantic_script)],
-            env=env,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            check=True
-        )
-        print(result.stdout)
-        if result.stderr:
-            print("Warnings:", result.stderr, file=sys.stderr)
-        print(f"{OK_MARK} Semantic artifacts generated successfully")
-    except subprocess.CalledProcessError as e:
-        print(f"{WARN_MARK} Semantic artifacts builder failed with code {e.returncode}")
-        print("STDOUT:", e.stdout)
-        print("STDERR:", e.stderr)
-        print(f"  Continuing without semantic artifacts")
-
-
-def run_overview_artifacts(paths):
-    """Run dataset overview artifacts builder as subprocess."""
+    # Outputs are not declared (the builder decides), so it always runs
+    return Task("semantic_artifacts", (PYTHON_CMD, str(semantic_script)), env=env, optional=True)
+
+
+def overview_task(paths):
+    """Task running the dataset overview artifacts builder (None if the script is missing)."""
     overview_script = paths["site_root"] / "scripts" / "build_dataset_overview_artifacts.py"
     
     if not overview_script.exists():
         print(f"{WARN_MARK} Overview artifacts builder not found at {overview_script}")
         print(f"  Skipping overview artifacts generation")
-        return
+        return None
     
-    # Build environment variables
-    env = os.environ.copy()
-    env["ARCHIVE_BASE_PATH"] = str(paths["cryptobot_archive"])
-    env["PYTHONIOENCODING"] = "utf-8"
+    env = {
+        "ARCHIVE_BASE_PATH": str(paths["cryptobot_archive"]),
+        "PYTHONIOENCODING": "utf-8",
+    }
+    return Task("overview_artifacts", (PYTHON_CMD, str(overview_script)), env=env, optional=True)
+
+
+def run_generators(paths, scan_limit=None, overview=True, jobs=3):
+    """
+    Run the exporter and the semantic and overview builders concurrently.
+
+    All three read ARCHIVE_BASE_PATH independently. The builders are only
+    added when their scripts exist, so without them the graph is the
+    exporter alone. The exporter is required (exit on failure); semantic
+    and overview builder failures are warnings.
+    """
+    tasks = [exporter_task(paths, scan_limit=scan_limit), semantic_task(paths, scan_limit=scan_limit)]
+    if overview:
+        tasks.append(overview_task(paths))
+    else:
+        print(f"{WARN_MARK} Skipping overview artifacts (--no-overview-artifacts)")
+    tasks = [t for t in tasks if t is not None]
     
-    print(f"\n{RUNNING_MARK} Running dataset overview artifacts builder...")
+    print(f"\n{RUNNING_MARK} Running {', '.join(t.name for t in tasks)} (jobs={jobs})...")
     print(f"  Archive: {paths['cryptobot_archive']}")
     print(f"  Output: {paths['output_dir']}")
     
-    # Determine python executable
-    python_cmd = sys.executable if sys.executable else "python"
-    
-    try:
-        result = subprocess.run(
-            [python_cmd, str(overview_script)],
-            env=env,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            check=True
-        )
-        print(result.stdout)
-        if result.stderr:
-            print("Warnings:", result.stderr, file=sys.stderr)
-        print(f"{OK_MARK} Overview artifacts generated successfully")
-    except subprocess.CalledProcessError as e:
-        print(f"{WARN_MARK} Overview artifacts builder failed with code {e.returncode}")
-        print("STDOUT:", e.stdout)
-        print("STDERR:", e.stderr)
-        print(f"  Continuing without overview artifacts")
-
+    ok = run_graph(
+        tasks,
+        jobs=jobs,
+        state_file=paths["site_root"] / "output" / "task_state.json",
+        metrics_file=paths["site_root"] / "output" / "task_metrics.jsonl",
+    )
+    if not ok:
+        print(f"{ERROR_MARK} Exporter failed")
+        sys.exit(1)
+    print(f"{OK_MARK} Generators completed")
 
 
 def verify_outputs(paths):
@@ -358,6 +320,12 @@ def main():
         action="store_true",
         help="Skip dataset overview artifacts generation"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=3,
+        help="Generators to run concurrently (default: 3)"
+    )
     
     args = parser.parse_args()
     
@@ -372,17 +340,13 @@ def main():
     # Step 2: Ensure directories
     ensure_directories(paths)
     
-    # Step 3: Run exporter
-    run_exporter(paths, scan_limit=args.scan_limit)
-    
-    # Step 4: Generate semantic artifacts
-    run_semantic_artifacts(paths, scan_limit=args.scan_limit)
-    
-    # Step 5: Generate dataset overview artifacts
-    if not args.no_overview_artifacts:
-        run_overview_artifacts(paths)
-    else:
-        print(f"{WARN_MARK} Skipping overview artifacts (--no-overview-artifacts)")
+    # Steps 3-5: Exporter, semantic and dataset overview artifacts (concurrent)
+    run_generators(
+        paths,
+        scan_limit=args.scan_limit,
+        overview=not args.no_overview_artifacts,
+        jobs=args.jobs,
+    )
     
     # Step 6: Verify outputs
     status_data = verify_outputs(paths)
@@ -5,18 +5,31 @@ Archive Statistics Builder
 Generates archive_stats.json with full archive scale metrics.
 Must be run locally (Cloudflare build cannot access local paths).
 Output is committed to repo under public/data/.
+
+With --incremental, per-file counts are persisted in a state file keyed by
+(name, size, mtime) and only new or modified hour files are recounted. Day
+folders whose files were all closed at the last run and whose directory
+mtime is unchanged are reused without stat-ing their files, so a daily run
+touches roughly one day of new data. The output is identical to a full scan.
 """
 
 import json
-import gzip
+import os
 import sys
+import tempfile
 from pathlib import Path
 from datetime import datetime, timezone
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from archive_index import ensure_index, is_closed
 
 
 # Configuration
 DEFAULT_ARCHIVE_PATH = Path(r"D:\Sentiment-Data\CryptoBot\data\archive")
 OUTPUT_FILE = Path("public/data/archive_stats.json")
+STATE_FILE = Path("output/archive_stats_state.json")
+STATE_VERSION = 1
 
 
 def find_archive_folders(archive_path: Path) -> list:
@@ -43,75 +56,182 @@ def find_archive_folders(archive_path: Path) -> list:
     return folders
 
 
-def count_entries_in_file(filepath: Path) -> int:
+def read_file_index(filepath: Path) -> dict:
     """
-    Count entries in a .jsonl or .jsonl.gz file.
+    Sidecar index of a .jsonl or .jsonl.gz file (archive_index.py).
+    
+    The file is only read when the sidecar is missing or stale. If reading
+    fails the result carries "read_error" and covers the lines read before
+    the error (none if the file could not be opened).
     
     Args:
         filepath: Path to JSONL file
     
     Returns:
-        Number of entries
+        Index dict with at least line_count and last_entry_ts
     """
-    count = 0
-    
     try:
-        if filepath.suffix == '.gz':
-            with gzip.open(filepath, 'rt', encoding='utf-8') as f:
-                for _ in f:
-                    count += 1
-        else:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                for _ in f:
-                    count += 1
+        return ensure_index(filepath)
     except Exception as e:
         print(f"[WARN] Failed to read {filepath}: {e}", file=sys.stderr)
+        return {"line_count": 0, "last_entry_ts": None, "read_error": str(e)}
+
+
+def count_entries_in_file(filepath: Path) -> int:
+    """
+    Count entries in a .jsonl or .jsonl.gz file.
+    
+    A file that fails to read part-way (e.g. a truncated gzip) counts the
+    lines before the error.
+    
+    Args:
+        filepath: Path to JSONL file
     
-    return count
+    Returns:
+        Number of entries
+    """
+    return read_file_index(filepath)["line_count"]
 
 
 def get_last_entry_timestamp(filepath: Path) -> str | None:
     """
     Get timestamp from last entry in a JSONL file.
     
+    The sidecar index records the last entry's meta.added_ts / added_ts /
+    timestamp / ts.
+    
     Args:
         filepath: Path to JSONL file
     
     Returns:
         ISO timestamp string or None
     """
+    return read_file_index(filepath)["last_entry_ts"]
+
+
+def load_state(state_path: Path, archive_path: Path) -> dict:
+    """
+    Load persisted per-folder counts.
+    
+    A missing, unreadable or foreign state file (other version or archive
+    root) yields an empty state, i.e. a full scan.
+    
+    Args:
+        state_path: Path to state JSON
+        archive_path: Archive root the state must belong to
+    
+    Returns:
+        State dictionary with a "folders" mapping
+    """
+    empty = {"state_version": STATE_VERSION, "source_path": str(archive_path), "folders": {}}
     try:
-        if filepath.suffix == '.gz':
-            with gzip.open(filepath, 'rt', encoding='utf-8') as f:
-                lines = f.readlines()
-        else:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        
-        if lines:
-            last_entry = json.loads(lines[-1])
-            # Try common timestamp fields
-            for field in ['meta.added_ts', 'added_ts', 'timestamp', 'ts']:
-                parts = field.split('.')
-                value = last_entry
-                for part in parts:
-                    value = value.get(part) if isinstance(value, dict) else None
-                    if value is None:
-                        break
-                if value:
-                    return value
-    except Exception as e:
-        print(f"[WARN] Failed to extract timestamp from {filepath}: {e}", file=sys.stderr)
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return empty
+    
+    if state.get("state_version") != STATE_VERSION or state.get("source_path") != str(archive_path):
+        print("[INFO] State file is from another version or archive, rescanning everything")
+        return empty
+    return state
+
+
+def save_state(state: dict, state_path: Path):
+    """
+    Atomically write the state file.
+    
+    Args:
+        state: State dictionary
+        state_path: Path to state JSON
+    """
+    try:
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=state_path.parent, prefix=".tmp_")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(tmp, state_path)
+    except OSError as e:
+        print(f"[WARN] Could not write state file {state_path}: {e}", file=sys.stderr)
+
+
+def scan_folder(folder: Path, cached: Optional[dict] = None, indexes: Optional[dict] = None) -> dict:
+    """
+    Count entries in one archive folder, reusing cached per-file counts.
+    
+    Files whose size and mtime match the cached record are not reopened.
+    The newest file (by mtime) supplies the folder's last entry timestamp.
+    A file that failed to read counts what was read this run but gets no
+    record, and its folder is not marked closed, so it is retried next run.
+    
+    Args:
+        folder: YYYYMMDD archive folder
+        cached: Folder record from a previous run (or None)
+        indexes: {hour_file: sidecar index} built by a scan that already
+            read those files (archive_scan.py); used while still current
+    
+    Returns:
+        Folder record: entries, last_entry_ts, closed, dir_mtime_ns, files
+    """
+    cached_files = (cached or {}).get("files", {})
+    
+    # Find all .jsonl and .jsonl.gz files
+    jsonl_files = list(folder.glob("*.jsonl")) + list(folder.glob("*.jsonl.gz"))
+    stats = {fp: fp.stat() for fp in jsonl_files}
+    jsonl_files.sort(key=lambda p: stats[p].st_mtime)
+    
+    files = {}
+    entries = 0
+    recounted = 0
+    failed = 0
+    last_ts = None
+    for filepath in jsonl_files:
+        st = stats[filepath]
+        record = cached_files.get(filepath.name)
+        if not record or record["size"] != st.st_size or record["mtime_ns"] != st.st_mtime_ns:
+            index = (indexes or {}).get(filepath)
+            if index is None or index["source"] != {"name": filepath.name, "size": st.st_size,
+                                                    "mtime_ns": st.st_mtime_ns}:
+                index = read_file_index(filepath)
+            record = {
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "line_count": index["line_count"],
+                "last_entry_ts": index["last_entry_ts"],
+            }
+            recounted += 1
+            if "read_error" in index:
+                failed += 1
+                entries += record["line_count"]
+                last_ts = record["last_entry_ts"]
+                continue
+        files[filepath.name] = record
+        entries += record["line_count"]
+        last_ts = record["last_entry_ts"]
     
-    return None
+    if cached is not None and recounted:
+        print(f"[INFO] {folder.name}: recounted {recounted} of {len(jsonl_files)} files")
+    if failed:
+        print(f"[WARN] {folder.name}: {failed} files failed to read; they will be recounted next run")
+    
+    return {
+        "entries": entries,
+        "last_entry_ts": last_ts,
+        "closed": not failed and all(is_closed(fp) for fp in jsonl_files),
+        # Taken after counting: writing sidecars may touch the directory
+        "dir_mtime_ns": folder.stat().st_mtime_ns,
+        "files": files,
+    }
 
 
-def build_archive_stats(archive_path: Path) -> dict:
+def build_archive_stats(archive_path: Path, state: Optional[dict] = None, indexes: Optional[dict] = None) -> dict:
     """
     Build archive statistics from full archive.
     
     Args:
         archive_path: Path to archive root directory
+        state: Persisted state from load_state() for an incremental run;
+            updated in place (None = full scan)
+        indexes: Sidecar indexes from a shared scan (see scan_folder)
     
     Returns:
         Dictionary with archive statistics
@@ -125,27 +245,38 @@ def build_archive_stats(archive_path: Path) -> dict:
     print(f"[INFO] Found {len(folders)} archive folders")
     print(f"[INFO] Date range: {folders[0].name} to {folders[-1].name}")
     
+    cached_folders = state["folders"] if state is not None else {}
+    scanned_folders = {}
+    reused = 0
     total_entries = 0
     last_entry_ts = None
     
     # Count entries in all folders
     for folder in folders:
-        folder_entries = 0
-        
-        # Find all .jsonl and .jsonl.gz files
-        jsonl_files = list(folder.glob("*.jsonl")) + list(folder.glob("*.jsonl.gz"))
-        jsonl_files.sort(key=lambda p: p.stat().st_mtime)
-        
-        for filepath in jsonl_files:
-            count = count_entries_in_file(filepath)
-            folder_entries += count
+        cached = cached_folders.get(folder.name)
+        if (
+            cached is not None
+            and cached["closed"]
+            and cached["dir_mtime_ns"] == folder.stat().st_mtime_ns
+        ):
+            # Every file was closed and none was added or removed since
+            record = cached
+            reused += 1
+        else:
+            record = scan_folder(folder, cached if state is not None else None, indexes)
+        scanned_folders[folder.name] = record
         
         # Get last entry timestamp from newest file in last folder
-        if folder == folders[-1] and jsonl_files:
-            last_entry_ts = get_last_entry_timestamp(jsonl_files[-1])
+        if folder == folders[-1]:
+            last_entry_ts = record["last_entry_ts"]
         
-        total_entries += folder_entries
-        print(f"[INFO] {folder.name}: {folder_entries} entries")
+        total_entries += record["entries"]
+        print(f"[INFO] {folder.name}: {record['entries']} entries")
+    
+    if state is not None:
+        state["folders"] = scanned_folders
+        print(f"[INFO] Incremental: {reused} closed folders reused, "
+              f"{len(folders) - reused} scanned")
     
     # Parse date strings
     first_day = folders[0].name  # YYYYMMDD
@@ -193,6 +324,17 @@ def main():
         default=DEFAULT_ARCHIVE_PATH,
         help=f"Path to archive root (default: {DEFAULT_ARCHIVE_PATH})"
     )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help="Reuse persisted per-file counts and recount only new or modified files"
+    )
+    parser.add_argument(
+        '--state-file',
+        type=Path,
+        default=STATE_FILE,
+        help=f"State file for --incremental (default: {STATE_FILE})"
+    )
     
     args = parser.parse_args()
     
@@ -202,7 +344,10 @@ def main():
     print()
     
     # Build stats
-    stats = build_archive_stats(args.archive_path)
+    state = load_state(args.state_file, args.archive_path) if args.incremental else None
+    stats = build_archive_stats(args.archive_path, state)
+    if state is not None:
+        save_state(state, args.state_file)
     
     # Write output
     write_stats(stats, OUTPUT_FILE)
@@ -9,26 +9,44 @@ Examples are computed deterministically from sample entries:
 - Numeric fields: median value
 - Counts: median count
 - Ranges: p10-p90
+
+The fields behind the examples are extracted from the entries once into
+Arrow columns (numeric_columns.py); medians, ranges and zero shares are
+then computed vectorized.
 """
 
 import json
-import math
-import statistics
+import sys
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from numeric_columns import extract_columns
+
 
-def get_nested_value(obj, path):
-    """Safely navigate nested dict using dot-separated path."""
-    parts = path.split('.')
-    current = obj
-    for part in parts:
-        if not isinstance(current, dict):
-            return None
-        if part not in current:
-            return None
-        current = current[part]
-    return current
+INSTRUMETRIQ_ROOT = Path(__file__).resolve().parent.parent
+COVERAGE_FILE = INSTRUMETRIQ_ROOT / 'data' / 'field_coverage_report.json'
+SAMPLE_FILE = INSTRUMETRIQ_ROOT / 'data' / 'samples' / 'cryptobot_latest_head200.jsonl'
+OUTPUT_FILE = INSTRUMETRIQ_ROOT / 'public' / 'data' / 'coverage_table.json'
+
+# Candidate paths the examples are computed from (extracted in one pass)
+NUMERIC_PATHS = [
+    'derived.spread_bps',
+    'derived.depth_imbalance',
+    'derived.liq_global_pct',
+    'derived.liq_self_pct',
+    'derived.depth_weighted',
+    'derived.depth_skew',
+    'twitter_sentiment_windows.last_cycle.posts_total',
+    'twitter_sentiment_windows.last_cycle.lexicon_sentiment.score',
+    'twitter_sentiment_windows.last_cycle.hybrid_decision_stats.posts_scored',
+    'twitter_sentiment_windows.last_2_cycles.posts_total',
+    'twitter_sentiment_windows.last_2_cycles.lexicon_sentiment.score',
+    'twitter_sentiment_windows.last_2_cycles.hybrid_decision_stats.posts_scored',
+    'twitter_sentiment_windows.last_cycle.author_stats.distinct_authors_total',
+    'twitter_sentiment_windows.last_cycle.author_stats.followers_count_mean',
+]
+LENGTH_PATHS = ['spot_prices']
 
 
 def find_best_path(coverage_lookup, *candidates):
@@ -39,85 +57,17 @@ def find_best_path(coverage_lookup, *candidates):
     return None
 
 
-def extract_numeric_values(entries, path):
-    """Extract all valid numeric values from entries for a given path."""
-    values = []
-    for entry in entries:
-        val = get_nested_value(entry, path)
-        if val is not None:
-            # Handle numeric types
-            if isinstance(val, (int, float)):
-                # Skip NaN and Inf
-                if not math.isnan(val) and not math.isinf(val):
-                    values.append(val)
-    return values
-
-
-def compute_median(entries, path):
-    """Compute median of numeric values."""
-    values = extract_numeric_values(entries, path)
-    return statistics.median(values) if values else None
-
-
-def compute_percentile(values, p):
-    """Compute percentile p (0-100) from sorted values."""
-    if not values:
-        return None
-    sorted_vals = sorted(values)
-    idx = int(len(sorted_vals) * p / 100.0)
-    idx = min(idx, len(sorted_vals) - 1)
-    return sorted_vals[idx]
-
-
-def compute_p10_p90(entries, path):
-    """Compute p10-p90 range."""
-    values = extract_numeric_values(entries, path)
-    if not values:
-        return None, None
-    p10 = compute_percentile(values, 10)
-    p90 = compute_percentile(values, 90)
-    return p10, p90
-
-
-def count_array_lengths(entries, path):
-    """Count lengths of arrays at path, return median length."""
-    lengths = []
-    for entry in entries:
-        val = get_nested_value(entry, path)
-        if val is not None and isinstance(val, list):
-            lengths.append(len(val))
-    return statistics.median(lengths) if lengths else None
-
-
-def count_zero_values(entries, path):
-    """Count how many entries have value == 0 at path."""
-    total = 0
-    zeros = 0
-    for entry in entries:
-        val = get_nested_value(entry, path)
-        if val is not None and isinstance(val, (int, float)):
-            total += 1
-            if val == 0:
-                zeros += 1
-    return (zeros / total * 100.0) if total > 0 else None
-
-
-def main():
-    instrumetriq_root = Path(__file__).resolve().parent.parent
-    coverage_file = instrumetriq_root / 'data' / 'field_coverage_report.json'
-    sample_file = instrumetriq_root / 'data' / 'samples' / 'cryptobot_latest_head200.jsonl'
-    output_file = instrumetriq_root / 'public' / 'data' / 'coverage_table.json'
+def build_coverage_table(entries, coverage):
+    """
+    Build the coverage table artifact.
     
-    print("=" * 70)
-    print("Building Coverage Table (Phase 1B)")
-    print("=" * 70)
-    print()
-    
-    # Load coverage report
-    print("[LOAD] field_coverage_report.json...")
-    with open(coverage_file, 'r', encoding='utf-8') as f:
-        coverage = json.load(f)
+    Args:
+        entries: Sample entries used for the example values
+        coverage: Parsed field_coverage_report.json
     
+    Returns:
+        coverage_table.json dictionary
+    """
     entries_scanned = coverage['entries_scanned']
     
     # Build coverage lookup
@@ -134,14 +84,7 @@ def main():
     print(f"[INFO] Loaded {len(coverage_lookup)} field paths")
     print()
     
-    # Load sample entries for examples
-    print("[LOAD] cryptobot_latest_head200.jsonl...")
-    entries = []
-    with open(sample_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            entries.append(json.loads(line))
-    print(f"[INFO] Loaded {len(entries)} sample entries")
-    print()
+    columns = extract_columns(entries, NUMERIC_PATHS, LENGTH_PATHS)
     
     # Define feature groups with candidate paths
     print("[BUILD] Evaluating feature groups...")
@@ -154,7 +97,7 @@ def main():
     
     checks_micro = []
     if spread_bps_path and coverage_lookup[spread_bps_path]['present_pct'] > 0:
-        median_spread = compute_median(entries, spread_bps_path)
+        median_spread = columns.median(spread_bps_path)
         checks_micro.append({
             'label': 'Spread (bps)',
             'path': spread_bps_path,
@@ -164,7 +107,7 @@ def main():
         })
     
     if depth_imb_path and coverage_lookup[depth_imb_path]['present_pct'] > 0:
-        median_imb = compute_median(entries, depth_imb_path)
+        median_imb = columns.median(depth_imb_path)
         checks_micro.append({
             'label': 'Depth imbalance',
             'path': depth_imb_path,
@@ -188,7 +131,7 @@ def main():
     
     checks_liq = []
     if liq_global_path and coverage_lookup[liq_global_path]['present_pct'] > 0:
-        median_global = compute_median(entries, liq_global_path)
+        median_global = columns.median(liq_global_path)
         checks_liq.append({
             'label': 'Global liquidity %',
             'path': liq_global_path,
@@ -198,7 +141,7 @@ def main():
         })
     
     if liq_self_path and coverage_lookup[liq_self_path]['present_pct'] > 0:
-        median_self = compute_median(entries, liq_self_path)
+        median_self = columns.median(liq_self_path)
         checks_liq.append({
             'label': 'Self liquidity %',
             'path': liq_self_path,
@@ -222,7 +165,7 @@ def main():
     
     checks_depth = []
     if depth_weighted_path and coverage_lookup[depth_weighted_path]['present_pct'] > 0:
-        median_weighted = compute_median(entries, depth_weighted_path)
+        median_weighted = columns.median(depth_weighted_path)
         checks_depth.append({
             'label': 'Weighted depth',
             'path': depth_weighted_path,
@@ -232,7 +175,7 @@ def main():
         })
     
     if depth_skew_path and coverage_lookup[depth_skew_path]['present_pct'] > 0:
-        median_skew = compute_median(entries, depth_skew_path)
+        median_skew = columns.median(depth_skew_path)
         checks_depth.append({
             'label': 'Depth skew',
             'path': depth_skew_path,
@@ -256,7 +199,7 @@ def main():
     checks_spot = []
     if spot_prices_path and coverage_lookup[spot_prices_path]['present_pct'] > 0:
         # Count median array length for spot_prices
-        median_count = count_array_lengths(entries, spot_prices_path)
+        median_count = columns.length_median(spot_prices_path)
         checks_spot.append({
             'label': 'Spot price samples',
             'path': spot_prices_path,
@@ -285,7 +228,7 @@ def main():
     
     checks_sent_last = []
     if posts_total_last_path and coverage_lookup[posts_total_last_path]['present_pct'] > 0:
-        median_posts = compute_median(entries, posts_total_last_path)
+        median_posts = columns.median(posts_total_last_path)
         checks_sent_last.append({
             'label': 'Posts per cycle',
             'path': posts_total_last_path,
@@ -295,8 +238,9 @@ def main():
         })
     
     if lex_score_path and coverage_lookup[lex_score_path]['present_pct'] >= 70:
-        p10, p90 = compute_p10_p90(entries, lex_score_path)
-        if p10 is not None and p90 is not None:
+        pct = columns.percentiles(lex_score_path, (10, 90))
+        if pct is not None:
+            p10, p90 = pct[10], pct[90]
             checks_sent_last.append({
                 'label': 'Lexicon score range',
                 'path': lex_score_path,
@@ -306,7 +250,7 @@ def main():
             })
     
     if hybrid_posts_scored_path and coverage_lookup[hybrid_posts_scored_path]['present_pct'] >= 70:
-        median_scored = compute_median(entries, hybrid_posts_scored_path)
+        median_scored = columns.median(hybrid_posts_scored_path)
         checks_sent_last.append({
             'label': 'Posts scored',
             'path': hybrid_posts_scored_path,
@@ -331,7 +275,7 @@ def main():
     
     checks_sent_2 = []
     if posts_total_2_path and coverage_lookup[posts_total_2_path]['present_pct'] > 0:
-        median_posts_2 = compute_median(entries, posts_total_2_path)
+        median_posts_2 = columns.median(posts_total_2_path)
         checks_sent_2.append({
             'label': 'Posts (2-cycle)',
             'path': posts_total_2_path,
@@ -341,7 +285,7 @@ def main():
         })
     
     if lex_score_2_path and coverage_lookup[lex_score_2_path]['present_pct'] >= 70:
-        median_score_2 = compute_median(entries, lex_score_2_path)
+        median_score_2 = columns.median(lex_score_2_path)
         checks_sent_2.append({
             'label': 'Lexicon score (2-cycle)',
             'path': lex_score_2_path,
@@ -351,7 +295,7 @@ def main():
         })
     
     if hybrid_posts_scored_2_path and coverage_lookup[hybrid_posts_scored_2_path]['present_pct'] >= 70:
-        median_scored_2 = compute_median(entries, hybrid_posts_scored_2_path)
+        median_scored_2 = columns.median(hybrid_posts_scored_2_path)
         checks_sent_2.append({
             'label': 'Posts scored (2-cycle)',
             'path': hybrid_posts_scored_2_path,
@@ -375,7 +319,7 @@ def main():
     checks_activity = []
     if posts_for_silence_path and coverage_lookup[posts_for_silence_path]['present_pct'] > 0:
         # Calculate % of entries with posts_total == 0 (silence)
-        silence_pct = count_zero_values(entries, posts_for_silence_path)
+        silence_pct = columns.zero_pct(posts_for_silence_path)
         checks_activity.append({
             'label': 'Silence rate',
             'path': posts_for_silence_path,
@@ -399,7 +343,7 @@ def main():
     
     checks_engagement = []
     if distinct_authors_path and coverage_lookup[distinct_authors_path]['present_pct'] >= 70:
-        median_authors = compute_median(entries, distinct_authors_path)
+        median_authors = columns.median(distinct_authors_path)
         checks_engagement.append({
             'label': 'Distinct authors',
             'path': distinct_authors_path,
@@ -409,7 +353,7 @@ def main():
         })
     
     if followers_path and coverage_lookup[followers_path]['present_pct'] >= 70:
-        median_followers = compute_median(entries, followers_path)
+        median_followers = columns.median(followers_path)
         if median_followers and median_followers >= 1000:
             checks_engagement.append({
                 'label': 'Follower reach',
@@ -440,13 +384,15 @@ def main():
     print()
     
     # Build output
-    output = {
+    return {
         'generated_at_utc': datetime.utcnow().isoformat() + 'Z',
         'entries_scanned': entries_scanned,
         'rows': rows
     }
-    
-    # Write output
+
+
+def write_coverage_table(output, output_file=OUTPUT_FILE):
+    """Write coverage_table.json and print the per-group summary."""
     output_file.parent.mkdir(parents=True, exist_ok=True)
     with open(output_file, 'w', encoding='ascii') as f:
         json.dump(output, f, indent=2, ensure_ascii=True)
@@ -458,8 +404,32 @@ def main():
     print("=" * 70)
     print("Summary")
     print("=" * 70)
-    for row in rows:
+    for row in output['rows']:
         print(f"{row['label']:35} {row['present_pct']:5.1f}% ({len(row['checks'])} checks)")
+
+
+def main():
+    print("=" * 70)
+    print("Building Coverage Table (Phase 1B)")
+    print("=" * 70)
+    print()
+    
+    # Load coverage report
+    print("[LOAD] field_coverage_report.json...")
+    with open(COVERAGE_FILE, 'r', encoding='utf-8') as f:
+        coverage = json.load(f)
+    
+    # Load sample entries for examples
+    print("[LOAD] cryptobot_latest_head200.jsonl...")
+    entries = []
+    with open(SAMPLE_FILE, 'r', encoding='utf-8') as f:
+        for line in f:
+            entries.append(json.loads(line))
+    print(f"[INFO] Loaded {len(entries)} sample entries")
+    print()
+    
+    output = build_coverage_table(entries, coverage)
+    write_coverage_table(output)
     
     print()
     print("=" * 70)
@@ -130,11 +130,18 @@ def generate_non_claims_block():
     ]
 
 
-def build_dataset_overview():
-    """Build dataset_overview.json artifact."""
-    print("Loading sample entries...")
-    entries = load_sample_entries()
-    print(f"Loaded {len(entries)} entries from {SAMPLE_DATA_FILE}")
+def build_dataset_overview(entries=None):
+    """
+    Build and write dataset_overview.json artifact.
+    
+    Args:
+        entries: Sample entries already loaded by the caller (default: read
+            SAMPLE_DATA_FILE)
+    """
+    if entries is None:
+        print("Loading sample entries...")
+        entries = load_sample_entries()
+        print(f"Loaded {len(entries)} entries from {SAMPLE_DATA_FILE}")
     
     # Extract metrics
     scale = extract_scale_metrics(entries)
@@ -20,7 +20,10 @@ Structure of each index:
       "r2_key": "tier1/daily/2026-01/2026-01-27/instrumetriq_tier1_daily_2026-01-27.parquet",
       "manifest_key": "tier1/daily/2026-01/2026-01-27/manifest.json",
       "size_bytes": 123456,
-      "last_modified": "2026-01-27T02:35:12Z"
+      "last_modified": "2026-01-27T02:35:12Z",
+      "row_count": 41234,
+      "sha256": "9f2c...",
+      "coverage": {"hours_found": 24, "hours_expected": 24, "coverage_ratio": 1.0, "is_partial": false}
     },
     ...
   ],
@@ -30,10 +33,18 @@ Structure of each index:
     "manifest_key": "tier1/mtd/2026-01/manifest.json",
     "size_bytes": 5790000,
     "last_modified": "2026-01-27T02:45:00Z",
-    "days_included": 27
+    "days_included": 27,
+    "row_count": 1100000,
+    "sha256": "4b1e..."
   }
 }
 
+Manifest enrichment:
+    row_count / sha256 / coverage come from each daily manifest.json. Manifests
+    are fetched concurrently (--workers) and cached by ETag in --manifest-cache,
+    so a run only fetches manifests that are new or changed since the last run.
+    ETags come from the same list_objects_v2 pass that finds the parquets.
+
 Usage:
     # Generate all tier indexes
     python3 scripts/generate_download_index.py --all
@@ -43,12 +54,16 @@ Usage:
     
     # Specify custom output directory
     python3 scripts/generate_download_index.py --all --output-dir /var/www/instrumetriq/private/download_index/
+
+    # Force a full manifest refetch (ignore the ETag cache)
+    python3 scripts/generate_download_index.py --all --refresh-manifests
 """
 
 import argparse
 import boto3
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -56,12 +71,118 @@ from datetime import datetime, timezone
 sys.path.insert(0, str(Path(__file__).parent))
 
 from r2_config import get_r2_config
+from r2_metrics import in_current_stage, instrument_client, stage
+
+
+# Local ETag cache for manifest summaries (manifest_key -> {"etag", "summary"})
+DEFAULT_MANIFEST_CACHE = Path("./output/download_index/manifest_cache.json")
+
+# Concurrent manifest fetches (bounded to stay well under R2 rate limits)
+DEFAULT_WORKERS = 16
+
+
+# ==============================================================================
+# Manifest fetching (concurrent, ETag-cached)
+# ==============================================================================
+
+def summarize_manifest(manifest):
+    """Reduce a daily/MTD manifest to the fields the download index exposes."""
+    coverage = None
+    if manifest.get("hours_found") is not None:
+        coverage = {
+            "hours_found": manifest.get("hours_found"),
+            "hours_expected": manifest.get("hours_expected", 24),
+            "coverage_ratio": manifest.get("coverage_ratio"),
+            "is_partial": manifest.get("is_partial", False),
+        }
+    return {
+        "row_count": manifest.get("row_count"),
+        "sha256": manifest.get("parquet_sha256") or manifest.get("sha256"),
+        "parquet_size_bytes": manifest.get("parquet_size_bytes"),
+        "days_included": manifest.get("days_included"),
+        "coverage": coverage,
+    }
+
+
+def load_manifest_cache(path):
+    """Load the ETag cache; a missing or corrupt cache is treated as empty."""
+    if not path or not path.exists():
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"[WARN] Ignoring unreadable manifest cache {path}: {e}")
+        return {}
+
+
+def save_manifest_cache(path, cache):
+    """Write the ETag cache atomically (temp file + rename)."""
+    if not path:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    tmp_path.replace(path)
 
 
-def list_daily_files(s3, bucket, tier):
+def _fetch_manifest_summary(s3, bucket, manifest_key):
+    response = s3.get_object(Bucket=bucket, Key=manifest_key)
+    manifest = json.loads(response['Body'].read())
+    return response.get('ETag'), summarize_manifest(manifest)
+
+
+def fetch_manifest_summaries(s3, bucket, manifest_etags, cache, workers=DEFAULT_WORKERS):
+    """
+    Return {manifest_key: summary} for every key in manifest_etags.
+    
+    Keys whose listed ETag matches the cache are served from the cache; the rest
+    are fetched concurrently with at most `workers` requests in flight. The cache
+    dict is updated in place.
+    """
+    summaries = {}
+    to_fetch = []
+    
+    for key, etag in manifest_etags.items():
+        cached = cache.get(key)
+        if cached and etag and cached.get("etag") == etag:
+            summaries[key] = cached["summary"]
+        else:
+            to_fetch.append(key)
+    
+    if not to_fetch:
+        return summaries
+    
+    print(f"    Fetching {len(to_fetch)} manifest(s) ({len(summaries)} cached, {workers} workers)...")
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        fetch = in_current_stage(_fetch_manifest_summary)
+        futures = {pool.submit(fetch, s3, bucket, key): key for key in to_fetch}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                etag, summary = future.result()
+            except Exception as e:
+                print(f"[WARN] Could not read manifest {key}: {e}")
+                continue
+            summaries[key] = summary
+            cache[key] = {"etag": manifest_etags.get(key) or etag, "summary": summary}
+    
+    return summaries
+
+
+# ==============================================================================
+# Index building
+# ==============================================================================
+
+def list_daily_files(s3, bucket, tier, manifest_etags=None):
     """
     List all daily parquet files for a tier with metadata.
     
+    If manifest_etags is a dict, it is filled with {manifest_key: etag} for every
+    manifest.json seen in the same listing (no extra R2 calls).
+    
     Returns:
         List of dicts with date, r2_key, manifest_key, size_bytes, last_modified
     """
@@ -80,6 +201,11 @@ def list_daily_files(s3, bucket, tier):
         for obj in page['Contents']:
             key = obj['Key']
             
+            if key.endswith('/manifest.json'):
+                if manifest_etags is not None:
+                    manifest_etags[key] = obj.get('ETag')
+                continue
+            
             # Only process .parquet files
             if not key.endswith('.parquet'):
                 continue
@@ -110,10 +236,13 @@ def list_daily_files(s3, bucket, tier):
     return files
 
 
-def get_mtd_info(s3, bucket, tier):
+def get_mtd_info(s3, bucket, tier, cache, workers=DEFAULT_WORKERS):
     """
     Get MTD bundle info if it exists.
     
+    A single listing of the MTD prefix replaces the head_object on the parquet
+    and provides the manifest ETag for the cache.
+    
     Returns:
         Dict with mtd info or None if not found
     """
@@ -124,40 +253,69 @@ def get_mtd_info(s3, bucket, tier):
     manifest_key = f"{tier}/mtd/{current_month}/manifest.json"
     
     try:
-        obj = s3.head_object(Bucket=bucket, Key=mtd_key)
-        
-        # Try to read manifest to get days_included
-        days_included = None
-        try:
-            manifest_obj = s3.get_object(Bucket=bucket, Key=manifest_key)
-            manifest_data = json.loads(manifest_obj['Body'].read())
-            days_included = manifest_data.get('days_included')
-        except Exception:
-            pass  # Manifest might not exist yet
-        
-        return {
-            "month": current_month,
-            "r2_key": mtd_key,
-            "manifest_key": manifest_key,
-            "size_bytes": obj['ContentLength'],
-            "last_modified": obj['LastModified'].isoformat(),
-            "days_included": days_included
-        }
+        response = s3.list_objects_v2(Bucket=bucket, Prefix=f"{tier}/mtd/{current_month}/")
     except Exception:
         return None
+    
+    objects = {obj['Key']: obj for obj in response.get('Contents', [])}
+    obj = objects.get(mtd_key)
+    if obj is None:
+        return None
+    
+    # Manifest might not exist yet
+    summary = {}
+    if manifest_key in objects:
+        summaries = fetch_manifest_summaries(
+            s3, bucket, {manifest_key: objects[manifest_key].get('ETag')}, cache, workers
+        )
+        summary = summaries.get(manifest_key, {})
+    
+    return {
+        "month": current_month,
+        "r2_key": mtd_key,
+        "manifest_key": manifest_key,
+        "size_bytes": obj['Size'],
+        "last_modified": obj['LastModified'].isoformat(),
+        "days_included": summary.get("days_included"),
+        "row_count": summary.get("row_count"),
+        "sha256": summary.get("sha256"),
+    }
 
 
-def generate_tier_index(s3, bucket, tier):
+def generate_tier_index(s3, bucket, tier, cache, workers=DEFAULT_WORKERS):
     """
     Generate index for a single tier.
     
+    Args:
+        cache: Manifest ETag cache (updated in place)
+        workers: Maximum concurrent manifest fetches
+    
     Returns:
         Dict with tier index data
     """
     print(f"\n=== Generating index for {tier.upper()} ===")
     
-    daily_files = list_daily_files(s3, bucket, tier)
-    mtd_info = get_mtd_info(s3, bucket, tier)
+    manifest_etags = {}
+    with stage("list"):
+        daily_files = list_daily_files(s3, bucket, tier, manifest_etags)
+    
+    # Enrich daily entries from their manifests
+    wanted = {f["manifest_key"]: manifest_etags[f["manifest_key"]]
+              for f in daily_files if f["manifest_key"] in manifest_etags}
+    with stage("manifests"):
+        summaries = fetch_manifest_summaries(s3, bucket, wanted, cache, workers)
+        mtd_info = get_mtd_info(s3, bucket, tier, cache, workers)
+    
+    # Drop cache entries for manifests that no longer exist (retention cleanup)
+    current_mtd_manifest = mtd_info["manifest_key"] if mtd_info else None
+    for key in [k for k in cache if k.startswith(f"{tier}/") and k not in wanted and k != current_mtd_manifest]:
+        del cache[key]
+
+    for f in daily_files:
+        summary = summaries.get(f["manifest_key"], {})
+        f["row_count"] = summary.get("row_count")
+        f["sha256"] = summary.get("sha256")
+        f["coverage"] = summary.get("coverage")
     
     index = {
         "tier": tier,
@@ -166,7 +324,8 @@ def generate_tier_index(s3, bucket, tier):
         "mtd": mtd_info
     }
     
-    print(f"[{tier.upper()}] Found {len(daily_files)} daily files")
+    print(f"[{tier.upper()}] Found {len(daily_files)} daily files "
+          f"({sum(1 for f in daily_files if f['row_count'] is not None)} with manifest data)")
     if mtd_info:
         print(f"[{tier.upper()}] Found MTD bundle: {mtd_info['month']}")
     else:
@@ -181,6 +340,12 @@ def main():
     parser.add_argument("--all", action="store_true", help="Index all tiers")
     parser.add_argument("--output-dir", type=Path, default=Path("/var/www/instrumetriq/private/download_index"),
                        help="Output directory for index files")
+    parser.add_argument("--manifest-cache", type=Path, default=DEFAULT_MANIFEST_CACHE,
+                       help=f"ETag cache for manifest summaries (default: {DEFAULT_MANIFEST_CACHE})")
+    parser.add_argument("--refresh-manifests", action="store_true",
+                       help="Ignore the manifest cache and refetch every manifest")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                       help=f"Concurrent manifest fetches (default: {DEFAULT_WORKERS})")
     args = parser.parse_args()
     
     if not args.tier and not args.all:
@@ -203,19 +368,21 @@ def main():
         print(f"[ERROR] Loading R2 config: {e}", file=sys.stderr)
         sys.exit(1)
     
-    s3 = boto3.client(
+    s3 = instrument_client(boto3.client(
         's3',
         endpoint_url=cfg.endpoint,
         aws_access_key_id=cfg.access_key_id,
         aws_secret_access_key=cfg.secret_access_key,
         region_name='auto'
-    )
+    ))
     
     print(f"Output directory: {args.output_dir}")
     print(f"Tiers: {', '.join(tiers)}\n")
     
+    cache = {} if args.refresh_manifests else load_manifest_cache(args.manifest_cache)
+    
     for tier in tiers:
-        index = generate_tier_index(s3, cfg.bucket, tier)
+        index = generate_tier_index(s3, cfg.bucket, tier, cache, max(1, args.workers))
         
         # Write to file
         output_file = args.output_dir / f"{tier}.json"
@@ -224,6 +391,8 @@ def main():
         
         print(f"✓ Wrote {output_file}")
     
+    save_manifest_cache(args.manifest_cache, cache)
+    
     print(f"\n✓ Index generation complete")
 
 
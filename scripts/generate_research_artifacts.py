@@ -7,6 +7,17 @@ Creates 3 website-safe JSON artifacts showing dataset behavior:
 - sampling_density.json: Sampling resolution quality metrics
 - session_lifecycle.json: Monitoring window lifecycle patterns
 
+Entries are folded into a ResearchSummary as they stream past (quantile
+sketches, histograms and counts from streaming_summaries.py) instead of
+being held in memory, so the artifacts can cover the latest day or the
+whole archive. With --scope all, each day's summary is cached under
+RESEARCH_SKETCH_DIR and only new or changed days are re-read.
+
+Accuracy: medians and percentiles are exact while a statistic has at most
+1024 values; beyond that they are within the normalized rank error recorded
+in each artifact's quantile_accuracy block (~0.27%). Counts, shares,
+histograms, min and max are always exact.
+
 Rules:
 - Use ONLY paths from field_coverage_report.json (Phase 1A SSOT)
 - NO predictive claims or correlations
@@ -14,16 +25,42 @@ Rules:
 - ASCII-only JSON
 """
 
-import gzip
 import json
 import math
-import statistics
+import os
 import sys
-from collections import defaultdict
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+sys.path.insert(0, str(Path(__file__).parent))
+from archive_scan import Aggregator, scan_files
+from streaming_summaries import DEFAULT_K, Counts, Histogram, QuantileSketch
+
+DEFAULT_ARCHIVE_PATH = Path('/srv/cryptobot/data/archive')
+
+# Per-day summary cache for --scope all
+DEFAULT_SKETCH_DIR = Path('output/research_sketches')
+
+POSTS_BINS = [
+    {'name': '0_posts', 'min': 0, 'max': 0},
+    {'name': '1-2_posts', 'min': 1, 'max': 2},
+    {'name': '3-9_posts', 'min': 3, 'max': 9},
+    {'name': '10-24_posts', 'min': 10, 'max': 24},
+    {'name': '25-49_posts', 'min': 25, 'max': 49},
+    {'name': '50+_posts', 'min': 50, 'max': float('inf')}
+]
+
+SAMPLE_COUNT_BUCKETS = [
+    {'label': '<600', 'min': 0, 'max': 599},
+    {'label': '600-699', 'min': 600, 'max': 699},
+    {'label': '700-749', 'min': 700, 'max': 749},
+    {'label': '750-799', 'min': 750, 'max': 799},
+    {'label': '800-899', 'min': 800, 'max': 899},
+    {'label': '900+', 'min': 900, 'max': float('inf')}
+]
+
 
 def get_nested_value(obj: Dict[str, Any], path: str) -> Any:
     """Safely navigate nested dict using dot-separated path."""
@@ -43,145 +80,236 @@ def find_path_in_ssot(coverage: Dict[str, Any], *candidates: str) -> Optional[st
     all_paths = set()
     for group, fields in coverage.get('field_groups', {}).items():
         all_paths.update(fields.keys())
-    
+
     for path in candidates:
         if path in all_paths:
             return path
     return None
 
 
-def extract_numeric_values(entries: List[Dict], path: str) -> List[float]:
-    """Extract all valid numeric values from entries for a given path."""
-    values = []
-    for entry in entries:
-        val = get_nested_value(entry, path)
-        if val is not None and isinstance(val, (int, float)):
-            if not math.isnan(val) and not math.isinf(val):
-                values.append(val)
-    return values
-
-
-def compute_percentiles(values: List[float]) -> Dict[str, Optional[float]]:
-    """Compute p10, median, p90, min, max."""
-    if not values:
-        return {'median': None, 'p10': None, 'p90': None, 'min': None, 'max': None}
-    
-    sorted_vals = sorted(values)
-    n = len(sorted_vals)
-    
+def resolve_research_paths(coverage: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """Field paths the three artifacts read (None where absent from the SSOT)."""
     return {
-        'median': statistics.median(sorted_vals),
-        'p10': sorted_vals[int(n * 0.1)],
-        'p90': sorted_vals[int(n * 0.9)],
-        'min': min(sorted_vals),
-        'max': max(sorted_vals)
+        'posts_total': find_path_in_ssot(
+            coverage,
+            'twitter_sentiment_windows.last_2_cycles.posts_total',
+            'twitter_sentiment_windows.last_cycle.posts_total'
+        ),
+        'spread_bps': find_path_in_ssot(coverage, 'derived.spread_bps'),
+        'liq_global_pct': find_path_in_ssot(coverage, 'derived.liq_global_pct'),
+        'liq_self_pct': find_path_in_ssot(coverage, 'derived.liq_self_pct'),
+        'sample_count': find_path_in_ssot(
+            coverage,
+            'meta.sample_count',
+            'meta.samples',
+            'sampling.count'
+        ),
+        'spot_prices': find_path_in_ssot(coverage, 'spot_prices'),
+        'duration_sec': find_path_in_ssot(coverage, 'meta.duration_sec'),
+        'added_ts': find_path_in_ssot(
+            coverage,
+            'meta.added_ts',
+            'meta.created_at',
+            'timestamps.added'
+        ),
     }
 
 
-def build_activity_regimes(entries: List[Dict], coverage: Dict[str, Any]) -> Dict[str, Any]:
+def _finite_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not math.isnan(value) and not math.isinf(value)
+
+
+class ResearchSummary:
+    """
+    Mergeable summary of entries holding everything the three artifacts
+    need: per-bin counts and sketches, sample_count sketch and histogram,
+    spot_prices length, duration and admission-hour counts.
+
+    Args:
+        paths: Field paths from resolve_research_paths()
+        k: Quantile sketch size
+    """
+
+    def __init__(self, paths: Dict[str, Optional[str]], k: int = DEFAULT_K):
+        self.paths = paths
+        self.k = k
+        self.entries_scanned = 0
+        self.regimes = {
+            b['name']: {
+                'n': 0,
+                'spread_bps': QuantileSketch(k),
+                'liq_global_pct': QuantileSketch(k),
+                'liq_self_pct': QuantileSketch(k),
+            }
+            for b in POSTS_BINS
+        }
+        self.sample_count = QuantileSketch(k)
+        self.sample_count_histogram = Histogram(SAMPLE_COUNT_BUCKETS)
+        self.spot_prices_len = QuantileSketch(k)
+        self.duration_sec = QuantileSketch(k)
+        self.admission_hours = Counts()
+
+    def update(self, entry: Dict[str, Any]):
+        """Fold one archive entry into the summary."""
+        paths = self.paths
+        self.entries_scanned += 1
+
+        posts = get_nested_value(entry, paths['posts_total']) if paths['posts_total'] else None
+        if posts is not None and isinstance(posts, (int, float)):
+            for b in POSTS_BINS:
+                if b['min'] <= posts <= b['max']:
+                    regime = self.regimes[b['name']]
+                    regime['n'] += 1
+                    for field in ('spread_bps', 'liq_global_pct', 'liq_self_pct'):
+                        if paths[field]:
+                            value = get_nested_value(entry, paths[field])
+                            if _finite_number(value):
+                                regime[field].update(value)
+                    break
+
+        if paths['sample_count']:
+            value = get_nested_value(entry, paths['sample_count'])
+            if _finite_number(value):
+                self.sample_count.update(value)
+                self.sample_count_histogram.update(value)
+
+        if paths['spot_prices']:
+            spots = get_nested_value(entry, paths['spot_prices'])
+            if spots is not None and isinstance(spots, list):
+                self.spot_prices_len.update(len(spots))
+
+        if paths['duration_sec']:
+            dur = get_nested_value(entry, paths['duration_sec'])
+            if _finite_number(dur) and dur > 0:
+                self.duration_sec.update(dur)
+
+        if paths['added_ts']:
+            added_str = get_nested_value(entry, paths['added_ts'])
+            if added_str:
+                from dateutil import parser as date_parser
+                try:
+                    added_dt = date_parser.isoparse(str(added_str))
+
+                    # Track admission hour in UTC
+                    # If timestamp has timezone info, convert to UTC; if naive, assume UTC
+                    if added_dt.tzinfo is not None:
+                        added_utc = added_dt.astimezone(timezone.utc)
+                    else:
+                        added_utc = added_dt.replace(tzinfo=timezone.utc)
+
+                    self.admission_hours.update(added_utc.hour)
+                except (ValueError, OverflowError):
+                    pass
+
+    def sketches(self) -> List[QuantileSketch]:
+        sketches = [self.sample_count, self.spot_prices_len, self.duration_sec]
+        for regime in self.regimes.values():
+            sketches.extend([regime['spread_bps'], regime['liq_global_pct'], regime['liq_self_pct']])
+        return sketches
+
+    def merge(self, other: 'ResearchSummary') -> 'ResearchSummary':
+        """Fold another summary (same paths) into this one (returns self)."""
+        self.entries_scanned += other.entries_scanned
+        for name, regime in self.regimes.items():
+            theirs = other.regimes[name]
+            regime['n'] += theirs['n']
+            for field in ('spread_bps', 'liq_global_pct', 'liq_self_pct'):
+                regime[field].merge(theirs[field])
+        self.sample_count.merge(other.sample_count)
+        self.sample_count_histogram.merge(other.sample_count_histogram)
+        self.spot_prices_len.merge(other.spot_prices_len)
+        self.duration_sec.merge(other.duration_sec)
+        self.admission_hours.merge(other.admission_hours)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'paths': self.paths,
+            'k': self.k,
+            'entries_scanned': self.entries_scanned,
+            'regimes': {
+                name: {field: (value if field == 'n' else value.to_dict()) for field, value in regime.items()}
+                for name, regime in self.regimes.items()
+            },
+            'sample_count': self.sample_count.to_dict(),
+            'sample_count_histogram': self.sample_count_histogram.to_dict(),
+            'spot_prices_len': self.spot_prices_len.to_dict(),
+            'duration_sec': self.duration_sec.to_dict(),
+            'admission_hours': self.admission_hours.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ResearchSummary':
+        summary = cls(data['paths'], data['k'])
+        summary.entries_scanned = data['entries_scanned']
+        for name, regime in data['regimes'].items():
+            summary.regimes[name] = {
+                field: (value if field == 'n' else QuantileSketch.from_dict(value))
+                for field, value in regime.items()
+            }
+        summary.sample_count = QuantileSketch.from_dict(data['sample_count'])
+        summary.sample_count_histogram = Histogram.from_dict(SAMPLE_COUNT_BUCKETS, data['sample_count_histogram'])
+        summary.spot_prices_len = QuantileSketch.from_dict(data['spot_prices_len'])
+        summary.duration_sec = QuantileSketch.from_dict(data['duration_sec'])
+        summary.admission_hours = Counts.from_dict(data['admission_hours'], key_type=int)
+        return summary
+
+
+def quantile_accuracy(sketches: List[QuantileSketch]) -> Dict[str, Any]:
+    """Accuracy block recorded in each artifact."""
+    return {
+        'method': f'KLL quantile sketch (k={sketches[0].k}); exact until a statistic exceeds k values',
+        'exact': all(s.exact for s in sketches),
+        'max_normalized_rank_error': round(max(s.rank_error() for s in sketches), 4),
+    }
+
+
+def build_activity_regimes(summary: ResearchSummary) -> Dict[str, Any]:
     """Build activity_regimes.json artifact."""
     print("\n[BUILD] activity_regimes.json")
-    
-    # Find posts_total path
-    posts_path = find_path_in_ssot(
-        coverage,
-        'twitter_sentiment_windows.last_2_cycles.posts_total',
-        'twitter_sentiment_windows.last_cycle.posts_total'
-    )
-    
+
+    posts_path = summary.paths['posts_total']
+
     if not posts_path:
         print("  ERROR: No posts_total path found in SSOT")
         return {
             'error': 'No posts_total field available',
             'unavailable_reason': 'Required field not in field_coverage_report.json'
         }
-    
+
     print(f"  Using posts_total: {posts_path}")
-    
-    # Find liquidity/spread paths
-    spread_path = find_path_in_ssot(coverage, 'derived.spread_bps')
-    liq_global_path = find_path_in_ssot(coverage, 'derived.liq_global_pct')
-    liq_self_path = find_path_in_ssot(coverage, 'derived.liq_self_pct')
-    
-    # Define bins
-    bins = [
-        {'name': '0_posts', 'min': 0, 'max': 0},
-        {'name': '1-2_posts', 'min': 1, 'max': 2},
-        {'name': '3-9_posts', 'min': 3, 'max': 9},
-        {'name': '10-24_posts', 'min': 10, 'max': 24},
-        {'name': '25-49_posts', 'min': 25, 'max': 49},
-        {'name': '50+_posts', 'min': 50, 'max': float('inf')}
-    ]
-    
-    # Initialize bins
-    bin_data = defaultdict(lambda: {
-        'posts_values': [],
-        'spread_values': [],
-        'liq_global_values': [],
-        'liq_self_values': []
-    })
-    
-    # Bin entries
-    for entry in entries:
-        posts = get_nested_value(entry, posts_path)
-        if posts is None or not isinstance(posts, (int, float)):
-            continue
-        
-        # Find bin
-        bin_name = None
-        for b in bins:
-            if b['min'] <= posts <= b['max']:
-                bin_name = b['name']
-                break
-        
-        if not bin_name:
-            continue
-        
-        bin_data[bin_name]['posts_values'].append(posts)
-        
-        # Collect other metrics
-        if spread_path:
-            spread = get_nested_value(entry, spread_path)
-            if spread is not None and isinstance(spread, (int, float)):
-                bin_data[bin_name]['spread_values'].append(spread)
-        
-        if liq_global_path:
-            liq_g = get_nested_value(entry, liq_global_path)
-            if liq_g is not None and isinstance(liq_g, (int, float)):
-                bin_data[bin_name]['liq_global_values'].append(liq_g)
-        
-        if liq_self_path:
-            liq_s = get_nested_value(entry, liq_self_path)
-            if liq_s is not None and isinstance(liq_s, (int, float)):
-                bin_data[bin_name]['liq_self_values'].append(liq_s)
-    
+
+    spread_path = summary.paths['spread_bps']
+    liq_global_path = summary.paths['liq_global_pct']
+    liq_self_path = summary.paths['liq_self_pct']
+
     # Compute stats per bin
-    total_entries = sum(len(bd['posts_values']) for bd in bin_data.values())
-    
+    total_entries = sum(regime['n'] for regime in summary.regimes.values())
+
     regime_rows = []
-    for b in bins:
-        bd = bin_data[b['name']]
-        n = len(bd['posts_values'])
-        
+    for b in POSTS_BINS:
+        bd = summary.regimes[b['name']]
+        n = bd['n']
+
         if n == 0:
             continue
-        
+
         regime_rows.append({
             'bin': b['name'],
             'posts_range': f"{b['min']}-{b['max']}" if b['max'] != float('inf') else f"{b['min']}+",
             'n_entries': n,
             'share_pct': round(n / total_entries * 100, 1) if total_entries > 0 else 0,
-            'median_spread_bps': round(statistics.median(bd['spread_values']), 1) if bd['spread_values'] else None,
-            'median_liq_global_pct': round(statistics.median(bd['liq_global_values']), 1) if bd['liq_global_values'] else None,
-            'median_liq_self_pct': round(statistics.median(bd['liq_self_values']), 1) if bd['liq_self_values'] else None
+            'median_spread_bps': round(bd['spread_bps'].median(), 1) if bd['spread_bps'].n else None,
+            'median_liq_global_pct': round(bd['liq_global_pct'].median(), 1) if bd['liq_global_pct'].n else None,
+            'median_liq_self_pct': round(bd['liq_self_pct'].median(), 1) if bd['liq_self_pct'].n else None
         })
-    
+
     print(f"  Generated {len(regime_rows)} regime bins")
-    
+
     # Build artifact
     artifact = {
         'generated_at_utc': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
-        'entries_scanned': len(entries),
+        'entries_scanned': summary.entries_scanned,
         'total_binned': total_entries,
         'source': {
             'sample_file': 'data/samples/cryptobot_latest_head200.jsonl',
@@ -194,9 +322,13 @@ def build_activity_regimes(entries: List[Dict], coverage: Dict[str, Any]) -> Dic
             'liq_self_pct': liq_self_path if liq_self_path else None
         },
         'unavailable_fields': [],
-        'regimes': regime_rows
+        'regimes': regime_rows,
+        'quantile_accuracy': quantile_accuracy([
+            regime[field] for regime in summary.regimes.values()
+            for field in ('spread_bps', 'liq_global_pct', 'liq_self_pct')
+        ])
     }
-    
+
     # Note unavailable fields
     if not spread_path:
         artifact['unavailable_fields'].append({
@@ -213,81 +345,49 @@ def build_activity_regimes(entries: List[Dict], coverage: Dict[str, Any]) -> Dic
             'field': 'liq_self_pct',
             'reason': 'Path not found in field_coverage_report.json'
         })
-    
+
     return artifact
 
 
-def build_sampling_density(entries: List[Dict], coverage: Dict[str, Any]) -> Dict[str, Any]:
+def build_sampling_density(summary: ResearchSummary) -> Dict[str, Any]:
     """Build sampling_density.json artifact."""
     print("\n[BUILD] sampling_density.json")
-    
-    # Find sample_count path
-    sample_count_path = find_path_in_ssot(
-        coverage,
-        'meta.sample_count',
-        'meta.samples',
-        'sampling.count'
-    )
-    
-    # Find spot_prices path
-    spot_prices_path = find_path_in_ssot(coverage, 'spot_prices')
-    
-    sample_counts = []
-    spot_lengths = []
-    
-    # Collect sample counts
+
+    sample_count_path = summary.paths['sample_count']
+    spot_prices_path = summary.paths['spot_prices']
+
     if sample_count_path:
         print(f"  Using sample_count: {sample_count_path}")
-        sample_counts = extract_numeric_values(entries, sample_count_path)
     else:
         print("  WARNING: No sample_count path found")
-    
-    # Collect spot_prices lengths
+
     if spot_prices_path:
         print(f"  Using spot_prices: {spot_prices_path}")
-        for entry in entries:
-            spots = get_nested_value(entry, spot_prices_path)
-            if spots is not None and isinstance(spots, list):
-                spot_lengths.append(len(spots))
     else:
         print("  WARNING: No spot_prices path found")
-    
-    # Compute stats
-    sample_stats = compute_percentiles(sample_counts) if sample_counts else {
-        'median': None, 'p10': None, 'p90': None, 'min': None, 'max': None
-    }
-    
-    spot_stats = compute_percentiles(spot_lengths) if spot_lengths else {
-        'median': None, 'p10': None, 'p90': None, 'min': None, 'max': None
-    }
-    
+
+    # Compute stats (all None when no values were seen)
+    sample_stats = summary.sample_count.summary()
+    spot_stats = summary.spot_prices_len.summary()
+    n_samples = summary.sample_count.n
+
     # Build histogram for sample_count
     histogram = []
-    if sample_counts:
-        buckets = [
-            {'label': '<600', 'min': 0, 'max': 599},
-            {'label': '600-699', 'min': 600, 'max': 699},
-            {'label': '700-749', 'min': 700, 'max': 749},
-            {'label': '750-799', 'min': 750, 'max': 799},
-            {'label': '800-899', 'min': 800, 'max': 899},
-            {'label': '900+', 'min': 900, 'max': float('inf')}
-        ]
-        
-        for bucket in buckets:
-            count = sum(1 for v in sample_counts if bucket['min'] <= v <= bucket['max'])
+    if n_samples:
+        for bucket, count in zip(SAMPLE_COUNT_BUCKETS, summary.sample_count_histogram.counts):
             histogram.append({
                 'bucket': bucket['label'],
                 'count': count,
-                'share_pct': round(count / len(sample_counts) * 100, 1) if sample_counts else 0
+                'share_pct': round(count / n_samples * 100, 1)
             })
-    
-    print(f"  Sample count values: {len(sample_counts)}")
-    print(f"  Spot price lengths: {len(spot_lengths)}")
-    
+
+    print(f"  Sample count values: {n_samples}")
+    print(f"  Spot price lengths: {summary.spot_prices_len.n}")
+
     # Build artifact
     artifact = {
         'generated_at_utc': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
-        'entries_scanned': len(entries),
+        'entries_scanned': summary.entries_scanned,
         'source': {
             'sample_file': 'data/samples/cryptobot_latest_head200.jsonl',
             'ssot_file': 'data/field_coverage_report.json'
@@ -297,7 +397,7 @@ def build_sampling_density(entries: List[Dict], coverage: Dict[str, Any]) -> Dic
             'spot_prices': spot_prices_path if spot_prices_path else None
         },
         'sample_count_stats': {
-            'n_entries': len(sample_counts),
+            'n_entries': n_samples,
             'median': round(sample_stats['median'], 1) if sample_stats['median'] else None,
             'p10': round(sample_stats['p10'], 1) if sample_stats['p10'] else None,
             'p90': round(sample_stats['p90'], 1) if sample_stats['p90'] else None,
@@ -306,16 +406,17 @@ def build_sampling_density(entries: List[Dict], coverage: Dict[str, Any]) -> Dic
         },
         'sample_count_histogram': histogram if histogram else None,
         'spot_prices_len_stats': {
-            'n_entries': len(spot_lengths),
+            'n_entries': summary.spot_prices_len.n,
             'median': int(spot_stats['median']) if spot_stats['median'] else None,
             'p10': int(spot_stats['p10']) if spot_stats['p10'] else None,
             'p90': int(spot_stats['p90']) if spot_stats['p90'] else None,
             'min': int(spot_stats['min']) if spot_stats['min'] else None,
             'max': int(spot_stats['max']) if spot_stats['max'] else None
         },
-        'unavailable_fields': []
+        'unavailable_fields': [],
+        'quantile_accuracy': quantile_accuracy([summary.sample_count, summary.spot_prices_len])
     }
-    
+
     # Note unavailable fields
     if not sample_count_path:
         artifact['unavailable_fields'].append({
@@ -327,89 +428,46 @@ def build_sampling_density(entries: List[Dict], coverage: Dict[str, Any]) -> Dic
             'field': 'spot_prices',
             'reason': 'Path not found in field_coverage_report.json'
         })
-    
+
     return artifact
 
 
-def build_session_lifecycle(entries: List[Dict], coverage: Dict[str, Any]) -> Dict[str, Any]:
+def build_session_lifecycle(summary: ResearchSummary) -> Dict[str, Any]:
     """Build session_lifecycle.json artifact."""
     print("\n[BUILD] session_lifecycle.json")
-    
-    # Find duration and added timestamp paths
-    duration_path = find_path_in_ssot(
-        coverage,
-        'meta.duration_sec'
-    )
-    
-    added_path = find_path_in_ssot(
-        coverage,
-        'meta.added_ts',
-        'meta.created_at',
-        'timestamps.added'
-    )
-    
+
+    duration_path = summary.paths['duration_sec']
+    added_path = summary.paths['added_ts']
+
     print(f"  Duration field: {duration_path if duration_path else 'NOT FOUND'}")
     print(f"  Added timestamp: {added_path if added_path else 'NOT FOUND'}")
-    
-    durations = []
-    admission_hours = defaultdict(int)
-    
-    # Extract durations directly from meta.duration_sec if available
-    if duration_path:
-        for entry in entries:
-            dur = get_nested_value(entry, duration_path)
-            if dur is not None and isinstance(dur, (int, float)) and dur > 0:
-                durations.append(dur)
-    
-    # Track admission hours if timestamp available
-    if added_path:
-        from dateutil import parser as date_parser
-        
-        for entry in entries:
-            added_str = get_nested_value(entry, added_path)
-            
-            if added_str:
-                try:
-                    added_dt = date_parser.isoparse(str(added_str))
-                    
-                    # Track admission hour in UTC
-                    # If timestamp has timezone info, convert to UTC; if naive, assume UTC
-                    if added_dt.tzinfo is not None:
-                        added_utc = added_dt.astimezone(timezone.utc)
-                    else:
-                        # Naive timestamp: assume UTC
-                        added_utc = added_dt.replace(tzinfo=timezone.utc)
-                    
-                    admission_hours[added_utc.hour] += 1
-                except:
-                    pass
-    
-    # Compute stats
-    duration_stats = compute_percentiles(durations) if durations else {
-        'median': None, 'p10': None, 'p90': None, 'min': None, 'max': None
-    }
-    
+
+    admission_hours = summary.admission_hours.counts
+
+    # Compute stats (all None when no durations were seen)
+    duration_stats = summary.duration_sec.summary()
+
     # Build hour distribution
     hour_dist = [
-        {'hour': h, 'count': admission_hours[h]}
+        {'hour': h, 'count': admission_hours.get(h, 0)}
         for h in range(24)
     ] if admission_hours else None
-    
-    print(f"  Durations computed: {len(durations)}")
+
+    print(f"  Durations computed: {summary.duration_sec.n}")
     print(f"  Admission hours tracked: {sum(admission_hours.values())}")
-    
+
     # Check for highly concentrated admission hours
     total_admissions = sum(admission_hours.values())
     max_hour_count = max(admission_hours.values()) if admission_hours else 0
     has_concentration_bias = (max_hour_count / total_admissions >= 0.90) if total_admissions > 0 else False
-    
+
     if has_concentration_bias:
         print(f"  NOTE: Admission hours are highly concentrated ({max_hour_count}/{total_admissions} = {max_hour_count/total_admissions:.1%})")
-    
+
     # Build artifact
     artifact = {
         'generated_at_utc': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
-        'entries_scanned': len(entries),
+        'entries_scanned': summary.entries_scanned,
         'source': {
             'sample_file': 'data/samples/cryptobot_latest_head200.jsonl',
             'ssot_file': 'data/field_coverage_report.json'
@@ -423,7 +481,7 @@ def build_session_lifecycle(entries: List[Dict], coverage: Dict[str, Any]) -> Di
             'duration_sec': duration_path if duration_path else None
         },
         'duration_stats': {
-            'n_entries_with_duration': len(durations),
+            'n_entries_with_duration': summary.duration_sec.n,
             'duration_sec': {
                 'median': int(duration_stats['median']) if duration_stats['median'] else None,
                 'p10': int(duration_stats['p10']) if duration_stats['p10'] else None,
@@ -433,13 +491,14 @@ def build_session_lifecycle(entries: List[Dict], coverage: Dict[str, Any]) -> Di
             }
         },
         'admission_hour_distribution': hour_dist,
-        'unavailable_fields': []
+        'unavailable_fields': [],
+        'quantile_accuracy': quantile_accuracy([summary.duration_sec])
     }
-    
+
     # Add concentration note if detected
     if has_concentration_bias:
         artifact['note_sample_bias'] = 'Admission hours are highly concentrated in this sample; this may reflect the sample window rather than global behavior.'
-    
+
     # Note unavailable fields
     if not duration_path:
         artifact['unavailable_fields'].append({
@@ -451,93 +510,228 @@ def build_session_lifecycle(entries: List[Dict], coverage: Dict[str, Any]) -> Di
             'field': 'added_ts',
             'reason': 'No meta.added_ts or similar timestamp path found in SSOT'
         })
-    
+
     return artifact
 
 
+class ResearchSketches(Aggregator):
+    """
+    archive_scan plugin: one ResearchSummary per archive day.
+
+    Result: {day: ResearchSummary}
+
+    Args:
+        paths: Field paths from resolve_research_paths()
+        days: Only summarize these days (default: every scanned day)
+        k: Quantile sketch size
+    """
+
+    name = "research_sketches"
+
+    def __init__(self, paths: Dict[str, Optional[str]], days: Optional[List[str]] = None, k: int = DEFAULT_K):
+        self.paths = paths
+        self.days = set(days) if days is not None else None
+        self.k = k
+
+    def create(self):
+        return {"day": None, "days": {}}
+
+    def start_file(self, partial, hour_file):
+        day = hour_file.parent.name
+        partial["day"] = day if self.days is None or day in self.days else None
+        if partial["day"] is not None:
+            partial["days"].setdefault(day, ResearchSummary(self.paths, self.k))
+        return partial
+
+    def map(self, partial, entry):
+        if partial["day"] is not None:
+            partial["days"][partial["day"]].update(entry)
+        return partial
+
+    def combine(self, a, b):
+        for day, summary in b["days"].items():
+            if day in a["days"]:
+                a["days"][day].merge(summary)
+            else:
+                a["days"][day] = summary
+        return a
+
+    def finalize(self, partial):
+        return partial["days"]
+
+
+def find_archive_days(archive_base: Path) -> List[Path]:
+    """YYYYMMDD archive folders, oldest first."""
+    return sorted(d for d in archive_base.iterdir() if d.is_dir() and d.name.isdigit())
+
+
+def find_latest_folder(archive_base: Path) -> Path:
+    """Latest YYYYMMDD archive folder (exits if there is none)."""
+    date_folders = find_archive_days(archive_base)
+    if not date_folders:
+        print("  ERROR: No archive folders found")
+        sys.exit(1)
+    return date_folders[-1]
+
+
+def _day_fingerprint(day_folder: Path) -> Dict[str, list]:
+    fingerprint = {}
+    for hour_file in sorted(day_folder.glob('*.jsonl.gz')):
+        st = hour_file.stat()
+        fingerprint[hour_file.name] = [st.st_size, st.st_mtime_ns]
+    return fingerprint
+
+
+def summarize_archive(archive_base: Path, paths: Dict[str, Optional[str]],
+                      sketch_dir: Path, jobs: int = 1) -> ResearchSummary:
+    """
+    Merge the per-day summaries of every archive day.
+
+    A day's summary is cached as sketch_dir/YYYYMMDD.json together with the
+    size/mtime of its hour files; days whose files are unchanged (and whose
+    cache was built for the same field paths) are loaded from the cache,
+    the rest are re-read in one parallel scan.
+
+    Returns:
+        The merged summary, days in archive order
+    """
+    day_folders = find_archive_days(archive_base)
+    cached = {}
+    stale = []
+    for day_folder in day_folders:
+        cache_file = sketch_dir / f"{day_folder.name}.json"
+        fingerprint = _day_fingerprint(day_folder)
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+            if record['files'] == fingerprint and record['summary']['paths'] == paths \
+                    and record['summary']['k'] == DEFAULT_K:
+                cached[day_folder.name] = ResearchSummary.from_dict(record['summary'])
+                continue
+        except (OSError, json.JSONDecodeError, KeyError):
+            pass
+        stale.append((day_folder, fingerprint))
+
+    print(f"  {len(cached)} cached day(s), {len(stale)} to scan")
+
+    if stale:
+        hour_files = [f for day_folder, _ in stale for f in sorted(day_folder.glob('*.jsonl.gz'))]
+        results, _ = scan_files(hour_files, [ResearchSketches(paths)], jobs=jobs)
+        sketch_dir.mkdir(parents=True, exist_ok=True)
+        for day_folder, fingerprint in stale:
+            summary = results[ResearchSketches.name].get(day_folder.name, ResearchSummary(paths))
+            cached[day_folder.name] = summary
+            fd, tmp = tempfile.mkstemp(dir=sketch_dir, prefix='.tmp_')
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'files': fingerprint, 'summary': summary.to_dict()}, f, separators=(',', ':'))
+            os.replace(tmp, sketch_dir / f"{day_folder.name}.json")
+
+    merged = ResearchSummary(paths)
+    for day_folder in day_folders:
+        merged.merge(cached[day_folder.name])
+    return merged
+
+
+def build_research_artifacts(summary: ResearchSummary, label: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the three Phase 2A artifacts from a summary.
+
+    Args:
+        summary: Summary of the entries to describe
+        label: Source description (archive day or day range)
+
+    Returns:
+        {output filename: artifact}
+    """
+    artifacts = {
+        'activity_regimes.json': build_activity_regimes(summary),
+        'sampling_density.json': build_sampling_density(summary),
+        'session_lifecycle.json': build_session_lifecycle(summary),
+    }
+    for artifact in artifacts.values():
+        if 'source' in artifact:
+            artifact['source']['sample_file'] = f'Full archive: {label}'
+    return artifacts
+
+
+def write_research_artifacts(artifacts: Dict[str, Dict[str, Any]], output_dir: Path):
+    """Write artifacts as ASCII JSON into output_dir."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for filename, artifact in artifacts.items():
+        output_file = output_dir / filename
+        with open(output_file, 'w', encoding='ascii') as f:
+            json.dump(artifact, f, indent=2, ensure_ascii=True)
+        print(f"  Wrote: {output_file}")
+
+
 def main():
     """Build all Phase 2A artifacts."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build Phase 2A descriptive behavior artifacts")
+    parser.add_argument('--archive-path', type=Path, default=DEFAULT_ARCHIVE_PATH,
+                        help=f"Path to archive root (default: {DEFAULT_ARCHIVE_PATH})")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for reading hour files")
+    parser.add_argument('--scope', choices=['latest', 'all'], default='latest',
+                        help="Summarize the latest archive day or every day (default: latest)")
+    parser.add_argument('--sketch-dir', type=Path,
+                        default=Path(os.environ.get('RESEARCH_SKETCH_DIR') or DEFAULT_SKETCH_DIR),
+                        help=f"Per-day summary cache for --scope all "
+                             f"(default: RESEARCH_SKETCH_DIR or {DEFAULT_SKETCH_DIR})")
+    args = parser.parse_args()
+
     print("=" * 70)
     print("Building Phase 2A Descriptive Behavior Artifacts")
     print("=" * 70)
-    
+
     root = Path(__file__).resolve().parent.parent
-    
+
     # Load SSOT
     print("\n[LOAD] field_coverage_report.json (SSOT)...")
     coverage_file = root / 'data' / 'field_coverage_report.json'
     with open(coverage_file, 'r', encoding='utf-8') as f:
         coverage = json.load(f)
     print(f"  Loaded {coverage['unique_paths_discovered']} paths")
-    
-    # Load entries from full archive (stream from compressed file)
-    print("\n[LOAD] Full archive from CryptoBot...")
-    archive_base = Path('/srv/cryptobot/data/archive')
-    
-    # Find latest archive folder
-    date_folders = sorted([d for d in archive_base.iterdir() if d.is_dir() and d.name.isdigit()], reverse=True)
-    if not date_folders:
-        print("  ERROR: No archive folders found")
-        sys.exit(1)
-    
-    latest_folder = date_folders[0]
-    print(f"  Using archive folder: {latest_folder.name}")
-    
-    # Find all .jsonl.gz files in the latest folder, sorted by modification time (newest first)
-    archive_files = sorted(latest_folder.glob('*.jsonl.gz'), key=lambda f: f.stat().st_mtime, reverse=True)
-    
-    if not archive_files:
-        print(f"  ERROR: No .jsonl.gz files found in {latest_folder}")
-        sys.exit(1)
-    
-    print(f"  Found {len(archive_files)} archive file(s)")
-    
-    # Load all entries from all files
-    entries = []
-    for archive_file in archive_files:
-        print(f"  Reading {archive_file.name}...")
-        with gzip.open(archive_file, 'rt', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        entries.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        pass
-    
-    print(f"  Loaded {len(entries)} total entries from full archive")
-    
+    paths = resolve_research_paths(coverage)
+
+    if args.scope == 'all':
+        print("\n[LOAD] Full archive from CryptoBot (all days)...")
+        day_folders = find_archive_days(args.archive_path)
+        if not day_folders:
+            print("  ERROR: No archive folders found")
+            sys.exit(1)
+        summary = summarize_archive(args.archive_path, paths, args.sketch_dir, args.jobs)
+        label = f"{day_folders[0].name} to {day_folders[-1].name}"
+    else:
+        # Summarize the latest day while streaming its hour files (parallel scan)
+        print("\n[LOAD] Full archive from CryptoBot...")
+        latest_folder = find_latest_folder(args.archive_path)
+        print(f"  Using archive folder: {latest_folder.name}")
+
+        archive_files = sorted(latest_folder.glob('*.jsonl.gz'))
+        if not archive_files:
+            print(f"  ERROR: No .jsonl.gz files found in {latest_folder}")
+            sys.exit(1)
+
+        print(f"  Found {len(archive_files)} archive file(s)")
+
+        results, _ = scan_files(archive_files, [ResearchSketches(paths, [latest_folder.name])],
+                                jobs=min(len(archive_files), args.jobs))
+        summary = results[ResearchSketches.name].get(latest_folder.name, ResearchSummary(paths))
+        label = latest_folder.name
+
+    print(f"  Summarized {summary.entries_scanned} total entries from full archive")
+
     # Build artifacts
     output_dir = root / 'public' / 'data'
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # 1. Activity regimes
-    activity = build_activity_regimes(entries, coverage)
-    activity['source']['sample_file'] = f'Full archive: {latest_folder.name}'
-    activity_file = output_dir / 'activity_regimes.json'
-    with open(activity_file, 'w', encoding='ascii') as f:
-        json.dump(activity, f, indent=2, ensure_ascii=True)
-    print(f"  Wrote: {activity_file}")
-    
-    # 2. Sampling density
-    sampling = build_sampling_density(entries, coverage)
-    sampling['source']['sample_file'] = f'Full archive: {latest_folder.name}'
-    sampling_file = output_dir / 'sampling_density.json'
-    with open(sampling_file, 'w', encoding='ascii') as f:
-        json.dump(sampling, f, indent=2, ensure_ascii=True)
-    print(f"  Wrote: {sampling_file}")
-    
-    # 3. Session lifecycle
-    lifecycle = build_session_lifecycle(entries, coverage)
-    lifecycle['source']['sample_file'] = f'Full archive: {latest_folder.name}'
-    lifecycle_file = output_dir / 'session_lifecycle.json'
-    with open(lifecycle_file, 'w', encoding='ascii') as f:
-        json.dump(lifecycle, f, indent=2, ensure_ascii=True)
-    print(f"  Wrote: {lifecycle_file}")
-    
+    artifacts = build_research_artifacts(summary, label)
+    write_research_artifacts(artifacts, output_dir)
+
     print("\n" + "=" * 70)
     print("DONE")
     print("=" * 70)
-    print(f"Generated 3 artifacts from {len(entries)} entries in {output_dir}")
+    print(f"Generated 3 artifacts from {summary.entries_scanned} entries in {output_dir}")
 
 
 if __name__ == '__main__':
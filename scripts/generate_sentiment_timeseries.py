@@ -3,18 +3,25 @@
 Generate Sentiment Time Series for Sample Symbols
 
 Extracts all archive entries for the 100 sample symbols and creates a per-symbol
-time series of sentiment scores and post counts.
+time series of sentiment scores and post counts. Points come from the
+per-symbol sentiment store (sentiment_store.py), which is appended with new
+archive days on each run.
 
 Output: public/data/sample_symbols_sentiment_timeseries.json
 """
 
 import json
-import gzip
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
+sys.path.insert(0, str(Path(__file__).parent))
+from sentiment_store import SentimentStore
+
+SAMPLE_JSON = Path("public/data/sample_entries_v7.json")
+OUTPUT_FILE = Path("public/data/sample_symbols_sentiment_timeseries.json")
+
 
 def load_sample_symbols(sample_json_path: Path) -> List[str]:
     """Load the list of symbols from the public sample entries file."""
@@ -29,125 +36,33 @@ def load_sample_symbols(sample_json_path: Path) -> List[str]:
         sys.exit(1)
 
 
-def extract_sentiment_data(entry: dict) -> Optional[dict]:
+def load_series_from_store(archive_path: Path, target_symbols: set,
+                           extracted: Optional[dict] = None) -> Dict[str, List[dict]]:
     """
-    Extract sentiment and post count from an entry.
+    Extract all archive entries for the target symbols via the sentiment store.
     
-    Returns dict with:
-    - ts: timestamp (ISO8601)
-    - mean_sent: hybrid sentiment mean score (-1 to +1)
-    - posts: total posts counted
-    - is_silent: whether entry was marked as silent
-    """
-    # Get timestamp
-    ts = entry.get('meta', {}).get('added_ts')
-    if not ts:
-        return None
-    
-    # Try to get sentiment from last_2_cycles first, fallback to last_cycle
-    windows = entry.get('twitter_sentiment_windows', {})
-    
-    sentiment_data = None
-    posts_total = None
-    is_silent = None
-    
-    # Priority: last_2_cycles > last_cycle
-    if 'last_2_cycles' in windows:
-        window = windows['last_2_cycles']
-        sentiment_data = window.get('hybrid_decision_stats', {}).get('mean_score')
-        posts_total = window.get('posts_total')
-        activity = window.get('sentiment_activity', {})
-        is_silent = activity.get('is_silent')
-    
-    if sentiment_data is None and 'last_cycle' in windows:
-        window = windows['last_cycle']
-        sentiment_data = window.get('hybrid_decision_stats', {}).get('mean_score')
-        posts_total = window.get('posts_total')
-        activity = window.get('sentiment_activity', {})
-        is_silent = activity.get('is_silent')
-    
-    # Only include entries with sentiment data
-    if sentiment_data is None:
-        return None
-    
-    result = {
-        'ts': ts,
-        'mean_sent': round(sentiment_data, 4)
-    }
-    
-    if posts_total is not None:
-        result['posts'] = posts_total
-    
-    if is_silent is not None:
-        result['is_silent'] = is_silent
-    
-    return result
-
-
-def scan_archive_for_symbols(archive_path: Path, target_symbols: set) -> Dict[str, List[dict]]:
-    """
-    Scan the archive and extract all entries for the target symbols.
+    The per-symbol store (sentiment_store.py) is first synced with the
+    archive, which ingests only days that are new or changed since the last
+    run; then only the target symbols' partitions are read. Days already
+    read by a shared scan can be passed as extracted (see
+    SentimentStore.sync).
     
     Returns a dict mapping symbol -> list of time series points.
     """
-    print(f"[INFO] Scanning archive: {archive_path}")
+    store = SentimentStore()
+    print(f"[INFO] Syncing sentiment store {store.store_dir} with archive: {archive_path}")
     
-    series_by_symbol = {symbol: [] for symbol in target_symbols}
-    total_entries_scanned = 0
-    total_entries_matched = 0
-    
-    # Find all date folders
-    date_folders = sorted([
-        d for d in archive_path.iterdir() 
-        if d.is_dir() and d.name.isdigit() and len(d.name) == 8
-    ])
-    
-    if not date_folders:
-        print(f"[ERROR] No date folders found in {archive_path}", file=sys.stderr)
-        sys.exit(1)
+    result = store.sync(archive_path, extracted=extracted)
+    print(f"[INFO] Ingested {len(result['ingested'])} new or changed days "
+          f"({result['rows']} points)")
     
-    print(f"[INFO] Found {len(date_folders)} date folders")
-    
-    for date_folder in date_folders:
-        print(f"[INFO] Processing {date_folder.name}...")
-        
-        # Find all .jsonl.gz files in this folder
-        archive_files = list(date_folder.glob('*.jsonl.gz'))
-        
-        for archive_file in archive_files:
-            try:
-                with gzip.open(archive_file, 'rt', encoding='utf-8') as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        
-                        total_entries_scanned += 1
-                        
-                        try:
-                            entry = json.loads(line)
-                            symbol = entry.get('symbol')
-                            
-                            if symbol in target_symbols:
-                                sentiment_point = extract_sentiment_data(entry)
-                                if sentiment_point:
-                                    series_by_symbol[symbol].append(sentiment_point)
-                                    total_entries_matched += 1
-                        
-                        except json.JSONDecodeError:
-                            continue
-            
-            except Exception as e:
-                print(f"[WARN] Error reading {archive_file.name}: {e}", file=sys.stderr)
-                continue
-    
-    print(f"[INFO] Scanned {total_entries_scanned} total entries")
+    series_by_symbol = store.read_series(target_symbols)
+    total_entries_matched = sum(len(series) for series in series_by_symbol.values())
     print(f"[INFO] Matched {total_entries_matched} entries for sample symbols")
     
-    # Sort each symbol's series by timestamp
-    for symbol in series_by_symbol:
-        series_by_symbol[symbol].sort(key=lambda x: x['ts'])
-        if series_by_symbol[symbol]:
-            print(f"  {symbol}: {len(series_by_symbol[symbol])} entries")
+    for symbol, series in series_by_symbol.items():
+        if series:
+            print(f"  {symbol}: {len(series)} entries")
     
     return series_by_symbol
 
@@ -188,9 +103,9 @@ def main():
     print()
     
     # Paths
-    sample_json = Path("public/data/sample_entries_v7.json")
+    sample_json = SAMPLE_JSON
     archive_path = Path("/srv/cryptobot/data/archive")
-    output_path = Path("public/data/sample_symbols_sentiment_timeseries.json")
+    output_path = OUTPUT_FILE
     
     # Check if archive exists
     if not archive_path.exists():
@@ -205,8 +120,8 @@ def main():
     symbols = load_sample_symbols(sample_json)
     target_symbols = set(symbols)
     
-    # Scan archive
-    series_by_symbol = scan_archive_for_symbols(archive_path, target_symbols)
+    # Sync store and read the sample symbols' partitions
+    series_by_symbol = load_series_from_store(archive_path, target_symbols)
     
     # Write artifact
     write_timeseries_artifact(series_by_symbol, output_path)
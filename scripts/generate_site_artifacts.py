@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Single-Scan Site Artifact Generator
+
+daily_site_refresh.sh used to run one process per artifact, each re-reading
+the archive or the sample file and re-parsing the same JSON. This command
+builds them all from shared inputs:
+
+    - One archive pass (archive_scan.py) over the latest day plus the days
+      the sentiment store still has to ingest; every entry is decoded once
+      and fed to the aggregators that need it:
+        * SentimentPoints   -> sentiment store -> sample_symbols_sentiment_timeseries.json
+        * ResearchSketches  -> activity_regimes / sampling_density / session_lifecycle.json
+        * sidecar indexes   -> archive_stats.json (incremental, no recount)
+    - field_coverage_report.json and the head-200 sample are parsed once and
+      shared by coverage_table.json, dataset_overview.json and the research
+      artifacts
+
+Outputs are identical to running the per-artifact scripts, which remain as
+thin CLIs over the same build functions.
+
+Usage:
+    python3 scripts/generate_site_artifacts.py --archive-path /srv/cryptobot/data/archive
+    python3 scripts/generate_site_artifacts.py --archive-path ... --jobs 8 --skip sentiment_timeseries
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+import generate_archive_stats
+import generate_coverage_table
+import generate_dataset_overview
+import generate_research_artifacts
+import generate_sentiment_timeseries
+from archive_scan import scan_files
+from sentiment_store import SentimentPoints, SentimentStore, day_fingerprint
+
+DEFAULT_ARCHIVE_PATH = Path("/srv/cryptobot/data/archive")
+
+# Build order: the store scan writes sidecars that archive stats then reuse
+ARTIFACTS = [
+    "sentiment_timeseries",
+    "archive_stats",
+    "research_artifacts",
+    "coverage_table",
+    "dataset_overview",
+]
+
+# Store backlogs larger than this are ingested day by day by the store
+# itself (bounded memory) instead of through the shared pass
+SHARED_SCAN_MAX_DAYS = 3
+
+
+def plan_shared_scan(archive_path: Path, selected: list, store: SentimentStore) -> tuple:
+    """
+    Decide which archive days the shared pass reads.
+
+    Returns:
+        Tuple of (latest day folder, [day folders to scan])
+    """
+    folders = generate_archive_stats.find_archive_folders(archive_path)
+    if not folders:
+        print("[ERROR] No archive folders found", file=sys.stderr)
+        sys.exit(1)
+    latest = folders[-1]
+
+    days = {latest.name: latest}
+    if "sentiment_timeseries" in selected:
+        pending = store.pending_days(archive_path, store.load_state())
+        if len(pending) <= SHARED_SCAN_MAX_DAYS:
+            days.update((d.name, d) for d in pending)
+        else:
+            print(f"[INFO] Sentiment store backlog of {len(pending)} days is ingested separately")
+    return latest, [days[name] for name in sorted(days)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build all site artifacts from one shared archive pass")
+    parser.add_argument("--archive-path", type=Path, default=DEFAULT_ARCHIVE_PATH,
+                        help=f"Path to archive root (default: {DEFAULT_ARCHIVE_PATH})")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for the archive pass")
+    parser.add_argument("--skip", action="append", default=[], choices=ARTIFACTS,
+                        help="Artifact to skip (repeatable)")
+    parser.add_argument("--state-file", type=Path, default=generate_archive_stats.STATE_FILE,
+                        help=f"Archive stats state file (default: {generate_archive_stats.STATE_FILE})")
+    args = parser.parse_args()
+
+    selected = [a for a in ARTIFACTS if a not in args.skip]
+
+    print("=" * 70)
+    print("Site Artifact Generator (single scan)")
+    print("=" * 70)
+    print(f"Artifacts: {', '.join(selected)}")
+    print()
+
+    if not args.archive_path.exists():
+        print(f"[ERROR] Archive path not found: {args.archive_path}", file=sys.stderr)
+        return 1
+
+    timings = {}
+    t0 = time.time()
+
+    # Shared non-archive inputs, parsed once
+    coverage = None
+    if "research_artifacts" in selected or "coverage_table" in selected:
+        with open(generate_coverage_table.COVERAGE_FILE, 'r', encoding='utf-8') as f:
+            coverage = json.load(f)
+        print(f"[LOAD] {generate_coverage_table.COVERAGE_FILE.name}")
+    sample_entries = None
+    if "coverage_table" in selected or "dataset_overview" in selected:
+        sample_entries = generate_dataset_overview.load_sample_entries()
+        print(f"[LOAD] {generate_dataset_overview.SAMPLE_DATA_FILE.name}: {len(sample_entries)} entries")
+
+    # Shared archive pass
+    store = SentimentStore()
+    latest, scan_days = plan_shared_scan(args.archive_path, selected, store)
+    fingerprints = {d.name: day_fingerprint(d) for d in scan_days}
+    hour_files = [f for d in scan_days for f in sorted(d.glob("*.jsonl.gz"))]
+
+    aggregators = []
+    if "sentiment_timeseries" in selected:
+        aggregators.append(SentimentPoints())
+    if "research_artifacts" in selected:
+        research_paths = generate_research_artifacts.resolve_research_paths(coverage)
+        aggregators.append(generate_research_artifacts.ResearchSketches(research_paths, [latest.name]))
+
+    print(f"\n[SCAN] {len(hour_files)} hour files from {', '.join(d.name for d in scan_days)}")
+    indexes = {}
+    results, scan_stats = scan_files(hour_files, aggregators, jobs=args.jobs, indexes=indexes)
+    timings["archive_pass"] = time.time() - t0
+
+    # Build artifacts from the shared results
+    if "sentiment_timeseries" in selected:
+        t = time.time()
+        print("\n[BUILD] sample_symbols_sentiment_timeseries.json")
+        extracted = {
+            day: {**points, "files": fingerprints[day]}
+            for day, points in results[SentimentPoints.name].items()
+        }
+        symbols = generate_sentiment_timeseries.load_sample_symbols(generate_sentiment_timeseries.SAMPLE_JSON)
+        series_by_symbol = generate_sentiment_timeseries.load_series_from_store(
+            args.archive_path, set(symbols), extracted
+        )
+        generate_sentiment_timeseries.write_timeseries_artifact(
+            series_by_symbol, generate_sentiment_timeseries.OUTPUT_FILE
+        )
+        timings["sentiment_timeseries"] = time.time() - t
+
+    if "archive_stats" in selected:
+        t = time.time()
+        print("\n[BUILD] archive_stats.json")
+        state = generate_archive_stats.load_state(args.state_file, args.archive_path)
+        stats = generate_archive_stats.build_archive_stats(args.archive_path, state, indexes)
+        generate_archive_stats.save_state(state, args.state_file)
+        generate_archive_stats.write_stats(stats, generate_archive_stats.OUTPUT_FILE)
+        timings["archive_stats"] = time.time() - t
+
+    if "research_artifacts" in selected:
+        t = time.time()
+        summary = results[generate_research_artifacts.ResearchSketches.name].get(latest.name)
+        if summary is not None and summary.entries_scanned:
+            artifacts = generate_research_artifacts.build_research_artifacts(summary, latest.name)
+            generate_research_artifacts.write_research_artifacts(
+                artifacts, generate_coverage_table.INSTRUMETRIQ_ROOT / 'public' / 'data'
+            )
+        else:
+            print(f"[WARN] No entries in {latest.name}, research artifacts not rebuilt", file=sys.stderr)
+        timings["research_artifacts"] = time.time() - t
+
+    if "coverage_table" in selected:
+        t = time.time()
+        print("\n[BUILD] coverage_table.json")
+        output = generate_coverage_table.build_coverage_table(sample_entries, coverage)
+        generate_coverage_table.write_coverage_table(output)
+        timings["coverage_table"] = time.time() - t
+
+    if "dataset_overview" in selected:
+        t = time.time()
+        print("\n[BUILD] dataset_overview.json")
+        generate_dataset_overview.build_dataset_overview(sample_entries)
+        timings["dataset_overview"] = time.time() - t
+
+    print()
+    print("=" * 70)
+    print("Summary")
+    print("=" * 70)
+    print(f"Archive pass: {scan_stats['entries']:,} entries decoded once "
+          f"({scan_stats['entries_per_sec'] or 0:,.0f} entries/sec)")
+    for name, seconds in timings.items():
+        print(f"  {name:24} {seconds:6.1f}s")
+    print(f"Total: {time.time() - t0:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
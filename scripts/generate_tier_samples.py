@@ -24,7 +24,6 @@ import argparse
 import json
 import random
 import sys
-import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -33,6 +32,8 @@ from typing import Any, Optional
 sys.path.insert(0, str(Path(__file__).parent))
 
 from r2_config import get_r2_config, R2Config
+from r2_metrics import instrument_client
+from r2_range_file import open_r2_parquet, take_rows
 
 try:
     import pyarrow as pa
@@ -131,12 +132,12 @@ def write_jsonl(records: list[dict], path: Path, indent: bool = False) -> None:
 
 def get_s3_client(config: R2Config):
     """Create boto3 S3 client for R2."""
-    return boto3.client(
+    return instrument_client(boto3.client(
         "s3",
         endpoint_url=config.endpoint,
         aws_access_key_id=config.access_key_id,
         aws_secret_access_key=config.secret_access_key,
-    )
+    ))
 
 
 def find_latest_date(s3_client, bucket: str, prefix: str) -> Optional[str]:
@@ -163,11 +164,9 @@ def find_latest_date(s3_client, bucket: str, prefix: str) -> Optional[str]:
     return sorted(dates)[-1] if dates else None
 
 
-def download_parquet(s3_client, bucket: str, key: str) -> pa.Table:
-    """Download a parquet file from R2 and return as Arrow table."""
-    with tempfile.NamedTemporaryFile(suffix=".parquet", delete=True) as tmp:
-        s3_client.download_file(bucket, key, tmp.name)
-        return pq.read_table(tmp.name)
+def open_parquet(s3_client, bucket: str, key: str) -> pq.ParquetFile:
+    """Open a parquet in R2 for ranged reads (only the footer is fetched up front)."""
+    return open_r2_parquet(s3_client, bucket, key)
 
 
 # ==============================================================================
@@ -191,6 +190,23 @@ def sample_table(table: pa.Table, n: int = DEFAULT_SAMPLE_SIZE, seed: int = 42)
     return table.take(indices)
 
 
+def sample_parquet(parquet_file: pq.ParquetFile, n: int = DEFAULT_SAMPLE_SIZE, seed: int = 42) -> pa.Table:
+    """
+    Sample n random rows from a parquet file.
+
+    Picks the same rows as sample_table() on the fully loaded table, but reads
+    only the row groups that contain them.
+    """
+    num_rows = parquet_file.metadata.num_rows
+    
+    if num_rows <= n:
+        return parquet_file.read()
+    
+    random.seed(seed)
+    indices = sorted(random.sample(range(num_rows), n))
+    return take_rows(parquet_file, indices)
+
+
 def get_tier3_sample(s3_client, bucket: str, date: Optional[str], n: int) -> pa.Table:
     """Get sample from Tier 3 daily parquet."""
     if date is None:
@@ -199,12 +215,12 @@ def get_tier3_sample(s3_client, bucket: str, date: Optional[str], n: int) -> pa.
             raise RuntimeError("No Tier 3 daily data found in R2")
     
     key = f"tier3/daily/{date}/data.parquet"
-    print(f"  Downloading tier3/daily/{date}/data.parquet...")
+    print(f"  Reading tier3/daily/{date}/data.parquet...")
     
-    table = download_parquet(s3_client, bucket, key)
-    print(f"  Source: {table.num_rows} rows, {table.num_columns} columns")
+    parquet_file = open_parquet(s3_client, bucket, key)
+    print(f"  Source: {parquet_file.metadata.num_rows} rows, {len(parquet_file.schema_arrow)} columns")
     
-    return sample_table(table, n)
+    return sample_parquet(parquet_file, n)
 
 
 def get_tier2_sample(s3_client, bucket: str, date: Optional[str], n: int) -> pa.Table:
@@ -215,12 +231,12 @@ def get_tier2_sample(s3_client, bucket: str, date: Optional[str], n: int) -> pa.
             raise RuntimeError("No Tier 2 weekly data found in R2")
     
     key = f"tier2/weekly/{date}/dataset_entries_7d.parquet"
-    print(f"  Downloading tier2/weekly/{date}/dataset_entries_7d.parquet...")
+    print(f"  Reading tier2/weekly/{date}/dataset_entries_7d.parquet...")
     
-    table = download_parquet(s3_client, bucket, key)
-    print(f"  Source: {table.num_rows} rows, {table.num_columns} columns")
+    parquet_file = open_parquet(s3_client, bucket, key)
+    print(f"  Source: {parquet_file.metadata.num_rows} rows, {len(parquet_file.schema_arrow)} columns")
     
-    return sample_table(table, n)
+    return sample_parquet(parquet_file, n)
 
 
 def get_tier1_sample(s3_client, bucket: str, date: Optional[str], n: int) -> pa.Table:
@@ -231,12 +247,12 @@ def get_tier1_sample(s3_client, bucket: str, date: Optional[str], n: int) -> pa.
             raise RuntimeError("No Tier 1 weekly data found in R2")
     
     key = f"tier1/weekly/{date}/dataset_entries_7d.parquet"
-    print(f"  Downloading tier1/weekly/{date}/dataset_entries_7d.parquet...")
+    print(f"  Reading tier1/weekly/{date}/dataset_entries_7d.parquet...")
     
-    table = download_parquet(s3_client, bucket, key)
-    print(f"  Source: {table.num_rows} rows, {table.num_columns} columns")
+    parquet_file = open_parquet(s3_client, bucket, key)
+    print(f"  Source: {parquet_file.metadata.num_rows} rows, {len(parquet_file.schema_arrow)} columns")
     
-    return sample_table(table, n)
+    return sample_parquet(parquet_file, n)
 
 
 # ==============================================================================
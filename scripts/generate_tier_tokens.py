@@ -24,6 +24,7 @@ from pathlib import Path
 # Add scripts directory to path for r2_config import
 sys.path.insert(0, str(Path(__file__).parent))
 from r2_config import get_r2_config
+from r2_metrics import instrument_client
 import boto3
 
 TOKEN_FILE = Path("/etc/instrumetriq/tier_tokens.json")
@@ -61,13 +62,13 @@ def save_token_state(state: dict) -> None:
     # Upload to R2 for Cloudflare Pages access
     try:
         cfg = get_r2_config()
-        s3 = boto3.client(
+        s3 = instrument_client(boto3.client(
             's3',
             endpoint_url=cfg.endpoint,
             aws_access_key_id=cfg.access_key_id,
             aws_secret_access_key=cfg.secret_access_key,
             region_name='auto'
-        )
+        ))
         
         s3.put_object(
             Bucket=cfg.bucket,
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Hash-While-Writing I/O
+
+SHA256 digests for manifests and integrity checks without a second pass over
+the file:
+
+    - write_table_hashed(): parquet bytes are teed through sha256 as the
+      ParquetWriter emits them
+    - download_hashed(): R2 downloads are teed through sha256 as they stream
+      in (boto3 managed transfer, still multi-part; parts are written in
+      order because the sink is not seekable)
+    - sha256_stream(): digest of a GetObject body without touching disk
+
+Digests produced this way are remembered per file (device, inode, size,
+mtime), so a later sha256_file() on the same unchanged file - e.g. the
+manifest step after the write - returns without reading it. Hard links share
+the inode and therefore the digest. Only digests taken while the bytes were
+written or downloaded are remembered; integrity checks call
+sha256_file(path, trust_memo=False) so a file corrupted after it was written
+is still caught. Where a re-read is needed (integrity checks, files written
+by DuckDB) sha256_file() hashes an mmap of the file in one call instead of
+8 KB reads.
+
+Usage:
+    from hashing_io import download_hashed, sha256_file, write_table_hashed
+
+    parquet_sha256, size = write_table_hashed(table, parquet_path, compression="zstd")
+    ...
+    manifest["parquet_sha256"] = sha256_file(parquet_path)   # no re-read
+    ok = sha256_file(parquet_path, trust_memo=False) == expected   # verifiers re-hash
+
+    # Digest of a local file
+    python3 scripts/hashing_io.py output/tier1_daily/2026-01-18/data.parquet
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Optional
+
+# Read size for stream hashing
+HASH_CHUNK_BYTES = 8 * 1024 * 1024
+
+# {(st_dev, st_ino, st_size, st_mtime_ns): sha256} of files hashed on the way in/out
+_known_digests: dict[tuple, str] = {}
+_known_lock = threading.Lock()
+
+
+def _file_key(path) -> Optional[tuple]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def record_digest(path, sha256: str):
+    """
+    Remember the digest of a file as it is now.
+
+    Only for digests of the bytes as they were written or downloaded; a
+    digest read back from metadata says nothing about the file on disk.
+    """
+    key = _file_key(path)
+    if key is not None:
+        with _known_lock:
+            _known_digests[key] = sha256
+
+
+def known_digest(path) -> Optional[str]:
+    """Digest recorded for this exact file, or None if unknown or changed since."""
+    key = _file_key(path)
+    if key is None:
+        return None
+    with _known_lock:
+        return _known_digests.get(key)
+
+
+class HashingWriter:
+    """
+    Write-only binary file wrapper that tees every write through sha256.
+
+    Not seekable on purpose: writers that need random access (and boto3's
+    parallel part writes) fall back to sequential output, which keeps the
+    digest equal to the file's.
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+        self._sha256 = hashlib.sha256()
+        self.bytes_written = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        view = memoryview(data)
+        self._sha256.update(view)
+        self.raw.write(view)
+        self.bytes_written += view.nbytes
+        return view.nbytes
+
+    def tell(self) -> int:
+        return self.bytes_written
+
+    def flush(self):
+        self.raw.flush()
+
+    def close(self):
+        # The caller owns the underlying file
+        self.flush()
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return False
+
+    def seekable(self) -> bool:
+        return False
+
+    def hexdigest(self) -> str:
+        return self._sha256.hexdigest()
+
+
+def write_table_hashed(table, path: Path, **write_kwargs) -> tuple[str, int]:
+    """
+    pq.write_table() that returns (sha256, size) of the written file.
+
+    Args:
+        table: pyarrow.Table
+        path: Output parquet path
+        **write_kwargs: Passed to pq.write_table (compression, row_group_size, ...)
+    """
+    import pyarrow.parquet as pq
+
+    with open(path, "wb", buffering=HASH_CHUNK_BYTES) as f:
+        sink = HashingWriter(f)
+        pq.write_table(table, sink, **write_kwargs)
+    digest = sink.hexdigest()
+    record_digest(path, digest)
+    return digest, sink.bytes_written
+
+
+def download_hashed(s3, bucket: str, key: str, path: Path) -> tuple[str, int]:
+    """
+    Download an R2 object to path, returning (sha256, size) of its bytes.
+    """
+    with open(path, "wb", buffering=HASH_CHUNK_BYTES) as f:
+        sink = HashingWriter(f)
+        s3.download_fileobj(bucket, key, sink)
+    digest = sink.hexdigest()
+    record_digest(path, digest)
+    return digest, sink.bytes_written
+
+
+def sha256_stream(stream, chunk_bytes: int = HASH_CHUNK_BYTES) -> str:
+    """SHA256 of a readable binary stream (e.g. a GetObject body)."""
+    h = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(chunk_bytes), b""):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def sha256_file(path: Path, trust_memo: bool = True) -> str:
+    """
+    SHA256 of a file: the recorded digest if it was hashed while written or
+    downloaded, otherwise one hashlib call over an mmap of the file.
+
+    Args:
+        trust_memo: Use a recorded digest; verifiers pass False so the
+            bytes on disk are always re-hashed
+    """
+    if trust_memo:
+        digest = known_digest(path)
+        if digest is not None:
+            return digest
+
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                h.update(mapped)
+    return h.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the SHA256 of local files")
+    parser.add_argument("paths", nargs="+", help="Files to hash")
+    args = parser.parse_args()
+
+    for path in args.paths:
+        print(f"{sha256_file(Path(path), trust_memo=False)}  {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
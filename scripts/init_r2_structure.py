@@ -26,6 +26,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from r2_config import get_r2_config
+from r2_metrics import instrument_client
 
 try:
     import boto3
@@ -47,12 +48,12 @@ PREFIXES_TO_CREATE = [
 
 def create_s3_client(config):
     """Create an S3 client configured for R2."""
-    return boto3.client(
+    return instrument_client(boto3.client(
         "s3",
         endpoint_url=config.endpoint,
         aws_access_key_id=config.access_key_id,
         aws_secret_access_key=config.secret_access_key,
-    )
+    ))
 
 
 def ensure_prefix_exists(client, bucket: str, prefix: str) -> bool:
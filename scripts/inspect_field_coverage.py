@@ -22,19 +22,42 @@ CRITICAL RULES:
     If sentiment fields are not found, the inspection logic must be wrong,
     not the data. Re-check traversal logic before concluding data is missing.
 
-INPUTS:
-    - data/samples/cryptobot_latest_head200.jsonl (real v7 entries)
+COUNTING:
+    Presence is counted in ONE traversal per entry (walk_paths): every dict
+    path reached is both discovered and counted, list elements are inspected
+    for discovery only (their paths are never "present", as before). This
+    is O(fields) per entry instead of O(paths x entries), so coverage can be
+    computed over whole archive days or months in parallel (archive_scan.py),
+    or straight from Tier 3 parquet: flat columns from footer null counts,
+    struct columns from their Arrow null bitmaps (a path is present where it
+    and all its parents are non-null). In parquet a JSON null and a missing
+    key are both null, so parquet "present" means present and non-null.
+
+INPUTS (one of):
+    - data/samples/cryptobot_latest_head200.jsonl (real v7 entries, default)
+    - --archive-path with --date YYYYMMDD or --month YYYYMM
+    - --parquet FILE_OR_DIR ... (e.g. output/tier3_daily/2026-01-*)
 
 OUTPUTS:
     - data/field_coverage_report.json (machine-readable)
     - data/field_coverage_report.md (human-readable, temporary)
+
+Usage:
+    python scripts/inspect_field_coverage.py
+    python scripts/inspect_field_coverage.py --archive-path /srv/cryptobot/data/archive --month 202601 --jobs 8
+    python scripts/inspect_field_coverage.py --parquet output/tier3_daily/2026-01-13 --out-dir output/coverage
 """
 
+import argparse
 import json
+import os
 import sys
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, Set
+from typing import Any, Dict, List, Optional, Set
+
+sys.path.insert(0, str(Path(__file__).parent))
+from archive_scan import Aggregator, find_hour_files, scan_files
 
 
 def discover_paths(obj: Any, prefix: str = "") -> Set[str]:
@@ -116,118 +139,233 @@ def categorize_path(path: str) -> str:
         return "other"
 
 
-def main():
-    # Locate sample file
-    instrumetriq_root = Path(__file__).resolve().parent.parent
-    sample_file = instrumetriq_root / "data" / "samples" / "cryptobot_latest_head200.jsonl"
-    
-    if not sample_file.exists():
-        print(f"ERROR: Sample file not found: {sample_file}", file=sys.stderr)
-        print("Run: npm run sync-sample", file=sys.stderr)
-        return 1
-    
-    print("=" * 70)
-    print("Field Coverage Inspection (Phase 1A)")
-    print("=" * 70)
-    print(f"Source: {sample_file.name}")
-    print()
-    
-    # Load all entries
-    entries = []
-    with open(sample_file, 'r', encoding='utf-8') as f:
+
+
+def walk_paths(obj: Any, coverage: dict, prefix: str = "", countable: bool = True):
+    """
+    Discover and count the paths of one JSON object in a single traversal.
+
+    Paths get the same names as discover_paths(). A path is counted present
+    exactly when get_field_value() would find it: reached through dicts
+    only, with no "." inside a key along the way. Paths under a list
+    (first element only) are discovered but never counted.
+
+    Args:
+        obj: Entry (or nested value)
+        coverage: Accumulator from new_coverage(); updated in place
+        prefix: Path of obj
+        countable: False below a list or a dotted key
+    """
+    if not isinstance(obj, dict):
+        return
+    present = coverage["present"]
+    discovered = coverage["discovered"]
+    for key, value in obj.items():
+        current_path = f"{prefix}.{key}" if prefix else key
+        discovered.add(current_path)
+        counted = countable and "." not in key
+        if counted:
+            present[current_path] = present.get(current_path, 0) + 1
+
+        if isinstance(value, dict):
+            walk_paths(value, coverage, current_path, counted)
+        elif isinstance(value, list) and len(value) > 0:
+            walk_paths(value[0], coverage, current_path, False)
+
+
+def new_coverage() -> dict:
+    """Empty coverage accumulator: entries, present counts per path, discovered paths."""
+    return {"entries": 0, "present": {}, "discovered": set()}
+
+
+def merge_coverage(a: dict, b: dict) -> dict:
+    """Fold coverage b into a (returns a)."""
+    a["entries"] += b["entries"]
+    for path, count in b["present"].items():
+        a["present"][path] = a["present"].get(path, 0) + count
+    a["discovered"] |= b["discovered"]
+    return a
+
+
+class FieldCoverage(Aggregator):
+    """archive_scan plugin: field coverage accumulator (see new_coverage)."""
+
+    name = "field_coverage"
+
+    def create(self):
+        return new_coverage()
+
+    def map(self, partial, entry):
+        partial["entries"] += 1
+        walk_paths(entry, partial)
+        return partial
+
+    def combine(self, a, b):
+        return merge_coverage(a, b)
+
+
+def coverage_from_jsonl(path: Path) -> dict:
+    """Coverage of a plain JSONL file (the head-200 sample)."""
+    coverage = new_coverage()
+    with open(path, 'r', encoding='utf-8') as f:
         for line_num, line in enumerate(f, 1):
             try:
                 entry = json.loads(line)
-                entries.append(entry)
             except json.JSONDecodeError as e:
                 print(f"WARNING: Line {line_num} invalid JSON: {e}", file=sys.stderr)
-    
-    print(f"[INFO] Loaded {len(entries)} entries")
-    
-    if len(entries) == 0:
-        print("ERROR: No entries loaded", file=sys.stderr)
-        return 1
-    
-    print()
-    
-    # Discover all unique paths across all entries
-    print("[DISCOVERY] Scanning all entries for field paths...")
-    all_paths = set()
-    for entry in entries:
-        all_paths.update(discover_paths(entry))
-    
-    print(f"[DISCOVERY] Found {len(all_paths)} unique field paths")
-    print()
-    
-    # Count presence for each path
-    print("[COUNTING] Checking presence across all entries...")
+                continue
+            coverage["entries"] += 1
+            walk_paths(entry, coverage)
+    return coverage
+
+
+def _discover_arrow_type(arrow_type, prefix: str, discovered: Set[str]):
+    # Schema counterpart of walking a list's first element: names only
+    import pyarrow as pa
+
+    if pa.types.is_struct(arrow_type):
+        for field in arrow_type:
+            current_path = f"{prefix}.{field.name}"
+            discovered.add(current_path)
+            _discover_arrow_type(field.type, current_path, discovered)
+    elif pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+        if pa.types.is_struct(arrow_type.value_type):
+            _discover_arrow_type(arrow_type.value_type, prefix, discovered)
+
+
+def _walk_arrow(array, path: str, key: str, coverage: dict, countable: bool = True):
+    # flatten() folds the parent's validity into each child, so a child's
+    # non-null count is the number of rows where the whole path exists
+    import pyarrow as pa
+
+    coverage["discovered"].add(path)
+    counted = countable and "." not in key
+    if counted:
+        coverage["present"][path] = coverage["present"].get(path, 0) + len(array) - array.null_count
+    if pa.types.is_struct(array.type):
+        for field, child in zip(array.type, array.flatten()):
+            _walk_arrow(child, f"{path}.{field.name}", field.name, coverage, counted)
+    elif pa.types.is_list(array.type) or pa.types.is_large_list(array.type):
+        if pa.types.is_struct(array.type.value_type):
+            _discover_arrow_type(array.type.value_type, path, coverage["discovered"])
+
+
+def coverage_from_parquet(parquet_path: Path) -> dict:
+    """
+    Coverage of one parquet file without materializing rows as dicts.
+
+    Non-struct columns are settled from the footer (verify_engine.null_counts);
+    struct columns are streamed in record batches and their null bitmaps
+    counted level by level.
+    """
+    import pyarrow as pa
+    from local_parquet import iter_batches, open_local_parquet
+    from verify_engine import null_counts
+
+    pf = open_local_parquet(parquet_path)
+    rows = pf.metadata.num_rows
+    coverage = new_coverage()
+    coverage["entries"] = rows
+
+    struct_columns = [field.name for field in pf.schema_arrow if pa.types.is_struct(field.type)]
+    flat_fields = [field for field in pf.schema_arrow if field.name not in struct_columns]
+    if flat_fields:
+        nulls = null_counts(pf, [field.name for field in flat_fields], footer=True)
+        for field in flat_fields:
+            coverage["discovered"].add(field.name)
+            if "." not in field.name:
+                coverage["present"][field.name] = rows - nulls[field.name]
+            _discover_arrow_type(field.type, field.name, coverage["discovered"])
+
+    if struct_columns:
+        for batch in iter_batches(pf, columns=struct_columns):
+            for name, column in zip(batch.schema.names, batch.columns):
+                _walk_arrow(column, name, name, coverage)
+    return coverage
+
+
+def find_parquet_files(paths: List[Path]) -> List[Path]:
+    """Parquet files given directly or found under the given directories."""
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(path.rglob("*.parquet")))
+        elif path.exists():
+            files.append(path)
+        else:
+            print(f"[WARN] Not found: {path}", file=sys.stderr)
+    return files
+
+
+def build_report(coverage: dict, source: str) -> dict:
+    """field_coverage_report.json layout from a coverage accumulator."""
+    entries = coverage["entries"]
+    all_paths = coverage["discovered"]
+
     path_counts = {}
     for path in sorted(all_paths):
-        present = 0
-        for entry in entries:
-            exists, _ = get_field_value(entry, path)
-            if exists:
-                present += 1
-        
+        present = coverage["present"].get(path, 0)
         path_counts[path] = {
             "present": present,
-            "missing": len(entries) - present
+            "missing": entries - present
         }
-    
-    print(f"[COUNTING] Counted presence for {len(path_counts)} paths")
-    print()
-    
+
     # Organize by category
     categorized = defaultdict(dict)
     for path, counts in sorted(path_counts.items()):
         category = categorize_path(path)
         categorized[category][path] = counts
-    
-    # Build JSON output
-    output_data = {
-        "source": sample_file.name,
-        "entries_scanned": len(entries),
+
+    return {
+        "source": source,
+        "entries_scanned": entries,
         "unique_paths_discovered": len(all_paths),
         "field_groups": dict(categorized)
     }
-    
-    # Write JSON output
-    json_output = instrumetriq_root / "data" / "field_coverage_report.json"
+
+
+def write_report(output_data: dict, out_dir: Path):
+    """Write field_coverage_report.json and .md into out_dir."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    entries = output_data["entries_scanned"]
+    categorized = output_data["field_groups"]
+
+    json_output = out_dir / "field_coverage_report.json"
     with open(json_output, 'w', encoding='utf-8') as f:
         json.dump(output_data, f, indent=2, ensure_ascii=True)
-    
+
     print(f"[OUTPUT] Wrote JSON: {json_output}")
-    
+
     # Build Markdown output
     md_lines = [
         "# Field Coverage Report (Phase 1A)",
         "",
-        f"**Source:** `{sample_file.name}`",
-        f"**Entries Scanned:** {len(entries)}",
-        f"**Unique Paths Discovered:** {len(all_paths)}",
+        f"**Source:** `{output_data['source']}`",
+        f"**Entries Scanned:** {entries}",
+        f"**Unique Paths Discovered:** {output_data['unique_paths_discovered']}",
         "",
         "---",
         "",
         "## Field Groups",
         ""
     ]
-    
+
     for category in sorted(categorized.keys()):
         paths = categorized[category]
         md_lines.append(f"### {category}")
         md_lines.append("")
         md_lines.append("| Field Path | Present | Missing | Rate |")
         md_lines.append("|------------|---------|---------|------|")
-        
+
         for path in sorted(paths.keys()):
             counts = paths[path]
-            rate = counts["present"] / len(entries) * 100
+            rate = counts["present"] / entries * 100
             md_lines.append(
                 f"| `{path}` | {counts['present']} | {counts['missing']} | {rate:.1f}% |"
             )
-        
+
         md_lines.append("")
-    
+
     md_lines.extend([
         "---",
         "",
@@ -249,34 +387,122 @@ def main():
         "4. Document unavailable fields with exact paths from this report",
         ""
     ])
-    
-    md_output = instrumetriq_root / "data" / "field_coverage_report.md"
+
+    md_output = out_dir / "field_coverage_report.md"
     with open(md_output, 'w', encoding='utf-8') as f:
         f.write('\n'.join(md_lines))
-    
+
     print(f"[OUTPUT] Wrote Markdown: {md_output}")
+
+
+def _archive_date_range(date: Optional[str], month: Optional[str]) -> tuple:
+    if date:
+        return date, date
+    return f"{month}01", f"{month}31"
+
+
+def main():
+    instrumetriq_root = Path(__file__).resolve().parent.parent
+
+    parser = argparse.ArgumentParser(description="Field coverage inspection (Phase 1A)")
+    parser.add_argument("--archive-path", type=Path,
+                        help="Archive root; inspect a full day (--date) or month (--month)")
+    parser.add_argument("--date", help="Archive day YYYYMMDD (with --archive-path)")
+    parser.add_argument("--month", help="Archive month YYYYMM (with --archive-path)")
+    parser.add_argument("--parquet", type=Path, nargs="+",
+                        help="Tier 3 parquet files or directories to inspect instead")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for archive / parquet inputs")
+    parser.add_argument("--out-dir", type=Path, default=instrumetriq_root / "data",
+                        help="Directory for field_coverage_report.json/.md (default: data/)")
+    args = parser.parse_args()
+
+    if args.archive_path and not (args.date or args.month):
+        parser.error("--archive-path needs --date or --month")
+    if args.archive_path and args.parquet:
+        parser.error("--archive-path and --parquet are mutually exclusive")
+
+    print("=" * 70)
+    print("Field Coverage Inspection (Phase 1A)")
+    print("=" * 70)
+
+    if args.archive_path:
+        from_date, to_date = _archive_date_range(args.date, args.month)
+        source = f"archive {args.date or args.month}"
+        print(f"Source: {args.archive_path} ({from_date} to {to_date})")
+        print()
+        hour_files = find_hour_files(args.archive_path, from_date, to_date)
+        if not hour_files:
+            print("ERROR: No archive hour files found", file=sys.stderr)
+            return 1
+        print(f"[DISCOVERY] Traversing {len(hour_files)} hour files (jobs={args.jobs})...")
+        results, _ = scan_files(hour_files, [FieldCoverage()], jobs=args.jobs)
+        coverage = results[FieldCoverage.name]
+    elif args.parquet:
+        parquet_files = find_parquet_files(args.parquet)
+        if not parquet_files:
+            print("ERROR: No parquet files found", file=sys.stderr)
+            return 1
+        source = parquet_files[0].name if len(parquet_files) == 1 else f"{len(parquet_files)} parquet files"
+        print(f"Source: {source}")
+        print()
+        print(f"[DISCOVERY] Reading null bitmaps of {len(parquet_files)} parquet file(s) (jobs={args.jobs})...")
+        if args.jobs > 1 and len(parquet_files) > 1:
+            from parallel_verify import run_partitions
+            parts = run_partitions(coverage_from_parquet, [(f,) for f in parquet_files],
+                                   jobs=min(args.jobs, len(parquet_files)))
+        else:
+            parts = [coverage_from_parquet(f) for f in parquet_files]
+        coverage = new_coverage()
+        for part in parts:
+            merge_coverage(coverage, part)
+    else:
+        sample_file = instrumetriq_root / "data" / "samples" / "cryptobot_latest_head200.jsonl"
+        if not sample_file.exists():
+            print(f"ERROR: Sample file not found: {sample_file}", file=sys.stderr)
+            print("Run: npm run sync-sample", file=sys.stderr)
+            return 1
+        source = sample_file.name
+        print(f"Source: {source}")
+        print()
+        print("[DISCOVERY] Traversing all entries (single pass)...")
+        coverage = coverage_from_jsonl(sample_file)
+
+    print(f"[INFO] Loaded {coverage['entries']} entries")
+
+    if coverage["entries"] == 0:
+        print("ERROR: No entries loaded", file=sys.stderr)
+        return 1
+
+    print(f"[DISCOVERY] Found {len(coverage['discovered'])} unique field paths")
     print()
-    
+
+    output_data = build_report(coverage, source)
+    write_report(output_data, args.out_dir)
+    print()
+
+    categorized = output_data["field_groups"]
+
     # Summary
     print("=" * 70)
     print("SUMMARY")
     print("=" * 70)
-    print(f"Entries scanned:       {len(entries)}")
-    print(f"Unique paths found:    {len(all_paths)}")
+    print(f"Entries scanned:       {coverage['entries']}")
+    print(f"Unique paths found:    {len(coverage['discovered'])}")
     print(f"Field groups:          {len(categorized)}")
     print()
-    
+
     # Highlight key groups
     for key_group in ["sentiment_last_cycle", "sentiment_last_2_cycles", "sentiment_meta"]:
         if key_group in categorized:
             count = len(categorized[key_group])
             print(f"{key_group:25} {count} paths")
-    
+
     print()
     print("=" * 70)
     print("DONE")
     print("=" * 70)
-    
+
     return 0
 
 
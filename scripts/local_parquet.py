@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Local Parquet Reader
+
+Shared read path for parquets on local disk (downloads, tier cache entries,
+build outputs). Verifiers and builders used to pq.read_table() whole files,
+decoding every column and row group at once - several GB of RSS for a Tier 3
+day. Here files are memory-mapped (pages come from the page cache instead of
+being copied into read buffers) and consumers ask only for what they use:
+
+    - schema / row counts:   footer only
+    - column projections:    read_columns(pf, [...]) decodes just those columns
+    - full-file passes:      iter_batches() streams bounded record batches
+    - null counts / checks:  verify_engine.run_rules() streams a rule set
+    - sampling:              r2_range_file.take_rows() decodes only the row groups hit
+
+Pre-buffering (coalesced column-chunk reads) helps high-latency sources and
+is on for file objects such as R2RangeFile; for local files it is off by
+default and can be enabled per call or with LOCAL_PARQUET_PRE_BUFFER=1.
+
+Usage:
+    from local_parquet import iter_batches, open_local_parquet, read_columns
+
+    pf = open_local_parquet(parquet_path)
+    print(pf.schema_arrow, pf.metadata.num_rows)
+    table = read_columns(pf, ["symbol", "sentiment_score"])
+    for batch in iter_batches(pf, columns=["futures_raw"]):
+        ...
+"""
+
+import os
+from typing import Iterator, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Rows per streamed batch; bounds the decoded working set of full-file passes
+DEFAULT_BATCH_ROWS = 65536
+
+# Pre-buffer local reads (env override for slow or network-mounted disks)
+DEFAULT_PRE_BUFFER = os.environ.get("LOCAL_PARQUET_PRE_BUFFER", "") == "1"
+
+
+def open_local_parquet(
+    source,
+    pre_buffer: Optional[bool] = None,
+    buffer_size: int = 0,
+) -> pq.ParquetFile:
+    """
+    Open a parquet for projected / streamed reads.
+
+    Args:
+        source: Local path (memory-mapped) or a readable file object
+            (e.g. R2RangeFile; always pre-buffered)
+        pre_buffer: Coalesce column-chunk reads for local files
+            (default: LOCAL_PARQUET_PRE_BUFFER env)
+        buffer_size: Read buffer per column chunk in bytes; 0 reads each
+            chunk whole (see pyarrow.parquet.ParquetFile)
+
+    Returns:
+        pyarrow.parquet.ParquetFile (only the footer has been read)
+    """
+    if isinstance(source, pq.ParquetFile):
+        return source
+    if isinstance(source, (str, os.PathLike)):
+        if pre_buffer is None:
+            pre_buffer = DEFAULT_PRE_BUFFER
+        return pq.ParquetFile(str(source), memory_map=True, pre_buffer=pre_buffer, buffer_size=buffer_size)
+    return pq.ParquetFile(source, pre_buffer=True, buffer_size=buffer_size)
+
+
+def present_columns(pf: pq.ParquetFile, columns: Optional[list[str]]) -> Optional[list[str]]:
+    """Requested top-level columns that exist in the file (None = all)."""
+    if columns is None:
+        return None
+    names = pf.schema_arrow.names
+    return [c for c in columns if c in names]
+
+
+def iter_batches(
+    pf: pq.ParquetFile,
+    columns: Optional[list[str]] = None,
+    row_groups: Optional[list[int]] = None,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Stream record batches of the selected columns and row groups.
+
+    Columns missing from the file are skipped; with an empty selection the
+    batches carry row counts only.
+    """
+    yield from pf.iter_batches(
+        batch_size=batch_rows,
+        row_groups=row_groups,
+        columns=present_columns(pf, columns),
+    )
+
+
+def read_columns(
+    pf: pq.ParquetFile,
+    columns: Optional[list[str]],
+    row_groups: Optional[list[int]] = None,
+) -> pa.Table:
+    """
+    Read only the selected top-level columns (and row groups) into a table.
+
+    Columns missing from the file are skipped.
+    """
+    columns = present_columns(pf, columns)
+    if row_groups is not None:
+        return pf.read_row_groups(row_groups, columns=columns)
+    return pf.read(columns=columns)
+
+
+def head_rows(pf: pq.ParquetFile, n: int, columns: Optional[list[str]] = None) -> pa.Table:
+    """First n rows of the selected columns, decoding no more batches than needed."""
+    batches = []
+    remaining = n
+    for batch in iter_batches(pf, columns, batch_rows=max(1, min(n, DEFAULT_BATCH_ROWS))):
+        batches.append(batch.slice(0, remaining))
+        remaining -= batches[-1].num_rows
+        if remaining <= 0:
+            break
+    if not batches:
+        return pf.read_row_groups([], columns=present_columns(pf, columns))
+    return pa.Table.from_batches(batches)
+
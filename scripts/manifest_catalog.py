@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Manifest Catalog
+
+One catalog.json per R2 partition prefix (e.g. tier3/daily, tier1/weekly)
+summarizing every partition's manifest. Readers fetch a single object instead
+of one manifest per day.
+
+Catalog layout (R2 key: {prefix}/catalog.json):
+    {
+      "catalog_version": 1,
+      "prefix": "tier3/daily",
+      "updated_ts_utc": "2026-01-28T00:12:03+00:00",
+      "entries": {
+        "2026-01-27": {
+          "partition": "2026-01-27",
+          "r2_key": "tier3/daily/2026-01/2026-01-27/instrumetriq_tier3_daily_2026-01-27.parquet",
+          "manifest_key": "tier3/daily/2026-01/2026-01-27/manifest.json",
+          "row_count": 41234,
+          "sha256": "9f2c...",
+          "size_bytes": 123456789,
+          "hours_found": 24,
+          "is_partial": false,
+          "schema_fingerprint": "b71d...",
+          "updated_ts_utc": "..."
+        }
+      }
+    }
+
+Concurrency:
+    Upserts are read-modify-write with a conditional PUT (If-Match on the ETag
+    that was read, or If-None-Match: * when creating). A concurrent builder that
+    wrote in between makes the PUT fail with 412, and the upsert re-reads and
+    retries. No builder's entry is lost and readers never see a partial file.
+
+Usage:
+    from manifest_catalog import fetch_catalog_entries, upsert_catalog_entry
+
+    entries = fetch_catalog_entries(s3, bucket, "tier3/daily")
+    upsert_catalog_entry(s3, bucket, "tier3/daily", "2026-01-27",
+                         catalog_entry_from_manifest(manifest, r2_key, manifest_key, schema))
+
+    # Rebuild a catalog from the manifests already in R2 (bootstrap / repair)
+    python3 scripts/manifest_catalog.py --rebuild tier3/daily
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+try:
+    from botocore.exceptions import ClientError
+except ImportError:
+    print("[ERROR] boto3 is required. Install with: pip install boto3", file=sys.stderr)
+    sys.exit(1)
+
+sys.path.insert(0, str(Path(__file__).parent))
+from schema_registry import schema_fingerprint
+
+CATALOG_VERSION = 1
+CATALOG_FILENAME = "catalog.json"
+
+# Conditional-PUT retry budget for concurrent upserts
+MAX_UPSERT_ATTEMPTS = 8
+
+
+def catalog_key(prefix: str) -> str:
+    """R2 key of the catalog for a partition prefix (e.g. "tier3/daily")."""
+    return f"{prefix.rstrip('/')}/{CATALOG_FILENAME}"
+
+
+def catalog_entry_from_manifest(
+    manifest: dict,
+    r2_key: str,
+    manifest_key: str,
+    schema=None,
+    size_bytes: Optional[int] = None,
+) -> dict:
+    """
+    Build a catalog entry from a partition manifest.
+
+    Args:
+        manifest: Manifest dict as written by a builder
+        r2_key: R2 key of the partition parquet
+        manifest_key: R2 key of the manifest
+        schema: Optional pyarrow schema of the parquet (for the fingerprint)
+        size_bytes: Parquet size for manifests that do not record one
+    """
+    fingerprint = manifest.get("schema_fingerprint")
+    if fingerprint is None and schema is not None:
+        fingerprint = schema_fingerprint(schema)
+
+    return {
+        "r2_key": r2_key,
+        "manifest_key": manifest_key,
+        "row_count": manifest.get("row_count"),
+        "sha256": manifest.get("parquet_sha256") or manifest.get("sha256"),
+        "size_bytes": manifest.get("parquet_size_bytes") or manifest.get("file_size_bytes") or size_bytes,
+        "hours_found": manifest.get("hours_found"),
+        "hours_expected": manifest.get("hours_expected"),
+        "missing_hours": manifest.get("missing_hours"),
+        "rows_by_hour": manifest.get("rows_by_hour"),
+        "is_partial": manifest.get("is_partial", False),
+        "schema_fingerprint": fingerprint,
+    }
+
+
+# ==============================================================================
+# Read
+# ==============================================================================
+
+def load_catalog(s3, bucket: str, prefix: str) -> tuple[dict, Optional[str]]:
+    """
+    Fetch the catalog for a prefix.
+
+    Returns:
+        Tuple of (catalog dict, ETag). A missing catalog returns an empty
+        catalog and ETag None.
+    """
+    try:
+        response = s3.get_object(Bucket=bucket, Key=catalog_key(prefix))
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+            return _empty_catalog(prefix), None
+        raise
+
+    catalog = json.loads(response["Body"].read())
+    catalog.setdefault("entries", {})
+    return catalog, response.get("ETag")
+
+
+def fetch_catalog_entries(s3, bucket: str, prefix: str) -> dict[str, dict]:
+    """
+    Return {partition: entry} for a prefix; empty if the catalog is missing
+    or unreadable (callers fall back to per-partition manifests).
+    """
+    try:
+        catalog, _ = load_catalog(s3, bucket, prefix)
+    except Exception as e:
+        print(f"[WARN] Could not read catalog {catalog_key(prefix)}: {e}", file=sys.stderr)
+        return {}
+    return catalog.get("entries", {})
+
+
+def _empty_catalog(prefix: str) -> dict:
+    return {
+        "catalog_version": CATALOG_VERSION,
+        "prefix": prefix.rstrip("/"),
+        "updated_ts_utc": None,
+        "entries": {},
+    }
+
+
+# ==============================================================================
+# Write (optimistic concurrency)
+# ==============================================================================
+
+def _is_precondition_failure(e: ClientError) -> bool:
+    code = e.response.get("Error", {}).get("Code")
+    status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return code in ("PreconditionFailed", "412") or status == 412
+
+
+def _put_catalog(s3, bucket: str, prefix: str, catalog: dict, etag: Optional[str]):
+    body = json.dumps(catalog, indent=2, sort_keys=True).encode("utf-8")
+    params = {
+        "Bucket": bucket,
+        "Key": catalog_key(prefix),
+        "Body": body,
+        "ContentType": "application/json",
+    }
+    if etag:
+        params["IfMatch"] = etag
+    else:
+        params["IfNoneMatch"] = "*"
+    s3.put_object(**params)
+
+
+def update_catalog(s3, bucket: str, prefix: str, mutate, max_attempts: int = MAX_UPSERT_ATTEMPTS) -> dict:
+    """
+    Apply mutate(entries) to the catalog with a conditional PUT, retrying on
+    concurrent modification.
+
+    Args:
+        mutate: Callable receiving the entries dict and modifying it in place
+
+    Returns:
+        The catalog as written
+
+    Raises:
+        RuntimeError: If every attempt lost the race
+    """
+    for attempt in range(1, max_attempts + 1):
+        catalog, etag = load_catalog(s3, bucket, prefix)
+        mutate(catalog["entries"])
+        catalog["catalog_version"] = CATALOG_VERSION
+        catalog["prefix"] = prefix.rstrip("/")
+        catalog["updated_ts_utc"] = datetime.now(timezone.utc).isoformat()
+        catalog["entries"] = dict(sorted(catalog["entries"].items()))
+
+        try:
+            _put_catalog(s3, bucket, prefix, catalog, etag)
+            return catalog
+        except ClientError as e:
+            if not _is_precondition_failure(e):
+                raise
+            # Another writer got in first: back off with jitter and re-read
+            time.sleep(min(2.0, 0.1 * (2 ** (attempt - 1))) * (0.5 + random.random()))
+
+    raise RuntimeError(f"Catalog {catalog_key(prefix)} update lost {max_attempts} concurrent races")
+
+
+def upsert_catalog_entry(s3, bucket: str, prefix: str, partition: str, entry: dict) -> dict:
+    """Insert or replace one partition's entry. Returns the written catalog."""
+    stored = {
+        "partition": partition,
+        **entry,
+        "updated_ts_utc": datetime.now(timezone.utc).isoformat(),
+    }
+
+    def mutate(entries):
+        entries[partition] = stored
+
+    return update_catalog(s3, bucket, prefix, mutate)
+
+
+def remove_catalog_entries(s3, bucket: str, prefix: str, partitions: list[str]) -> dict:
+    """Drop entries (e.g. after retention cleanup). Returns the written catalog."""
+    def mutate(entries):
+        for partition in partitions:
+            entries.pop(partition, None)
+
+    return update_catalog(s3, bucket, prefix, mutate)
+
+
+# ==============================================================================
+# CLI: rebuild from existing manifests
+# ==============================================================================
+
+def rebuild_catalog(s3, bucket: str, prefix: str) -> dict:
+    """
+    Rebuild a catalog by reading every manifest.json under the prefix.
+
+    The partition id is the manifest's parent folder name (YYYY-MM-DD for daily
+    and weekly, YYYY-MM for monthly). Schema fingerprints are carried over only
+    if the manifests record one.
+    """
+    prefix = prefix.rstrip("/")
+    parquet_keys: dict[str, str] = {}
+    parquet_sizes: dict[str, int] = {}
+    manifest_keys: dict[str, str] = {}
+
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=f"{prefix}/"):
+        for obj in page.get("Contents", []):
+            key = obj["Key"]
+            parent = key.rsplit("/", 2)[-2] if key.count("/") >= 2 else None
+            if not parent:
+                continue
+            if key.endswith("/manifest.json"):
+                manifest_keys[parent] = key
+            elif key.endswith(".parquet"):
+                parquet_keys[parent] = key
+                parquet_sizes[parent] = obj.get("Size")
+
+    print(f"[INFO] Found {len(manifest_keys)} manifests under {prefix}/")
+    entries = {}
+    for partition, manifest_key in sorted(manifest_keys.items()):
+        if partition not in parquet_keys:
+            print(f"  [SKIP] {partition}: manifest without parquet")
+            continue
+        try:
+            response = s3.get_object(Bucket=bucket, Key=manifest_key)
+            manifest = json.loads(response["Body"].read())
+        except Exception as e:
+            print(f"  [WARN] {partition}: could not read manifest: {e}")
+            continue
+        entries[partition] = {
+            "partition": partition,
+            **catalog_entry_from_manifest(manifest, parquet_keys[partition], manifest_key,
+                                          size_bytes=parquet_sizes.get(partition)),
+            "updated_ts_utc": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def mutate(existing):
+        existing.clear()
+        existing.update(entries)
+
+    catalog = update_catalog(s3, bucket, prefix, mutate)
+    print(f"[OK] Wrote {catalog_key(prefix)} with {len(catalog['entries'])} entries")
+    return catalog
+
+
+def main():
+    sys.path.insert(0, str(Path(__file__).parent))
+    import boto3
+    from r2_config import get_r2_config
+    from r2_metrics import instrument_client
+
+    parser = argparse.ArgumentParser(description="Inspect or rebuild per-prefix manifest catalogs in R2")
+    parser.add_argument("prefix", nargs="?", default="tier3/daily", help="Partition prefix (default: tier3/daily)")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the catalog from manifests in R2")
+    args = parser.parse_args()
+
+    cfg = get_r2_config()
+    s3 = instrument_client(boto3.client(
+        "s3",
+        endpoint_url=cfg.endpoint,
+        aws_access_key_id=cfg.access_key_id,
+        aws_secret_access_key=cfg.secret_access_key,
+        region_name="auto",
+    ))
+
+    if args.rebuild:
+        rebuild_catalog(s3, cfg.bucket, args.prefix)
+        return 0
+
+    entries = fetch_catalog_entries(s3, cfg.bucket, args.prefix)
+    print(f"{catalog_key(args.prefix)}: {len(entries)} entries")
+    for partition, entry in entries.items():
+        partial = " (PARTIAL)" if entry.get("is_partial") else ""
+        print(f"  {partition}: {entry.get('row_count')} rows, {entry.get('size_bytes')} bytes{partial}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -202,16 +202,17 @@ def check_r2_exists(tier: str, date_str: str) -> bool:
     """Check if R2 object exists for the tier/date."""
     try:
         from r2_config import get_r2_config
+        from r2_metrics import instrument_client
         import boto3
         
         config = get_r2_config()
-        client = boto3.client(
+        client = instrument_client(boto3.client(
             's3',
             endpoint_url=config.endpoint,
             aws_access_key_id=config.access_key_id,
             aws_secret_access_key=config.secret_access_key,
             region_name='auto'
-        )
+        ))
         
         tier_config = TIERS[tier]
         key = f"{tier_config['r2_prefix']}/{date_str}/data.parquet"
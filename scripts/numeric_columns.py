@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Columnar Numeric Summaries for Artifact Generators
+
+Site artifact generators used to compute each statistic with its own pass
+over the entry dicts (one get_nested_value walk per entry, per field, per
+statistic) and pure-Python sorting and bucket counting. Here the needed
+fields are pulled out of the entries ONCE into Arrow columns, then every
+statistic runs as pyarrow.compute kernels:
+
+    - extract_columns(): one traversal per entry over a trie of the
+      requested dot-separated paths (shared prefixes are walked once)
+    - median / percentile / zero share / histogram over the columns
+
+Each statistic reproduces the pure-Python definition it replaces:
+
+    - numeric values are int/float (bool counts as int, as isinstance did);
+      NaN and +-inf are dropped for median / percentiles / histograms but
+      still count towards zero_pct's denominator
+    - median follows statistics.median (arrow_checks.numeric_summary)
+    - percentile(p) is sorted_values[min(int(n * p / 100), n - 1)]
+    - histogram buckets are inclusive [min, max]; a value lands in the
+      first matching bucket
+
+Usage:
+    from numeric_columns import extract_columns
+
+    columns = extract_columns(entries, ["derived.spread_bps"], length_paths=["spot_prices"])
+    columns.median("derived.spread_bps")
+    columns.percentiles("derived.spread_bps", (10, 90))
+    columns.length_median("spot_prices")
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+sys.path.insert(0, str(Path(__file__).parent))
+from arrow_checks import numeric_summary
+
+# Trie key holding the paths that end at a node (JSON keys are strings)
+_LEAF = None
+
+
+def _build_trie(numeric_paths: Iterable[str], length_paths: Iterable[str]) -> dict:
+    trie = {}
+    for kind, paths in (("numeric", numeric_paths), ("length", length_paths)):
+        for path in paths:
+            node = trie
+            for part in path.split('.'):
+                node = node.setdefault(part, {})
+            node.setdefault(_LEAF, []).append((kind, path))
+    return trie
+
+
+def _walk(obj: dict, node: dict, row: int, numeric: dict, lengths: dict):
+    for key, child in node.items():
+        if key is _LEAF:
+            continue
+        value = obj.get(key)
+        if value is None:
+            continue
+        for kind, path in child.get(_LEAF, ()):
+            if kind == "numeric":
+                if isinstance(value, (int, float)):
+                    numeric[path][row] = float(value)
+            elif isinstance(value, list):
+                lengths[path][row] = len(value)
+        if isinstance(value, dict):
+            _walk(value, child, row, numeric, lengths)
+
+
+class NumericColumns:
+    """
+    Columns extracted by extract_columns(); one row per entry, null where
+    the path is missing or not of the expected type.
+
+    Attributes:
+        numeric: {path: float64 Array} (NaN / inf kept)
+        lengths: {path: int64 Array} of list lengths
+    """
+
+    def __init__(self, numeric: Dict[str, pa.Array], lengths: Dict[str, pa.Array]):
+        self.numeric = numeric
+        self.lengths = lengths
+        self._finite = {}
+
+    def finite(self, path: str) -> pa.Array:
+        """Non-null, finite values of a numeric path."""
+        if path not in self._finite:
+            column = self.numeric[path]
+            self._finite[path] = column.filter(pc.is_finite(column))
+        return self._finite[path]
+
+    def median(self, path: str) -> Optional[float]:
+        """statistics.median of the finite values (None if there are none)."""
+        summary = numeric_summary(self.finite(path), ("median",))
+        return summary["median"] if summary else None
+
+    def percentiles(self, path: str, ps: Sequence[float]) -> Optional[Dict[float, float]]:
+        """{p: sorted_values[int(n * p / 100)]} of the finite values (None if empty)."""
+        values = self.finite(path)
+        n = len(values)
+        if n == 0:
+            return None
+        order = pc.sort_indices(values)
+        return {p: values[order[min(int(n * p / 100.0), n - 1)].as_py()].as_py() for p in ps}
+
+    def zero_pct(self, path: str) -> Optional[float]:
+        """Percent of numeric values (NaN / inf included) equal to 0."""
+        column = self.numeric[path]
+        total = len(column) - column.null_count
+        if total == 0:
+            return None
+        zeros = pc.sum(pc.equal(column, 0.0)).as_py() or 0
+        return zeros / total * 100.0
+
+    def histogram(self, path: str, buckets: List[dict]) -> List[int]:
+        """Finite-value counts per inclusive {'min', 'max'} bucket."""
+        values = self.finite(path)
+        counts = []
+        taken = None
+        for bucket in buckets:
+            mask = pc.and_(pc.greater_equal(values, bucket['min']), pc.less_equal(values, bucket['max']))
+            if taken is not None:
+                mask = pc.and_(mask, pc.invert(taken))
+            counts.append(pc.sum(pc.cast(mask, pa.int64())).as_py() or 0)
+            taken = mask if taken is None else pc.or_(taken, mask)
+        return counts
+
+    def length_median(self, path: str) -> Optional[float]:
+        """statistics.median of the list lengths at path (None if no lists)."""
+        summary = numeric_summary(self.lengths[path], ("median",))
+        return summary["median"] if summary else None
+
+
+def extract_columns(entries: Sequence[dict], numeric_paths: Iterable[str] = (),
+                    length_paths: Iterable[str] = ()) -> NumericColumns:
+    """
+    Extract numeric values and list lengths for the given paths in one pass.
+
+    Args:
+        entries: Entry dicts
+        numeric_paths: Dot-separated paths of numeric fields
+        length_paths: Dot-separated paths of list fields (lengths are taken)
+
+    Returns:
+        NumericColumns with one row per entry
+    """
+    numeric_paths = list(dict.fromkeys(numeric_paths))
+    length_paths = list(dict.fromkeys(length_paths))
+    trie = _build_trie(numeric_paths, length_paths)
+    n = len(entries)
+    numeric = {path: [None] * n for path in numeric_paths}
+    lengths = {path: [None] * n for path in length_paths}
+
+    for row, entry in enumerate(entries):
+        if isinstance(entry, dict):
+            _walk(entry, trie, row, numeric, lengths)
+
+    return NumericColumns(
+        {path: pa.array(values, type=pa.float64()) for path, values in numeric.items()},
+        {path: pa.array(values, type=pa.int64()) for path, values in lengths.items()},
+    )
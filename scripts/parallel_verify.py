@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Parallel Partition Verification
+
+Runs a per-partition verification function (one date or one week) across a
+process pool, so whole-history audits scale with cores instead of days.
+
+    - Download budget: a partition is only started while the bytes of the
+      partitions in flight stay under max_inflight_bytes (a partition larger
+      than the budget still runs, alone)
+    - Clean logs: each worker's stdout is captured and printed as one block
+      when the partition finishes
+    - Deterministic results: returned in input order regardless of
+      completion order, ready for the verifier's generate_report()
+    - R2 metrics: calls made by a worker are attributed to the caller's
+      stage and folded into the parent's r2_metrics collector (pool
+      processes never reach the parent's atexit report)
+
+The worker must be a module-level function (picklable) returning a
+picklable result, e.g. a VerificationResult dataclass.
+
+Usage:
+    from parallel_verify import run_partitions
+
+    results = run_partitions(
+        verify_date_from_r2,
+        [(config, d, cache_dir) for d in dates],
+        jobs=8,
+        sizes=[r2_sizes[d] for d in dates],
+        max_inflight_bytes=4 * 1024**3,
+    )
+"""
+
+import contextlib
+import io
+import sys
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+sys.path.insert(0, str(Path(__file__).parent))
+from r2_metrics import current_stage, get_metrics, stage
+
+# Default cap on bytes being downloaded/verified at once (--max-inflight-mb)
+DEFAULT_MAX_INFLIGHT_MB = 4096
+
+
+def _run_captured(worker: Callable, args: tuple, stage_name: str) -> tuple:
+    """
+    Run worker(*args) in a pool process, capturing its stdout and R2 calls.
+
+    Returns:
+        Tuple of (result, captured log, error message or None, R2 counts)
+    """
+    # Drop counters inherited from the parent at fork time
+    metrics = get_metrics()
+    metrics.export_counts()
+
+    buffer = io.StringIO()
+    result = None
+    error = None
+    with contextlib.redirect_stdout(buffer), stage(stage_name):
+        try:
+            result = worker(*args)
+        except Exception as e:
+            # Keep the traceback with the partition's log
+            print(traceback.format_exc())
+            error = f"{type(e).__name__}: {e}"
+    return result, buffer.getvalue(), error, metrics.export_counts()
+
+
+def run_partitions(
+    worker: Callable,
+    partition_args: Sequence[tuple],
+    jobs: int,
+    sizes: Optional[Sequence[Optional[int]]] = None,
+    max_inflight_bytes: Optional[int] = None,
+    on_error: Optional[Callable[[tuple, str], object]] = None,
+    label: str = "Verification worker",
+) -> list:
+    """
+    Run worker(*args) for every args tuple with up to `jobs` processes.
+
+    Args:
+        worker: Module-level function verifying one partition
+        partition_args: One argument tuple per partition, in report order
+        jobs: Maximum concurrent processes
+        sizes: Bytes each partition downloads (None entries count as 0)
+        max_inflight_bytes: Download budget across running partitions
+        on_error: Builds a result from (args, error message) for a
+            partition whose worker raised; by default a RuntimeError is raised
+        label: Names the worker in failure messages
+
+    Returns:
+        Results in the order of partition_args
+    """
+    sizes = list(sizes) if sizes is not None else [None] * len(partition_args)
+    results = [None] * len(partition_args)
+    pending = list(range(len(partition_args)))
+    running = {}
+    inflight_bytes = 0
+    stage_name = current_stage()
+
+    with ProcessPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            # Start partitions while slots and budget allow, in order
+            while pending and len(running) < jobs:
+                index = pending[0]
+                size = sizes[index] or 0
+                if (running and max_inflight_bytes is not None
+                        and inflight_bytes + size > max_inflight_bytes):
+                    break
+                pending.pop(0)
+                future = pool.submit(_run_captured, worker, partition_args[index], stage_name)
+                running[future] = index
+                inflight_bytes += size
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                inflight_bytes -= sizes[index] or 0
+                result, log, error, r2_counts = future.result()
+                get_metrics().merge_counts(r2_counts)
+                sys.stdout.write(log)
+                sys.stdout.flush()
+                if error is not None:
+                    if on_error is None:
+                        raise RuntimeError(f"{label} failed: {error}")
+                    print(f"[ERROR] {label} failed: {error}", file=sys.stderr)
+                    result = on_error(partition_args[index], error)
+                results[index] = result
+
+    return results
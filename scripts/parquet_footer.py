@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Parquet Footer Statistics
+
+Answers verification questions from the parquet footer (ParquetFile.metadata)
+instead of decoding data:
+
+    - row counts and schema
+    - per-column null counts (summed row-group statistics)
+    - min/max ranges (e.g. snapshot_ts, meta.added_ts, spot_spread_bps)
+
+Footer null counts are exact for flat top-level columns. For nested columns
+(structs, lists) leaf statistics cannot tell a null parent from a null child;
+verify_engine.NullCounts(footer=True) settles those from the footer when some
+leaf has no nulls at all and otherwise streams only the smallest leaf chunk.
+
+With an R2RangeFile source the footer costs one ranged GET per file, so a
+full-history schema/null audit transfers almost nothing.
+
+Usage:
+    from parquet_footer import footer_column_stats
+
+    pf = pq.ParquetFile(path_or_range_file)
+    stats = footer_column_stats(pf.metadata)
+    print(stats["spot_spread_bps"]["min"], stats["spot_spread_bps"]["max"])
+
+    # Footer summary of a local parquet
+    python3 scripts/parquet_footer.py output/tier3_daily/2026-01-13/data.parquet
+"""
+
+import argparse
+import json
+import sys
+from typing import Optional
+
+import pyarrow.parquet as pq
+
+
+def footer_column_stats(metadata) -> dict[str, dict]:
+    """
+    Aggregate row-group statistics per leaf column path.
+
+    Returns:
+        {path_in_schema: {"null_count", "min", "max", "compressed_bytes"}}.
+        null_count is None if any row group lacks a null count; min/max are
+        None if any row group lacks min/max.
+    """
+    stats: dict[str, dict] = {}
+    for rg in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg)
+        for ci in range(row_group.num_columns):
+            column = row_group.column(ci)
+            path = column.path_in_schema
+            entry = stats.setdefault(path, {
+                "null_count": 0,
+                "min": None,
+                "max": None,
+                "compressed_bytes": 0,
+                "_has_min_max": True,
+            })
+            entry["compressed_bytes"] += column.total_compressed_size
+
+            s = column.statistics
+            if s is None or not s.has_null_count:
+                entry["null_count"] = None
+            elif entry["null_count"] is not None:
+                entry["null_count"] += s.null_count
+
+            if s is None or not s.has_min_max:
+                # All-null chunks have no min/max but don't invalidate the range
+                if not (s is not None and s.has_null_count and s.null_count == row_group.num_rows):
+                    entry["_has_min_max"] = False
+                continue
+            try:
+                if entry["min"] is None or s.min < entry["min"]:
+                    entry["min"] = s.min
+                if entry["max"] is None or s.max > entry["max"]:
+                    entry["max"] = s.max
+            except TypeError:
+                entry["_has_min_max"] = False
+
+    for entry in stats.values():
+        if not entry.pop("_has_min_max"):
+            entry["min"] = None
+            entry["max"] = None
+    return stats
+
+
+def column_range(stats: dict[str, dict], path: str) -> Optional[tuple]:
+    """(min, max) for a leaf path from footer_column_stats, or None if unknown."""
+    entry = stats.get(path)
+    if not entry or entry["min"] is None:
+        return None
+    return entry["min"], entry["max"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print footer statistics of a parquet file")
+    parser.add_argument("path", help="Local parquet path")
+    args = parser.parse_args()
+
+    pf = pq.ParquetFile(args.path)
+    stats = footer_column_stats(pf.metadata)
+    summary = {
+        "rows": pf.metadata.num_rows,
+        "row_groups": pf.metadata.num_row_groups,
+        "columns": pf.schema_arrow.names,
+        "leaf_stats": {
+            path: {
+                "null_count": entry["null_count"],
+                "min": str(entry["min"]) if entry["min"] is not None else None,
+                "max": str(entry["max"]) if entry["max"] is not None else None,
+                "compressed_bytes": entry["compressed_bytes"],
+            }
+            for path, entry in stats.items()
+        },
+    }
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+R2 Operation Metrics
+
+Counts R2 (S3 API) calls and bytes per operation and per script stage by
+hooking the botocore event system of a boto3 client. R2 bills per operation
+class, so the summary also splits calls into Class A and Class B.
+
+A process-wide collector is used: every client passed through
+instrument_client() reports into it. At interpreter exit a summary is printed
+and appended as one JSON line to the metrics log.
+
+The active stage is context-local (a ContextVar), so threads never see each
+other's stage. Executor threads start without the caller's context: wrap the
+submitted function with in_current_stage() to keep the caller's stage.
+Pool processes never reach the parent's atexit report; they return
+export_counts() deltas and the parent folds them in with merge_counts()
+(parallel_verify.run_partitions does both).
+
+Environment variables:
+    R2_METRICS_LOG - JSONL log path (default: ./output/metrics/r2_metrics.jsonl).
+                     Set to an empty string to disable the log.
+
+Usage:
+    from r2_metrics import instrument_client, stage, get_metrics
+
+    s3 = instrument_client(boto3.client("s3", ...))
+
+    with stage("download"):
+        s3.download_file(bucket, key, path)
+        pool.submit(in_current_stage(fetch), key)
+
+    manifest["r2_operations"] = get_metrics().snapshot()
+"""
+
+import atexit
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_METRICS_LOG = Path("./output/metrics/r2_metrics.jsonl")
+
+# Stage used when no stage() block is active
+DEFAULT_STAGE = "main"
+
+# Active stage of the current thread / task
+_current_stage = contextvars.ContextVar("r2_metrics_stage", default=DEFAULT_STAGE)
+
+# R2 pricing classes (https://developers.cloudflare.com/r2/pricing/)
+CLASS_A_OPERATIONS = {
+    "ListBuckets", "PutBucket", "ListObjects", "ListObjectsV2", "PutObject",
+    "CopyObject", "CompleteMultipartUpload", "CreateMultipartUpload",
+    "UploadPart", "UploadPartCopy", "ListMultipartUploads", "ListParts",
+    "PutBucketEncryption", "PutBucketCors", "PutBucketLifecycleConfiguration",
+}
+CLASS_B_OPERATIONS = {
+    "HeadBucket", "HeadObject", "GetObject", "GetBucketEncryption",
+    "GetBucketLocation", "GetBucketCors", "GetBucketLifecycleConfiguration",
+}
+
+# boto3 managed-transfer methods counted in addition to the API calls they issue
+TRANSFER_METHODS = ["download_file", "download_fileobj", "upload_file"]
+
+
+def _empty_op() -> dict:
+    return {"calls": 0, "errors": 0, "bytes_in": 0, "bytes_out": 0}
+
+
+def _op_class(operation: str) -> str:
+    if operation in CLASS_A_OPERATIONS:
+        return "A"
+    if operation in CLASS_B_OPERATIONS:
+        return "B"
+    return "free"
+
+
+class R2Metrics:
+    """Thread-safe counters for R2 operations, grouped by stage."""
+
+    def __init__(self, script: Optional[str] = None):
+        self.script = script or Path(sys.argv[0]).name
+        self.started_ts = datetime.now(timezone.utc)
+        self._t0 = time.monotonic()
+        self._lock = threading.Lock()
+        # stage -> operation -> counters
+        self._ops: dict[str, dict[str, dict]] = {}
+        # stage -> transfer method -> {"calls", "bytes"}
+        self._transfers: dict[str, dict[str, dict]] = {}
+
+    # --------------------------------------------------------------------------
+    # Recording
+    # --------------------------------------------------------------------------
+
+    @property
+    def current_stage(self) -> str:
+        return _current_stage.get()
+
+    def record_call(self, operation: str, bytes_out: int = 0):
+        stage_name = _current_stage.get()
+        with self._lock:
+            op = self._ops.setdefault(stage_name, {}).setdefault(operation, _empty_op())
+            op["calls"] += 1
+            op["bytes_out"] += bytes_out
+
+    def record_response(self, operation: str, bytes_in: int = 0, error: bool = False):
+        stage_name = _current_stage.get()
+        with self._lock:
+            op = self._ops.setdefault(stage_name, {}).setdefault(operation, _empty_op())
+            op["bytes_in"] += bytes_in
+            if error:
+                op["errors"] += 1
+
+    def record_transfer(self, method: str, num_bytes: int):
+        stage_name = _current_stage.get()
+        with self._lock:
+            t = self._transfers.setdefault(stage_name, {}).setdefault(method, {"calls": 0, "bytes": 0})
+            t["calls"] += 1
+            t["bytes"] += num_bytes
+
+    # --------------------------------------------------------------------------
+    # Cross-process transfer
+    # --------------------------------------------------------------------------
+
+    def export_counts(self, reset: bool = True) -> dict:
+        """
+        Raw per-stage counters (picklable), for a pool worker to return.
+
+        Args:
+            reset: Clear the counters so the next export only holds new calls
+        """
+        with self._lock:
+            counts = {
+                "operations": {s: {k: dict(v) for k, v in ops.items()} for s, ops in self._ops.items()},
+                "transfers": {s: {k: dict(v) for k, v in t.items()} for s, t in self._transfers.items()},
+            }
+            if reset:
+                self._ops = {}
+                self._transfers = {}
+        return counts
+
+    def merge_counts(self, counts: Optional[dict]):
+        """Add counters from export_counts() (e.g. of a pool worker)."""
+        if not counts:
+            return
+        with self._lock:
+            for stage_name, ops in counts["operations"].items():
+                for name, counters in ops.items():
+                    op = self._ops.setdefault(stage_name, {}).setdefault(name, _empty_op())
+                    for k in op:
+                        op[k] += counters.get(k, 0)
+            for stage_name, methods in counts["transfers"].items():
+                for name, counters in methods.items():
+                    t = self._transfers.setdefault(stage_name, {}).setdefault(name, {"calls": 0, "bytes": 0})
+                    t["calls"] += counters["calls"]
+                    t["bytes"] += counters["bytes"]
+
+    # --------------------------------------------------------------------------
+    # Reporting
+    # --------------------------------------------------------------------------
+
+    def snapshot(self) -> dict:
+        """Return a JSON-serializable summary of everything recorded so far."""
+        with self._lock:
+            operations: dict[str, dict] = {}
+            stages: dict[str, dict] = {}
+            totals = _empty_op()
+            totals["class_a_calls"] = 0
+            totals["class_b_calls"] = 0
+
+            for stage_name, ops in self._ops.items():
+                stage_totals = _empty_op()
+                for name, counters in ops.items():
+                    agg = operations.setdefault(name, {**_empty_op(), "class": _op_class(name)})
+                    for k in ("calls", "errors", "bytes_in", "bytes_out"):
+                        agg[k] += counters[k]
+                        stage_totals[k] += counters[k]
+                        totals[k] += counters[k]
+                    if _op_class(name) == "A":
+                        totals["class_a_calls"] += counters["calls"]
+                    elif _op_class(name) == "B":
+                        totals["class_b_calls"] += counters["calls"]
+                stages[stage_name] = {
+                    "totals": stage_totals,
+                    "operations": {k: dict(v) for k, v in sorted(ops.items())},
+                }
+
+            transfers: dict[str, dict] = {}
+            for stage_name, methods in self._transfers.items():
+                for name, counters in methods.items():
+                    agg = transfers.setdefault(name, {"calls": 0, "bytes": 0})
+                    agg["calls"] += counters["calls"]
+                    agg["bytes"] += counters["bytes"]
+                stages.setdefault(stage_name, {"totals": _empty_op(), "operations": {}})
+                stages[stage_name]["transfers"] = {k: dict(v) for k, v in sorted(methods.items())}
+
+        return {
+            "script": self.script,
+            "started_ts_utc": self.started_ts.isoformat(),
+            "snapshot_ts_utc": datetime.now(timezone.utc).isoformat(),
+            "elapsed_sec": round(time.monotonic() - self._t0, 3),
+            "totals": totals,
+            "operations": dict(sorted(operations.items())),
+            "transfers": dict(sorted(transfers.items())),
+            "stages": stages,
+        }
+
+    def has_activity(self) -> bool:
+        with self._lock:
+            return bool(self._ops or self._transfers)
+
+    def print_summary(self, file=None):
+        """Print a compact per-operation summary."""
+        file = file or sys.stdout
+        snap = self.snapshot()
+        totals = snap["totals"]
+
+        print(f"\n{'='*60}", file=file)
+        print(f"R2 OPERATIONS: {snap['script']}", file=file)
+        print(f"{'='*60}", file=file)
+        print(f"  {'Operation':<28} {'Class':>5} {'Calls':>7} {'Errors':>7} {'MB in':>9} {'MB out':>9}", file=file)
+        for name, op in snap["operations"].items():
+            print(
+                f"  {name:<28} {op['class']:>5} {op['calls']:>7} {op['errors']:>7} "
+                f"{op['bytes_in']/1024/1024:>9.2f} {op['bytes_out']/1024/1024:>9.2f}",
+                file=file,
+            )
+        for name, t in snap["transfers"].items():
+            print(f"  {name + ' (transfer)':<28} {'':>5} {t['calls']:>7} {'':>7} {t['bytes']/1024/1024:>9.2f}", file=file)
+        print(
+            f"  Total: {totals['calls']} calls (Class A: {totals['class_a_calls']}, "
+            f"Class B: {totals['class_b_calls']}), "
+            f"{totals['bytes_in']/1024/1024:.2f} MB in, {totals['bytes_out']/1024/1024:.2f} MB out",
+            file=file,
+        )
+        if len(snap["stages"]) > 1:
+            for stage_name, s in snap["stages"].items():
+                st = s["totals"]
+                print(f"  [{stage_name}] {st['calls']} calls, {st['bytes_in']/1024/1024:.2f} MB in", file=file)
+        print(f"{'='*60}", file=file)
+
+    def append_to_log(self, log_path: Optional[Path] = None) -> Optional[Path]:
+        """Append the snapshot as one JSON line. Returns the path written, if any."""
+        if log_path is None:
+            env_path = os.environ.get("R2_METRICS_LOG")
+            if env_path == "":
+                return None
+            log_path = Path(env_path) if env_path else DEFAULT_METRICS_LOG
+
+        try:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(log_path, "a") as f:
+                f.write(json.dumps(self.snapshot(), sort_keys=True) + "\n")
+        except OSError as e:
+            print(f"[WARN] Could not write R2 metrics log {log_path}: {e}", file=sys.stderr)
+            return None
+        return log_path
+
+
+# ==============================================================================
+# Process-wide collector
+# ==============================================================================
+
+_metrics: Optional[R2Metrics] = None
+_atexit_registered = False
+
+
+def get_metrics() -> R2Metrics:
+    """Return the process-wide metrics collector (created on first use)."""
+    global _metrics
+    if _metrics is None:
+        _metrics = R2Metrics()
+    return _metrics
+
+
+def _report_at_exit():
+    metrics = get_metrics()
+    if not metrics.has_activity():
+        return
+    metrics.print_summary()
+    metrics.append_to_log()
+
+
+def current_stage() -> str:
+    """Stage R2 calls from this thread / task are attributed to."""
+    return _current_stage.get()
+
+
+@contextmanager
+def stage(name: str):
+    """Attribute R2 calls made inside the block (in this thread) to the named stage."""
+    token = _current_stage.set(name)
+    try:
+        yield get_metrics()
+    finally:
+        _current_stage.reset(token)
+
+
+def in_current_stage(fn):
+    """
+    Wrap fn to run in the caller's current stage, for functions submitted
+    to executor threads (which start in the default stage).
+    """
+    name = _current_stage.get()
+
+    def run(*args, **kwargs):
+        with stage(name):
+            return fn(*args, **kwargs)
+
+    return run
+
+
+# ==============================================================================
+# botocore event hooks
+# ==============================================================================
+
+def _body_length(body) -> int:
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    try:
+        from botocore.utils import determine_content_length
+        length = determine_content_length(body)
+        return int(length) if length is not None else 0
+    except Exception:
+        return 0
+
+
+def _on_before_call(model=None, params=None, **kwargs):
+    if model is None:
+        return
+    bytes_out = _body_length(params.get("body")) if params else 0
+    get_metrics().record_call(model.name, bytes_out)
+
+
+def _on_after_call(http_response=None, parsed=None, model=None, **kwargs):
+    if model is None:
+        return
+    status = getattr(http_response, "status_code", 200) or 200
+    bytes_in = 0
+    if model.name == "GetObject" and isinstance(parsed, dict) and status < 300:
+        bytes_in = int(parsed.get("ContentLength") or 0)
+    get_metrics().record_response(model.name, bytes_in, error=status >= 400)
+
+
+def _on_after_call_error(model=None, **kwargs):
+    if model is None:
+        return
+    get_metrics().record_response(model.name, error=True)
+
+
+def _wrap_transfer(client, method: str):
+    original = getattr(client, method)
+
+    if method == "download_file":
+        def wrapper(Bucket, Key, Filename, *args, **kwargs):
+            result = original(Bucket, Key, Filename, *args, **kwargs)
+            try:
+                size = os.path.getsize(Filename)
+            except OSError:
+                size = 0
+            get_metrics().record_transfer(method, size)
+            return result
+    elif method == "download_fileobj":
+        def wrapper(Bucket, Key, Fileobj, *args, **kwargs):
+            result = original(Bucket, Key, Fileobj, *args, **kwargs)
+            try:
+                size = Fileobj.tell()
+            except Exception:
+                size = 0
+            get_metrics().record_transfer(method, size)
+            return result
+    else:
+        def wrapper(Filename, Bucket, Key, *args, **kwargs):
+            try:
+                size = os.path.getsize(Filename)
+            except OSError:
+                size = 0
+            result = original(Filename, Bucket, Key, *args, **kwargs)
+            get_metrics().record_transfer(method, size)
+            return result
+
+    wrapper.__doc__ = original.__doc__
+    setattr(client, method, wrapper)
+
+
+def instrument_client(client):
+    """
+    Register metrics hooks on a boto3 S3 client and return it.
+
+    Safe to call more than once on the same client.
+    """
+    global _atexit_registered
+
+    if getattr(client, "_r2_metrics_instrumented", False):
+        return client
+
+    events = client.meta.events
+    events.register("before-call.s3", _on_before_call, unique_id="r2-metrics-before-call")
+    events.register("after-call.s3", _on_after_call, unique_id="r2-metrics-after-call")
+    events.register("after-call-error.s3", _on_after_call_error, unique_id="r2-metrics-after-call-error")
+
+    for method in TRANSFER_METHODS:
+        if hasattr(client, method):
+            _wrap_transfer(client, method)
+
+    client._r2_metrics_instrumented = True
+
+    get_metrics()
+    if not _atexit_registered:
+        atexit.register(_report_at_exit)
+        _atexit_registered = True
+
+    return client
+
+
+if __name__ == "__main__":
+    # Summarize the metrics log: per-script totals across recorded runs
+    log_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_METRICS_LOG
+    if not log_path.exists():
+        print(f"[ERROR] Metrics log not found: {log_path}", file=sys.stderr)
+        sys.exit(1)
+
+    per_script: dict[str, dict] = {}
+    with open(log_path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            run = json.loads(line)
+            agg = per_script.setdefault(run["script"], {"runs": 0, "calls": 0, "class_a": 0, "class_b": 0, "bytes_in": 0})
+            agg["runs"] += 1
+            agg["calls"] += run["totals"]["calls"]
+            agg["class_a"] += run["totals"].get("class_a_calls", 0)
+            agg["class_b"] += run["totals"].get("class_b_calls", 0)
+            agg["bytes_in"] += run["totals"]["bytes_in"]
+
+    print(f"{'Script':<36} {'Runs':>6} {'Calls':>8} {'Class A':>8} {'Class B':>8} {'GB in':>9}")
+    for script, agg in sorted(per_script.items(), key=lambda kv: kv[1]["calls"], reverse=True):
+        print(
+            f"{script:<36} {agg['runs']:>6} {agg['calls']:>8} {agg['class_a']:>8} "
+            f"{agg['class_b']:>8} {agg['bytes_in']/1024**3:>9.3f}"
+        )
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Schema Fingerprint Registry
+
+Tier 3 schemas are inferred per day, so new nested fields and type changes
+arrive silently and only surface when partitions are merged. Builders record
+a canonical fingerprint of every partition they write - in the manifest
+(and from there the catalog) as "schema_fingerprint", and in a local
+registry that also keeps each distinct schema's leaf fields:
+
+    {registry_dir}/{prefix with / -> _}.json
+    {
+      "registry_version": 1,
+      "prefix": "tier3/daily",
+      "schemas": {fingerprint: {"fields": {leaf_path: type}, "first_seen", "last_seen"}},
+      "partitions": {partition: fingerprint}
+    }
+
+Drift detection diffs consecutive partitions' fingerprints and, where they
+differ, the registered leaf fields (added / removed / type changed). No
+parquet data is read; with --from-r2 unknown fingerprints are filled in from
+the catalog and the parquet footer (one ranged GET per new schema).
+
+Merges use concat_by_fingerprint(): identical fingerprints take the
+zero-copy pa.concat_tables path; otherwise each table is conformed to the
+unified (permissive) schema with one planned cast before concatenating.
+
+Configuration (env):
+    SCHEMA_REGISTRY_DIR   Registry root (default: ./output/schema_registry)
+
+Usage:
+    from schema_registry import SchemaRegistry, concat_by_fingerprint, schema_fingerprint
+
+    manifest["schema_fingerprint"] = SchemaRegistry().record("tier3/daily", date_str, table.schema)
+    merged, plan = concat_by_fingerprint(tables)
+
+    # Drift report for a prefix (local registry)
+    python3 scripts/schema_registry.py tier3/daily
+
+    # Fill the registry from the R2 catalog + parquet footers first
+    python3 scripts/schema_registry.py tier3/daily --from-r2 --from-date 2026-01-01
+
+    # Register a local parquet
+    python3 scripts/schema_registry.py tier3/daily --register output/tier3_daily/2026-01-18/data.parquet --partition 2026-01-18
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Non-POSIX: registry works, without cross-process locking
+    fcntl = None
+
+import pyarrow as pa
+
+REGISTRY_VERSION = 1
+DEFAULT_REGISTRY_DIR = Path("./output/schema_registry")
+
+
+# ==============================================================================
+# Fingerprints
+# ==============================================================================
+
+def schema_fingerprint(schema) -> str:
+    """
+    SHA256 of a pyarrow schema's canonical string form (field names, order,
+    types and nullability, including nested struct children).
+    """
+    canonical = "\n".join(
+        f"{field.name}:{field.type}:{'null' if field.nullable else 'notnull'}"
+        for field in schema
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def parquet_schema_fingerprint(parquet_path) -> Optional[str]:
+    """Fingerprint a local parquet's schema from its footer (None if unreadable)."""
+    try:
+        import pyarrow.parquet as pq
+        return schema_fingerprint(pq.read_schema(parquet_path))
+    except Exception:
+        return None
+
+
+def leaf_fields(schema) -> dict[str, str]:
+    """{dotted leaf path: type} with structs expanded (lists/maps kept whole)."""
+    fields = {}
+
+    def walk(path, dtype):
+        if pa.types.is_struct(dtype):
+            for child in dtype:
+                walk(f"{path}.{child.name}", child.type)
+        else:
+            fields[path] = str(dtype)
+
+    for field in schema:
+        walk(field.name, field.type)
+    return fields
+
+
+def diff_fields(old: dict[str, str], new: dict[str, str]) -> dict:
+    """Added, removed and type-changed leaf paths between two field maps."""
+    return {
+        "added": sorted(p for p in new if p not in old),
+        "removed": sorted(p for p in old if p not in new),
+        "type_changed": {
+            p: {"from": old[p], "to": new[p]}
+            for p in sorted(old) if p in new and old[p] != new[p]
+        },
+    }
+
+
+# ==============================================================================
+# Registry
+# ==============================================================================
+
+class SchemaRegistry:
+    """
+    Local registry of partition schema fingerprints per R2 prefix.
+
+    Args:
+        registry_dir: Root directory (default: SCHEMA_REGISTRY_DIR env or
+            ./output/schema_registry)
+    """
+
+    def __init__(self, registry_dir: Optional[Path] = None):
+        self.registry_dir = Path(registry_dir or os.environ.get("SCHEMA_REGISTRY_DIR") or DEFAULT_REGISTRY_DIR)
+
+    def _path(self, prefix: str) -> Path:
+        return self.registry_dir / f"{prefix.strip('/').replace('/', '_')}.json"
+
+    def load(self, prefix: str) -> dict:
+        try:
+            with open(self._path(prefix)) as f:
+                registry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            registry = {}
+        registry.setdefault("registry_version", REGISTRY_VERSION)
+        registry.setdefault("prefix", prefix.strip("/"))
+        registry.setdefault("schemas", {})
+        registry.setdefault("partitions", {})
+        return registry
+
+    def _save(self, prefix: str, registry: dict):
+        path = self._path(prefix)
+        registry["updated_ts_utc"] = datetime.now(timezone.utc).isoformat()
+        registry["partitions"] = dict(sorted(registry["partitions"].items()))
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp_")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(registry, f, indent=2)
+            os.replace(tmp, path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def record_many(self, prefix: str, schemas: dict[str, object]) -> dict[str, str]:
+        """
+        Register {partition: pyarrow schema}. Returns {partition: fingerprint}.
+        """
+        path = self._path(prefix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fingerprints = {}
+        with open(path.with_suffix(".lock"), "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            registry = self.load(prefix)
+            for partition, schema in schemas.items():
+                fingerprint = schema_fingerprint(schema)
+                entry = registry["schemas"].setdefault(fingerprint, {
+                    "fields": leaf_fields(schema),
+                    "first_seen": partition,
+                    "last_seen": partition,
+                })
+                entry["first_seen"] = min(entry["first_seen"], partition)
+                entry["last_seen"] = max(entry["last_seen"], partition)
+                registry["partitions"][partition] = fingerprint
+                fingerprints[partition] = fingerprint
+            self._save(prefix, registry)
+        return fingerprints
+
+    def record(self, prefix: str, partition: str, schema) -> str:
+        """Register one partition's schema. Returns its fingerprint."""
+        return self.record_many(prefix, {partition: schema})[partition]
+
+    def drift(self, prefix: str, from_partition: Optional[str] = None, to_partition: Optional[str] = None) -> list[dict]:
+        """
+        Schema changes between consecutive registered partitions.
+
+        Returns:
+            [{"partition", "previous_partition", "from", "to", "added",
+              "removed", "type_changed"}] in partition order
+        """
+        registry = self.load(prefix)
+        changes = []
+        previous = None
+        for partition, fingerprint in registry["partitions"].items():
+            if from_partition and partition < from_partition:
+                continue
+            if to_partition and partition > to_partition:
+                continue
+            if previous is not None and fingerprint != previous[1]:
+                old = registry["schemas"].get(previous[1], {}).get("fields", {})
+                new = registry["schemas"].get(fingerprint, {}).get("fields", {})
+                changes.append({
+                    "partition": partition,
+                    "previous_partition": previous[0],
+                    "from": previous[1],
+                    "to": fingerprint,
+                    **diff_fields(old, new),
+                })
+            previous = (partition, fingerprint)
+        return changes
+
+
+def record_partition_schema(prefix: str, partition: str, schema) -> str:
+    """
+    Fingerprint a builder's output schema and record it in the local
+    registry. Registry I/O problems only warn; the fingerprint is returned
+    either way for the manifest.
+
+    Args:
+        prefix: Partition prefix (e.g. "tier1/daily")
+        partition: Partition id (date or week end)
+        schema: pyarrow schema, or path of a parquet to read it from (footer only)
+    """
+    if isinstance(schema, (str, Path)):
+        import pyarrow.parquet as pq
+        schema = pq.read_schema(schema)
+    try:
+        return SchemaRegistry().record(prefix, partition, schema)
+    except OSError as e:
+        print(f"[WARN] Schema registry update failed: {e}", file=sys.stderr)
+        return schema_fingerprint(schema)
+
+
+# ==============================================================================
+# Merging
+# ==============================================================================
+
+def conform_table(table, schema):
+    """Reorder/add missing columns as nulls and cast a table to schema."""
+    columns = []
+    for field in schema:
+        if field.name in table.column_names:
+            columns.append(table.column(field.name))
+        else:
+            columns.append(pa.nulls(table.num_rows, type=field.type))
+    return pa.Table.from_arrays(columns, names=schema.names).cast(schema)
+
+
+def concat_by_fingerprint(tables: list) -> tuple:
+    """
+    Concatenate tables, choosing the path from their schema fingerprints.
+
+    Returns:
+        Tuple of (table, plan) where plan is {"path": "zero_copy" | "cast",
+        "fingerprints": n distinct, "cast_tables": n}
+    """
+    fingerprints = [schema_fingerprint(t.schema) for t in tables]
+    if len(set(fingerprints)) <= 1:
+        return pa.concat_tables(tables), {"path": "zero_copy", "fingerprints": 1, "cast_tables": 0}
+
+    unified = pa.unify_schemas([t.schema for t in tables], promote_options="permissive")
+    target = schema_fingerprint(unified)
+    conformed = [t if fp == target else conform_table(t, unified) for t, fp in zip(tables, fingerprints)]
+    plan = {
+        "path": "cast",
+        "fingerprints": len(set(fingerprints)),
+        "cast_tables": sum(1 for fp in fingerprints if fp != target),
+    }
+    return pa.concat_tables(conformed), plan
+
+
+# ==============================================================================
+# R2 sync
+# ==============================================================================
+
+def sync_from_r2(registry: SchemaRegistry, prefix: str, from_partition: Optional[str] = None) -> int:
+    """
+    Register partitions listed in the R2 catalog whose schema is not yet
+    known locally, reading only parquet footers. Returns partitions added.
+    """
+    sys.path.insert(0, str(Path(__file__).parent))
+    import boto3
+    import pyarrow.parquet as pq
+    from manifest_catalog import fetch_catalog_entries
+    from r2_config import get_r2_config
+    from r2_metrics import instrument_client
+    from r2_range_file import R2RangeFile
+
+    cfg = get_r2_config()
+    s3 = instrument_client(boto3.client(
+        "s3",
+        endpoint_url=cfg.endpoint,
+        aws_access_key_id=cfg.access_key_id,
+        aws_secret_access_key=cfg.secret_access_key,
+        region_name="auto",
+    ))
+
+    known = registry.load(prefix)
+    schemas = {}
+    for partition, entry in fetch_catalog_entries(s3, cfg.bucket, prefix).items():
+        if from_partition and partition < from_partition:
+            continue
+        fingerprint = entry.get("schema_fingerprint")
+        # Known partitions are re-read only when the catalog reports a different schema
+        if partition in known["partitions"] and fingerprint in (None, known["partitions"][partition]):
+            continue
+        if not entry.get("r2_key"):
+            continue
+        try:
+            schemas[partition] = pq.ParquetFile(R2RangeFile(s3, cfg.bucket, entry["r2_key"])).schema_arrow
+        except Exception as e:
+            print(f"  [WARN] {partition}: could not read footer: {e}")
+    if schemas:
+        registry.record_many(prefix, schemas)
+    return len(schemas)
+
+
+# ==============================================================================
+# CLI
+# ==============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Schema fingerprint registry and drift report")
+    parser.add_argument("prefix", nargs="?", default="tier3/daily", help="Partition prefix (default: tier3/daily)")
+    parser.add_argument("--from-date", help="First partition to report")
+    parser.add_argument("--to-date", help="Last partition to report")
+    parser.add_argument("--from-r2", action="store_true",
+                        help="Register unknown partitions from the R2 catalog (footer reads only)")
+    parser.add_argument("--register", type=Path, help="Register a local parquet")
+    parser.add_argument("--partition", help="Partition id for --register")
+    parser.add_argument("--json", action="store_true", help="Print the drift report as JSON")
+    parser.add_argument("--registry-dir", type=Path, default=None,
+                        help=f"Registry root (default: {DEFAULT_REGISTRY_DIR})")
+    args = parser.parse_args()
+
+    registry = SchemaRegistry(args.registry_dir)
+
+    if args.register:
+        if not args.partition:
+            parser.error("--register requires --partition")
+        import pyarrow.parquet as pq
+        fingerprint = registry.record(args.prefix, args.partition, pq.read_schema(args.register))
+        print(f"[OK] {args.prefix} {args.partition}: {fingerprint[:16]}")
+        return 0
+
+    if args.from_r2:
+        added = sync_from_r2(registry, args.prefix, args.from_date)
+        print(f"[INFO] Registered {added} partitions from R2")
+
+    changes = registry.drift(args.prefix, args.from_date, args.to_date)
+    if args.json:
+        print(json.dumps(changes, indent=2))
+        return 0
+
+    data = registry.load(args.prefix)
+    partitions = [p for p in data["partitions"]
+                  if (not args.from_date or p >= args.from_date) and (not args.to_date or p <= args.to_date)]
+    print("=" * 60)
+    print(f"SCHEMA DRIFT: {args.prefix}")
+    print("=" * 60)
+    print(f"  Partitions: {len(partitions)}")
+    print(f"  Distinct schemas: {len({data['partitions'][p] for p in partitions})}")
+    print(f"  Changes: {len(changes)}")
+    for change in changes:
+        print(f"\n  {change['previous_partition']} -> {change['partition']} "
+              f"({change['from'][:12]} -> {change['to'][:12]})")
+        for path in change["added"]:
+            print(f"    + {path}")
+        for path in change["removed"]:
+            print(f"    - {path}")
+        for path, types in change["type_changed"].items():
+            print(f"    ~ {path}: {types['from']} -> {types['to']}")
+    if not changes:
+        print("\n[OK] No schema drift")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
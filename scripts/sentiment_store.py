@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Per-Symbol Sentiment Time-Series Store
+
+generate_sentiment_timeseries.py used to decompress every archive hour file
+and json.loads every entry on each refresh, only to keep a few sample
+symbols. The store keeps the extracted sentiment points of every symbol in
+parquet partitions keyed by symbol, appended one archive day at a time:
+
+    {store_dir}/
+      _state.json                          # ingested days + hour-file fingerprints
+      symbol=BTC/20260118.parquet          # one file per ingested day ...
+      symbol=BTC/202512.parquet            # ... compacted per month once closed
+
+    columns: day (YYYYMMDD folder), added_ts, mean_sent, posts, is_silent
+
+sync() ingests only days that are new or whose hour files changed (a day
+folder whose files were all closed at ingestion and whose directory mtime
+is unchanged is skipped without stat-ing its files). Readers open only the
+partitions of the symbols they ask for.
+
+Configuration (env):
+    SENTIMENT_STORE_DIR   Store root (default: ./output/sentiment_store)
+
+Usage:
+    from sentiment_store import SentimentStore
+
+    store = SentimentStore()
+    store.sync(archive_path)
+    series = store.read_series({"BTC", "ETH"})
+
+    # Ingest new archive days, then compact closed months
+    python3 scripts/sentiment_store.py --archive-path /srv/cryptobot/data/archive
+
+    # Re-ingest one day
+    python3 scripts/sentiment_store.py --archive-path ... --date 20260118 --force
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote, unquote
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+try:
+    import fcntl
+except ImportError:  # Non-POSIX: store works, without cross-process locking
+    fcntl = None
+
+sys.path.insert(0, str(Path(__file__).parent))
+from archive_index import is_closed
+from archive_scan import Aggregator, scan_files
+from local_parquet import open_local_parquet, read_columns
+
+STORE_VERSION = 1
+DEFAULT_STORE_DIR = Path("output/sentiment_store")
+DEFAULT_ARCHIVE_PATH = Path("/srv/cryptobot/data/archive")
+
+SCHEMA = pa.schema([
+    ("day", pa.string()),
+    ("added_ts", pa.string()),
+    ("mean_sent", pa.float64()),
+    ("posts", pa.int64()),
+    ("is_silent", pa.bool_()),
+])
+SERIES_COLUMNS = ["added_ts", "mean_sent", "posts", "is_silent"]
+
+
+def extract_sentiment_data(entry: dict) -> Optional[dict]:
+    """
+    Extract sentiment and post count from an entry.
+
+    Returns dict with:
+    - ts: timestamp (ISO8601)
+    - mean_sent: hybrid sentiment mean score (-1 to +1)
+    - posts: total posts counted
+    - is_silent: whether entry was marked as silent
+    """
+    # Get timestamp
+    ts = entry.get('meta', {}).get('added_ts')
+    if not ts:
+        return None
+
+    # Try to get sentiment from last_2_cycles first, fallback to last_cycle
+    windows = entry.get('twitter_sentiment_windows', {})
+
+    sentiment_data = None
+    posts_total = None
+    is_silent = None
+
+    # Priority: last_2_cycles > last_cycle
+    if 'last_2_cycles' in windows:
+        window = windows['last_2_cycles']
+        sentiment_data = window.get('hybrid_decision_stats', {}).get('mean_score')
+        posts_total = window.get('posts_total')
+        activity = window.get('sentiment_activity', {})
+        is_silent = activity.get('is_silent')
+
+    if sentiment_data is None and 'last_cycle' in windows:
+        window = windows['last_cycle']
+        sentiment_data = window.get('hybrid_decision_stats', {}).get('mean_score')
+        posts_total = window.get('posts_total')
+        activity = window.get('sentiment_activity', {})
+        is_silent = activity.get('is_silent')
+
+    # Only include entries with sentiment data
+    if sentiment_data is None:
+        return None
+
+    result = {
+        'ts': ts,
+        'mean_sent': round(sentiment_data, 4)
+    }
+
+    if posts_total is not None:
+        result['posts'] = posts_total
+
+    if is_silent is not None:
+        result['is_silent'] = is_silent
+
+    return result
+
+
+class SentimentPoints(Aggregator):
+    """
+    archive_scan plugin: per-day, per-symbol sentiment point columns.
+
+    Result: {day: {"entries": n, "columns": {symbol: {column: [values]}}}}
+    """
+
+    name = "sentiment_points"
+
+    def create(self):
+        return {"day": None, "days": {}}
+
+    def start_file(self, partial, hour_file):
+        partial["day"] = hour_file.parent.name
+        partial["days"].setdefault(partial["day"], {"entries": 0, "columns": {}})
+        return partial
+
+    def map(self, partial, entry):
+        day = partial["days"][partial["day"]]
+        day["entries"] += 1
+        symbol = entry.get("symbol")
+        if symbol is None:
+            return partial
+        point = extract_sentiment_data(entry)
+        if point is None:
+            return partial
+        columns = day["columns"].setdefault(symbol, {name: [] for name in SERIES_COLUMNS})
+        columns["added_ts"].append(point["ts"])
+        columns["mean_sent"].append(point["mean_sent"])
+        columns["posts"].append(point.get("posts"))
+        columns["is_silent"].append(point.get("is_silent"))
+        return partial
+
+    def combine(self, a, b):
+        for day, part in b["days"].items():
+            target = a["days"].setdefault(day, {"entries": 0, "columns": {}})
+            target["entries"] += part["entries"]
+            for symbol, columns in part["columns"].items():
+                target_columns = target["columns"].setdefault(symbol, {name: [] for name in SERIES_COLUMNS})
+                for name in SERIES_COLUMNS:
+                    target_columns[name].extend(columns[name])
+        return a
+
+    def finalize(self, partial):
+        return partial["days"]
+
+
+def find_day_folders(archive_path: Path) -> List[Path]:
+    """YYYYMMDD folders under the archive root, oldest first."""
+    return sorted(
+        d for d in archive_path.iterdir()
+        if d.is_dir() and d.name.isdigit() and len(d.name) == 8
+    )
+
+
+def _hour_files(day_folder: Path) -> List[Path]:
+    return sorted(day_folder.glob("*.jsonl.gz"))
+
+
+def _fingerprint(hour_files: List[Path]) -> Dict[str, list]:
+    fingerprint = {}
+    for hour_file in hour_files:
+        st = hour_file.stat()
+        fingerprint[hour_file.name] = [st.st_size, st.st_mtime_ns]
+    return fingerprint
+
+
+def day_fingerprint(day_folder: Path) -> Dict[str, list]:
+    """{hour file name: [size, mtime_ns]} of a day folder (what sync compares)."""
+    return _fingerprint(_hour_files(day_folder))
+
+
+def _write_parquet(table: pa.Table, path: Path):
+    """Atomically write a partition file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp_", suffix=".parquet")
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp, compression="zstd")
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+class SentimentStore:
+    """
+    Symbol-partitioned store of per-entry sentiment points.
+
+    Args:
+        store_dir: Root directory (default: SENTIMENT_STORE_DIR env or
+            ./output/sentiment_store)
+    """
+
+    def __init__(self, store_dir: Optional[Path] = None):
+        self.store_dir = Path(store_dir or os.environ.get("SENTIMENT_STORE_DIR") or DEFAULT_STORE_DIR)
+        self.state_path = self.store_dir / "_state.json"
+
+    def load_state(self) -> dict:
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            state = {}
+        if state.get("store_version") not in (None, STORE_VERSION):
+            raise ValueError(f"Unsupported sentiment store version in {self.state_path}")
+        state.setdefault("store_version", STORE_VERSION)
+        state.setdefault("days", {})
+        state.setdefault("months", {})
+        return state
+
+    def _save_state(self, state: dict):
+        state["updated_ts_utc"] = datetime.now(timezone.utc).isoformat()
+        state["days"] = dict(sorted(state["days"].items()))
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.store_dir, prefix=".tmp_")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp, self.state_path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def symbol_dir(self, symbol: str) -> Path:
+        return self.store_dir / f"symbol={quote(symbol, safe='')}"
+
+    def symbols(self) -> List[str]:
+        """Symbols with at least one partition file."""
+        if not self.store_dir.exists():
+            return []
+        return sorted(
+            unquote(d.name[len("symbol="):])
+            for d in self.store_dir.iterdir()
+            if d.is_dir() and d.name.startswith("symbol=")
+        )
+
+    def pending_days(self, archive_path: Path, state: dict, dates: Optional[List[str]] = None,
+                     force: bool = False) -> List[Path]:
+        """Day folders that are new or changed since they were ingested."""
+        pending = []
+        for day_folder in find_day_folders(archive_path):
+            if dates and day_folder.name not in dates:
+                continue
+            known = state["days"].get(day_folder.name)
+            if known is None or force:
+                pending.append(day_folder)
+                continue
+            if known["closed"] and known["dir_mtime_ns"] == day_folder.stat().st_mtime_ns:
+                continue
+            hour_files = _hour_files(day_folder)
+            if known["files"] != _fingerprint(hour_files):
+                pending.append(day_folder)
+            else:
+                # Unchanged; refresh flags so the next run can skip it
+                known["closed"] = all(is_closed(f) for f in hour_files)
+                known["dir_mtime_ns"] = day_folder.stat().st_mtime_ns
+        return pending
+
+    def _drop_day(self, day: str, state: dict):
+        """Remove a previously ingested day's rows from every symbol partition."""
+        known = state["days"].get(day)
+        if not known:
+            return
+        month = day[:6]
+        compacted = day in state["months"].get(month, [])
+        for symbol in known["symbols"]:
+            if compacted:
+                path = self.symbol_dir(symbol) / f"{month}.parquet"
+                if path.exists():
+                    table = read_columns(open_local_parquet(path), None)
+                    _write_parquet(table.filter(pc.not_equal(table["day"], day)), path)
+            else:
+                (self.symbol_dir(symbol) / f"{day}.parquet").unlink(missing_ok=True)
+        if compacted:
+            state["months"][month].remove(day)
+        del state["days"][day]
+
+    def ingest_day(self, day_folder: Path, state: dict, extracted: Optional[dict] = None,
+                   jobs: int = 1) -> dict:
+        """
+        Extract one archive day into per-symbol day partitions.
+
+        Args:
+            day_folder: YYYYMMDD archive folder
+            state: Store state (updated in place)
+            extracted: The day's SentimentPoints result from a scan that
+                already read it ({"entries", "columns", "files"}); used only
+                if its hour-file fingerprint still matches
+            jobs: Worker processes when the day has to be scanned here
+
+        Returns:
+            The day's state record (rows, symbols, files, closed, dir_mtime_ns)
+        """
+        day = day_folder.name
+        hour_files = _hour_files(day_folder)
+        fingerprint = _fingerprint(hour_files)
+
+        if extracted is None or extracted.get("files") != fingerprint:
+            results, _ = scan_files(hour_files, [SentimentPoints()], jobs=jobs, indexes={})
+            extracted = results[SentimentPoints.name].get(day, {"entries": 0, "columns": {}})
+        columns_by_symbol = extracted["columns"]
+        entries = extracted["entries"]
+
+        self._drop_day(day, state)
+        rows = 0
+        for symbol, columns in columns_by_symbol.items():
+            n = len(columns["added_ts"])
+            table = pa.table({"day": [day] * n, **columns}, schema=SCHEMA)
+            _write_parquet(table, self.symbol_dir(symbol) / f"{day}.parquet")
+            rows += n
+
+        record = {
+            "entries": entries,
+            "rows": rows,
+            "symbols": sorted(columns_by_symbol),
+            "files": fingerprint,
+            "closed": all(is_closed(f) for f in hour_files),
+            # Taken after reading: writing sidecars may touch the directory
+            "dir_mtime_ns": day_folder.stat().st_mtime_ns,
+            "ingested_ts_utc": datetime.now(timezone.utc).isoformat(),
+        }
+        state["days"][day] = record
+        return record
+
+    def compact(self, state: dict) -> int:
+        """
+        Merge the day files of each fully closed past month into one file per
+        symbol. Returns the number of months compacted.
+        """
+        current_month = datetime.now(timezone.utc).strftime("%Y%m")
+        days_by_month: Dict[str, List[str]] = {}
+        for day in state["days"]:
+            days_by_month.setdefault(day[:6], []).append(day)
+
+        compacted = 0
+        for month, days in sorted(days_by_month.items()):
+            done = state["months"].get(month, [])
+            new_days = [d for d in days if d not in done]
+            if month >= current_month or not new_days:
+                continue
+            if not all(state["days"][d]["closed"] for d in days):
+                continue
+            symbols = sorted({s for d in new_days for s in state["days"][d]["symbols"]})
+            for symbol in symbols:
+                month_path = self.symbol_dir(symbol) / f"{month}.parquet"
+                day_paths = [self.symbol_dir(symbol) / f"{d}.parquet" for d in sorted(new_days)]
+                day_paths = [p for p in day_paths if p.exists()]
+                tables = [read_columns(open_local_parquet(p), None) for p in day_paths]
+                if month_path.exists():
+                    # A compaction interrupted before its unlinks left day files
+                    # whose rows the month file already holds: replace them
+                    month_table = read_columns(open_local_parquet(month_path), None)
+                    merged_days = pa.array([p.stem for p in day_paths], pa.string())
+                    keep = pc.invert(pc.is_in(month_table["day"], value_set=merged_days))
+                    tables.insert(0, month_table.filter(keep))
+                if not tables:
+                    continue
+                _write_parquet(pa.concat_tables(tables), month_path)
+                for path in day_paths:
+                    path.unlink()
+            state["months"][month] = sorted(set(done) | set(new_days))
+            compacted += 1
+        return compacted
+
+    def sync(self, archive_path: Path, dates: Optional[List[str]] = None, force: bool = False,
+             compact: bool = True, jobs: int = 1, extracted: Optional[dict] = None) -> dict:
+        """
+        Ingest new or changed archive days (and compact closed months).
+
+        Args:
+            archive_path: Archive root
+            dates: Only these YYYYMMDD days (default: all)
+            force: Re-ingest days that are up to date
+            compact: Compact closed months afterwards
+            jobs: Worker processes for scanning a day
+            extracted: {day: SentimentPoints result + "files"} from a shared
+                scan (see generate_site_artifacts.py); such days are not reread
+
+        Returns:
+            {"ingested": [days], "rows": n, "compacted_months": n}
+        """
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.store_dir / "_state.lock", "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            state = self.load_state()
+            pending = self.pending_days(archive_path, state, dates, force)
+            rows = 0
+            for day_folder in pending:
+                t0 = time.time()
+                record = self.ingest_day(day_folder, state, (extracted or {}).get(day_folder.name), jobs)
+                rows += record["rows"]
+                print(f"  [OK] {day_folder.name}: {record['rows']} points for "
+                      f"{len(record['symbols'])} symbols ({time.time() - t0:.1f}s)")
+                # Persist per day so an interrupted sync resumes where it stopped
+                self._save_state(state)
+            compacted = self.compact(state) if compact else 0
+            self._save_state(state)
+        return {"ingested": [d.name for d in pending], "rows": rows, "compacted_months": compacted}
+
+    def read_symbol(self, symbol: str) -> pa.Table:
+        """All points of one symbol, sorted by added_ts (stable)."""
+        files = sorted(self.symbol_dir(symbol).glob("*.parquet"))
+        tables = [read_columns(open_local_parquet(p), SERIES_COLUMNS) for p in files]
+        if not tables:
+            return SCHEMA.empty_table().select(SERIES_COLUMNS)
+        table = pa.concat_tables(tables)
+        return table.take(pc.sort_indices(table, sort_keys=[("added_ts", "ascending")]))
+
+    def read_series(self, symbols) -> Dict[str, List[dict]]:
+        """
+        Per-symbol point lists ({"ts", "mean_sent"[, "posts"][, "is_silent"]}),
+        reading only the requested symbols' partitions.
+        """
+        series_by_symbol = {}
+        for symbol in symbols:
+            points = []
+            for row in self.read_symbol(symbol).to_pylist():
+                point = {"ts": row["added_ts"], "mean_sent": row["mean_sent"]}
+                if row["posts"] is not None:
+                    point["posts"] = row["posts"]
+                if row["is_silent"] is not None:
+                    point["is_silent"] = row["is_silent"]
+                points.append(point)
+            series_by_symbol[symbol] = points
+        return series_by_symbol
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest archive days into the per-symbol sentiment store")
+    parser.add_argument("--archive-path", type=Path, default=DEFAULT_ARCHIVE_PATH,
+                        help=f"Path to archive root (default: {DEFAULT_ARCHIVE_PATH})")
+    parser.add_argument("--store-dir", type=Path, default=None,
+                        help=f"Store root (default: SENTIMENT_STORE_DIR or {DEFAULT_STORE_DIR})")
+    parser.add_argument("--date", action="append", dest="dates", help="YYYYMMDD folder (repeatable; default: all)")
+    parser.add_argument("--force", action="store_true", help="Re-ingest days that are already up to date")
+    parser.add_argument("--no-compact", action="store_true", help="Skip monthly compaction")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes per day scan")
+    args = parser.parse_args()
+
+    if not args.archive_path.exists():
+        print(f"[ERROR] Archive path not found: {args.archive_path}", file=sys.stderr)
+        return 1
+
+    store = SentimentStore(args.store_dir)
+
+    print("=" * 60)
+    print("Sentiment Store Sync")
+    print("=" * 60)
+    print(f"Store: {store.store_dir}")
+
+    t0 = time.time()
+    result = store.sync(args.archive_path, args.dates, args.force, compact=not args.no_compact, jobs=args.jobs)
+    print(f"\n[OK] {len(result['ingested'])} days ingested, {result['rows']} points, "
+          f"{result['compacted_months']} months compacted ({time.time() - t0:.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Mergeable Streaming Summaries
+
+Constant-memory replacements for "collect values into a list, then sort":
+
+    - QuantileSketch: KLL-style quantile sketch. Exact (plain sorted list)
+      until it holds more than k values; after that it keeps O(k log n)
+      values and answers any quantile within a normalized rank error of
+      about 2.296 / k^0.9723 (99% confidence; ~0.27% for the default
+      k=1024). min / max / count are always exact.
+    - Histogram: counts over fixed inclusive buckets (exact).
+    - Counts: counts per key (exact).
+
+All three merge (a.merge(b)) so partial summaries from hour files, days or
+worker processes combine into the summary of their union, and serialize to
+JSON (to_dict / from_dict) so per-day summaries can be persisted and merged
+incrementally. Compaction uses a fixed pseudo-random sequence: the same
+inputs in the same order always give the same sketch.
+
+Usage:
+    from streaming_summaries import Histogram, QuantileSketch
+
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.update(value)
+    sketch.merge(other_day_sketch)
+    print(sketch.median(), sketch.quantile(0.9), sketch.rank_error())
+"""
+
+import math
+import statistics
+from typing import Optional
+
+# Default sketch size: exact up to this many values, ~0.27% rank error beyond
+DEFAULT_K = 1024
+
+# Smallest capacity of a compactor level (KLL's m)
+MIN_LEVEL_CAPACITY = 8
+
+
+class QuantileSketch:
+    """
+    KLL-style mergeable quantile sketch over numeric values.
+
+    Args:
+        k: Accuracy parameter (size of the top compactor level)
+    """
+
+    def __init__(self, k: int = DEFAULT_K):
+        self.k = k
+        self.levels = [[]]
+        self.n = 0
+        self.min = None
+        self.max = None
+        self._coin = 0
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(MIN_LEVEL_CAPACITY, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _next_offset(self) -> int:
+        # Deterministic LCG bit so identical inputs give identical sketches
+        self._coin = (self._coin * 1103515245 + 12345) & 0x7FFFFFFF
+        return (self._coin >> 16) & 1
+
+    def _compress(self):
+        while sum(len(items) for items in self.levels) > sum(
+            self._capacity(h) for h in range(len(self.levels))
+        ):
+            for h, items in enumerate(self.levels):
+                if len(items) >= self._capacity(h):
+                    if h + 1 == len(self.levels):
+                        self.levels.append([])
+                    items.sort()
+                    keep = [items.pop()] if len(items) % 2 else []
+                    self.levels[h + 1].extend(items[self._next_offset()::2])
+                    self.levels[h] = keep
+                    break
+
+    def update(self, value: float):
+        """Add one value."""
+        self.levels[0].append(value)
+        self.n += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if len(self.levels[0]) > self._capacity(0):
+            self._compress()
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Fold another sketch into this one (returns self)."""
+        if other.n == 0:
+            return self
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for h, items in enumerate(other.levels):
+            self.levels[h].extend(items)
+        self.n += other.n
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._compress()
+        return self
+
+    @property
+    def exact(self) -> bool:
+        """True while no values have been compacted away."""
+        return len(self.levels) == 1
+
+    def rank_error(self) -> float:
+        """Normalized rank error bound of quantile() (0.0 while exact)."""
+        if self.exact:
+            return 0.0
+        return 2.296 / self.k ** 0.9723
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Value at 0-based rank floor(q * n) (the sorted_values[int(n * q)]
+        convention); None if empty.
+        """
+        if self.n == 0:
+            return None
+        target = min(int(self.n * q), self.n - 1)
+        if self.exact:
+            return sorted(self.levels[0])[target]
+        weighted = sorted((v, 1 << h) for h, items in enumerate(self.levels) for v in items)
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative > target:
+                return value
+        return weighted[-1][0]
+
+    def median(self) -> Optional[float]:
+        """statistics.median while exact, else quantile(0.5); None if empty."""
+        if self.n == 0:
+            return None
+        if self.exact:
+            return statistics.median(self.levels[0])
+        return self.quantile(0.5)
+
+    def summary(self) -> dict:
+        """median / p10 / p90 / min / max (all None when empty)."""
+        return {
+            'median': self.median(),
+            'p10': self.quantile(0.1),
+            'p90': self.quantile(0.9),
+            'min': self.min,
+            'max': self.max,
+        }
+
+    def to_dict(self) -> dict:
+        return {"k": self.k, "n": self.n, "min": self.min, "max": self.max,
+                "levels": self.levels, "coin": self._coin}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "QuantileSketch":
+        sketch = cls(data["k"])
+        sketch.n = data["n"]
+        sketch.min = data["min"]
+        sketch.max = data["max"]
+        sketch.levels = [list(items) for items in data["levels"]]
+        sketch._coin = data["coin"]
+        return sketch
+
+
+class Histogram:
+    """
+    Counts over fixed buckets; a value lands in the first bucket with
+    min <= value <= max. total counts every value, bucketed or not.
+
+    Args:
+        buckets: [{'label', 'min', 'max'}, ...]
+    """
+
+    def __init__(self, buckets: list):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0
+
+    def update(self, value: float):
+        self.total += 1
+        for i, bucket in enumerate(self.buckets):
+            if bucket['min'] <= value <= bucket['max']:
+                self.counts[i] += 1
+                break
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+        return self
+
+    def to_dict(self) -> dict:
+        return {"counts": self.counts, "total": self.total}
+
+    @classmethod
+    def from_dict(cls, buckets: list, data: dict) -> "Histogram":
+        histogram = cls(buckets)
+        histogram.counts = list(data["counts"])
+        histogram.total = data["total"]
+        return histogram
+
+
+class Counts:
+    """Exact counts per key (keys must be JSON-serializable as strings)."""
+
+    def __init__(self):
+        self.counts = {}
+
+    def update(self, key, weight: int = 1):
+        self.counts[key] = self.counts.get(key, 0) + weight
+
+    def merge(self, other: "Counts") -> "Counts":
+        for key, count in other.counts.items():
+            self.update(key, count)
+        return self
+
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def to_dict(self) -> dict:
+        return {str(key): count for key, count in self.counts.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict, key_type=str) -> "Counts":
+        counts = cls()
+        counts.counts = {key_type(key): count for key, count in data.items()}
+        return counts
@@ -5,6 +5,14 @@ Archive Sample Sync Script
 Extracts the most recent N entries from the CryptoBot archive and writes them
 to a normalized sample file for use by artifact builders.
 
+Tail sampling (default) decodes only the lines it keeps: hour files are
+taken newest first by name (no stat of every file), and in each one the
+last lines are located through the sidecar's line offsets
+(archive_index.py) when a fresh sidecar exists, or else with one streaming
+pass that keeps a bounded deque of raw lines; only those lines are parsed.
+Plain .jsonl files seek straight to the offset; gzip streams still
+decompress up to it. --full-read restores the old whole-file read.
+
 Usage:
     python scripts/sync_archive_sample.py --n 200
     python scripts/sync_archive_sample.py --n 500 --archive-path /custom/path
@@ -14,10 +22,14 @@ import json
 import gzip
 import argparse
 import sys
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import List, Dict, Tuple, Optional
 
+sys.path.insert(0, str(Path(__file__).parent))
+from archive_index import READ_ERRORS, load_index
+
 
 # Default paths
 DEFAULT_ARCHIVE_BASE = Path("../cryptobot/data/archive")
@@ -117,6 +129,121 @@ def extract_tail_entries(archive_files: List[Tuple[Path, float]], n: int) -> Tup
     return tail_entries, source_files
 
 
+def _open_binary(filepath: Path):
+    if filepath.suffix == '.gz':
+        return gzip.open(filepath, 'rb')
+    return open(filepath, 'rb')
+
+
+def _parse_tail(raw_lines, k: int) -> Tuple[List[Dict], int]:
+    """Parse raw lines, keeping the last k entries; returns (entries, undecodable lines)."""
+    entries = []
+    bad = 0
+    for raw in raw_lines:
+        if not raw.strip():
+            continue
+        try:
+            entries.append(json.loads(raw))
+        except ValueError:
+            # JSONDecodeError or UnicodeDecodeError (non-UTF-8 bytes)
+            bad += 1
+    return entries[-k:], bad
+
+
+def _tail_from_sidecar(filepath: Path, index: Dict, k: int) -> List[Dict]:
+    # Lines that are not entries (blank or undecodable) are counted in the
+    # sidecar, so starting that many lines earlier always covers k entries
+    offsets = index["line_offsets"]
+    skipped_lines = index["line_count"] - index["row_count"]
+    start = max(0, len(offsets) - k - skipped_lines)
+    if start >= len(offsets):
+        return []
+    with _open_binary(filepath) as f:
+        f.seek(offsets[start])
+        entries, _ = _parse_tail(f, k)
+    return entries
+
+
+def _tail_from_stream(filepath: Path, k: int) -> List[Dict]:
+    # Keep only the last raw lines; widen the window if some of them turn
+    # out blank or undecodable and the file had more lines to offer. A read
+    # error (e.g. the newest hour's gzip is still being written) ends the
+    # file; the lines before it are kept.
+    window = k
+    while True:
+        lines = deque(maxlen=window)
+        error = None
+        try:
+            with _open_binary(filepath) as f:
+                lines.extend(raw for raw in f if raw.strip())
+        except READ_ERRORS as e:
+            error = e
+        entries, bad = _parse_tail(lines, k)
+        if len(entries) >= k or bad == 0 or len(lines) < window:
+            if error is not None:
+                print(f"[WARN] Error reading {filepath.name} after {len(lines)} tail lines: {error}",
+                      file=sys.stderr)
+            return entries
+        window += bad
+
+
+def read_tail_entries(filepath: Path, k: int) -> Tuple[List[Dict], str]:
+    """
+    Last k entries of a .jsonl or .jsonl.gz file, parsing only those lines.
+
+    Returns:
+        Tuple of (entries in file order, method: "sidecar" or "stream")
+    """
+    try:
+        index = load_index(filepath)
+        if index is not None:
+            return _tail_from_sidecar(filepath, index, k), "sidecar"
+        return _tail_from_stream(filepath, k), "stream"
+    except READ_ERRORS as e:
+        print(f"[WARN] Error reading {filepath.name}: {e}", file=sys.stderr)
+        return [], "error"
+
+
+def get_archive_files_by_name(folder: Path) -> List[Path]:
+    """Archive files (.jsonl, .jsonl.gz) newest hour first, by file name."""
+    files = sorted(list(folder.glob('*.jsonl')) + list(folder.glob('*.jsonl.gz')),
+                   key=lambda f: f.name, reverse=True)
+    if not files:
+        print(f"[ERROR] No .jsonl or .jsonl.gz files found in {folder}", file=sys.stderr)
+        sys.exit(1)
+    print(f"[INFO] Found {len(files)} archive files (newest: {files[0].name})")
+    return files
+
+
+def extract_tail_entries_seek(archive_files: List[Path], n: int) -> Tuple[List[Dict], List[str]]:
+    """
+    Extract the most recent N entries, reading each file from its tail.
+
+    Files are consumed newest first until N entries are collected; the
+    result is in chronological order (older file's tail, then newer).
+    """
+    chunks = []
+    source_files = []
+    total = 0
+
+    for filepath in archive_files:
+        if total >= n:
+            break
+
+        entries, method = read_tail_entries(filepath, n - total)
+
+        if entries:
+            source_files.append(str(filepath))
+            chunks.append(entries)
+            total += len(entries)
+            print(f"[INFO] {filepath.name}: {len(entries)} tail entries via {method} (total: {total})")
+
+    tail_entries = [entry for entries in reversed(chunks) for entry in entries]
+
+    print(f"[INFO] Extracted {len(tail_entries)} tail entries from {len(source_files)} files")
+    return tail_entries, source_files
+
+
 def write_sample_file(entries: List[Dict], output_path: Path):
     """Write entries to normalized JSONL (ASCII-only, LF line endings)."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -144,6 +271,8 @@ def main():
     parser.add_argument('--n', type=int, default=200, help='Number of entries to extract (default: 200)')
     parser.add_argument('--archive-path', type=Path, default=DEFAULT_ARCHIVE_BASE, 
                         help='Path to archive base directory')
+    parser.add_argument('--full-read', action='store_true',
+                        help='Read and parse whole files (by mtime) instead of tail sampling')
     args = parser.parse_args()
     
     print("=" * 60)
@@ -159,11 +288,13 @@ def main():
     # Find latest archive folder
     latest_folder = find_latest_archive_folder(args.archive_path)
     
-    # Get archive files
-    archive_files = get_archive_files(latest_folder)
-    
     # Extract tail entries
-    tail_entries, source_files = extract_tail_entries(archive_files, args.n)
+    if args.full_read:
+        archive_files = get_archive_files(latest_folder)
+        tail_entries, source_files = extract_tail_entries(archive_files, args.n)
+    else:
+        archive_files = get_archive_files_by_name(latest_folder)
+        tail_entries, source_files = extract_tail_entries_seek(archive_files, args.n)
     
     if len(tail_entries) == 0:
         print("[ERROR] No entries extracted", file=sys.stderr)
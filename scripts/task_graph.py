@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Task Graph Runner
+
+Site pipelines (daily_site_refresh.sh, deploy_to_cloudflare.py) used to run
+their generators one after another, buffering each one's output until it
+exited. Here each step is a Task with a command and declared inputs and
+outputs, and the runner:
+
+    - orders tasks by their dependencies: explicit `after` names plus any
+      task whose outputs are (or contain) another task's inputs
+    - runs independent tasks concurrently (--jobs), streaming their output
+      line by line with a [task] prefix
+    - records wall time and peak RSS of every executed task as one JSON line
+      per task in the metrics file (output/task_metrics.jsonl)
+    - skips a task whose command and inputs (size + mtime of every file)
+      are unchanged since its last successful run and whose outputs are
+      still as that run left them (state in output/task_state.json);
+      tasks that declare no inputs or no outputs always run
+    - stops dependents of a failed task (independent tasks still finish);
+      failures of optional tasks are reported as warnings only
+
+Usage:
+    from task_graph import Task, run_graph
+
+    tasks = [
+        Task("sync", ("python3", "scripts/sync_from_archive.py"), inputs=("archive",), outputs=("data/sample.jsonl",)),
+        Task("samples", ("python3", "scripts/generate_public_samples.py"), inputs=("data/sample.jsonl",)),
+    ]
+    ok = run_graph(tasks, jobs=4)
+
+    # Daily refresh pipeline (steps 1-4 of daily_site_refresh.sh)
+    python3 scripts/task_graph.py daily_refresh --archive-path /srv/cryptobot/data/archive
+    python3 scripts/task_graph.py daily_refresh --archive-path ... --dry-run
+    python3 scripts/task_graph.py daily_refresh --archive-path ... --force
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_STATE_FILE = Path("output/task_state.json")
+DEFAULT_METRICS_FILE = Path("output/task_metrics.jsonl")
+DEFAULT_ARCHIVE_PATH = Path("/srv/cryptobot/data/archive")
+
+STATE_VERSION = 1
+
+_print_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Task:
+    """
+    One pipeline step.
+
+    Args:
+        name: Unique task name (log prefix, state and metrics key)
+        command: Argument vector to execute
+        inputs: Files or directories the step reads
+        outputs: Files or directories the step writes
+        after: Names of tasks that must finish first besides those implied
+            by inputs / outputs
+        env: Extra environment variables
+        optional: A failure is a warning and does not stop dependents
+    """
+    name: str
+    command: tuple
+    inputs: tuple = ()
+    outputs: tuple = ()
+    after: tuple = ()
+    env: dict = field(default_factory=dict)
+    optional: bool = False
+
+
+def _log(message: str, stream=None):
+    with _print_lock:
+        print(message, file=stream or sys.stdout, flush=True)
+
+
+def fingerprint_paths(paths) -> Dict[str, object]:
+    """
+    {path: [size, mtime_ns]} for files, a digest of (relative name, size,
+    mtime_ns) of every file below for directories, None if missing.
+    """
+    fingerprints = {}
+    for path in map(Path, paths):
+        if path.is_file():
+            st = path.stat()
+            fingerprints[str(path)] = [st.st_size, st.st_mtime_ns]
+        elif path.is_dir():
+            digest = hashlib.sha256()
+            count = 0
+            for child in sorted(p for p in path.rglob("*") if p.is_file()):
+                st = child.stat()
+                digest.update(f"{child.relative_to(path)}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+                count += 1
+            fingerprints[str(path)] = [count, digest.hexdigest()]
+        else:
+            fingerprints[str(path)] = None
+    return fingerprints
+
+
+def _overlaps(a: Path, b: Path) -> bool:
+    return a == b or a in b.parents or b in a.parents
+
+
+def resolve_dependencies(tasks: List[Task]) -> Dict[str, List[str]]:
+    """
+    {task name: [names it waits for]}.
+
+    Raises:
+        ValueError: Duplicate names, unknown `after` names or a cycle
+    """
+    names = [t.name for t in tasks]
+    if len(set(names)) != len(names):
+        raise ValueError("Duplicate task names")
+
+    deps = {}
+    for task in tasks:
+        unknown = [n for n in task.after if n not in names]
+        if unknown:
+            raise ValueError(f"{task.name}: unknown dependencies {unknown}")
+        waits = list(task.after)
+        for other in tasks:
+            if other.name == task.name or other.name in waits:
+                continue
+            if any(_overlaps(Path(i), Path(o)) for i in task.inputs for o in other.outputs):
+                waits.append(other.name)
+        deps[task.name] = waits
+
+    # Cycle check (depth-first)
+    visiting, done = set(), set()
+
+    def visit(name, chain):
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle: {' -> '.join(chain + [name])}")
+        visiting.add(name)
+        for dep in deps[name]:
+            visit(dep, chain + [name])
+        visiting.discard(name)
+        done.add(name)
+
+    for name in names:
+        visit(name, [])
+    return deps
+
+
+def load_state(state_file: Path) -> dict:
+    try:
+        with open(state_file, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("state_version") == STATE_VERSION:
+            return state
+    except (OSError, json.JSONDecodeError):
+        pass
+    return {"state_version": STATE_VERSION, "tasks": {}}
+
+
+def save_state(state: dict, state_file: Path):
+    """Atomically write the task state."""
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=state_file.parent, prefix=".tmp_")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp, state_file)
+
+
+def _task_key(task: Task) -> str:
+    return json.dumps({"command": list(task.command), "env": task.env}, sort_keys=True)
+
+
+def is_up_to_date(task: Task, record: Optional[dict]) -> bool:
+    """True if the task's last successful run saw the same command, inputs and outputs."""
+    if not task.inputs or not task.outputs or record is None:
+        return False
+    return (
+        record.get("key") == _task_key(task)
+        and record.get("inputs") == fingerprint_paths(task.inputs)
+        and record.get("outputs") == fingerprint_paths(task.outputs)
+        and all(v is not None for v in record["outputs"].values())
+    )
+
+
+def _peak_rss_mb(rusage) -> Optional[float]:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return round(rusage.ru_maxrss * scale / (1024 * 1024), 1)
+
+
+def run_task(task: Task) -> dict:
+    """
+    Execute one task, streaming its combined stdout/stderr with a [name]
+    prefix.
+
+    Returns:
+        {"returncode", "wall_sec", "peak_rss_mb"} (peak_rss_mb None where
+        os.wait4 is unavailable)
+    """
+    env = os.environ.copy()
+    env.update(task.env)
+    env.setdefault("PYTHONUNBUFFERED", "1")
+    env.setdefault("PYTHONIOENCODING", "utf-8")
+
+    t0 = time.time()
+    try:
+        proc = subprocess.Popen(
+            list(task.command), env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, encoding="utf-8", errors="replace", bufsize=1,
+        )
+    except OSError as e:
+        _log(f"[{task.name}] [ERROR] Could not start: {e}", sys.stderr)
+        return {"returncode": None, "wall_sec": 0.0, "peak_rss_mb": None}
+
+    for line in proc.stdout:
+        _log(f"[{task.name}] {line.rstrip()}")
+    proc.stdout.close()
+
+    peak_rss_mb = None
+    if hasattr(os, "wait4"):
+        _, status, rusage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        peak_rss_mb = _peak_rss_mb(rusage)
+    else:
+        proc.wait()
+    return {"returncode": proc.returncode, "wall_sec": round(time.time() - t0, 3), "peak_rss_mb": peak_rss_mb}
+
+
+def run_graph(
+    tasks: List[Task],
+    jobs: int = 4,
+    state_file: Path = DEFAULT_STATE_FILE,
+    metrics_file: Path = DEFAULT_METRICS_FILE,
+    force: bool = False,
+    dry_run: bool = False,
+) -> bool:
+    """
+    Run tasks in dependency order, up to `jobs` at a time.
+
+    Args:
+        tasks: Tasks (declaration order breaks ties)
+        jobs: Concurrent tasks
+        state_file: Last successful run per task (for skipping)
+        metrics_file: JSONL file the per-task metrics are appended to
+        force: Run every task even if up to date
+        dry_run: Print the plan (run / skip) without executing
+
+    Returns:
+        True unless a required task failed or was blocked
+    """
+    deps = resolve_dependencies(tasks)
+    by_name = {t.name: t for t in tasks}
+    state = load_state(state_file)
+    run_started = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+    status = {}      # name -> ok | skipped | failed | blocked | dry-run
+    results = {}
+    pending = [t.name for t in tasks]
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            for name in list(pending):
+                waits = deps[name]
+                if any(status.get(d) is None for d in waits):
+                    continue
+                task = by_name[name]
+                blocked_by = [d for d in waits if status[d] in ("failed", "blocked") and not by_name[d].optional]
+                if blocked_by:
+                    status[name] = "blocked"
+                    pending.remove(name)
+                    _log(f"[SKIP] {name}: blocked by failed {', '.join(blocked_by)}", sys.stderr)
+                    continue
+                if not force and is_up_to_date(task, state["tasks"].get(name)):
+                    status[name] = "skipped"
+                    pending.remove(name)
+                    _log(f"[SKIP] {name}: inputs unchanged since last successful run")
+                    continue
+                if dry_run:
+                    status[name] = "dry-run"
+                    pending.remove(name)
+                    _log(f"[DRY-RUN] {name}: {' '.join(task.command)}")
+                    continue
+                if len(running) >= jobs:
+                    break
+                pending.remove(name)
+                _log(f"[>>] {name}: {' '.join(task.command)}")
+                # Inputs are fingerprinted before the run: anything that
+                # changes them while the task runs triggers a rerun next time
+                running[pool.submit(run_task, task)] = (name, fingerprint_paths(task.inputs))
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name, input_fingerprints = running.pop(future)
+                task = by_name[name]
+                result = future.result()
+                results[name] = result
+                if result["returncode"] == 0:
+                    status[name] = "ok"
+                    # Inputs the task rewrites itself (incremental state)
+                    # are recorded as left by this run
+                    own = [i for i in task.inputs if any(_overlaps(Path(i), Path(o)) for o in task.outputs)]
+                    input_fingerprints.update(fingerprint_paths(own))
+                    state["tasks"][name] = {
+                        "key": _task_key(task),
+                        "inputs": input_fingerprints,
+                        "outputs": fingerprint_paths(task.outputs),
+                        "finished_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+                    }
+                    save_state(state, state_file)
+                    _log(f"[OK] {name} ({result['wall_sec']:.1f}s)")
+                else:
+                    status[name] = "failed"
+                    mark = "[WARN]" if task.optional else "[ERROR]"
+                    _log(f"{mark} {name} failed with code {result['returncode']}", sys.stderr)
+
+    if not dry_run:
+        metrics_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(metrics_file, "a", encoding="utf-8") as f:
+            for task in tasks:
+                record = {"run_started_utc": run_started, "task": task.name, "status": status[task.name]}
+                record.update(results.get(task.name, {}))
+                f.write(json.dumps(record) + "\n")
+
+    print()
+    print("=" * 60)
+    print("Task Summary")
+    print("=" * 60)
+    for task in tasks:
+        result = results.get(task.name, {})
+        wall = f"{result['wall_sec']:8.1f}s" if "wall_sec" in result else " " * 9
+        rss = f"{result['peak_rss_mb']:8.1f} MB" if result.get("peak_rss_mb") is not None else ""
+        print(f"  {task.name:28} {status[task.name]:8} {wall} {rss}")
+
+    return not any(status[t.name] in ("failed", "blocked") and not t.optional for t in tasks)
+
+
+def latest_day_folder(archive_path: Path) -> Path:
+    """Newest YYYYMMDD folder of the archive (the archive root if none)."""
+    days = sorted(d for d in archive_path.iterdir() if d.is_dir() and d.name.isdigit() and len(d.name) == 8)
+    return days[-1] if days else archive_path
+
+
+def daily_refresh_tasks(archive_path: Path, python: str = sys.executable or "python3") -> List[Task]:
+    """Steps 1-4 of daily_site_refresh.sh (paths relative to the site root)."""
+    return [
+        Task(
+            "sync_sample",
+            (python, "scripts/sync_from_archive.py", "--n", "200", "--archive-path", str(archive_path)),
+            inputs=(str(latest_day_folder(archive_path)),),
+            outputs=("data/samples/cryptobot_latest_tail200.jsonl",
+                     "data/samples/cryptobot_latest_tail200.meta.json"),
+        ),
+        Task(
+            "public_samples",
+            (python, "scripts/generate_public_samples.py"),
+            inputs=("data/samples/cryptobot_latest_tail200.jsonl",),
+            outputs=("public/data/sample_entries_v7.json",
+                     "public/data/sample_entries_spots_v7.json",
+                     "public/data/sample_entries_v7.jsonl"),
+        ),
+        Task(
+            "site_artifacts",
+            (python, "scripts/generate_site_artifacts.py", "--archive-path", str(archive_path)),
+            # The scan covers the latest day plus whatever the incremental
+            # state files say is pending, so fingerprint those rather than
+            # walking the whole archive
+            inputs=(str(latest_day_folder(archive_path)),
+                    "output/sentiment_store/_state.json",
+                    "output/archive_stats_state.json",
+                    "data/field_coverage_report.json",
+                    "data/samples/cryptobot_latest_head200.jsonl",
+                    "public/data/sample_entries_v7.json"),
+            outputs=("output/sentiment_store/_state.json",
+                     "output/archive_stats_state.json",
+                     "public/data/archive_stats.json",
+                     "public/data/coverage_table.json",
+                     "public/data/dataset_overview.json",
+                     "public/data/activity_regimes.json",
+                     "public/data/sampling_density.json",
+                     "public/data/session_lifecycle.json",
+                     "public/data/sample_symbols_sentiment_timeseries.json"),
+        ),
+        Task(
+            "daily_update_post",
+            (python, "scripts/generate_daily_update_post.py"),
+            inputs=("public/data/archive_stats.json",
+                    "public/data/coverage_table.json",
+                    "output/tier3_daily"),
+            outputs=("src/content/updates",),
+        ),
+    ]
+
+
+PIPELINES = {
+    "daily_refresh": daily_refresh_tasks,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a site pipeline as a task graph")
+    parser.add_argument("pipeline", choices=sorted(PIPELINES), help="Pipeline to run")
+    parser.add_argument("--archive-path", type=Path, default=DEFAULT_ARCHIVE_PATH,
+                        help=f"Path to archive root (default: {DEFAULT_ARCHIVE_PATH})")
+    parser.add_argument("--jobs", type=int, default=4, help="Concurrent tasks (default: 4)")
+    parser.add_argument("--force", action="store_true", help="Run tasks even if their inputs are unchanged")
+    parser.add_argument("--dry-run", action="store_true", help="Print the plan without running anything")
+    parser.add_argument("--state-file", type=Path, default=DEFAULT_STATE_FILE,
+                        help=f"Task state file (default: {DEFAULT_STATE_FILE})")
+    parser.add_argument("--metrics-file", type=Path, default=DEFAULT_METRICS_FILE,
+                        help=f"Per-task metrics JSONL (default: {DEFAULT_METRICS_FILE})")
+    args = parser.parse_args()
+
+    if not args.archive_path.exists():
+        print(f"[ERROR] Archive path not found: {args.archive_path}", file=sys.stderr)
+        return 1
+
+    print("=" * 60)
+    print(f"Task Graph: {args.pipeline}")
+    print("=" * 60)
+
+    tasks = PIPELINES[args.pipeline](args.archive_path)
+    ok = run_graph(tasks, jobs=args.jobs, state_file=args.state_file,
+                   metrics_file=args.metrics_file, force=args.force, dry_run=args.dry_run)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Tier Object Cache
+
+Shared on-disk cache for parquet objects downloaded from R2, so one nightly
+cycle (daily builders, weekly builders, monthly bundle, verifiers) downloads
+each Tier 3 daily parquet at most once.
+
+Entries are keyed by R2 key + ETag: a re-uploaded object gets a new ETag and
+therefore a new entry, and stale entries age out through LRU eviction.
+
+Layout:
+    {cache_dir}/objects/{digest[:2]}/{digest}.parquet   read-only data file
+    {cache_dir}/objects/{digest[:2]}/{digest}.json      key, etag, size, sha256
+    {cache_dir}/objects/{digest[:2]}/{digest}.lock      per-entry flock
+
+Concurrency:
+    A miss takes an exclusive flock on the entry, re-checks, downloads to a
+    temp file and renames it into place, so concurrent processes asking for
+    the same object wait for one download instead of racing. Eviction only
+    removes entries whose lock it can take without blocking. Consumers get a
+    hard link (or reflink/copy) in their own working dir, which stays valid
+    even if the entry is evicted afterwards.
+
+Configuration (environment):
+    TIER_CACHE_DIR      Cache root (default: ./output/cache/r2_objects)
+    TIER_CACHE_MAX_GB   Size cap before LRU eviction (default: 20)
+
+Usage:
+    from tier_cache import get_cache
+
+    cache = get_cache()
+    local = cache.materialize(s3, bucket, key, temp_dir / "tier3.parquet",
+                              expected_sha256=entry["sha256"])
+
+    # Inspect / evict / clear
+    python3 scripts/tier_cache.py
+    python3 scripts/tier_cache.py --evict
+    python3 scripts/tier_cache.py --clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from hashing_io import download_hashed, known_digest, record_digest
+
+try:
+    import fcntl
+except ImportError:  # Non-POSIX: cache works, without cross-process locking
+    fcntl = None
+
+DEFAULT_CACHE_DIR = Path("./output/cache/r2_objects")
+DEFAULT_MAX_GB = 20
+
+# Linux FICLONE ioctl (reflink on btrfs/xfs)
+FICLONE = 0x40049409
+
+
+class _EntryLock:
+    """Exclusive flock on a lock file (no-op without fcntl)."""
+
+    def __init__(self, path: Path, blocking: bool = True):
+        self.path = path
+        self.blocking = blocking
+        self.fd = None
+        self.acquired = False
+
+    def __enter__(self):
+        if fcntl is None:
+            self.acquired = True
+            return self
+        self.fd = os.open(self.path, os.O_CREAT | os.O_RDWR, 0o644)
+        flags = fcntl.LOCK_EX if self.blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(self.fd, flags)
+            self.acquired = True
+        except BlockingIOError:
+            self.acquired = False
+        return self
+
+    def __exit__(self, *exc):
+        if self.fd is not None:
+            if self.acquired:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+        return False
+
+
+class TierCache:
+    """
+    Content-addressed (R2 key + ETag) cache of downloaded objects.
+
+    Args:
+        cache_dir: Cache root
+        max_bytes: Size cap; least recently used entries are evicted past it
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: Optional[int] = None):
+        if cache_dir is None:
+            cache_dir = Path(os.environ.get("TIER_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        if max_bytes is None:
+            max_gb = float(os.environ.get("TIER_CACHE_MAX_GB") or DEFAULT_MAX_GB)
+            max_bytes = int(max_gb * 1024 ** 3)
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / "objects"
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_downloaded = 0
+
+    # ------------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def entry_digest(key: str, etag: str) -> str:
+        etag = etag.strip('"')
+        return hashlib.sha256(f"{key}\0{etag}".encode("utf-8")).hexdigest()
+
+    def _paths(self, digest: str) -> tuple[Path, Path, Path]:
+        folder = self.objects_dir / digest[:2]
+        return folder / f"{digest}.parquet", folder / f"{digest}.json", folder / f"{digest}.lock"
+
+    # ------------------------------------------------------------------
+    # Fetch
+    # ------------------------------------------------------------------
+
+    def fetch(
+        self,
+        s3,
+        bucket: str,
+        key: str,
+        etag: Optional[str] = None,
+        expected_sha256: Optional[str] = None,
+    ) -> Path:
+        """
+        Return the cached (read-only) path for an object, downloading on miss.
+
+        Args:
+            etag: Object ETag if already known (skips a head_object)
+            expected_sha256: Verified on download; a cached entry recorded
+                with a different sha256 is discarded and re-downloaded
+
+        Raises:
+            ValueError: If the downloaded bytes don't match expected_sha256
+        """
+        if etag is None:
+            etag = s3.head_object(Bucket=bucket, Key=key)["ETag"]
+
+        digest = self.entry_digest(key, etag)
+        data_path, meta_path, lock_path = self._paths(digest)
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with _EntryLock(lock_path):
+            meta = self._read_meta(meta_path)
+            if meta and data_path.exists():
+                if expected_sha256 and meta.get("sha256") != expected_sha256:
+                    print(f"[WARN] Cached {key} sha256 differs from expected; re-downloading", file=sys.stderr)
+                else:
+                    os.utime(data_path)
+                    with self._lock:
+                        self.hits += 1
+                    return data_path
+
+            tmp_path = data_path.with_name(f"{digest}.tmp.{os.getpid()}.{threading.get_ident()}")
+            try:
+                actual_sha256, _ = download_hashed(s3, bucket, key, tmp_path)
+                if expected_sha256 and actual_sha256 != expected_sha256:
+                    raise ValueError(
+                        f"SHA256 mismatch for {key}: expected {expected_sha256[:16]}..., "
+                        f"got {actual_sha256[:16]}..."
+                    )
+                size = tmp_path.stat().st_size
+                os.chmod(tmp_path, 0o444)
+                os.replace(tmp_path, data_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+
+            self._write_meta(meta_path, {
+                "key": key,
+                "bucket": bucket,
+                "etag": etag,
+                "size_bytes": size,
+                "sha256": actual_sha256,
+                "cached_ts_utc": datetime.now(timezone.utc).isoformat(),
+            })
+            with self._lock:
+                self.misses += 1
+                self.bytes_downloaded += size
+
+        self.evict(keep={digest})
+        return data_path
+
+    def materialize(
+        self,
+        s3,
+        bucket: str,
+        key: str,
+        dest: Path,
+        etag: Optional[str] = None,
+        expected_sha256: Optional[str] = None,
+    ) -> Path:
+        """
+        Fetch an object through the cache and place it at dest.
+
+        Uses a hard link, then a reflink, then a copy. The result is
+        read-only when hard-linked (it shares the cache inode); treat it as
+        an input file and delete it when done rather than modifying it.
+        """
+        cached = self.fetch(s3, bucket, key, etag=etag, expected_sha256=expected_sha256)
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.unlink(missing_ok=True)
+        link_or_copy(cached, dest)
+        digest = known_digest(cached)
+        if digest is not None:
+            record_digest(dest, digest)
+        return dest
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _read_meta(meta_path: Path) -> Optional[dict]:
+        try:
+            with open(meta_path) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _write_meta(meta_path: Path, meta: dict):
+        tmp = meta_path.with_name(meta_path.name + f".tmp.{os.getpid()}")
+        with open(tmp, "w") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp, meta_path)
+
+    def entries(self) -> list[dict]:
+        """All complete entries with their path, size and last-use time."""
+        result = []
+        if not self.objects_dir.exists():
+            return result
+        for data_path in self.objects_dir.glob("*/*.parquet"):
+            digest = data_path.stem
+            _, meta_path, _ = self._paths(digest)
+            try:
+                stat = data_path.stat()
+            except FileNotFoundError:
+                continue
+            meta = self._read_meta(meta_path) or {}
+            result.append({
+                "digest": digest,
+                "path": data_path,
+                "key": meta.get("key"),
+                "size_bytes": stat.st_size,
+                "last_used": stat.st_mtime,
+            })
+        return result
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+
+    def evict(self, keep: Optional[set] = None) -> int:
+        """
+        Evict least recently used entries until the cache fits max_bytes.
+
+        Args:
+            keep: Digests never evicted in this pass (e.g. the entry just fetched)
+
+        Returns:
+            Number of bytes freed
+        """
+        keep = keep or set()
+        entries = sorted(self.entries(), key=lambda e: e["last_used"])
+        total = sum(e["size_bytes"] for e in entries)
+        freed = 0
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry["digest"] in keep:
+                continue
+            if self._remove_entry(entry["digest"], blocking=False):
+                total -= entry["size_bytes"]
+                freed += entry["size_bytes"]
+        return freed
+
+    def _remove_entry(self, digest: str, blocking: bool) -> bool:
+        data_path, meta_path, lock_path = self._paths(digest)
+        with _EntryLock(lock_path, blocking=blocking) as lock:
+            if not lock.acquired:
+                return False  # In use by another process
+            data_path.unlink(missing_ok=True)
+            meta_path.unlink(missing_ok=True)
+        # The lock file stays: unlinking it could let two processes lock different inodes
+        return True
+
+    def clear(self) -> int:
+        """Remove every entry not currently locked. Returns bytes freed."""
+        freed = 0
+        for entry in self.entries():
+            if self._remove_entry(entry["digest"], blocking=False):
+                freed += entry["size_bytes"]
+        return freed
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes_downloaded": self.bytes_downloaded,
+        }
+
+
+def link_or_copy(src: Path, dest: Path):
+    """Hard-link src to dest, falling back to a reflink and then a copy."""
+    try:
+        os.link(src, dest)
+        return
+    except OSError:
+        pass
+
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            dest.unlink(missing_ok=True)
+
+    shutil.copyfile(src, dest)
+
+
+_cache: Optional[TierCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> TierCache:
+    """Process-wide cache configured from the environment."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TierCache()
+        return _cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or prune the shared R2 object cache")
+    parser.add_argument("--cache-dir", type=str, default=None,
+                        help=f"Cache root (default: $TIER_CACHE_DIR or {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--evict", action="store_true", help="Evict LRU entries down to the size cap")
+    parser.add_argument("--clear", action="store_true", help="Remove all entries")
+    args = parser.parse_args()
+
+    cache = TierCache(Path(args.cache_dir) if args.cache_dir else None)
+
+    if args.clear:
+        freed = cache.clear()
+        print(f"[OK] Cleared {freed / 1024 ** 2:.1f} MB")
+        return 0
+    if args.evict:
+        freed = cache.evict()
+        print(f"[OK] Evicted {freed / 1024 ** 2:.1f} MB")
+
+    entries = sorted(cache.entries(), key=lambda e: e["last_used"], reverse=True)
+    total = sum(e["size_bytes"] for e in entries)
+    print(f"Cache: {cache.cache_dir}")
+    print(f"Entries: {len(entries)}, {total / 1024 ** 3:.2f} GB of {cache.max_bytes / 1024 ** 3:.1f} GB cap")
+    for entry in entries:
+        last_used = datetime.fromtimestamp(entry["last_used"], timezone.utc).strftime("%Y-%m-%d %H:%M")
+        print(f"  {last_used}  {entry['size_bytes'] / 1024 ** 2:8.1f} MB  {entry['key']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
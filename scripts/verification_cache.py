@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Verification Result Cache
+
+Persists verifier results keyed by (verifier, partition, parquet sha256 from
+the manifest, verifier rule-set version, mode). A partition whose parquet
+and rules are unchanged is answered from the cache without downloading or
+re-checking it, so a "verify everything" run costs one manifest GET per
+unchanged partition and full work only for new or changed ones.
+
+Results are stored as JSON (dataclasses.asdict of the verifier's
+VerificationResult) under:
+
+    {cache_dir}/{verifier}/{partition}_{key}.json
+
+Not cached:
+    - partitions whose manifest has no sha256 (nothing identifies the content)
+    - results with a SHA256 mismatch (the object may be re-uploaded under the
+      same manifest)
+
+Configuration (env):
+    VERIFICATION_CACHE_DIR   Cache root (default: ./output/cache/verification)
+
+Usage:
+    from verification_cache import VerificationCache, manifest_sha256
+
+    cache = VerificationCache()
+    cached = cache.get("tier3_parquet", date_str, sha, RULESET_VERSION, variant)
+    if cached is not None:
+        result = VerificationResult(**cached)
+    else:
+        result = verify_date(...)
+        cache.put("tier3_parquet", date_str, sha, RULESET_VERSION, result, variant)
+
+    # Drop all cached results (e.g. after changing checks without a version bump)
+    python3 scripts/verification_cache.py --clear
+"""
+
+import argparse
+import dataclasses
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_DIR = Path("./output/cache/verification")
+
+
+def manifest_sha256(manifest: Optional[dict]) -> Optional[str]:
+    """Parquet sha256 recorded in a manifest (daily, weekly or files.main layout)."""
+    if not manifest:
+        return None
+    sha = manifest.get("parquet_sha256") or manifest.get("sha256")
+    if not sha:
+        sha = manifest.get("files", {}).get("main", {}).get("sha256")
+    return sha or None
+
+
+class VerificationCache:
+    """
+    Directory of cached verification results.
+
+    Args:
+        cache_dir: Cache root (default: VERIFICATION_CACHE_DIR env or
+            ./output/cache/verification)
+        read: If False, lookups always miss but results are still stored
+            (forces re-verification while refreshing the cache)
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, read: bool = True):
+        self.cache_dir = Path(cache_dir or os.environ.get("VERIFICATION_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self.read = read
+
+    def _path(self, verifier: str, partition: str, sha256: str, ruleset_version, variant: str) -> Path:
+        key = hashlib.sha256(
+            json.dumps([verifier, partition, sha256, str(ruleset_version), variant]).encode()
+        ).hexdigest()[:24]
+        return self.cache_dir / verifier / f"{partition}_{key}.json"
+
+    def get(
+        self,
+        verifier: str,
+        partition: str,
+        sha256: Optional[str],
+        ruleset_version,
+        variant: str = "",
+    ) -> Optional[dict]:
+        """
+        Cached result fields for a partition, or None on a miss.
+
+        The returned dict is the asdict() of the stored result, with
+        info["verification_cache"] noting when it was verified.
+        """
+        if not self.read or not sha256:
+            return None
+        path = self._path(verifier, partition, sha256, ruleset_version, variant)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        result = entry["result"]
+        result.setdefault("info", {})["verification_cache"] = {
+            "verified_ts_utc": entry.get("verified_ts_utc"),
+            "ruleset_version": entry.get("ruleset_version"),
+        }
+        return result
+
+    def put(
+        self,
+        verifier: str,
+        partition: str,
+        sha256: Optional[str],
+        ruleset_version,
+        result,
+        variant: str = "",
+    ) -> bool:
+        """
+        Store a verification result (a dataclass). Returns True if stored.
+        """
+        if not sha256 or result.info.get("sha256_match") is False:
+            return False
+
+        path = self._path(verifier, partition, sha256, ruleset_version, variant)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "verifier": verifier,
+            "partition": partition,
+            "sha256": sha256,
+            "ruleset_version": ruleset_version,
+            "variant": variant,
+            "verified_ts_utc": datetime.now(timezone.utc).isoformat(),
+            "result": dataclasses.asdict(result),
+        }
+
+        # Atomic write: concurrent --jobs workers never see partial files
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp_")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp, path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        return True
+
+    def clear(self, verifier: Optional[str] = None) -> int:
+        """Delete cached results (one verifier or all). Returns files removed."""
+        root = self.cache_dir / verifier if verifier else self.cache_dir
+        if not root.exists():
+            return 0
+        count = sum(1 for _ in root.rglob("*.json"))
+        shutil.rmtree(root)
+        return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the verification result cache")
+    parser.add_argument("--cache-dir", type=str, default=None,
+                        help=f"Cache root (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--clear", action="store_true", help="Delete cached results")
+    parser.add_argument("--verifier", type=str, default=None,
+                        help="Limit --clear / listing to one verifier (e.g. tier3_parquet)")
+    args = parser.parse_args()
+
+    cache = VerificationCache(Path(args.cache_dir) if args.cache_dir else None)
+
+    if args.clear:
+        removed = cache.clear(args.verifier)
+        print(f"[OK] Removed {removed} cached results from {cache.cache_dir}")
+        return 0
+
+    root = cache.cache_dir / args.verifier if args.verifier else cache.cache_dir
+    if not root.exists():
+        print(f"[INFO] No cached results in {root}")
+        return 0
+    for verifier_dir in sorted(p for p in ([root] if args.verifier else root.iterdir()) if p.is_dir()):
+        print(f"  {verifier_dir.name}: {sum(1 for _ in verifier_dir.glob('*.json'))} results")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,803 @@
+#!/usr/bin/env python3
+"""
+Streaming Verification Engine
+
+Single-pass verification of tier parquets. A verifier is a declarative
+DailyTierSpec (expected columns, required struct fields, critical columns);
+the engine checks the schema from the footer and streams the data through
+a rule set with ParquetFile.iter_batches, so memory is bounded by one row
+group's column chunks plus one record batch regardless of file size, and
+each column chunk is read once.
+
+Rules:
+    RowCount        total rows
+    DistinctCount   distinct non-null values of a column (e.g. symbols)
+    HeadValues      first N values of a column
+    FirstRow        first row of a set of columns as a dict
+    NumericSummary  exact min/max/median/mean/sum of a column (arrow_checks)
+    ValueCounts     most frequent values of a column
+    BoolCounts      null / non-null / True counts of a boolean column
+    NullCounts      top-level null counts per column (NaN counts as missing
+                    for float columns unless disabled); critical columns with
+                    nulls fail the data check. With footer=True columns the
+                    footer statistics can settle are not read at all.
+
+verify_tier1_daily.py, verify_tier2_daily.py and verify_tier3_daily.py are
+thin configurations of this engine; the weekly verifiers, verify_tier3_parquet.py
+and the schema checkers run their data checks as rule sets through run_rules().
+
+In-build verification: builders run the same schema checks and rules on the
+table they are about to upload (verification_block), embed the result in the
+manifest as "verification" and refuse the upload when it fails. With
+--from-manifest the daily and weekly verifiers then only confirm the
+parquet's sha256 for exports carrying a passing block
+(confirm_from_manifest).
+
+Usage:
+    from verify_engine import DailyTierSpec, run_daily_cli
+
+    SPEC = DailyTierSpec(tier="tier1", label="Tier 1",
+                         expected_columns=[...], critical_columns=[...])
+
+    if __name__ == "__main__":
+        run_daily_cli(SPEC)
+
+    # In a builder, before upload
+    manifest["verification"] = verification_block(SPEC, table)
+    if not upload_allowed(manifest["verification"]):
+        return False
+"""
+
+import abc
+import argparse
+import json
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    print("[ERROR] pyarrow required: pip install pyarrow", file=sys.stderr)
+    sys.exit(1)
+
+sys.path.insert(0, str(Path(__file__).parent))
+from r2_config import get_r2_config
+from r2_metrics import instrument_client
+from r2_range_file import R2RangeFile
+from arrow_checks import bool_counts, numeric_summary, top_value_counts
+from hashing_io import sha256_stream
+from local_parquet import open_local_parquet
+from parquet_footer import footer_column_stats
+
+# Rows per streamed record batch (bounds memory per verification)
+DEFAULT_BATCH_ROWS = 65536
+
+# Version of the engine's rule semantics, recorded in manifest verification
+# blocks; bump when the rules change
+ENGINE_VERSION = 1
+
+
+# ==============================================================================
+# Tier Specs
+# ==============================================================================
+
+@dataclass(frozen=True)
+class TierSpec:
+    """
+    Declarative description of a tier export.
+
+    Args:
+        tier: R2 tier prefix (e.g. "tier1")
+        label: Display name (e.g. "Tier 1")
+        expected_columns: Required top-level columns
+        critical_columns: Columns that must never be null
+        struct_fields: {column: [required sub-fields]} checked in the schema
+        optional_columns: Columns allowed besides expected_columns
+        excluded_columns: Columns that must not be present
+        max_null_ratio: {column: highest allowed null ratio}
+    """
+    tier: str
+    label: str
+    expected_columns: list[str]
+    critical_columns: list[str]
+    struct_fields: dict[str, list[str]] = field(default_factory=dict)
+    optional_columns: list[str] = field(default_factory=list)
+    excluded_columns: list[str] = field(default_factory=list)
+    max_null_ratio: dict[str, float] = field(default_factory=dict)
+
+    def data_rules(self) -> list["Rule"]:
+        """Rule set streamed over the data for this tier."""
+        return [
+            RowCount(),
+            DistinctCount("symbol", "symbols"),
+            HeadValues("symbol", 5, "sample_symbols"),
+            NullCounts(self.expected_columns, self.critical_columns, self.max_null_ratio),
+        ]
+
+
+@dataclass(frozen=True)
+class DailyTierSpec(TierSpec):
+    """
+    TierSpec for a daily export in R2.
+
+    Args:
+        show_file_size: Print the parquet size with the schema summary
+    """
+    show_file_size: bool = False
+
+    def r2_key(self, date: str) -> str:
+        return f"{self.tier}/daily/{date[:7]}/{date}/instrumetriq_{self.tier}_daily_{date}.parquet"
+
+    def manifest_key(self, date: str) -> str:
+        return f"{self.tier}/daily/{date[:7]}/{date}/manifest.json"
+
+
+# ==============================================================================
+# Streaming Rules
+# ==============================================================================
+
+class Rule(abc.ABC):
+    """A check evaluated incrementally over record batches."""
+
+    columns: list[str] = []
+
+    def prepare(self, source):
+        """Hook run before streaming (e.g. to settle answers from the footer)."""
+
+    @abc.abstractmethod
+    def update(self, batch: pa.RecordBatch):
+        """Fold one record batch into the rule's state."""
+
+    @abc.abstractmethod
+    def finish(self, result: dict):
+        """Write this rule's outcome into the data result dict."""
+
+
+class RowCount(Rule):
+    def __init__(self):
+        self.columns = []
+        self.rows = 0
+
+    def update(self, batch):
+        self.rows += batch.num_rows
+
+    def finish(self, result):
+        result["total_rows"] = self.rows
+
+
+class DistinctCount(Rule):
+    def __init__(self, column: str, key: str):
+        self.columns = [column]
+        self.column = column
+        self.key = key
+        self.values = set()
+
+    def update(self, batch):
+        if self.column in batch.schema.names:
+            self.values.update(pc.unique(pc.drop_null(batch.column(self.column))).to_pylist())
+
+    def finish(self, result):
+        result[self.key] = len(self.values)
+
+
+class HeadValues(Rule):
+    def __init__(self, column: str, n: int, key: str):
+        self.columns = [column]
+        self.column = column
+        self.n = n
+        self.key = key
+        self.values = []
+
+    def update(self, batch):
+        if len(self.values) < self.n and self.column in batch.schema.names:
+            needed = self.n - len(self.values)
+            self.values.extend(batch.column(self.column).slice(0, needed).to_pylist())
+
+    def finish(self, result):
+        result[self.key] = self.values
+
+
+class FirstRow(Rule):
+    """First row of the columns present, as {column: value} (empty for no rows)."""
+
+    def __init__(self, columns: list[str], key: str):
+        self.columns = list(columns)
+        self.key = key
+        self.row = None
+
+    def update(self, batch):
+        if self.row is None and batch.num_rows:
+            self.row = {
+                name: batch.column(name)[0].as_py()
+                for name in self.columns if name in batch.schema.names
+            }
+
+    def finish(self, result):
+        result[self.key] = self.row or {}
+
+
+class NumericSummary(Rule):
+    """
+    arrow_checks.numeric_summary of one column over the whole file.
+
+    Only this column's values are kept (8 bytes a row for numeric columns),
+    so the median is exact rather than estimated. The outcome is None when
+    the column is missing or entirely null.
+    """
+
+    def __init__(self, column: str, stats, key: str):
+        self.columns = [column]
+        self.column = column
+        self.stats = stats
+        self.key = key
+        self.chunks = []
+
+    def update(self, batch):
+        if self.column in batch.schema.names:
+            self.chunks.append(batch.column(self.column))
+
+    def finish(self, result):
+        if not self.chunks:
+            result[self.key] = None
+            return
+        result[self.key] = numeric_summary(pa.chunked_array(self.chunks), self.stats)
+
+
+class ValueCounts(Rule):
+    """arrow_checks.top_value_counts of one column (optionally its first N rows)."""
+
+    def __init__(self, column: str, limit: int, key: str, head: Optional[int] = None):
+        self.columns = [column]
+        self.column = column
+        self.limit = limit
+        self.head = head
+        self.key = key
+        self.chunks = []
+        self.rows = 0
+
+    def update(self, batch):
+        if self.column not in batch.schema.names:
+            return
+        if self.head is not None:
+            if self.rows >= self.head:
+                return
+            batch = batch.slice(0, self.head - self.rows)
+        self.chunks.append(batch.column(self.column))
+        self.rows += batch.num_rows
+
+    def finish(self, result):
+        if not self.chunks:
+            result[self.key] = []
+            return
+        result[self.key] = top_value_counts(pa.chunked_array(self.chunks), limit=self.limit)
+
+
+class BoolCounts(Rule):
+    """arrow_checks.bool_counts of a boolean column, summed over batches (None if absent)."""
+
+    def __init__(self, column: str, key: str):
+        self.columns = [column]
+        self.column = column
+        self.key = key
+        self.counts = None
+
+    def prepare(self, source):
+        schema = source.schema_arrow if isinstance(source, pq.ParquetFile) else source.schema
+        if self.column in schema.names:
+            self.counts = {"non_null": 0, "null": 0, "true": 0}
+
+    def update(self, batch):
+        if self.column not in batch.schema.names:
+            return
+        for name, value in bool_counts(batch.column(self.column)).items():
+            self.counts[name] += value
+
+    def finish(self, result):
+        result[self.key] = self.counts
+
+
+class NullCounts(Rule):
+    """
+    Missing values per top-level column. Critical columns with nulls, or
+    columns above their max_null_ratio, fail the data check.
+
+    Args:
+        columns: Columns to count (None = every column in the file)
+        nan_as_null: Count NaN as missing in float columns (pandas isna
+            semantics)
+        footer: Settle columns from the footer statistics where they are
+            exact - flat columns, and nested columns with a leaf that has no
+            nulls - and stream only the smallest leaf of the remaining nested
+            columns (a leaf read carries the parent's validity)
+
+    Outcome: "null_counts" (columns with nulls), "column_null_counts" (every
+    counted column) and, with footer=True, "null_count_data_reads" (columns
+    that needed a data read).
+    """
+
+    def __init__(
+        self,
+        columns: Optional[list[str]] = None,
+        critical: Optional[list[str]] = None,
+        max_null_ratio: Optional[dict] = None,
+        nan_as_null: bool = True,
+        footer: bool = False,
+    ):
+        self.max_null_ratio = max_null_ratio or {}
+        self.names = None if columns is None else list(dict.fromkeys(list(columns) + list(self.max_null_ratio)))
+        self.columns = list(self.names or [])
+        self.critical = critical or []
+        self.nan_as_null = nan_as_null
+        self.footer = footer
+        self.counts = {c: 0 for c in self.columns}
+        self.streamed = set(self.columns)
+        self.data_reads = None
+        self.rows = 0
+
+    def prepare(self, source):
+        schema = source.schema_arrow if isinstance(source, pq.ParquetFile) else source.schema
+        if self.names is None:
+            self.names = schema.names
+        self.names = [c for c in self.names if c in schema.names]
+        self.counts = {c: 0 for c in self.names}
+        self.columns = list(self.names)
+        self.streamed = set(self.names)
+        if not (self.footer and isinstance(source, pq.ParquetFile)):
+            return
+
+        stats = footer_column_stats(source.metadata)
+        self.columns = []
+        self.data_reads = []
+        for name in self.names:
+            leaves = {path: entry for path, entry in stats.items()
+                      if path == name or path.startswith(name + ".")}
+            nested = list(leaves) != [name]
+            nan_possible = self.nan_as_null and pa.types.is_floating(schema.field(name).type)
+
+            # Flat column: the footer is exact (NaN is not a null there)
+            if not nested and leaves[name]["null_count"] is not None and not nan_possible:
+                self.counts[name] = leaves[name]["null_count"]
+                self.streamed.discard(name)
+                continue
+
+            # Nested column: leaf null counts include parent nulls, so a leaf
+            # with no nulls proves the column has none
+            if nested and any(entry["null_count"] == 0 for entry in leaves.values()):
+                self.streamed.discard(name)
+                continue
+
+            self.data_reads.append(name)
+            if nested and leaves:
+                self.columns.append(min(leaves, key=lambda p: leaves[p]["compressed_bytes"]))
+            else:
+                self.columns.append(name)
+
+    def update(self, batch):
+        self.rows += batch.num_rows
+        for name in self.streamed:
+            if name not in batch.schema.names:
+                continue
+            col = batch.column(name)
+            missing = col.null_count
+            if self.nan_as_null and pa.types.is_floating(col.type):
+                missing += pc.sum(pc.cast(pc.fill_null(pc.is_nan(col), False), pa.int64())).as_py() or 0
+            self.counts[name] += missing
+
+    def finish(self, result):
+        result["null_counts"] = {c: n for c, n in self.counts.items() if n > 0}
+        result["column_null_counts"] = dict(self.counts)
+        if self.data_reads is not None:
+            result["null_count_data_reads"] = self.data_reads
+        for c in self.critical:
+            if result["null_counts"].get(c, 0) > 0:
+                result["errors"].append(f"Critical column {c} has {result['null_counts'][c]} nulls")
+        for c, limit in self.max_null_ratio.items():
+            ratio = self.counts.get(c, 0) / self.rows if self.rows else 0.0
+            if ratio > limit:
+                result["errors"].append(f"Column {c} is {ratio:.1%} null (limit {limit:.1%})")
+
+
+def run_rules(
+    source,
+    rules: list[Rule],
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    max_rows: Optional[int] = None,
+) -> dict:
+    """
+    Evaluate a rule set in one pass.
+
+    Args:
+        source: pyarrow.parquet.ParquetFile (streamed; only the columns the
+            rules need are read) or an in-memory pyarrow.Table (e.g. the
+            table a builder is about to write)
+        max_rows: Stop after this many rows (e.g. 1 for FirstRow checks)
+
+    Returns:
+        Dict with each rule's outcome, "errors" and "data_valid"
+    """
+    names = source.schema_arrow.names if isinstance(source, pq.ParquetFile) else source.schema.names
+    columns = []
+    for rule in rules:
+        rule.prepare(source)
+        # Leaf paths ("meta.added_ts") select part of a top-level column
+        columns.extend(
+            c for c in rule.columns
+            if (c in names or c.split(".")[0] in names) and c not in columns
+        )
+
+    # With no columns needed the batches carry row counts only
+    if isinstance(source, pq.ParquetFile):
+        batches = source.iter_batches(batch_size=batch_rows, columns=columns)
+    else:
+        batches = source.select(columns).to_batches(max_chunksize=batch_rows)
+
+    rows = 0
+    for batch in batches:
+        if max_rows is not None:
+            batch = batch.slice(0, max_rows - rows)
+        for rule in rules:
+            rule.update(batch)
+        rows += batch.num_rows
+        if max_rows is not None and rows >= max_rows:
+            break
+
+    result = {"errors": []}
+    for rule in rules:
+        rule.finish(result)
+    result["data_valid"] = not result["errors"]
+    return result
+
+
+def null_counts(source, columns: Optional[list[str]] = None, footer: bool = False) -> dict[str, int]:
+    """
+    Exact top-level null count of each column (NaN is not a null here).
+
+    Args:
+        source: ParquetFile or pyarrow.Table
+        columns: Columns to count (None = all)
+        footer: Settle what the footer can and read only one leaf of the
+            remaining nested columns (see NullCounts)
+    """
+    return run_rules(source, [NullCounts(columns, nan_as_null=False, footer=footer)])["column_null_counts"]
+
+
+# ==============================================================================
+# Schema
+# ==============================================================================
+
+def verify_schema(spec: TierSpec, schema: pa.Schema, num_rows: int) -> dict:
+    """Check a schema against the spec (column set + struct fields)."""
+    actual_cols = schema.names
+    allowed = set(spec.expected_columns) | set(spec.optional_columns) | set(spec.excluded_columns)
+
+    result = {
+        "rows": num_rows,
+        "columns": len(actual_cols),
+        "column_names": actual_cols,
+        "missing_columns": [c for c in spec.expected_columns if c not in actual_cols],
+        "extra_columns": [c for c in actual_cols if c not in allowed],
+        "excluded_present": [c for c in spec.excluded_columns if c in actual_cols],
+        "struct_missing": {},
+    }
+
+    for column, required in spec.struct_fields.items():
+        if column not in actual_cols:
+            continue
+        col_type = schema.field(column).type
+        present = [f.name for f in col_type] if pa.types.is_struct(col_type) else []
+        missing = [f for f in required if f not in present]
+        if missing:
+            result["struct_missing"][column] = missing
+
+    result["schema_valid"] = not (
+        result["missing_columns"] or result["extra_columns"]
+        or result["excluded_present"] or result["struct_missing"]
+    )
+    return result
+
+
+# ==============================================================================
+# In-Build Verification
+# ==============================================================================
+
+def verification_block(spec: TierSpec, source, batch_rows: int = DEFAULT_BATCH_ROWS) -> dict:
+    """
+    Run the spec's schema checks and rule set on a build output.
+
+    Builders embed the returned dict in the manifest as "verification" and
+    refuse to upload when its status is FAIL.
+
+    Args:
+        source: The pyarrow.Table being written, or a ParquetFile / local
+            path of a parquet written by another engine (streamed locally)
+    """
+    if not isinstance(source, pa.Table):
+        source = open_local_parquet(source)
+    if isinstance(source, pa.Table):
+        schema, num_rows = source.schema, source.num_rows
+    else:
+        schema, num_rows = source.schema_arrow, source.metadata.num_rows
+
+    schema_result = verify_schema(spec, schema, num_rows)
+    data_result = run_rules(source, spec.data_rules(), batch_rows)
+
+    errors = []
+    warnings = []
+    if num_rows == 0:
+        errors.append("No rows")
+    if schema_result["missing_columns"]:
+        errors.append(f"Missing columns: {schema_result['missing_columns']}")
+    if schema_result["excluded_present"]:
+        errors.append(f"Excluded columns present: {schema_result['excluded_present']}")
+    for column, missing in schema_result["struct_missing"].items():
+        errors.append(f"Missing {column} fields: {missing}")
+    if schema_result["extra_columns"]:
+        warnings.append(f"Extra columns: {schema_result['extra_columns']}")
+    errors.extend(data_result["errors"])
+
+    return {
+        "engine": "verify_engine",
+        "engine_version": ENGINE_VERSION,
+        "spec": spec.tier,
+        "status": "FAIL" if errors else ("WARN" if warnings else "PASS"),
+        "errors": errors,
+        "warnings": warnings,
+        "row_count": num_rows,
+        "distinct_symbols": data_result["symbols"],
+        "null_counts": data_result["null_counts"],
+        "verified_ts_utc": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def upload_allowed(verification: dict) -> bool:
+    """Print the in-build verification outcome; False means do not upload."""
+    if verification["status"] == "FAIL":
+        print("[ERROR] In-build verification failed; output will not be uploaded:", file=sys.stderr)
+        for error in verification["errors"]:
+            print(f"  - {error}", file=sys.stderr)
+        return False
+    for warning in verification["warnings"]:
+        print(f"[WARN] In-build verification: {warning}")
+    print(f"[OK] In-build verification {verification['status']} "
+          f"({verification['row_count']:,} rows, {verification['distinct_symbols']} symbols)")
+    return True
+
+
+# ==============================================================================
+# R2
+# ==============================================================================
+
+def get_s3():
+    try:
+        import boto3
+    except ImportError:
+        print("[ERROR] boto3 required: pip install boto3", file=sys.stderr)
+        sys.exit(1)
+
+    cfg = get_r2_config()
+    return instrument_client(boto3.client(
+        "s3",
+        endpoint_url=cfg.endpoint,
+        aws_access_key_id=cfg.access_key_id,
+        aws_secret_access_key=cfg.secret_access_key
+    )), cfg.bucket
+
+
+def list_available_dates(s3, bucket: str, spec: DailyTierSpec) -> list[str]:
+    """List all available daily dates for a tier in R2."""
+    # Structure: tierX/daily/YYYY-MM/YYYY-MM-DD/instrumetriq_tierX_daily_YYYY-MM-DD.parquet
+    dates = set()
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=f"{spec.tier}/daily/"):
+        for obj in page.get("Contents", []):
+            key = obj["Key"]
+            if f"instrumetriq_{spec.tier}_daily_" in key and key.endswith(".parquet"):
+                parts = key.split("/")
+                if len(parts) >= 4:
+                    dates.add(parts[3])  # YYYY-MM-DD folder name
+    return sorted(dates)
+
+
+# ==============================================================================
+# Verification
+# ==============================================================================
+
+def verify_date(
+    s3,
+    bucket: str,
+    spec: DailyTierSpec,
+    date: str,
+    schema_only: bool = False,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+) -> dict:
+    """Full verification for a single date."""
+    print(f"\n{'='*60}")
+    print(f"Verifying {spec.label} for {date}")
+    print(f"{'='*60}")
+
+    result = {"date": date, "status": "PASS"}
+    n_expected = len(spec.expected_columns)
+
+    # Open (only the footer is fetched here)
+    try:
+        range_file = R2RangeFile(s3, bucket, spec.r2_key(date))
+        parquet_file = pq.ParquetFile(range_file, pre_buffer=True)
+    except Exception as e:
+        print(f"  [ERROR] Failed to open: {e}")
+        return {"date": date, "status": "FAIL", "error": str(e)}
+
+    # Schema check
+    schema_result = verify_schema(spec, parquet_file.schema_arrow, parquet_file.metadata.num_rows)
+    result["schema"] = schema_result
+
+    print(f"  Rows: {schema_result['rows']:,}")
+    print(f"  Columns: {schema_result['columns']} (expected {n_expected})")
+    if spec.show_file_size:
+        print(f"  Size: {range_file.size() / (1024 * 1024):.1f} MB")
+
+    if schema_result["missing_columns"]:
+        print(f"  [ERROR] Missing columns: {schema_result['missing_columns']}")
+        result["status"] = "FAIL"
+
+    if schema_result["excluded_present"]:
+        print(f"  [ERROR] Excluded columns present: {schema_result['excluded_present']}")
+        result["status"] = "FAIL"
+
+    if schema_result["extra_columns"]:
+        print(f"  [WARN] Extra columns: {schema_result['extra_columns']}")
+
+    for column, missing in schema_result["struct_missing"].items():
+        print(f"  [ERROR] Missing {column} fields: {missing}")
+        result["status"] = "FAIL"
+
+    if schema_result["schema_valid"]:
+        struct_note = "".join(
+            f", {len(fields)} {column} fields" for column, fields in spec.struct_fields.items()
+        )
+        print(f"  [OK] Schema valid ({n_expected} columns{struct_note})")
+
+    # Data check: one streamed pass over the needed columns
+    if not schema_only:
+        data_result = run_rules(parquet_file, spec.data_rules(), batch_rows)
+        result["data"] = data_result
+
+        print(f"  Symbols: {data_result['symbols']}")
+
+        if data_result["null_counts"]:
+            print(f"  Nulls: {data_result['null_counts']}")
+        else:
+            print("  [OK] No nulls in any column")
+
+        for error in data_result["errors"]:
+            print(f"  [ERROR] {error}")
+        if not data_result["data_valid"]:
+            result["status"] = "FAIL"
+
+    stats = range_file.stats()
+    print(f"  Fetched: {stats['bytes_fetched'] / (1024 * 1024):.1f} of "
+          f"{stats['object_bytes'] / (1024 * 1024):.1f} MB ({stats['requests']} range requests)")
+
+    print(f"  Result: {result['status']}")
+    return result
+
+
+def confirm_from_manifest(s3, bucket: str, parquet_key: str, manifest_key: str, name: str) -> Optional[tuple[dict, bool]]:
+    """
+    Confirm an export the builder already verified.
+
+    When the manifest carries a passing in-build "verification" block, the
+    rule set has already run on exactly these bytes, so only the parquet's
+    sha256 is checked (one streamed GET, nothing decoded).
+
+    Args:
+        name: Date or week shown in messages
+
+    Returns:
+        (verification block, sha256 matches), or None if the manifest has
+        no usable verification block (caller falls back to full verification)
+    """
+    try:
+        response = s3.get_object(Bucket=bucket, Key=manifest_key)
+        manifest = json.loads(response["Body"].read())
+    except Exception as e:
+        print(f"  [WARN] {name}: no manifest ({e}); running full verification")
+        return None
+
+    verification = manifest.get("verification")
+    expected_sha = manifest.get("parquet_sha256")
+    if not verification or verification.get("status") == "FAIL" or not expected_sha:
+        print(f"  [INFO] {name}: no passing in-build verification; running full verification")
+        return None
+
+    body = s3.get_object(Bucket=bucket, Key=parquet_key)["Body"]
+    return verification, sha256_stream(body) == expected_sha
+
+
+def verify_date_from_manifest(s3, bucket: str, spec: DailyTierSpec, date: str) -> Optional[dict]:
+    """
+    confirm_from_manifest for a daily export.
+
+    Returns:
+        Result dict, or None if the manifest has no usable verification
+        block (caller falls back to verify_date)
+    """
+    outcome = confirm_from_manifest(s3, bucket, spec.r2_key(date), spec.manifest_key(date), date)
+    if outcome is None:
+        return None
+    verification, sha_ok = outcome
+
+    print(f"\n{'='*60}")
+    print(f"Confirming {spec.label} for {date} (in-build verification {verification['status']})")
+    print(f"{'='*60}")
+
+    result = {"date": date, "status": "PASS", "verification": verification}
+    if sha_ok:
+        print(f"  [OK] SHA256 matches manifest ({verification.get('row_count', 0):,} rows "
+              f"verified {verification.get('verified_ts_utc', '?')})")
+    else:
+        print("  [ERROR] SHA256 mismatch with manifest")
+        result["status"] = "FAIL"
+    print(f"  Result: {result['status']}")
+    return result
+
+
+def run_daily_cli(spec: DailyTierSpec, argv: Optional[list[str]] = None):
+    """Command-line entry point shared by the daily tier verifiers."""
+    parser = argparse.ArgumentParser(description=f"Verify {spec.label} daily parquet exports")
+    parser.add_argument("--date", help="Specific date to verify (YYYY-MM-DD)")
+    parser.add_argument("--all", action="store_true", help="Verify all available dates")
+    parser.add_argument("--schema-only", action="store_true", help="Only check schema (footer-only range read), skip data validation")
+    parser.add_argument("--batch-rows", type=int, default=DEFAULT_BATCH_ROWS,
+                        help=f"Rows per streamed batch (default: {DEFAULT_BATCH_ROWS})")
+    parser.add_argument("--from-manifest", action="store_true",
+                        help="Trust a passing in-build verification block and only confirm sha256")
+    args = parser.parse_args(argv)
+
+    s3, bucket = get_s3()
+
+    if args.all:
+        dates = list_available_dates(s3, bucket, spec)
+        print(f"Found {len(dates)} {spec.label} daily exports")
+    elif args.date:
+        dates = [args.date]
+    else:
+        # Default: verify latest
+        dates = list_available_dates(s3, bucket, spec)
+        if dates:
+            dates = [dates[-1]]
+        else:
+            print(f"[ERROR] No {spec.label} daily exports found")
+            sys.exit(1)
+
+    results = []
+    for date in dates:
+        result = None
+        if args.from_manifest:
+            result = verify_date_from_manifest(s3, bucket, spec, date)
+        if result is None:
+            result = verify_date(s3, bucket, spec, date, args.schema_only, args.batch_rows)
+        results.append(result)
+
+    # Summary
+    print(f"\n{'='*60}")
+    print("SUMMARY")
+    print(f"{'='*60}")
+    passed = sum(1 for r in results if r["status"] == "PASS")
+    failed = sum(1 for r in results if r["status"] == "FAIL")
+    print(f"  Total: {len(results)}")
+    print(f"  Passed: {passed}")
+    print(f"  Failed: {failed}")
+
+    if failed > 0:
+        print("\nFailed dates:")
+        for r in results:
+            if r["status"] == "FAIL":
+                print(f"  - {r['date']}")
+        sys.exit(1)
+    else:
+        print(f"\n[OK] All {spec.label} daily exports verified successfully")
@@ -20,15 +20,20 @@ Usage:
     # Verify from R2 explicitly
     python3 scripts/verify_tier1_weekly.py --r2 --end-day 2025-12-28
 
+    # Verify all weeks, 4 at a time (report stays in week order)
+    python3 scripts/verify_tier1_weekly.py --jobs 4
+
+    # Only confirm the sha256 of weeks the builder verified in-build
+    python3 scripts/verify_tier1_weekly.py --from-manifest
+
 Outputs:
     Reports are written to output/verify_tier1/report_YYYYMMDD_HHMMSS.md
     Per-week artifacts are written to output/verify_tier1/{end-day}/
+    Verification results are cached in output/cache/verification/tier1_weekly/
 """
 
 import argparse
-import hashlib
 import json
-import statistics
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
@@ -37,7 +42,6 @@ from typing import Optional
 
 try:
     import pyarrow.parquet as pq
-    import pyarrow as pa
 except ImportError:
     print("[ERROR] pyarrow not installed. Run: pip install pyarrow", file=sys.stderr)
     sys.exit(1)
@@ -53,6 +57,21 @@ SCRIPT_DIR = Path(__file__).parent
 sys.path.insert(0, str(SCRIPT_DIR))
 
 from r2_config import get_r2_config, R2Config
+from r2_metrics import instrument_client
+from parallel_verify import DEFAULT_MAX_INFLIGHT_MB, run_partitions
+from verification_cache import VerificationCache, manifest_sha256
+from hashing_io import download_hashed, sha256_file
+from local_parquet import open_local_parquet
+from verify_engine import (
+    DistinctCount,
+    FirstRow,
+    NullCounts,
+    NumericSummary,
+    TierSpec,
+    ValueCounts,
+    confirm_from_manifest,
+    run_rules,
+)
 
 
 # ==============================================================================
@@ -61,6 +80,10 @@ from r2_config import get_r2_config, R2Config
 
 VERIFY_CACHE_DIR = Path("./output/verify_tier1")
 
+# Version of the checks in this script; bump when they change so results
+# in the verification cache are recomputed
+RULESET_VERSION = 1
+
 # Tier 1 flattened schema (19 required fields)
 TIER1_REQUIRED_COLUMNS = [
     # Identity + Timing (6)
@@ -130,6 +153,28 @@ EXPECTED_COLUMNS = [
     "spot_spread_bps",
 ]
 
+# Numeric columns summarized by the data quality check, with their stats
+SUMMARY_COLUMNS = {
+    "spot_spread_bps": ("min", "max", "median"),
+    "meta_duration_sec": ("min", "max", "median"),
+    "score_final": ("min", "max", "mean"),
+    "sentiment_mean_score": ("min", "max", "mean"),
+    "sentiment_posts_total": ("min", "max", "sum"),
+}
+
+# Fields shown in the report's sample row (safe fields only)
+SAMPLE_ROW_COLUMNS = ["symbol", "snapshot_ts", "score_final", "sentiment_posts_total", "sentiment_mean_score"]
+
+# Rule set build_tier1_weekly.py runs on its table before upload
+SPEC = TierSpec(
+    tier="tier1",
+    label="Tier 1 weekly",
+    expected_columns=TIER1_REQUIRED_COLUMNS,
+    critical_columns=["symbol", "snapshot_ts"],
+    optional_columns=[c for c in COLUMN_TYPES if c not in TIER1_REQUIRED_COLUMNS],
+    max_null_ratio={c: 0.995 for c in CRITICAL_COLUMNS if c not in ("symbol", "snapshot_ts")},
+)
+
 
 # ==============================================================================
 # Data Classes
@@ -170,12 +215,12 @@ class VerificationResult:
 
 def get_s3_client(config: R2Config):
     """Create boto3 S3 client for R2."""
-    return boto3.client(
+    return instrument_client(boto3.client(
         "s3",
         endpoint_url=config.endpoint,
         aws_access_key_id=config.access_key_id,
         aws_secret_access_key=config.secret_access_key,
-    )
+    ))
 
 
 def list_tier1_weeks(config: R2Config) -> list[str]:
@@ -237,9 +282,9 @@ def download_from_r2(
         print(f"[ERROR] Objects not found in R2 for week {end_day}: {e}", file=sys.stderr)
         return None, None
     
-    # Download parquet
+    # Download parquet (hashed as it streams in; the integrity check reuses the digest)
     print(f"  Downloading {parquet_key}...")
-    s3.download_file(config.bucket, parquet_key, str(parquet_path))
+    download_hashed(s3, config.bucket, parquet_key, parquet_path)
     
     # Download manifest
     print(f"  Downloading {manifest_key}...")
@@ -248,6 +293,16 @@ def download_from_r2(
     return parquet_path, manifest_path
 
 
+def fetch_manifest(config: R2Config, end_day: str) -> Optional[dict]:
+    """Fetch and parse the manifest for a week, or None if missing/invalid."""
+    s3 = get_s3_client(config)
+    try:
+        response = s3.get_object(Bucket=config.bucket, Key=f"tier1/weekly/{end_day}/manifest.json")
+        return json.loads(response["Body"].read())
+    except Exception:
+        return None
+
+
 def get_r2_object_size(config: R2Config, end_day: str) -> int:
     """Get parquet file size from R2 without downloading."""
     s3 = get_s3_client(config)
@@ -264,15 +319,6 @@ def get_r2_object_size(config: R2Config, end_day: str) -> int:
 # Verification Checks
 # ==============================================================================
 
-def compute_sha256(filepath: Path) -> str:
-    """Compute SHA256 hash of a file."""
-    sha256 = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
-
-
 def check_presence_and_integrity(
     result: VerificationResult,
     parquet_path: Optional[Path],
@@ -321,7 +367,7 @@ def check_presence_and_integrity(
     
     if sha_field:
         expected_sha = manifest[sha_field]
-        actual_sha = compute_sha256(parquet_path)
+        actual_sha = sha256_file(parquet_path, trust_memo=False)
         
         result.info["expected_sha256"] = expected_sha
         result.info["actual_sha256"] = actual_sha
@@ -501,18 +547,19 @@ def check_source_coverage(
 def check_schema_columns(
     result: VerificationResult,
     parquet_path: Path,
-) -> Optional[pa.Table]:
-    """Check 4: Parquet schema (22 flattened fields)."""
+) -> Optional[pq.ParquetFile]:
+    """Check 4: Parquet schema (22 flattened fields), from the footer only."""
     try:
-        table = pq.read_table(parquet_path)
+        pf = open_local_parquet(parquet_path)
     except Exception as e:
         result.errors.append(f"Failed to read parquet file: {e}")
         return None
     
-    columns = set(table.column_names)
-    result.info["row_count"] = table.num_rows
-    result.info["column_count"] = table.num_columns
-    result.info["columns"] = table.column_names
+    schema = pf.schema_arrow
+    columns = set(schema.names)
+    result.info["row_count"] = pf.metadata.num_rows
+    result.info["column_count"] = len(schema)
+    result.info["columns"] = schema.names
     
     # Check required columns
     missing_required = []
@@ -533,7 +580,7 @@ def check_schema_columns(
     
     # Write schema to file for artifacts
     schema_lines = []
-    for fld in table.schema:
+    for fld in schema:
         type_str = str(fld.type)
         if len(type_str) > 100:
             type_str = type_str[:97] + "..."
@@ -545,7 +592,7 @@ def check_schema_columns(
     for col_name, expected_type in COLUMN_TYPES.items():
         if col_name not in columns:
             continue
-        actual_type = str(table.schema.field(col_name).type)
+        actual_type = str(schema.field(col_name).type)
         
         # Loose type matching
         if expected_type == "string" and not ("string" in actual_type or "utf8" in actual_type):
@@ -563,15 +610,29 @@ def check_schema_columns(
         for mismatch in type_mismatches:
             result.warnings.append(f"Type mismatch: {mismatch}")
     
-    result.info["column_types"] = {col: str(table.schema.field(col).type) for col in table.column_names}
+    result.info["column_types"] = {col: str(schema.field(col).type) for col in schema.names}
     
-    return table
+    return pf
 
 
-def check_data_quality(result: VerificationResult, table: pa.Table):
-    """Check 5: Data quality stats."""
+def check_data_quality(result: VerificationResult, pf: pq.ParquetFile):
+    """
+    Check 5: Data quality stats.
+    
+    One streamed pass (verify_engine.run_rules) decodes only the columns
+    the rules need; null counts cover every column, the numeric summaries
+    keep just their own column so medians stay exact.
+    """
     manifest = result.info.get("manifest", {})
-    num_rows = table.num_rows
+    num_rows = pf.metadata.num_rows
+    data = run_rules(pf, [
+        DistinctCount("symbol", "distinct_symbols"),
+        # Top 10 symbols by frequency (first 10k rows)
+        ValueCounts("symbol", 10, "top_symbols", head=10000),
+        NullCounts(nan_as_null=False),
+        *(NumericSummary(col, stats, col) for col, stats in SUMMARY_COLUMNS.items()),
+        FirstRow(SAMPLE_ROW_COLUMNS, "sample_row"),
+    ])
     
     # Compare row count to manifest
     manifest_row_count = manifest.get("row_count")
@@ -584,28 +645,13 @@ def check_data_quality(result: VerificationResult, table: pa.Table):
             result.info["row_count_match"] = True
     
     # Distinct symbols
-    if "symbol" in table.column_names:
-        symbol_col = table.column("symbol")
-        try:
-            symbols = symbol_col.unique()
-            result.info["distinct_symbols"] = len(symbols)
-            
-            # Top 10 symbols by frequency
-            symbol_dict = {}
-            for i in range(min(10000, num_rows)):
-                s = symbol_col[i].as_py()
-                if s:
-                    symbol_dict[s] = symbol_dict.get(s, 0) + 1
-            top_symbols = sorted(symbol_dict.items(), key=lambda x: -x[1])[:10]
-            result.info["top_symbols"] = top_symbols
-        except Exception:
-            result.info["distinct_symbols"] = "unknown"
+    if "symbol" in pf.schema_arrow.names:
+        result.info["distinct_symbols"] = data["distinct_symbols"]
+        result.info["top_symbols"] = data["top_symbols"]
     
     # Null ratios per column
     null_ratios = {}
-    for col_name in table.column_names:
-        col = table.column(col_name)
-        null_count = col.null_count
+    for col_name, null_count in data["column_null_counts"].items():
         null_ratio = null_count / num_rows if num_rows > 0 else 0
         null_ratios[col_name] = {
             "null_count": null_count,
@@ -626,93 +672,28 @@ def check_data_quality(result: VerificationResult, table: pa.Table):
     result.info["null_ratios"] = null_ratios
     
     # Numeric stats for key columns
-    numeric_stats = {}
-    
-    # spot_spread_bps
-    if "spot_spread_bps" in table.column_names:
-        col = table.column("spot_spread_bps")
-        vals = [v.as_py() for v in col if v.as_py() is not None]
-        if vals:
-            vals_sorted = sorted(vals)
-            numeric_stats["spot_spread_bps"] = {
-                "min": vals_sorted[0],
-                "max": vals_sorted[-1],
-                "median": statistics.median(vals_sorted),
-                "sample_count": len(vals),
-            }
-            # WARN if negative spread
-            if vals_sorted[0] < 0:
-                result.warnings.append(f"spot_spread_bps has negative values (min={vals_sorted[0]})")
-    
-    # meta_duration_sec
-    if "meta_duration_sec" in table.column_names:
-        col = table.column("meta_duration_sec")
-        vals = [v.as_py() for v in col if v.as_py() is not None]
-        if vals:
-            vals_sorted = sorted(vals)
-            numeric_stats["meta_duration_sec"] = {
-                "min": vals_sorted[0],
-                "max": vals_sorted[-1],
-                "median": statistics.median(vals_sorted),
-                "sample_count": len(vals),
-            }
-            # WARN if <= 0
-            if vals_sorted[0] <= 0:
-                result.warnings.append(f"meta_duration_sec has non-positive values (min={vals_sorted[0]})")
-    
-    # score_final
-    if "score_final" in table.column_names:
-        col = table.column("score_final")
-        vals = [v.as_py() for v in col if v.as_py() is not None]
-        if vals:
-            vals_sorted = sorted(vals)
-            numeric_stats["score_final"] = {
-                "min": vals_sorted[0],
-                "max": vals_sorted[-1],
-                "mean": statistics.mean(vals),
-                "sample_count": len(vals),
-            }
-    
-    # sentiment_mean_score
-    if "sentiment_mean_score" in table.column_names:
-        col = table.column("sentiment_mean_score")
-        vals = [v.as_py() for v in col if v.as_py() is not None]
-        if vals:
-            vals_sorted = sorted(vals)
-            numeric_stats["sentiment_mean_score"] = {
-                "min": vals_sorted[0],
-                "max": vals_sorted[-1],
-                "mean": statistics.mean(vals),
-                "sample_count": len(vals),
-            }
-    
-    # sentiment_posts_total
-    if "sentiment_posts_total" in table.column_names:
-        col = table.column("sentiment_posts_total")
-        vals = [v.as_py() for v in col if v.as_py() is not None]
-        if vals:
-            vals_sorted = sorted(vals)
-            numeric_stats["sentiment_posts_total"] = {
-                "min": vals_sorted[0],
-                "max": vals_sorted[-1],
-                "sum": sum(vals),
-                "sample_count": len(vals),
-            }
-            # FAIL if negative counts
-            if vals_sorted[0] < 0:
-                result.errors.append(f"sentiment_posts_total has negative values (min={vals_sorted[0]})")
+    numeric_stats = {col: data[col] for col in SUMMARY_COLUMNS if data[col]}
+    
+    # WARN if negative spread
+    stats = numeric_stats.get("spot_spread_bps")
+    if stats and stats["min"] < 0:
+        result.warnings.append(f"spot_spread_bps has negative values (min={stats['min']})")
+    
+    # WARN if duration <= 0
+    stats = numeric_stats.get("meta_duration_sec")
+    if stats and stats["min"] <= 0:
+        result.warnings.append(f"meta_duration_sec has non-positive values (min={stats['min']})")
+    
+    # FAIL if negative counts
+    stats = numeric_stats.get("sentiment_posts_total")
+    if stats and stats["min"] < 0:
+        result.errors.append(f"sentiment_posts_total has negative values (min={stats['min']})")
     
     result.info["numeric_stats"] = numeric_stats
     
     # Sample row (safe fields only)
     if num_rows > 0:
-        sample_row = {}
-        safe_fields = ["symbol", "snapshot_ts", "score_final", "sentiment_posts_total", "sentiment_mean_score"]
-        for col_name in safe_fields:
-            if col_name in table.column_names:
-                val = table.column(col_name)[0].as_py()
-                sample_row[col_name] = val
-        result.info["sample_row"] = sample_row
+        result.info["sample_row"] = data["sample_row"]
 
 
 # ==============================================================================
@@ -1033,13 +1014,13 @@ def verify_week(
     
     # Check 4: Schema / column policy
     print("  4. Checking schema (22 flattened fields)...")
-    table = check_schema_columns(result, parquet_path)
-    if table is None:
+    pf = check_schema_columns(result, parquet_path)
+    if pf is None:
         return result
     
     # Check 5: Data quality
     print("  5. Checking data quality...")
-    check_data_quality(result, table)
+    check_data_quality(result, pf)
     
     print(f"  -> Status: {result.status_symbol}")
     if result.errors:
@@ -1050,6 +1031,94 @@ def verify_week(
     return result
 
 
+def failed_result(end_day: str, error: str) -> VerificationResult:
+    """Result for a week whose verification could not run."""
+    result = VerificationResult(end_day=end_day)
+    result.errors.append(error)
+    return result
+
+
+def verify_week_from_manifest(config: R2Config, end_day: str) -> Optional[VerificationResult]:
+    """
+    Confirm a week the builder already verified (sha256 only, nothing decoded).
+    
+    Returns:
+        Result, or None if the manifest has no passing in-build verification
+        block (caller runs the full checks)
+    """
+    prefix = f"tier1/weekly/{end_day}/"
+    outcome = confirm_from_manifest(
+        get_s3_client(config), config.bucket,
+        f"{prefix}dataset_entries_7d.parquet", f"{prefix}manifest.json", end_day,
+    )
+    if outcome is None:
+        return None
+    verification, sha_ok = outcome
+    
+    result = VerificationResult(end_day=end_day)
+    result.info.update({
+        "from_manifest": True,
+        "verification": verification,
+        "sha256_match": sha_ok,
+        "row_count": verification.get("row_count", 0),
+        "distinct_symbols": verification.get("distinct_symbols", "N/A"),
+    })
+    result.warnings.extend(verification.get("warnings", []))
+    if not sha_ok:
+        result.errors.append("SHA256 mismatch with manifest")
+    print(f"\n[MANIFEST] {end_day}: {result.status_symbol} (in-build verification "
+          f"{verification['status']} {verification.get('verified_ts_utc', '?')}, sha256 "
+          f"{'matches' if sha_ok else 'MISMATCH'})")
+    return result
+
+
+def verify_week_from_r2(
+    config: R2Config,
+    end_day: str,
+    cache_dir: Path,
+    r2_size: Optional[int] = None,
+    verify_cache: Optional[VerificationCache] = None,
+    from_manifest: bool = False,
+) -> VerificationResult:
+    """
+    Download one week from R2, verify it and write its artifacts (one unit of work for --jobs).
+    
+    With verify_cache, a week whose manifest sha256 and RULESET_VERSION
+    match a cached result is not downloaded or re-checked. With
+    from_manifest, a week carrying a passing in-build verification block is
+    only sha256-confirmed.
+    """
+    if from_manifest:
+        result = verify_week_from_manifest(config, end_day)
+        if result is not None:
+            return result
+    
+    sha = None
+    if verify_cache is not None:
+        sha = manifest_sha256(fetch_manifest(config, end_day))
+        cached = verify_cache.get("tier1_weekly", end_day, sha, RULESET_VERSION)
+        if cached is not None:
+            result = VerificationResult(**cached)
+            print(f"\n[CACHE] {end_day}: {result.status_symbol} (sha256 {sha[:12]}... unchanged)")
+            return result
+    
+    if r2_size is None:
+        r2_size = get_r2_object_size(config, end_day)
+    parquet_path, manifest_path = download_from_r2(config, end_day, cache_dir)
+    
+    if parquet_path is None:
+        return failed_result(end_day, "Failed to download from R2")
+    
+    result = verify_week(end_day, parquet_path, manifest_path, r2_size)
+    
+    # Write artifacts
+    write_artifacts(result, cache_dir)
+    
+    if verify_cache is not None:
+        verify_cache.put("tier1_weekly", end_day, sha, RULESET_VERSION, result)
+    return result
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Verify Tier 1 weekly parquet exports for correctness"
@@ -1069,6 +1138,28 @@ def main():
         action="store_true",
         help="Download from R2 and verify (default if no --local specified)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Verify this many weeks concurrently in separate processes (default: 1)",
+    )
+    parser.add_argument(
+        "--max-inflight-mb",
+        type=int,
+        default=DEFAULT_MAX_INFLIGHT_MB,
+        help=f"With --jobs: cap on parquet MB being downloaded/verified at once (default: {DEFAULT_MAX_INFLIGHT_MB})",
+    )
+    parser.add_argument(
+        "--no-verify-cache",
+        action="store_true",
+        help="Re-verify every week instead of reusing cached results for unchanged parquets (cache is still refreshed)",
+    )
+    parser.add_argument(
+        "--from-manifest",
+        action="store_true",
+        help="Trust a passing in-build verification block in the manifest and only confirm sha256 (R2 mode)",
+    )
     parser.add_argument(
         "--output-dir",
         type=str,
@@ -1126,21 +1217,29 @@ def main():
             weeks_to_verify = available_weeks
             print(f"[INFO] Found {len(available_weeks)} weeks in R2, verifying ALL")
         
-        for end_day in weeks_to_verify:
-            r2_size = get_r2_object_size(config, end_day)
-            parquet_path, manifest_path = download_from_r2(config, end_day, cache_dir)
-            
-            if parquet_path is None:
-                result = VerificationResult(end_day=end_day)
-                result.errors.append(f"Failed to download from R2")
-                results.append(result)
-                continue
-            
-            result = verify_week(end_day, parquet_path, manifest_path, r2_size)
-            results.append(result)
-            
-            # Write artifacts
-            write_artifacts(result, cache_dir)
+        # Unchanged weeks are answered from cached results
+        verify_cache = VerificationCache(read=not args.no_verify_cache)
+        
+        if args.jobs > 1:
+            # Sizes up front: they drive the download budget
+            sizes = [get_r2_object_size(config, end_day) for end_day in weeks_to_verify]
+            print(f"[INFO] Verifying with {args.jobs} processes (max {args.max_inflight_mb} MB in flight)")
+            results = run_partitions(
+                verify_week_from_r2,
+                [
+                    (config, end_day, cache_dir, size, verify_cache, args.from_manifest)
+                    for end_day, size in zip(weeks_to_verify, sizes)
+                ],
+                jobs=args.jobs,
+                sizes=sizes,
+                max_inflight_bytes=args.max_inflight_mb * 1024 * 1024,
+                on_error=lambda task, error: failed_result(task[1], f"Verification crashed: {error}"),
+            )
+        else:
+            for end_day in weeks_to_verify:
+                results.append(verify_week_from_r2(
+                    config, end_day, cache_dir, verify_cache=verify_cache, from_manifest=args.from_manifest
+                ))
     
     # Generate report
     print(f"\n[Generating report: {report_path}]")
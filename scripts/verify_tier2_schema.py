@@ -13,9 +13,12 @@ Run: python scripts/verify_tier2_schema.py --week 2025-01-05
 
 import argparse
 import json
+import sys
 from pathlib import Path
 
-import pyarrow.parquet as pq
+sys.path.insert(0, str(Path(__file__).parent))
+from local_parquet import open_local_parquet
+from verify_engine import FirstRow, TierSpec, run_rules, verify_schema
 
 
 # Expected top-level columns for Tier 2 weekly parquet (8 columns)
@@ -30,6 +33,13 @@ EXPECTED_COLUMNS = [
     'twitter_sentiment_windows',
 ]
 
+SPEC = TierSpec(
+    tier="tier2",
+    label="Tier 2 weekly",
+    expected_columns=EXPECTED_COLUMNS,
+    critical_columns=["symbol", "snapshot_ts"],
+)
+
 # Fields that must be present in last_cycle
 LAST_CYCLE_REQUIRED_FIELDS = [
     'ai_sentiment',
@@ -79,26 +89,22 @@ def verify_week(week_dir: Path, verbose: bool = False) -> tuple[bool, list[str],
         warnings.append(f"Missing manifest.json")
     
     try:
-        pf = pq.ParquetFile(parquet_path)
-        schema = pf.schema_arrow
-        columns = schema.names
-        
-        # Check expected columns
-        missing_cols = set(EXPECTED_COLUMNS) - set(columns)
-        extra_cols = set(columns) - set(EXPECTED_COLUMNS)
+        pf = open_local_parquet(parquet_path)
+        columns = pf.schema_arrow.names
         
-        if missing_cols:
-            errors.append(f"Missing columns: {missing_cols}")
-        if extra_cols:
-            warnings.append(f"Extra columns (ok): {extra_cols}")
+        # Check expected columns (footer only)
+        schema_result = verify_schema(SPEC, pf.schema_arrow, pf.metadata.num_rows)
+        if schema_result["missing_columns"]:
+            errors.append(f"Missing columns: {schema_result['missing_columns']}")
+        if schema_result["extra_columns"]:
+            warnings.append(f"Extra columns (ok): {schema_result['extra_columns']}")
         
         # Read ONE row to verify structure
         if pf.metadata.num_rows == 0:
             errors.append("Parquet is empty (0 rows)")
             return False, errors, warnings
         
-        table = pf.read_row_group(0)
-        row = {col: table.column(col)[0].as_py() for col in columns if col in table.schema.names}
+        row = run_rules(pf, [FirstRow(columns, "row")], batch_rows=1, max_rows=1)["row"]
         
         # Verify symbol exists
         if not row.get('symbol'):
@@ -24,15 +24,20 @@ Usage:
     # Verify from R2 explicitly
     python3 scripts/verify_tier2_weekly.py --r2 --end-day 2025-12-28
 
+    # Verify all weeks, 4 at a time (report stays in week order)
+    python3 scripts/verify_tier2_weekly.py --jobs 4
+
+    # Only confirm the sha256 of weeks the builder verified in-build
+    python3 scripts/verify_tier2_weekly.py --from-manifest
+
 Outputs:
     Reports are written to output/verify_tier2/report_YYYYMMDD_HHMMSS.md
     Per-week artifacts are written to output/verify_tier2/{end-day}/
+    Verification results are cached in output/cache/verification/tier2_weekly/
 """
 
 import argparse
-import hashlib
 import json
-import statistics
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
@@ -57,6 +62,12 @@ SCRIPT_DIR = Path(__file__).parent
 sys.path.insert(0, str(SCRIPT_DIR))
 
 from r2_config import get_r2_config, R2Config
+from r2_metrics import instrument_client
+from parallel_verify import DEFAULT_MAX_INFLIGHT_MB, run_partitions
+from verification_cache import VerificationCache, manifest_sha256
+from hashing_io import download_hashed, sha256_file
+from local_parquet import open_local_parquet
+from verify_engine import BoolCounts, DistinctCount, NumericSummary, TierSpec, confirm_from_manifest, run_rules
 
 
 # ==============================================================================
@@ -65,6 +76,10 @@ from r2_config import get_r2_config, R2Config
 
 VERIFY_CACHE_DIR = Path("./output/verify_tier2")
 
+# Version of the checks in this script; bump when they change so results
+# in the verification cache are recomputed
+RULESET_VERSION = 1
+
 # Tier 2 FLAT schema column policy
 # 7 flat sentiment fields + 1 nested platform_engagement struct
 SENTIMENT_FLAT_FIELDS = [
@@ -115,6 +130,15 @@ SPOT_RAW_EXPECTED_FIELDS = [
     "spread_bps",
 ]
 
+# Rule set build_tier2_weekly.py runs on its table before upload
+SPEC = TierSpec(
+    tier="tier2",
+    label="Tier 2 weekly",
+    expected_columns=TIER2_REQUIRED_COLUMNS,
+    critical_columns=["symbol", "snapshot_ts"],
+    excluded_columns=TIER2_EXCLUDED_COLUMNS,
+)
+
 
 # ==============================================================================
 # Data Classes
@@ -155,12 +179,12 @@ class VerificationResult:
 
 def get_s3_client(config: R2Config):
     """Create boto3 S3 client for R2."""
-    return boto3.client(
+    return instrument_client(boto3.client(
         "s3",
         endpoint_url=config.endpoint,
         aws_access_key_id=config.access_key_id,
         aws_secret_access_key=config.secret_access_key,
-    )
+    ))
 
 
 def list_tier2_weeks(config: R2Config) -> list[str]:
@@ -219,8 +243,9 @@ def download_from_r2(
         print(f"[ERROR] Objects not found in R2 for week {end_day}: {e}", file=sys.stderr)
         return None, None
     
+    # Hashed as it streams in; the integrity check reuses the digest
     print(f"  Downloading {parquet_key}...")
-    s3.download_file(config.bucket, parquet_key, str(parquet_path))
+    download_hashed(s3, config.bucket, parquet_key, parquet_path)
     
     print(f"  Downloading {manifest_key}...")
     s3.download_file(config.bucket, manifest_key, str(manifest_path))
@@ -228,19 +253,32 @@ def download_from_r2(
     return parquet_path, manifest_path
 
 
+def fetch_manifest(config: R2Config, end_day: str) -> Optional[dict]:
+    """Fetch and parse the manifest for a week, or None if missing/invalid."""
+    s3 = get_s3_client(config)
+    try:
+        response = s3.get_object(Bucket=config.bucket, Key=f"tier2/weekly/{end_day}/manifest.json")
+        return json.loads(response["Body"].read())
+    except Exception:
+        return None
+
+
+def get_r2_object_size(config: R2Config, end_day: str) -> Optional[int]:
+    """Get parquet file size from R2 without downloading."""
+    s3 = get_s3_client(config)
+    key = f"tier2/weekly/{end_day}/dataset_entries_7d.parquet"
+    
+    try:
+        response = s3.head_object(Bucket=config.bucket, Key=key)
+        return response["ContentLength"]
+    except Exception:
+        return None
+
+
 # ==============================================================================
 # Verification Checks
 # ==============================================================================
 
-def compute_sha256(filepath: Path) -> str:
-    """Compute SHA256 hash of a file."""
-    sha256 = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
-
-
 def check_presence_and_integrity(
     result: VerificationResult,
     parquet_path: Optional[Path],
@@ -282,7 +320,7 @@ def check_presence_and_integrity(
         expected_sha = manifest["files"]["main"].get("sha256")
     
     if expected_sha:
-        actual_sha = compute_sha256(parquet_path)
+        actual_sha = sha256_file(parquet_path, trust_memo=False)
         result.info["expected_sha256"] = expected_sha
         result.info["actual_sha256"] = actual_sha
         result.info["sha256_match"] = expected_sha == actual_sha
@@ -345,18 +383,19 @@ def check_window_semantics(
 def check_schema_columns(
     result: VerificationResult,
     parquet_path: Path,
-) -> Optional[pa.Table]:
-    """Check C: Schema / column policy for FLAT schema."""
+) -> Optional[pq.ParquetFile]:
+    """Check C: Schema / column policy for FLAT schema, from the footer only."""
     try:
-        table = pq.read_table(parquet_path)
+        pf = open_local_parquet(parquet_path)
     except Exception as e:
         result.errors.append(f"Failed to read parquet file: {e}")
         return None
     
-    columns = set(table.column_names)
-    result.info["row_count"] = table.num_rows
-    result.info["column_count"] = table.num_columns
-    result.info["columns"] = table.column_names
+    schema = pf.schema_arrow
+    columns = set(schema.names)
+    result.info["row_count"] = pf.metadata.num_rows
+    result.info["column_count"] = len(schema)
+    result.info["columns"] = schema.names
     
     # Check required columns
     missing_required = []
@@ -382,7 +421,7 @@ def check_schema_columns(
     
     # Write schema to file for artifacts
     schema_lines = []
-    for fld in table.schema:
+    for fld in schema:
         type_str = str(fld.type)
         if len(type_str) > 100:
             type_str = type_str[:97] + "..."
@@ -390,20 +429,18 @@ def check_schema_columns(
     result.info["schema_lines"] = schema_lines
     
     # Check nested sanity for struct columns
-    check_nested_sanity(result, table)
+    check_nested_sanity(result, schema)
     
     # Check flat sentiment fields have correct types
-    check_flat_sentiment_fields(result, table)
+    check_flat_sentiment_fields(result, schema)
     
-    return table
+    return pf
 
 
-def check_nested_sanity(result: VerificationResult, table: pa.Table):
-    """Check nested struct fields (meta, spot_raw, etc.)."""
-    schema = table.schema
-    
+def check_nested_sanity(result: VerificationResult, schema: pa.Schema):
+    """Check nested struct fields (meta, spot_raw, etc.)."""    
     # Check meta sub-fields
-    if "meta" in table.column_names:
+    if "meta" in schema.names:
         meta_field = schema.field("meta")
         if pa.types.is_struct(meta_field.type):
             meta_field_names = [f.name for f in meta_field.type]
@@ -416,7 +453,7 @@ def check_nested_sanity(result: VerificationResult, table: pa.Table):
             result.warnings.append(f"meta is not a struct type: {meta_field.type}")
     
     # Check spot_raw sub-fields
-    if "spot_raw" in table.column_names:
+    if "spot_raw" in schema.names:
         spot_field = schema.field("spot_raw")
         if pa.types.is_struct(spot_field.type):
             spot_field_names = [f.name for f in spot_field.type]
@@ -428,13 +465,13 @@ def check_nested_sanity(result: VerificationResult, table: pa.Table):
     
     # Check derived and scores are structs
     for col_name in ["derived", "scores"]:
-        if col_name in table.column_names:
+        if col_name in schema.names:
             col_field = schema.field(col_name)
             if not pa.types.is_struct(col_field.type):
                 result.warnings.append(f"{col_name} is not a struct type: {col_field.type}")
 
 
-def check_flat_sentiment_fields(result: VerificationResult, table: pa.Table):
+def check_flat_sentiment_fields(result: VerificationResult, schema: pa.Schema):
     """Check the 7 flat sentiment fields have correct types."""
     expected_types = {
         "sentiment_is_silent": pa.bool_(),
@@ -446,11 +483,10 @@ def check_flat_sentiment_fields(result: VerificationResult, table: pa.Table):
         "sentiment_confidence": pa.float64(),
     }
     
-    schema = table.schema
     type_issues = []
     
     for field_name, expected_type in expected_types.items():
-        if field_name in table.column_names:
+        if field_name in schema.names:
             actual_type = schema.field(field_name).type
             # Allow null type as well
             if actual_type != expected_type and not pa.types.is_null(actual_type):
@@ -462,10 +498,16 @@ def check_flat_sentiment_fields(result: VerificationResult, table: pa.Table):
         result.info["sentiment_field_types_ok"] = True
 
 
-def check_data_quality(result: VerificationResult, table: pa.Table):
-    """Check D: Data quality summaries."""
+def check_data_quality(result: VerificationResult, pf: pq.ParquetFile):
+    """Check D: Data quality summaries (one streamed pass over the columns summarized)."""
     manifest = result.info.get("manifest", {})
-    num_rows = table.num_rows
+    num_rows = pf.metadata.num_rows
+    names = pf.schema_arrow.names
+    data = run_rules(pf, [
+        DistinctCount("symbol", "distinct_symbols"),
+        BoolCounts("sentiment_is_silent", "silent_counts"),
+        NumericSummary("sentiment_score", ("min", "max", "mean", "median"), "score_stats"),
+    ])
     
     # Compare row count to manifest
     manifest_row_count = manifest.get("row_count")
@@ -481,31 +523,18 @@ def check_data_quality(result: VerificationResult, table: pa.Table):
             result.info["row_count_match"] = True
     
     # Distinct symbols
-    if "symbol" in table.column_names:
-        symbol_col = table.column("symbol")
-        try:
-            symbols = symbol_col.unique()
-            result.info["distinct_symbols"] = len(symbols)
-        except Exception:
-            result.info["distinct_symbols"] = "unknown"
+    if "symbol" in names:
+        result.info["distinct_symbols"] = data["distinct_symbols"]
     
     # Sentiment coverage analysis
     # Check how many entries have sentiment data (sentiment_is_silent not null = has coverage)
-    if "sentiment_is_silent" in table.column_names:
-        silent_col = table.column("sentiment_is_silent")
+    if data["silent_counts"] is not None:
         try:
             # Count non-null (has coverage) vs null (no coverage)
-            has_coverage = 0
-            no_coverage = 0
-            silent_count = 0
-            for v in silent_col:
-                val = v.as_py()
-                if val is None:
-                    no_coverage += 1
-                else:
-                    has_coverage += 1
-                    if val is True:
-                        silent_count += 1
+            counts = data["silent_counts"]
+            has_coverage = counts["non_null"]
+            no_coverage = counts["null"]
+            silent_count = counts["true"]
             
             coverage_rate = has_coverage / num_rows if num_rows > 0 else 0
             result.info["sentiment_coverage"] = {
@@ -522,23 +551,22 @@ def check_data_quality(result: VerificationResult, table: pa.Table):
             pass
     
     # Check platform_engagement field exists
-    if PLATFORM_ENGAGEMENT_FIELD in table.column_names:
+    if PLATFORM_ENGAGEMENT_FIELD in names:
         result.info["platform_engagement_present"] = True
     else:
         result.warnings.append(f"Missing {PLATFORM_ENGAGEMENT_FIELD} field")
     
     # Sentiment score stats (for entries with coverage)
-    if "sentiment_score" in table.column_names:
-        score_col = table.column("sentiment_score")
+    if "sentiment_score" in names:
         try:
-            scores = [v.as_py() for v in score_col if v.as_py() is not None]
-            if scores:
+            stats = data["score_stats"]
+            if stats:
                 result.info["sentiment_score_stats"] = {
-                    "min": min(scores),
-                    "max": max(scores),
-                    "mean": round(statistics.mean(scores), 4),
-                    "median": round(statistics.median(scores), 4),
-                    "count": len(scores),
+                    "min": stats["min"],
+                    "max": stats["max"],
+                    "mean": round(stats["mean"], 4),
+                    "median": round(stats["median"], 4),
+                    "count": stats["sample_count"],
                 }
         except Exception:
             pass
@@ -548,16 +576,80 @@ def check_data_quality(result: VerificationResult, table: pa.Table):
 # Verification Runner
 # ==============================================================================
 
+def failed_result(end_day: str, error: str) -> VerificationResult:
+    """Result for a week whose verification could not run."""
+    result = VerificationResult(end_day=end_day)
+    result.errors.append(error)
+    return result
+
+
+def verify_week_from_manifest(config: R2Config, end_day: str) -> Optional[VerificationResult]:
+    """
+    Confirm a week the builder already verified (sha256 only, nothing decoded).
+    
+    Returns:
+        Result, or None if the manifest has no passing in-build verification
+        block (caller runs the full checks)
+    """
+    prefix = f"tier2/weekly/{end_day}/"
+    outcome = confirm_from_manifest(
+        get_s3_client(config), config.bucket,
+        f"{prefix}dataset_entries_7d.parquet", f"{prefix}manifest.json", end_day,
+    )
+    if outcome is None:
+        return None
+    verification, sha_ok = outcome
+    
+    result = VerificationResult(end_day=end_day)
+    result.info.update({
+        "from_manifest": True,
+        "verification": verification,
+        "sha256_match": sha_ok,
+        "row_count": verification.get("row_count", 0),
+        "distinct_symbols": verification.get("distinct_symbols", "N/A"),
+    })
+    result.warnings.extend(verification.get("warnings", []))
+    if not sha_ok:
+        result.errors.append("SHA256 mismatch with manifest")
+    print(f"\n[MANIFEST] {end_day}: {result.status_symbol} (in-build verification "
+          f"{verification['status']} {verification.get('verified_ts_utc', '?')}, sha256 "
+          f"{'matches' if sha_ok else 'MISMATCH'})")
+    return result
+
+
 def verify_week(
     end_day: str,
     parquet_path: Optional[Path] = None,
     manifest_path: Optional[Path] = None,
     from_r2: bool = False,
     config: Optional[R2Config] = None,
+    verify_cache: Optional[VerificationCache] = None,
+    from_manifest: bool = False,
 ) -> VerificationResult:
-    """Run all verification checks on a single week."""
+    """
+    Run all verification checks on a single week.
+    
+    With from_r2 and verify_cache, a week whose manifest sha256 and
+    RULESET_VERSION match a cached result is not downloaded or re-checked.
+    With from_r2 and from_manifest, a week carrying a passing in-build
+    verification block is only sha256-confirmed.
+    """
+    if from_r2 and config and from_manifest:
+        result = verify_week_from_manifest(config, end_day)
+        if result is not None:
+            return result
+    
     result = VerificationResult(end_day=end_day)
     
+    sha = None
+    if from_r2 and config and verify_cache is not None:
+        sha = manifest_sha256(fetch_manifest(config, end_day))
+        cached = verify_cache.get("tier2_weekly", end_day, sha, RULESET_VERSION)
+        if cached is not None:
+            result = VerificationResult(**cached)
+            print(f"\n[CACHE] {end_day}: {result.status_symbol} {result.status} (sha256 {sha[:12]}... unchanged)")
+            return result
+    
     # Download from R2 if needed
     if from_r2 and config:
         print(f"\n[WEEK] {end_day} (from R2)")
@@ -582,13 +674,16 @@ def verify_week(
     
     # Check C: Schema columns
     print("  [C] Checking schema columns (flat schema)...")
-    table = check_schema_columns(result, parquet_path)
-    if table is None:
+    pf = check_schema_columns(result, parquet_path)
+    if pf is None:
         return result
     
     # Check D: Data quality
     print("  [D] Checking data quality...")
-    check_data_quality(result, table)
+    check_data_quality(result, pf)
+    
+    if verify_cache is not None:
+        verify_cache.put("tier2_weekly", end_day, sha, RULESET_VERSION, result)
     
     # Summary
     print(f"  {result.status_symbol} {result.status}")
@@ -698,6 +793,14 @@ def main():
                         help="Force download from R2 (default if --local not set)")
     parser.add_argument("--all", action="store_true",
                         help="Verify all weeks in R2")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Verify this many weeks concurrently in separate processes (default: 1)")
+    parser.add_argument("--no-verify-cache", action="store_true",
+                        help="Re-verify every week instead of reusing cached results for unchanged parquets (cache is still refreshed)")
+    parser.add_argument("--from-manifest", action="store_true",
+                        help="Trust a passing in-build verification block in the manifest and only confirm sha256 (R2 mode)")
+    parser.add_argument("--max-inflight-mb", type=int, default=DEFAULT_MAX_INFLIGHT_MB,
+                        help=f"With --jobs: cap on parquet MB being downloaded/verified at once (default: {DEFAULT_MAX_INFLIGHT_MB})")
     
     args = parser.parse_args()
     
@@ -725,6 +828,9 @@ def main():
         # R2 verification
         config = get_r2_config()
         
+        # Unchanged weeks are answered from cached results
+        verify_cache = VerificationCache(read=not args.no_verify_cache)
+        
         if args.all or args.end_day is None:
             # Verify all weeks
             weeks = list_tier2_weeks(config)
@@ -737,11 +843,26 @@ def main():
             
             print(f"\n[INFO] Found {len(weeks)} weeks to verify: {weeks}")
             
-            for end_day in weeks:
-                result = verify_week(end_day, from_r2=True, config=config)
-                results.append(result)
+            if args.jobs > 1:
+                # Sizes up front: they drive the download budget
+                sizes = [get_r2_object_size(config, end_day) for end_day in weeks]
+                print(f"[INFO] Verifying with {args.jobs} processes (max {args.max_inflight_mb} MB in flight)")
+                results = run_partitions(
+                    verify_week,
+                    [(end_day, None, None, True, config, verify_cache, args.from_manifest) for end_day in weeks],
+                    jobs=args.jobs,
+                    sizes=sizes,
+                    max_inflight_bytes=args.max_inflight_mb * 1024 * 1024,
+                    on_error=lambda task, error: failed_result(task[0], f"Verification crashed: {error}"),
+                )
+            else:
+                for end_day in weeks:
+                    result = verify_week(end_day, from_r2=True, config=config, verify_cache=verify_cache,
+                                         from_manifest=args.from_manifest)
+                    results.append(result)
         else:
-            result = verify_week(args.end_day, from_r2=True, config=config)
+            result = verify_week(args.end_day, from_r2=True, config=config, verify_cache=verify_cache,
+                                 from_manifest=args.from_manifest)
             results.append(result)
     
     # Generate report
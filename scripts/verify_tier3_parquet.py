@@ -15,16 +15,31 @@ Usage:
     # Verify from local files
     python3 scripts/verify_tier3_parquet.py --local output/tier3_daily/2026-01-13
 
+    # Verify in R2 with ranged reads: footer + the checked columns only, no
+    # full download (SHA256 is not verified in this mode)
+    python3 scripts/verify_tier3_parquet.py --range-reads
+
+    # Full-history audit from parquet footers (schema, row counts, null
+    # ratios, value ranges); fetches little more than the footers
+    python3 scripts/verify_tier3_parquet.py --range-reads --metadata-only
+
+    # Verify 8 dates at a time (report stays in date order)
+    python3 scripts/verify_tier3_parquet.py --jobs 8
+
+    # Re-verify everything, ignoring cached results for unchanged parquets
+    python3 scripts/verify_tier3_parquet.py --no-verify-cache
+
 Outputs:
     Reports are written to output/verify_tier3/report_YYYYMMDD_HHMMSS.md
     Per-day artifacts are written to output/verify_tier3/{date}/
+    Verification results are cached in output/cache/verification/tier3_parquet/
 """
 
 import argparse
-import hashlib
 import json
 import random
 import sys
+import zlib
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -48,6 +63,15 @@ SCRIPT_DIR = Path(__file__).parent
 sys.path.insert(0, str(SCRIPT_DIR))
 
 from r2_config import get_r2_config, R2Config
+from r2_metrics import instrument_client
+from parallel_verify import DEFAULT_MAX_INFLIGHT_MB, run_partitions
+from parquet_footer import column_range, footer_column_stats
+from local_parquet import open_local_parquet
+from r2_range_file import R2RangeFile, take_rows
+from tier_cache import get_cache
+from verification_cache import VerificationCache, manifest_sha256
+from hashing_io import sha256_file
+from verify_engine import NullCounts, null_counts, run_rules
 
 
 # ==============================================================================
@@ -72,6 +96,13 @@ OPTIONAL_COLUMNS = ["scores", "futures_raw", "diag"]
 # Columns that are intentionally dropped in Tier3 export (always empty in v7)
 DROPPED_COLUMNS = ["norm", "labels"]
 
+# Columns read by the row/futures/null checks; --range-reads fetches only these
+RANGE_READ_COLUMNS = ["symbol", "meta", "spot_raw", "spot_prices", "derived", "futures_raw"]
+
+# Version of the checks in this script; bump when they change so results
+# in the verification cache are recomputed
+RULESET_VERSION = 1
+
 # Seed for reproducible random sampling
 RANDOM_SEED = 20260115
 
@@ -111,22 +142,26 @@ class VerificationResult:
 
 def get_s3_client(config: R2Config):
     """Create boto3 S3 client for R2."""
-    return boto3.client(
+    return instrument_client(boto3.client(
         "s3",
         endpoint_url=config.endpoint,
         aws_access_key_id=config.access_key_id,
         aws_secret_access_key=config.secret_access_key,
-    )
+    ))
 
 
 def download_from_r2(
     config: R2Config,
     date_str: str,
     cache_dir: Path,
+    include_parquet: bool = True,
 ) -> tuple[Optional[Path], Optional[Path]]:
     """
     Download parquet and manifest from R2 for a given date.
     
+    With include_parquet=False only the manifest is downloaded and the
+    returned parquet path is the (absent) local path.
+    
     Returns:
         Tuple of (parquet_path, manifest_path), or (None, None) if not found.
     """
@@ -152,8 +187,9 @@ def download_from_r2(
         return None, None
     
     # Download parquet
-    print(f"  Downloading {parquet_key}...")
-    s3.download_file(config.bucket, parquet_key, str(parquet_path))
+    if include_parquet:
+        print(f"  Downloading {parquet_key}...")
+        get_cache().materialize(s3, config.bucket, parquet_key, parquet_path)
     
     # Download manifest
     print(f"  Downloading {manifest_key}...")
@@ -162,6 +198,21 @@ def download_from_r2(
     return parquet_path, manifest_path
 
 
+def fetch_manifest(config: R2Config, date_str: str) -> Optional[dict]:
+    """Fetch and parse the manifest for a date, or None if missing/invalid."""
+    s3 = get_s3_client(config)
+    try:
+        response = s3.get_object(Bucket=config.bucket, Key=f"tier3/daily/{date_str}/manifest.json")
+        return json.loads(response["Body"].read())
+    except Exception:
+        return None
+
+
+def open_r2_parquet_file(config: R2Config, date_str: str) -> R2RangeFile:
+    """Open the R2 parquet for a date with ranged reads (fetches the footer only)."""
+    return R2RangeFile(get_s3_client(config), config.bucket, f"tier3/daily/{date_str}/data.parquet")
+
+
 def get_r2_object_sizes(config: R2Config, date_str: str) -> dict[str, int]:
     """Get file sizes from R2 without downloading."""
     s3 = get_s3_client(config)
@@ -210,27 +261,19 @@ def list_tier3_days(config: R2Config) -> list[str]:
 # Verification Checks
 # ==============================================================================
 
-def compute_sha256(filepath: Path) -> str:
-    """Compute SHA256 hash of a file."""
-    sha256 = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
-
-
 def check_presence_and_size(
     result: VerificationResult,
     parquet_path: Optional[Path],
     manifest_path: Optional[Path],
     r2_sizes: Optional[dict[str, int]] = None,
+    remote_parquet: Optional[R2RangeFile] = None,
 ):
     """Check 1: Presence + size sanity."""
-    if parquet_path is None or manifest_path is None:
+    if (remote_parquet is None and parquet_path is None) or manifest_path is None:
         result.errors.append("Missing parquet or manifest file")
         return
     
-    if not parquet_path.exists():
+    if remote_parquet is None and not parquet_path.exists():
         result.errors.append(f"Parquet file not found: {parquet_path}")
         return
     
@@ -238,7 +281,7 @@ def check_presence_and_size(
         result.errors.append(f"Manifest file not found: {manifest_path}")
         return
     
-    parquet_size = parquet_path.stat().st_size
+    parquet_size = remote_parquet.size() if remote_parquet else parquet_path.stat().st_size
     manifest_size = manifest_path.stat().st_size
     
     result.info["parquet_size_bytes"] = parquet_size
@@ -259,10 +302,10 @@ def check_presence_and_size(
 
 def check_manifest_correctness(
     result: VerificationResult,
-    parquet_path: Path,
+    parquet_path: Optional[Path],
     manifest_path: Path,
 ):
-    """Check 2: Manifest correctness and SHA256 verification."""
+    """Check 2: Manifest correctness and SHA256 verification (skipped without a local parquet)."""
     try:
         with open(manifest_path, "r") as f:
             manifest = json.load(f)
@@ -302,10 +345,13 @@ def check_manifest_correctness(
     if "max_added_ts" not in manifest and "max_timestamp" not in manifest:
         result.warnings.append("Manifest missing max_added_ts/max_timestamp")
     
-    # Verify SHA256
-    if sha_field:
+    # Verify SHA256 (needs every byte, so not possible with ranged reads)
+    if sha_field and parquet_path is None:
+        result.info["expected_sha256"] = manifest[sha_field]
+        result.info["sha256_verified"] = False
+    elif sha_field:
         expected_sha = manifest[sha_field]
-        actual_sha = compute_sha256(parquet_path)
+        actual_sha = sha256_file(parquet_path, trust_memo=False)
         
         result.info["expected_sha256"] = expected_sha
         result.info["actual_sha256"] = actual_sha
@@ -351,52 +397,76 @@ def check_manifest_correctness(
         result.info["partition_basis"] = partition_basis
 
 
+def summarize_schema(schema: pa.Schema) -> list[str]:
+    """Top-level schema summary lines (nested types truncated)."""
+    schema_summary = []
+    for field in schema:
+        type_str = str(field.type)
+        # Truncate long nested type descriptions
+        if len(type_str) > 80:
+            type_str = type_str[:77] + "..."
+        schema_summary.append(f"  {field.name}: {type_str}")
+    return schema_summary
+
+
 def check_parquet_readability(
     result: VerificationResult,
-    parquet_path: Path,
-) -> Optional[pa.Table]:
-    """Check 3: Parquet readability + schema overview."""
+    parquet_file,
+    columns: Optional[list[str]] = None,
+) -> Optional[pq.ParquetFile]:
+    """
+    Check 3: Parquet readability + schema overview.
+    
+    The file is opened (memory-mapped when local) and decoded once in
+    bounded batches; checks 5-7 then read only the columns and row groups
+    they need from the returned ParquetFile.
+    
+    Args:
+        parquet_file: Local path or file object (e.g. R2RangeFile)
+        columns: Read only these columns (schema and row count still come
+            from the footer and cover the whole file)
+    """
     try:
-        table = pq.read_table(parquet_path)
+        pf = open_local_parquet(parquet_file)
+        schema = pf.schema_arrow
+        if columns is not None:
+            columns = [c for c in columns if c in schema.names]
+        # Decode every selected column once so corrupt pages surface here;
+        # the per-column null counts are kept for check 7
+        result.info["null_counts"] = null_counts(pf, columns)
     except Exception as e:
         result.errors.append(f"Failed to read parquet file: {e}")
         return None
     
-    result.info["row_count"] = table.num_rows
-    result.info["column_count"] = table.num_columns
-    result.info["columns"] = table.column_names
+    num_rows = pf.metadata.num_rows
+    result.info["row_count"] = num_rows
+    result.info["column_count"] = len(schema)
+    result.info["columns"] = schema.names
+    if columns is not None:
+        result.info["columns_read"] = columns
     
-    # Summarize schema (top-level only to avoid huge output)
-    schema_summary = []
-    for field in table.schema:
-        type_str = str(field.type)
-        # Truncate long nested type descriptions
-        if len(type_str) > 80:
-            type_str = type_str[:77] + "..."
-        schema_summary.append(f"  {field.name}: {type_str}")
-    
-    result.info["schema_summary"] = schema_summary
+    result.info["schema_summary"] = summarize_schema(schema)
     
     # Verify row count matches manifest
     manifest = result.info.get("manifest", {})
     manifest_row_count = manifest.get("row_count")
     if manifest_row_count is not None:
-        if table.num_rows != manifest_row_count:
+        if num_rows != manifest_row_count:
             result.errors.append(
-                f"Row count mismatch: parquet has {table.num_rows}, manifest says {manifest_row_count}"
+                f"Row count mismatch: parquet has {num_rows}, manifest says {manifest_row_count}"
             )
         else:
             result.info["row_count_match"] = True
     
-    return table
+    return pf
 
 
 def check_required_columns(
     result: VerificationResult,
-    table: pa.Table,
+    column_names: list[str],
 ):
     """Check 4: Required top-level fields presence."""
-    columns = set(table.column_names)
+    columns = set(column_names)
     
     # Check required columns
     for col in REQUIRED_COLUMNS:
@@ -430,20 +500,26 @@ def check_required_columns(
 
 def check_row_content_sanity(
     result: VerificationResult,
-    table: pa.Table,
+    pf: pq.ParquetFile,
     date_str: str,
 ):
     """Check 5: Row-level spot checks (content sanity)."""
-    # Use seeded RNG for reproducibility
-    rng = random.Random(RANDOM_SEED + hash(date_str))
+    # Use seeded RNG for reproducibility (str hash() is salted per process)
+    rng = random.Random(RANDOM_SEED + zlib.crc32(date_str.encode()))
     
-    num_rows = table.num_rows
+    num_rows = pf.metadata.num_rows
     sample_size = min(20, num_rows)
     sample_indices = rng.sample(range(num_rows), sample_size)
     
     result.info["sampled_row_count"] = sample_size
     result.info["sampled_indices"] = sorted(sample_indices)
     
+    # Decode only the sampled rows' row groups and the columns checked below
+    columns = [c for c in ["symbol", "meta", "spot_raw", "spot_prices", "derived"]
+               if c in result.info["null_counts"]]
+    table = take_rows(pf, sorted(sample_indices), columns)
+    position = {idx: pos for pos, idx in enumerate(sorted(sample_indices))}
+    
     # Work with PyArrow directly (no pandas dependency)
     issues = []
     duration_values = []
@@ -462,13 +538,13 @@ def check_row_content_sanity(
         
         # Check symbol
         if symbol_idx is not None:
-            symbol_val = table.column(symbol_idx)[idx].as_py()
+            symbol_val = table.column(symbol_idx)[position[idx]].as_py()
             if symbol_val is None or (isinstance(symbol_val, str) and len(symbol_val) == 0):
                 row_issues.append(f"Row {idx}: symbol is empty or null")
         
         # Check meta.added_ts (just verify it exists and is parseable, not date range)
         if meta_idx is not None:
-            meta = table.column(meta_idx)[idx].as_py()
+            meta = table.column(meta_idx)[position[idx]].as_py()
             if meta is None:
                 row_issues.append(f"Row {idx}: meta is null")
             elif isinstance(meta, dict):
@@ -500,11 +576,11 @@ def check_row_content_sanity(
         # Check spot data presence
         has_spot = False
         if spot_raw_idx is not None:
-            spot_raw = table.column(spot_raw_idx)[idx].as_py()
+            spot_raw = table.column(spot_raw_idx)[position[idx]].as_py()
             if spot_raw is not None and spot_raw:
                 has_spot = True
         if not has_spot and spot_prices_idx is not None:
-            spot_prices = table.column(spot_prices_idx)[idx].as_py()
+            spot_prices = table.column(spot_prices_idx)[position[idx]].as_py()
             if spot_prices is not None and spot_prices:
                 has_spot = True
         if has_spot:
@@ -512,7 +588,7 @@ def check_row_content_sanity(
         
         # Check derived.spread_bps
         if derived_idx is not None:
-            derived = table.column(derived_idx)[idx].as_py()
+            derived = table.column(derived_idx)[position[idx]].as_py()
             if derived is not None and isinstance(derived, dict):
                 spread_bps = derived.get("spread_bps")
                 if spread_bps is not None and spread_bps < 0:
@@ -538,10 +614,10 @@ def check_row_content_sanity(
 
 def check_futures_sanity(
     result: VerificationResult,
-    table: pa.Table,
+    pf: pq.ParquetFile,
 ):
     """Check 6: Futures block sanity."""
-    columns = set(table.column_names)
+    columns = set(result.info["null_counts"])
     
     # Check if futures column exists
     if "futures_raw" not in columns:
@@ -551,21 +627,14 @@ def check_futures_sanity(
     
     result.info["futures_column_exists"] = True
     
-    # Count non-null futures rows using PyArrow directly
-    futures_col = table.column("futures_raw")
-    total_rows = table.num_rows
+    # Count non-null futures rows from the validity bitmap (no per-row decoding).
+    # A non-null value has content unless it is a struct with no fields.
+    futures_type = pf.schema_arrow.field("futures_raw").type
+    total_rows = pf.metadata.num_rows
     
-    non_null_count = 0
-    has_content_count = 0
-    
-    for i in range(total_rows):
-        val = futures_col[i].as_py()
-        if val is not None:
-            non_null_count += 1
-            if isinstance(val, dict) and len(val) > 0:
-                has_content_count += 1
-            elif not isinstance(val, dict):
-                has_content_count += 1
+    non_null_count = total_rows - result.info["null_counts"]["futures_raw"]
+    is_empty_struct = pa.types.is_struct(futures_type) and futures_type.num_fields == 0
+    has_content_count = 0 if is_empty_struct else non_null_count
     
     result.info["futures_non_null_count"] = non_null_count
     result.info["futures_has_content_count"] = has_content_count
@@ -585,15 +654,20 @@ def check_futures_sanity(
 
 def check_null_ratios(
     result: VerificationResult,
-    table: pa.Table,
+    pf: pq.ParquetFile,
 ):
-    """Check 7: Null / empty struct normalization sanity."""
-    num_rows = table.num_rows
-    
+    """Check 7: Null / empty struct normalization sanity (counts from check 3)."""
+    evaluate_null_counts(result, result.info.pop("null_counts"), pf.metadata.num_rows)
+
+
+def evaluate_null_counts(
+    result: VerificationResult,
+    null_counts: dict[str, int],
+    num_rows: int,
+):
+    """Check 7 rules applied to per-column null counts (from data or footer)."""
     null_ratios = []
-    for col_name in table.column_names:
-        col = table.column(col_name)
-        null_count = col.null_count
+    for col_name, null_count in null_counts.items():
         null_ratio = null_count / num_rows if num_rows > 0 else 0
         null_ratios.append((col_name, null_ratio, null_count))
     
@@ -607,9 +681,7 @@ def check_null_ratios(
     ]
     
     # Check if meta is ever null (ERROR)
-    meta_nulls = 0
-    if "meta" in table.column_names:
-        meta_nulls = table.column("meta").null_count
+    meta_nulls = null_counts.get("meta", 0)
     
     if meta_nulls > 0:
         result.errors.append(f"meta column has {meta_nulls} null values (should be 0)")
@@ -620,6 +692,92 @@ def check_null_ratios(
         result.warnings.append(f"Columns that are 100% null: {fully_null_cols}")
 
 
+def check_parquet_footer(
+    result: VerificationResult,
+    parquet_file,
+) -> Optional[pq.ParquetFile]:
+    """
+    Check 3 (metadata-only): schema, row count and row-group stats from the footer.
+    
+    Nothing but the footer is read. Records the same info as
+    check_parquet_readability plus footer min/max ranges.
+    """
+    try:
+        pf = pq.ParquetFile(parquet_file, pre_buffer=True)
+        schema = pf.schema_arrow
+        num_rows = pf.metadata.num_rows
+    except Exception as e:
+        result.errors.append(f"Failed to read parquet footer: {e}")
+        return None
+    
+    result.info["row_count"] = num_rows
+    result.info["row_group_count"] = pf.metadata.num_row_groups
+    result.info["column_count"] = len(schema)
+    result.info["columns"] = schema.names
+    result.info["schema_summary"] = summarize_schema(schema)
+    
+    manifest_row_count = result.info.get("manifest", {}).get("row_count")
+    if manifest_row_count is not None:
+        if num_rows != manifest_row_count:
+            result.errors.append(
+                f"Row count mismatch: parquet has {num_rows}, manifest says {manifest_row_count}"
+            )
+        else:
+            result.info["row_count_match"] = True
+    
+    return pf
+
+
+def check_footer_stats(
+    result: VerificationResult,
+    pf: pq.ParquetFile,
+):
+    """
+    Checks 5/6 (metadata-only): value ranges from row-group statistics.
+    
+    Replaces the 20-row sample with whole-file bounds where the footer has
+    them: meta.added_ts presence and range, meta.duration_sec bounds and
+    negative derived.spread_bps. Futures presence needs data and is skipped.
+    """
+    stats = footer_column_stats(pf.metadata)
+    result.info["footer_stats_columns"] = len(stats)
+    
+    added_ts = stats.get("meta.added_ts")
+    if added_ts is not None:
+        if added_ts["null_count"]:
+            result.warnings.append(f"meta.added_ts (or meta) is null in {added_ts['null_count']} rows")
+        ts_range = column_range(stats, "meta.added_ts")
+        if ts_range is not None:
+            result.info["added_ts_range"] = [str(v) for v in ts_range]
+    
+    duration = column_range(stats, "meta.duration_sec")
+    if duration is not None:
+        result.info["duration_min"], result.info["duration_max"] = duration
+        if duration[0] < MIN_DURATION_SEC or duration[1] > MAX_DURATION_SEC:
+            result.warnings.append(
+                f"meta.duration_sec range {duration[0]}-{duration[1]} exceeds expected "
+                f"({MIN_DURATION_SEC}-{MAX_DURATION_SEC})"
+            )
+    
+    spread = column_range(stats, "derived.spread_bps")
+    if spread is not None and spread[0] < 0:
+        result.warnings.append(f"derived.spread_bps has negative values (min {spread[0]})")
+    
+    missing = [path for path, entry in stats.items() if entry["null_count"] is None]
+    if missing:
+        result.info["footer_stats_missing"] = missing
+
+
+def check_footer_null_ratios(
+    result: VerificationResult,
+    pf: pq.ParquetFile,
+):
+    """Check 7 (metadata-only): null counts from the footer plus one leaf per nested column."""
+    data = run_rules(pf, [NullCounts(nan_as_null=False, footer=True)])
+    result.info["null_count_leaf_reads"] = data["null_count_data_reads"]
+    evaluate_null_counts(result, data["column_null_counts"], pf.metadata.num_rows)
+
+
 # ==============================================================================
 # Report Generation
 # ==============================================================================
@@ -639,7 +797,10 @@ def generate_report(results: list[VerificationResult], report_path: Path):
     
     for r in results:
         info = r.info
-        sha_match = "✅" if info.get("sha256_match") else "❌"
+        if info.get("sha256_verified") is False:
+            sha_match = "skipped"
+        else:
+            sha_match = "✅" if info.get("sha256_match") else "❌"
         
         # Format hours coverage
         hours_found = info.get("hours_found", "N/A")
@@ -775,6 +936,12 @@ def generate_report(results: list[VerificationResult], report_path: Path):
             lines.append(f"- **Optional columns found:** {info['optional_columns_present']}")
         lines.append("")
         
+        # Footer ranges (--metadata-only)
+        if "added_ts_range" in info:
+            lines.append(f"- **meta.added_ts range:** {info['added_ts_range'][0]} → {info['added_ts_range'][1]}")
+        if "duration_min" in info and "duration_avg" not in info:
+            lines.append(f"- **Duration (sec):** min={info['duration_min']:.0f}, max={info['duration_max']:.0f} (footer)")
+        
         # Duration stats
         if "duration_avg" in info:
             lines.append(f"- **Duration (sec):** min={info.get('duration_min'):.0f}, max={info.get('duration_max'):.0f}, avg={info.get('duration_avg'):.0f}")
@@ -808,53 +975,162 @@ def generate_report(results: list[VerificationResult], report_path: Path):
 
 def verify_date(
     date_str: str,
-    parquet_path: Path,
+    parquet_path: Optional[Path],
     manifest_path: Path,
     r2_sizes: Optional[dict[str, int]] = None,
+    remote_parquet: Optional[R2RangeFile] = None,
+    metadata_only: bool = False,
 ) -> VerificationResult:
-    """Run all verification checks for a single date."""
+    """
+    Run all verification checks for a single date.
+    
+    With remote_parquet the parquet is read from R2 via ranged reads:
+    only the footer and RANGE_READ_COLUMNS are fetched, SHA256 is not
+    verified and null ratios cover the fetched columns only.
+    
+    With metadata_only, checks 3-7 are answered from the parquet footer
+    (row-group statistics) plus one small leaf chunk per nested column;
+    row sampling and futures presence are skipped.
+    """
     result = VerificationResult(date=date_str)
     
     print(f"\n[Verifying {date_str}]")
     
     # Check 1: Presence + size
     print("  1. Checking presence and size...")
-    check_presence_and_size(result, parquet_path, manifest_path, r2_sizes)
+    check_presence_and_size(result, parquet_path, manifest_path, r2_sizes, remote_parquet)
     if result.has_errors:
         return result
     
     # Check 2: Manifest correctness
     print("  2. Checking manifest correctness...")
-    check_manifest_correctness(result, parquet_path, manifest_path)
+    check_manifest_correctness(result, None if remote_parquet else parquet_path, manifest_path)
+    
+    if metadata_only:
+        verify_footer(result, remote_parquet or parquet_path)
+    else:
+        verify_data(result, date_str, parquet_path, remote_parquet)
+    
+    if remote_parquet:
+        result.info["range_read"] = remote_parquet.stats()
+        print(f"  Fetched {remote_parquet.bytes_fetched / (1024 * 1024):.1f} of "
+              f"{remote_parquet.size() / (1024 * 1024):.1f} MB ({remote_parquet.requests} range requests)")
+    
+    print(f"  → Status: {result.status}")
+    if result.errors:
+        print(f"  → Errors: {len(result.errors)}")
+    if result.warnings:
+        print(f"  → Warnings: {len(result.warnings)}")
+    
+    return result
+
+
+def verify_footer(result: VerificationResult, parquet_file):
+    """Checks 3-7 from the parquet footer."""
+    print("  3. Checking parquet footer...")
+    pf = check_parquet_footer(result, parquet_file)
+    if pf is None:
+        return
+    
+    print("  4. Checking required columns...")
+    check_required_columns(result, result.info["columns"])
+    
+    print("  5-6. Checking row-group statistics (row sampling and futures skipped)...")
+    check_footer_stats(result, pf)
     
+    print("  7. Checking null ratios (footer)...")
+    check_footer_null_ratios(result, pf)
+
+
+def verify_data(
+    result: VerificationResult,
+    date_str: str,
+    parquet_path: Optional[Path],
+    remote_parquet: Optional[R2RangeFile],
+):
+    """Checks 3-7 from the parquet data."""
     # Check 3: Parquet readability
     print("  3. Checking parquet readability...")
-    table = check_parquet_readability(result, parquet_path)
-    if table is None:
-        return result
+    if remote_parquet:
+        pf = check_parquet_readability(result, remote_parquet, RANGE_READ_COLUMNS)
+    else:
+        pf = check_parquet_readability(result, parquet_path)
+    if pf is None:
+        return
     
     # Check 4: Required columns
     print("  4. Checking required columns...")
-    check_required_columns(result, table)
+    check_required_columns(result, result.info["columns"])
     
     # Check 5: Row content sanity
     print("  5. Checking row content sanity (sampling 20 rows)...")
-    check_row_content_sanity(result, table, date_str)
+    check_row_content_sanity(result, pf, date_str)
     
     # Check 6: Futures sanity
     print("  6. Checking futures block sanity...")
-    check_futures_sanity(result, table)
+    check_futures_sanity(result, pf)
     
     # Check 7: Null ratios
     print("  7. Checking null ratios...")
-    check_null_ratios(result, table)
+    check_null_ratios(result, pf)
+
+
+def failed_result(date_str: str, error: str) -> VerificationResult:
+    """Result for a date whose verification could not run."""
+    result = VerificationResult(date=date_str)
+    result.errors.append(error)
+    return result
+
+
+def verify_date_from_r2(
+    config: R2Config,
+    date_str: str,
+    cache_dir: Path,
+    range_reads: bool = False,
+    metadata_only: bool = False,
+    r2_sizes: Optional[dict[str, int]] = None,
+    verify_cache: Optional[VerificationCache] = None,
+) -> VerificationResult:
+    """
+    Fetch one date from R2 and verify it (one unit of work for --jobs).
     
-    print(f"  → Status: {result.status}")
-    if result.errors:
-        print(f"  → Errors: {len(result.errors)}")
-    if result.warnings:
-        print(f"  → Warnings: {len(result.warnings)}")
+    With verify_cache, a date whose manifest sha256 and RULESET_VERSION
+    match a cached result is not downloaded or re-checked.
+    """
+    variant = "range" if range_reads else "download"
+    if metadata_only:
+        variant += "+metadata"
+    sha = None
+    if verify_cache is not None:
+        sha = manifest_sha256(fetch_manifest(config, date_str))
+        cached = verify_cache.get("tier3_parquet", date_str, sha, RULESET_VERSION, variant)
+        if cached is not None:
+            result = VerificationResult(**cached)
+            print(f"\n[CACHE] {date_str}: {result.status} (sha256 {sha[:12]}... unchanged)")
+            return result
+    
+    print(f"\n[Downloading {date_str} from R2...]")
+    
+    # Get sizes first
+    if r2_sizes is None:
+        r2_sizes = get_r2_object_sizes(config, date_str)
+    
+    # Download files (manifest only with --range-reads)
+    parquet_path, manifest_path = download_from_r2(
+        config, date_str, cache_dir, include_parquet=not range_reads
+    )
+    
+    if parquet_path is None:
+        return failed_result(date_str, "Failed to download from R2")
     
+    remote_parquet = open_r2_parquet_file(config, date_str) if range_reads else None
+    result = verify_date(
+        date_str, parquet_path, manifest_path, r2_sizes, remote_parquet,
+        metadata_only=metadata_only,
+    )
+    
+    if verify_cache is not None:
+        verify_cache.put("tier3_parquet", date_str, sha, RULESET_VERSION, result, variant)
     return result
 
 
@@ -878,6 +1154,34 @@ def main():
         action="store_true",
         help="Download from R2 and verify (default if no --local specified)",
     )
+    parser.add_argument(
+        "--range-reads",
+        action="store_true",
+        help="Read parquets in R2 with ranged GETs instead of downloading them (skips SHA256)",
+    )
+    parser.add_argument(
+        "--metadata-only",
+        action="store_true",
+        help="Answer schema/row-count/null/range checks from parquet footers; "
+             "skips row sampling and futures checks (pair with --range-reads for a cheap full-history audit)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Verify this many dates concurrently in separate processes (default: 1)",
+    )
+    parser.add_argument(
+        "--max-inflight-mb",
+        type=int,
+        default=DEFAULT_MAX_INFLIGHT_MB,
+        help=f"With --jobs: cap on parquet MB being downloaded/verified at once (default: {DEFAULT_MAX_INFLIGHT_MB})",
+    )
+    parser.add_argument(
+        "--no-verify-cache",
+        action="store_true",
+        help="Re-verify every date instead of reusing cached results for unchanged parquets (cache is still refreshed)",
+    )
     parser.add_argument(
         "--output-dir",
         type=str,
@@ -919,7 +1223,7 @@ def main():
         parquet_path = local_path / "data.parquet"
         manifest_path = local_path / "manifest.json"
         
-        result = verify_date(date_str, parquet_path, manifest_path)
+        result = verify_date(date_str, parquet_path, manifest_path, metadata_only=args.metadata_only)
         results.append(result)
     else:
         # Download from R2
@@ -945,25 +1249,35 @@ def main():
         
         print(f"Dates to verify: {len(dates_to_verify)} day(s)")
         
-        for date_str in dates_to_verify:
-            print(f"\n[Downloading {date_str} from R2...]")
-            
-            # Get sizes first
-            r2_sizes = get_r2_object_sizes(config, date_str)
-            
-            # Download files
-            parquet_path, manifest_path = download_from_r2(
-                config, date_str, cache_dir
+        # Unchanged dates are answered from cached results
+        verify_cache = VerificationCache(read=not args.no_verify_cache)
+        
+        if args.jobs > 1:
+            # Sizes up front: they drive the download budget (ranged reads
+            # fetch little, so they aren't budgeted)
+            all_sizes = [get_r2_object_sizes(config, d) for d in dates_to_verify]
+            budget_sizes = (
+                [None] * len(dates_to_verify) if args.range_reads
+                else [sizes.get("data.parquet") for sizes in all_sizes]
             )
-            
-            if parquet_path is None:
-                result = VerificationResult(date=date_str)
-                result.errors.append("Failed to download from R2")
-                results.append(result)
-                continue
-            
-            result = verify_date(date_str, parquet_path, manifest_path, r2_sizes)
-            results.append(result)
+            print(f"  Verifying with {args.jobs} processes (max {args.max_inflight_mb} MB in flight)")
+            results = run_partitions(
+                verify_date_from_r2,
+                [
+                    (config, d, cache_dir, args.range_reads, args.metadata_only, sizes, verify_cache)
+                    for d, sizes in zip(dates_to_verify, all_sizes)
+                ],
+                jobs=args.jobs,
+                sizes=budget_sizes,
+                max_inflight_bytes=args.max_inflight_mb * 1024 * 1024,
+                on_error=lambda task, error: failed_result(task[1], f"Verification crashed: {error}"),
+            )
+        else:
+            for date_str in dates_to_verify:
+                results.append(verify_date_from_r2(
+                    config, date_str, cache_dir, args.range_reads, args.metadata_only,
+                    verify_cache=verify_cache,
+                ))
     
     # Generate report
     print("\n" + "=" * 60)
@@ -11,6 +11,9 @@ Lightweight verification that:
 Usage:
     python3 scripts/verify_tier3_schema.py [--date 2026-01-17]
     python3 scripts/verify_tier3_schema.py --all
+
+    # Verify parquets in R2 with ranged reads (footer + first row group only)
+    python3 scripts/verify_tier3_schema.py --r2 [--date 2026-01-17]
 """
 
 import argparse
@@ -19,8 +22,11 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent))
+
 try:
-    import pyarrow.parquet as pq
+    from local_parquet import open_local_parquet
+    from verify_engine import FirstRow, TierSpec, run_rules, verify_schema
 except ImportError:
     print("[ERROR] pyarrow required: pip install pyarrow", file=sys.stderr)
     sys.exit(1)
@@ -45,6 +51,16 @@ EXPECTED_TOP_COLUMNS = [
     'spot_prices',
 ]
 
+# Columns that may be null in the sampled row (e.g. futures_raw for spot-only coins)
+NULLABLE_COLUMNS = ['futures_raw', 'diag']
+
+SPEC = TierSpec(
+    tier='tier3',
+    label='Tier 3',
+    expected_columns=EXPECTED_TOP_COLUMNS,
+    critical_columns=[c for c in EXPECTED_TOP_COLUMNS if c not in NULLABLE_COLUMNS],
+)
+
 # Fields we expect in twitter_sentiment_windows.last_cycle
 EXPECTED_SENTIMENT_FIELDS = [
     'posts_total',
@@ -62,37 +78,19 @@ EXPECTED_SENTIMENT_FIELDS = [
 # Verification Functions
 # ==============================================================================
 
-def verify_schema_only(parquet_path: Path) -> dict:
-    """Verify schema without loading any data."""
-    pf = pq.ParquetFile(parquet_path)
-    schema = pf.schema_arrow
-    
-    result = {
-        'rows': pf.metadata.num_rows,
-        'columns': pf.metadata.num_columns,
-        'column_names': [f.name for f in schema],
-        'missing_columns': [],
-        'extra_columns': [],
-    }
-    
-    # Check expected columns
-    for col in EXPECTED_TOP_COLUMNS:
-        if col not in result['column_names']:
-            result['missing_columns'].append(col)
-    
-    # Check for extra columns
-    for col in result['column_names']:
-        if col not in EXPECTED_TOP_COLUMNS:
-            result['extra_columns'].append(col)
-    
+def verify_schema_only(parquet_file) -> dict:
+    """Verify schema without loading any data (path or file object)."""
+    pf = open_local_parquet(parquet_file)
+    result = verify_schema(SPEC, pf.schema_arrow, pf.metadata.num_rows)
+    result['columns'] = pf.metadata.num_columns
     return result
 
 
-def verify_one_row(parquet_path: Path) -> dict:
-    """Read exactly ONE row and check all fields have data."""
-    pf = pq.ParquetFile(parquet_path)
+def verify_one_row(parquet_file) -> dict:
+    """Read exactly ONE row and check all fields have data (path or file object)."""
+    pf = open_local_parquet(parquet_file)
+    columns = pf.schema_arrow.names
     
-    # Read just first row of first row group, one column at a time
     result = {
         'row_data': {},
         'null_columns': [],
@@ -100,38 +98,31 @@ def verify_one_row(parquet_path: Path) -> dict:
         'sentiment_check': {},
     }
     
-    for field in pf.schema_arrow:
-        col_name = field.name
+    # First row of the first row group; nothing past one batch is decoded
+    row = run_rules(pf, [FirstRow(columns, 'row')], batch_rows=1, max_rows=1)['row']
+    
+    for col_name in columns:
+        val = row.get(col_name)
         
-        # Read just this one column, first row
-        table = pf.read_row_group(0, columns=[col_name])
+        if val is None:
+            result['null_columns'].append(col_name)
+            continue
         
-        # Get first value using to_pylist on just one element
-        first_chunk = table.column(0).chunk(0)
-        if len(first_chunk) > 0:
-            # Use as_py() on scalar for efficiency
-            val = first_chunk[0].as_py()
-            
-            if val is None:
-                result['null_columns'].append(col_name)
-            else:
-                result['populated_columns'].append(col_name)
-                
-                # Store summary, not full value
-                if isinstance(val, dict):
-                    result['row_data'][col_name] = f"dict({len(val)} keys)"
-                elif isinstance(val, list):
-                    result['row_data'][col_name] = f"list({len(val)} items)"
-                elif isinstance(val, str) and len(val) > 50:
-                    result['row_data'][col_name] = val[:50] + "..."
-                else:
-                    result['row_data'][col_name] = val
-                
-                # Deep check twitter_sentiment_windows
-                if col_name == 'twitter_sentiment_windows' and isinstance(val, dict):
-                    result['sentiment_check'] = check_sentiment_structure(val)
+        result['populated_columns'].append(col_name)
+        
+        # Store summary, not full value
+        if isinstance(val, dict):
+            result['row_data'][col_name] = f"dict({len(val)} keys)"
+        elif isinstance(val, list):
+            result['row_data'][col_name] = f"list({len(val)} items)"
+        elif isinstance(val, str) and len(val) > 50:
+            result['row_data'][col_name] = val[:50] + "..."
         else:
-            result['null_columns'].append(col_name)
+            result['row_data'][col_name] = val
+        
+        # Deep check twitter_sentiment_windows
+        if col_name == 'twitter_sentiment_windows' and isinstance(val, dict):
+            result['sentiment_check'] = check_sentiment_structure(val)
     
     return result
 
@@ -209,9 +200,55 @@ def verify_day(date_str: str, tier3_dir: Path) -> dict:
     else:
         result['errors'].append("Manifest not found")
     
+    return check_parquet(result, parquet_path)
+
+
+def verify_day_r2(date_str: str, s3, bucket: str) -> dict:
+    """Verify a single day's Tier 3 parquet in R2 without downloading it."""
+    from r2_range_file import R2RangeFile
+    
+    day_prefix = f"tier3/daily/{date_str[:7]}/{date_str}"
+    parquet_key = f"{day_prefix}/instrumetriq_tier3_daily_{date_str}.parquet"
+    manifest_key = f"{day_prefix}/manifest.json"
+    
+    result = {
+        'date': date_str,
+        'exists': False,
+        'manifest_ok': False,
+        'schema_ok': False,
+        'data_ok': False,
+        'errors': [],
+    }
+    
+    try:
+        parquet_file = R2RangeFile(s3, bucket, parquet_key)
+    except Exception as e:
+        result['errors'].append(f"Parquet not found: {parquet_key} ({e})")
+        return result
+    
+    result['exists'] = True
+    
+    try:
+        manifest = json.loads(s3.get_object(Bucket=bucket, Key=manifest_key)["Body"].read())
+        result['manifest_ok'] = True
+        result['manifest'] = {
+            'rows': manifest.get('row_count'),
+            'coverage': manifest.get('coverage_pct'),
+            'hours': manifest.get('hours_found'),
+        }
+    except Exception as e:
+        result['errors'].append(f"Manifest error: {e}")
+    
+    check_parquet(result, parquet_file)
+    result['transfer'] = parquet_file.stats()
+    return result
+
+
+def check_parquet(result: dict, parquet_file) -> dict:
+    """Schema and one-row checks shared by local and R2 verification."""
     # Check schema (no data load)
     try:
-        schema_result = verify_schema_only(parquet_path)
+        schema_result = verify_schema_only(parquet_file)
         result['schema'] = schema_result
         if not schema_result['missing_columns']:
             result['schema_ok'] = True
@@ -223,7 +260,7 @@ def verify_day(date_str: str, tier3_dir: Path) -> dict:
     
     # Check one row of data
     try:
-        row_result = verify_one_row(parquet_path)
+        row_result = verify_one_row(parquet_file)
         result['row_check'] = row_result
         
         if not row_result['null_columns']:
@@ -231,7 +268,7 @@ def verify_day(date_str: str, tier3_dir: Path) -> dict:
         else:
             # Some nulls are OK (like futures_raw for spot-only coins)
             critical_nulls = [c for c in row_result['null_columns'] 
-                           if c not in ['futures_raw', 'diag']]
+                           if c not in NULLABLE_COLUMNS]
             if critical_nulls:
                 result['errors'].append(f"Critical null columns: {critical_nulls}")
             else:
@@ -279,6 +316,68 @@ def print_result(result: dict):
     if result.get('sentiment_warnings'):
         for warn in result['sentiment_warnings']:
             print(f"    └─ ⚠️  {warn}")
+    
+    transfer = result.get('transfer')
+    if transfer:
+        print(f"    └─ fetched {transfer['bytes_fetched'] / (1024 * 1024):.1f} of "
+              f"{transfer['object_bytes'] / (1024 * 1024):.1f} MB in {transfer['requests']} range requests")
+
+
+def main_r2(args):
+    """Verify Tier 3 days directly in R2."""
+    import boto3
+    from r2_config import get_r2_config
+    from r2_metrics import instrument_client
+    
+    cfg = get_r2_config()
+    s3 = instrument_client(boto3.client(
+        "s3",
+        endpoint_url=cfg.endpoint,
+        aws_access_key_id=cfg.access_key_id,
+        aws_secret_access_key=cfg.secret_access_key,
+    ))
+    
+    print("=" * 60)
+    print("TIER 3 SCHEMA VERIFICATION (R2, ranged reads)")
+    print("=" * 60)
+    print()
+    
+    if args.date:
+        dates = [args.date]
+    else:
+        dates = set()
+        paginator = s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=cfg.bucket, Prefix="tier3/daily/"):
+            for obj in page.get("Contents", []):
+                parts = obj["Key"].split("/")
+                if len(parts) == 5 and parts[4].endswith(".parquet"):
+                    dates.add(parts[3])
+        dates = sorted(dates)
+        if not dates:
+            print("[ERROR] No Tier 3 days found in R2", file=sys.stderr)
+            sys.exit(1)
+        if not args.all:
+            dates = [dates[-1]]
+    
+    print(f"Verifying {len(dates)} day(s)...")
+    print()
+    
+    all_pass = True
+    for date in dates:
+        result = verify_day_r2(date, s3, cfg.bucket)
+        print_result(result)
+        if result.get('errors'):
+            all_pass = False
+    
+    print()
+    print("=" * 60)
+    if all_pass:
+        print("✅ ALL VERIFICATIONS PASSED")
+    else:
+        print("❌ SOME VERIFICATIONS FAILED")
+    print("=" * 60)
+    
+    sys.exit(0 if all_pass else 1)
 
 
 def main():
@@ -286,10 +385,14 @@ def main():
     parser.add_argument('--date', help='Specific date to verify (YYYY-MM-DD)')
     parser.add_argument('--all', action='store_true', help='Verify all available days')
     parser.add_argument('--verbose', '-v', action='store_true', help='Show detailed output')
+    parser.add_argument('--r2', action='store_true', help='Verify parquets in R2 using ranged reads (no download)')
     args = parser.parse_args()
     
     tier3_dir = Path('output/tier3_daily')
     
+    if args.r2:
+        return main_r2(args)
+    
     if not tier3_dir.exists():
         print(f"[ERROR] Tier 3 directory not found: {tier3_dir}", file=sys.stderr)
         sys.exit(1)
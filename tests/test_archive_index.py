@@ -0,0 +1,95 @@
+"""Regression tests for archive_index read-error handling."""
+
+import gzip
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import archive_index  # noqa: E402
+from generate_archive_stats import count_entries_in_file  # noqa: E402
+
+CLOSED_MTIME = 1_600_000_000  # 2020-09-13, long past any hour
+
+
+def entry(i: int) -> bytes:
+    return json.dumps({"symbol": "BTC", "meta": {"added_ts": f"2020-09-13T12:00:{i:02d}Z"}}).encode() + b"\n"
+
+
+def write_hour_file(path: Path, lines: list[bytes]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, "wb") as f:
+        f.writelines(lines)
+    os.utime(path, (CLOSED_MTIME, CLOSED_MTIME))
+    return path
+
+
+def truncated_hour_file(tmp_path: Path) -> Path:
+    # Incompressible padding keeps early lines in early deflate blocks, so
+    # cutting the tail loses only the last lines
+    lines = [
+        json.dumps({"symbol": "BTC", "pad": os.urandom(2048).hex(), "added_ts": str(i)}).encode() + b"\n"
+        for i in range(50)
+    ]
+    path = write_hour_file(tmp_path / "20200913" / "12.jsonl.gz", lines)
+    data = path.read_bytes()
+    path.write_bytes(data[: len(data) // 2])
+    os.utime(path, (CLOSED_MTIME, CLOSED_MTIME))
+    return path
+
+
+def test_non_utf8_line_is_skipped(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARCHIVE_INDEX_DIR", str(tmp_path / "index"))
+    path = write_hour_file(
+        tmp_path / "20200913" / "12.jsonl.gz",
+        [entry(0), b'{"symbol": "\xff\xfe"}\n', entry(2), b"7\n"],
+    )
+
+    entries = list(archive_index.iter_entries(path, warn=False))
+    assert [e["meta"]["added_ts"] for e in entries] == ["2020-09-13T12:00:00Z", "2020-09-13T12:00:02Z"]
+
+    index = archive_index.load_index(path)
+    assert index is not None
+    assert index["line_count"] == 4
+    assert index["row_count"] == 2
+    assert index["bad_lines"] == 2
+
+
+def test_truncated_gzip_keeps_entries_before_the_error(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("ARCHIVE_INDEX_DIR", str(tmp_path / "index"))
+    path = truncated_hour_file(tmp_path)
+
+    entries = list(archive_index.iter_entries(path))
+    assert 0 < len(entries) < 50
+    assert "[WARN] Error reading" in capsys.readouterr().err
+    # A partial read never becomes a sidecar
+    assert archive_index.load_index(path) is None
+
+    index = archive_index.ensure_index(path)
+    assert "read_error" in index
+    assert index["row_count"] == len(entries)
+    assert archive_index.load_index(path) is None
+
+
+def test_corrupt_gzip_block_is_a_read_error(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARCHIVE_INDEX_DIR", str(tmp_path / "index"))
+    path = write_hour_file(tmp_path / "20200913" / "13.jsonl.gz", [entry(i % 60) for i in range(500)])
+    data = bytearray(path.read_bytes())
+    for i in range(20, len(data) - 8):
+        data[i] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    # Raises nothing; whatever decoded before the corruption is kept
+    entries = list(archive_index.iter_entries(path, warn=False))
+    assert len(entries) < 500
+    assert "read_error" in archive_index.build_index(path)
+
+
+def test_count_entries_keeps_partial_count(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARCHIVE_INDEX_DIR", str(tmp_path / "index"))
+    path = truncated_hour_file(tmp_path)
+
+    count = count_entries_in_file(path)
+    assert 0 < count < 50